@@ -0,0 +1,74 @@
+"""Shared fixtures for the benchmark suite.
+
+Inputs come from the synthetic export generator, so every run measures
+the same deterministic data.  Exports are generated once per session and
+shared by all benchmarks that ask for the same size.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from slack_chat_migrator.services.export_generator import (
+    ExportSpec,
+    GeneratedExport,
+    generate_export,
+)
+
+# Message counts each size-parametrized benchmark runs at
+SIZES = [100, 1_000, 10_000]
+
+
+@pytest.fixture(autouse=True)
+def _quiet_logging():
+    """Keep log handlers out of the measurements."""
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(scope="session")
+def export_factory(
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Callable[..., GeneratedExport]:
+    """Return ``make(messages, channels=1, **spec)``, cached per spec."""
+    cache: dict[ExportSpec, GeneratedExport] = {}
+
+    def make(messages: int, channels: int = 1, **kwargs: Any) -> GeneratedExport:
+        spec = ExportSpec(
+            users=50,
+            channels=channels,
+            messages=messages,
+            days=max(1, messages // 100),
+            **kwargs,
+        )
+        if spec not in cache:
+            cache[spec] = generate_export(spec, tmp_path_factory.mktemp("export"))
+        return cache[spec]
+
+    return make
+
+
+def load_messages(export: GeneratedExport) -> list[dict[str, Any]]:
+    """Return every message in *export*, in file order."""
+    return [
+        msg
+        for path in sorted(export.root.glob("*/*.json"))
+        for msg in json.loads(path.read_text(encoding="utf-8"))
+    ]
+
+
+def user_map(export: GeneratedExport) -> dict[str, str]:
+    """Return the Slack ID to email mapping of *export*'s users."""
+    users = json.loads((export.root / "users.json").read_text(encoding="utf-8"))
+    return {u["id"]: u["profile"].get("email", "") for u in users}
+
+
+def channel_dir(export: GeneratedExport, name: str = "general") -> Path:
+    """Return the directory of one channel in *export*."""
+    return export.root / name
@@ -0,0 +1,31 @@
+"""Benchmarks for the per-call overhead of RetryWrapper."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from slack_chat_migrator.core.state import MigrationState
+from slack_chat_migrator.services.chat.dry_run_service import DryRunChatService
+from slack_chat_migrator.utils.api import RetryWrapper
+
+CALLS = 1_000
+
+
+def _send(chat: Any) -> None:
+    for i in range(CALLS):
+        chat.spaces().messages().create(
+            parent="spaces/S", body={"text": str(i)}
+        ).execute()
+
+
+@pytest.mark.benchmark(group="retry_wrapper")
+def test_unwrapped_calls(benchmark):
+    """Reference: the same calls on the bare dry-run service."""
+    benchmark(_send, DryRunChatService(MigrationState()))
+
+
+@pytest.mark.benchmark(group="retry_wrapper")
+def test_wrapped_calls(benchmark):
+    benchmark(_send, RetryWrapper(DryRunChatService(MigrationState())))
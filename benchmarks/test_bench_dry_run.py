@@ -0,0 +1,21 @@
+"""End-to-end dry-run migrations of generated exports."""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.integration.conftest import make_migrator
+
+
+@pytest.mark.benchmark(group="dry_run")
+@pytest.mark.parametrize("size", [1_000, 10_000])
+def test_dry_run_migration(benchmark, export_factory, size):
+    export = export_factory(size, channels=10, file_ratio=0.05)
+
+    def setup():
+        return (make_migrator(export.root),), {}
+
+    def run(migrator) -> None:
+        assert migrator.migrate() is True
+
+    benchmark.pedantic(run, setup=setup, rounds=3)
@@ -0,0 +1,31 @@
+"""Benchmarks for reading a channel out of a Slack export."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.conftest import SIZES, channel_dir
+from slack_chat_migrator.services.export_catalog import scan_channel
+from slack_chat_migrator.services.messages.message_stream import ChannelMessageStream
+
+
+@pytest.mark.benchmark(group="message_stream")
+@pytest.mark.parametrize("size", SIZES)
+def test_stream_channel_messages(benchmark, export_factory, size):
+    """Ordered, de-duplicated message loading (formerly _load_and_sort_messages)."""
+    stream = ChannelMessageStream(channel_dir(export_factory(size)), "general")
+
+    count = benchmark(lambda: sum(1 for _ in stream))
+
+    assert count >= size
+
+
+@pytest.mark.benchmark(group="membership_scan")
+@pytest.mark.parametrize("size", SIZES)
+def test_scan_channel(benchmark, export_factory, size):
+    """Membership scan of a channel (formerly _scan_message_files_for_membership)."""
+    path = channel_dir(export_factory(size))
+
+    summary = benchmark(scan_channel, path, "general")
+
+    assert summary.users
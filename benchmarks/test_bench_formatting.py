@@ -0,0 +1,34 @@
+"""Benchmarks for Slack-to-Chat text conversion."""
+
+from __future__ import annotations
+
+import pytest
+
+from benchmarks.conftest import SIZES, load_messages, user_map
+from slack_chat_migrator.utils.formatting import convert_formatting, parse_slack_blocks
+
+
+@pytest.mark.benchmark(group="convert_formatting")
+@pytest.mark.parametrize("size", SIZES)
+def test_convert_formatting(benchmark, export_factory, size):
+    export = export_factory(size, mention_ratio=0.3)
+    texts = [m.get("text", "") for m in load_messages(export)]
+    users = user_map(export)
+
+    def run() -> None:
+        for text in texts:
+            convert_formatting(text, users)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="parse_slack_blocks")
+@pytest.mark.parametrize("size", SIZES)
+def test_parse_slack_blocks(benchmark, export_factory, size):
+    messages = load_messages(export_factory(size, rich_text_ratio=1.0))
+
+    def run() -> None:
+        for msg in messages:
+            parse_slack_blocks(msg)
+
+    benchmark(run)
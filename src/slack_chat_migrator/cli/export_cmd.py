@@ -0,0 +1,156 @@
+"""CLI command handlers for working with a Slack export directly."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Any
+
+import click
+
+from slack_chat_migrator.cli.common import cli
+from slack_chat_migrator.cli.renderers import error_panel, get_console, success_panel
+from slack_chat_migrator.services.export_generator import ExportSpec, generate_export
+from slack_chat_migrator.services.export_inspector import ExportInspector
+
+# ---------------------------------------------------------------------------
+# export command group
+# ---------------------------------------------------------------------------
+
+
+@cli.group("export")
+def export() -> None:
+    """Inspect, pre-process or synthesize a Slack export."""
+
+
+@export.command("index")
+@click.option(
+    "--export_path",
+    required=True,
+    help="Path to Slack export directory",
+)
+def index(export_path: str) -> None:
+    """Parse the export once and save a catalog of per-channel summaries.
+
+    The catalog is written to ``<export_path>/.export_catalog.json``, the
+    only place the other commands look for it.
+
+    The catalog records message counts, first/last timestamps, posting
+    users, file references, thread roots and join/leave history for each
+    channel.  ``init``, ``validate`` and ``migrate`` read it instead of
+    re-parsing every message file; channels whose files have changed
+    since indexing are rescanned automatically.
+
+    Args:
+        export_path: Path to Slack export directory.
+    """
+    console = get_console()
+    export_root = Path(export_path)
+    if not export_root.is_dir():
+        console.print(
+            error_panel(
+                "Invalid export path",
+                f"Export path does not exist or is not a directory: {export_root}",
+            )
+        )
+        sys.exit(1)
+
+    inspector = ExportInspector(export_root)
+    channels = [ch_dir.name for ch_dir in inspector.get_channel_dirs()]
+    catalog = inspector.catalog.build(channels)
+    written = catalog.save()
+
+    messages = sum(catalog.channel(name).message_count for name in channels)
+    console.print(
+        success_panel(
+            "Export indexed",
+            f"{len(channels)} channels, {messages:,} messages\n"
+            f"Written to [bold]{written}[/bold]",
+        )
+    )
+
+
+_RATIO = click.FloatRange(0.0, 1.0)
+
+
+@export.command("generate")
+@click.option(
+    "--output",
+    required=True,
+    help="Directory to write the export into (must be empty or missing)",
+)
+@click.option("--users", type=click.IntRange(min=2), default=50, show_default=True)
+@click.option("--channels", type=click.IntRange(min=1), default=10, show_default=True)
+@click.option(
+    "--messages",
+    type=click.IntRange(min=0),
+    default=1_000,
+    show_default=True,
+    help="Messages and thread replies across all channels",
+)
+@click.option("--days", type=click.IntRange(min=1), default=30, show_default=True)
+@click.option(
+    "--channel_skew",
+    type=click.FloatRange(min=0.0),
+    default=1.0,
+    show_default=True,
+    help="Zipf exponent for messages per channel (0 = uniform)",
+)
+@click.option(
+    "--channel_members",
+    type=click.IntRange(min=2),
+    default=25,
+    show_default=True,
+    help="Median members per channel",
+)
+@click.option("--thread_ratio", type=_RATIO, default=0.1, show_default=True)
+@click.option(
+    "--max_thread_replies", type=click.IntRange(min=1), default=8, show_default=True
+)
+@click.option(
+    "--reaction_density",
+    type=click.FloatRange(min=0.0),
+    default=0.3,
+    show_default=True,
+    help="Mean reactions per message",
+)
+@click.option("--file_ratio", type=_RATIO, default=0.05, show_default=True)
+@click.option("--edit_ratio", type=_RATIO, default=0.05, show_default=True)
+@click.option("--bot_ratio", type=_RATIO, default=0.02, show_default=True)
+@click.option("--domain", default="example.com", show_default=True)
+@click.option("--seed", type=int, default=0, show_default=True)
+def generate(output: str, **params: Any) -> None:
+    """Write a synthetic Slack export for benchmarking at scale.
+
+    The export is deterministic: the same options and seed always produce
+    the same files.  It has users, channels, threads, reactions, file
+    references and edits in the layout of a real Slack export, so
+    ``export index``, ``validate`` and ``migrate --dry_run`` run on it
+    unchanged.
+
+    Args:
+        output: Directory to write the export into.
+        **params: :class:`ExportSpec` fields.
+    """
+    console = get_console()
+    output_dir = Path(output)
+    if output_dir.exists() and (not output_dir.is_dir() or any(output_dir.iterdir())):
+        console.print(
+            error_panel(
+                "Output not empty",
+                f"Refusing to write into existing, non-empty path: {output_dir}",
+            )
+        )
+        sys.exit(1)
+
+    result = generate_export(ExportSpec(**params), output_dir)
+    console.print(
+        success_panel(
+            "Export generated",
+            f"{result.users:,} users, {result.channels:,} channels, "
+            f"{result.messages:,} messages ({result.threads:,} threads), "
+            f"{result.reactions:,} reactions, {result.files:,} files\n"
+            f"{result.bytes_written / 1_048_576:,.1f} MiB written to "
+            f"[bold]{result.root}[/bold]",
+        )
+    )
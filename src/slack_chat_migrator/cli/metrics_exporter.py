@@ -0,0 +1,424 @@
+"""Local OpenMetrics endpoint for monitoring long-running migrations.
+
+``migrate --metrics_port PORT`` starts a :class:`MetricsExporter` that
+subscribes to the run's :class:`ProgressTracker` and serves
+``http://127.0.0.1:PORT/metrics`` in the OpenMetrics text format, so
+Prometheus (or anything that speaks its exposition format) can scrape
+throughput, 429s, the channels in progress and an ETA while the migration
+runs unattended.
+
+Metrics exposed (all prefixed ``slack_migrator_``):
+
+* ``messages_total``, ``messages_failed_total``, ``reactions_total``,
+  ``files_total``, ``uploaded_bytes_total``, ``spaces_total``,
+  ``members_total``, ``channels_completed_total`` — counters.
+* ``messages_per_second``, ``reactions_per_second``, ``files_per_second`` —
+  throughput over the last ``METRICS_RATE_WINDOW_SECONDS``.
+* ``channels``, ``eta_seconds``, ``rate_limited_ratio`` — gauges.
+* ``current_channel_info``, ``phase_info`` — info metrics.
+* ``api_calls_total``, ``api_errors_total``, ``api_retries_total``,
+  ``api_rate_limited_total``, ``api_latency_seconds`` — per endpoint, from
+  :func:`~slack_chat_migrator.utils.metrics.get_api_metrics`.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+
+from slack_chat_migrator.constants import (
+    METRICS_EXPORTER_HOST,
+    METRICS_RATE_WINDOW_SECONDS,
+)
+from slack_chat_migrator.core.progress import EventType, ProgressEvent, ProgressTracker
+from slack_chat_migrator.utils.logging import log_with_context
+from slack_chat_migrator.utils.metrics import MetricsRegistry, get_api_metrics
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+METRIC_PREFIX = "slack_migrator_"
+
+
+class RateWindow:
+    """Event counts in one-second buckets over a sliding window."""
+
+    def __init__(self, window_seconds: int = METRICS_RATE_WINDOW_SECONDS) -> None:
+        self._window = window_seconds
+        self._seconds = [-1] * window_seconds
+        self._counts = [0] * window_seconds
+
+    def add(self, now: float, amount: int = 1) -> None:
+        """Count *amount* events at time *now*."""
+        second = int(now)
+        slot = second % self._window
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = 0
+        self._counts[slot] += amount
+
+    def rate(self, now: float, elapsed: float) -> float:
+        """Return events per second over the window ending at *now*.
+
+        Args:
+            now: Current time.
+            elapsed: Seconds since counting began; a run younger than the
+                window is averaged over its own age instead.
+        """
+        current = int(now)
+        total = sum(
+            count
+            for second, count in zip(self._seconds, self._counts)
+            if 0 <= current - second < self._window
+        )
+        span = min(float(self._window), elapsed)
+        return total / span if span > 0 else 0.0
+
+
+class ProgressStats:
+    """Aggregates :class:`ProgressEvent` objects for the exporter.
+
+    Events arrive on migration worker threads and are read on the HTTP
+    server's threads, so every access goes through one lock.
+    """
+
+    def __init__(
+        self,
+        total_channels: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.start_time = clock()
+        self.total_channels = total_channels
+        self.counters: dict[str, int] = dict.fromkeys(
+            (
+                "messages",
+                "messages_failed",
+                "reactions",
+                "files",
+                "uploaded_bytes",
+                "spaces",
+                "members",
+                "channels_completed",
+            ),
+            0,
+        )
+        self.rates = {
+            "messages": RateWindow(),
+            "reactions": RateWindow(),
+            "files": RateWindow(),
+        }
+        self.phase = "Initializing"
+        # Channel -> (messages done, messages expected) while it is running
+        self.active_channels: dict[str, tuple[int, int]] = {}
+
+    def handle_event(self, event: ProgressEvent) -> None:
+        """Fold one progress event into the counters."""
+        with self._lock:
+            self._apply(event)
+
+    def _apply(self, event: ProgressEvent) -> None:
+        kind = event.event_type
+        now = self._clock()
+        if kind == EventType.MESSAGE_SENT:
+            self._count("messages", now)
+            if event.channel and event.total:
+                self.active_channels[event.channel] = (event.count or 0, event.total)
+        elif kind == EventType.MESSAGE_FAILED:
+            self.counters["messages_failed"] += 1
+        elif kind == EventType.REACTION_ADDED:
+            self._count("reactions", now)
+        elif kind == EventType.FILE_UPLOADED:
+            self._count("files", now)
+            self.counters["uploaded_bytes"] += event.size_bytes or 0
+        elif kind == EventType.SPACE_CREATED:
+            self.counters["spaces"] += 1
+        elif kind == EventType.MEMBER_ADDED:
+            self.counters["members"] += 1
+        elif kind == EventType.CHANNEL_START and event.channel:
+            self.active_channels[event.channel] = (0, event.total or 0)
+        elif kind == EventType.MESSAGE_PHASE_START and event.channel:
+            self.active_channels[event.channel] = (0, event.total or 0)
+        elif kind == EventType.CHANNEL_COMPLETE:
+            self.counters["channels_completed"] += 1
+            self.active_channels.pop(event.channel or "", None)
+        elif kind == EventType.PHASE_CHANGE:
+            self.phase = event.detail or "Unknown"
+
+    def _count(self, name: str, now: float) -> None:
+        self.counters[name] += 1
+        self.rates[name].add(now)
+
+    def eta_seconds(self) -> float | None:
+        """Estimate the seconds left from the fraction of channels done.
+
+        Channels in progress count fractionally by their sent messages.
+
+        Returns:
+            Seconds remaining, or ``None`` when the channel total is unknown
+            or nothing has finished yet.
+        """
+        with self._lock:
+            if not self.total_channels:
+                return None
+            done = float(self.counters["channels_completed"])
+            for sent, total in self.active_channels.values():
+                if total:
+                    done += min(sent / total, 1.0)
+            elapsed = self._clock() - self.start_time
+        fraction = min(done / self.total_channels, 1.0)
+        if fraction <= 0:
+            return None
+        return elapsed / fraction - elapsed
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a consistent copy of every value the exporter renders."""
+        eta = self.eta_seconds()
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self.start_time
+            return {
+                "counters": dict(self.counters),
+                "rates": {
+                    name: window.rate(now, elapsed)
+                    for name, window in self.rates.items()
+                },
+                "total_channels": self.total_channels,
+                "active_channels": sorted(self.active_channels),
+                "phase": self.phase,
+                "eta_seconds": eta,
+                "elapsed_seconds": elapsed,
+            }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(value)
+    return repr(round(value, 6))
+
+
+class _Writer:
+    """Accumulates OpenMetrics metric families."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        self.lines.append(f"# TYPE {METRIC_PREFIX}{name} {kind}")
+        self.lines.append(f"# HELP {METRIC_PREFIX}{name} {help_text}")
+
+    def sample(
+        self, name: str, value: float, labels: dict[str, str] | None = None
+    ) -> None:
+        label_text = ""
+        if labels:
+            label_text = (
+                "{"
+                + ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+                + "}"
+            )
+        self.lines.append(f"{METRIC_PREFIX}{name}{label_text} {_format_value(value)}")
+
+
+_COUNTER_HELP = {
+    "messages": "Messages sent.",
+    "messages_failed": "Messages that failed to send.",
+    "reactions": "Reactions added.",
+    "files": "Files attached to sent messages.",
+    "uploaded_bytes": "Bytes of files attached to sent messages.",
+    "spaces": "Chat spaces created.",
+    "members": "Space memberships added.",
+    "channels_completed": "Channels finished.",
+}
+
+
+def _render_progress(out: _Writer, stats: dict[str, Any]) -> None:
+    for name, value in stats["counters"].items():
+        out.family(name, "counter", _COUNTER_HELP[name])
+        out.sample(f"{name}_total", value)
+
+    for name, rate in stats["rates"].items():
+        out.family(
+            f"{name}_per_second",
+            "gauge",
+            f"{name.capitalize()} per second over the last "
+            f"{METRICS_RATE_WINDOW_SECONDS}s.",
+        )
+        out.sample(f"{name}_per_second", rate)
+
+    out.family("channels", "gauge", "Channels selected for migration.")
+    out.sample("channels", stats["total_channels"])
+    out.family("elapsed_seconds", "gauge", "Seconds since the migration started.")
+    out.sample("elapsed_seconds", stats["elapsed_seconds"])
+    out.family("eta_seconds", "gauge", "Estimated seconds until all channels finish.")
+    if stats["eta_seconds"] is not None:
+        out.sample("eta_seconds", stats["eta_seconds"])
+
+    out.family("current_channel", "info", "Channels being migrated right now.")
+    for channel in stats["active_channels"]:
+        out.sample("current_channel_info", 1, {"channel": channel})
+    out.family("phase", "info", "Current migration phase.")
+    out.sample("phase_info", 1, {"phase": stats["phase"]})
+
+
+def _render_api(out: _Writer, registry: MetricsRegistry) -> None:
+    endpoints = sorted(registry.snapshot().items())
+    totals = registry.totals()
+
+    out.family(
+        "rate_limited_ratio", "gauge", "Fraction of API calls that received a 429."
+    )
+    out.sample(
+        "rate_limited_ratio",
+        totals.rate_limited / totals.calls if totals.calls else 0.0,
+    )
+
+    for name, help_text, attr in (
+        ("api_calls", "Google API calls, retries included.", "calls"),
+        ("api_retries", "Google API retry attempts.", "retries"),
+        ("api_rate_limited", "Google API 429 responses.", "rate_limited"),
+    ):
+        out.family(name, "counter", help_text)
+        for endpoint, metrics in endpoints:
+            out.sample(f"{name}_total", getattr(metrics, attr), {"endpoint": endpoint})
+
+    out.family("api_errors", "counter", "Google API calls that ultimately failed.")
+    for endpoint, metrics in endpoints:
+        for error, count in sorted(metrics.errors.items()):
+            out.sample(
+                "api_errors_total", count, {"endpoint": endpoint, "error": error}
+            )
+
+    out.family("api_latency_seconds", "histogram", "Google API call latency.")
+    for endpoint, metrics in endpoints:
+        cumulative = 0
+        for bound, count in zip(metrics.bucket_bounds, metrics.bucket_counts):
+            cumulative += count
+            out.sample(
+                "api_latency_seconds_bucket",
+                cumulative,
+                {"endpoint": endpoint, "le": repr(bound / 1000)},
+            )
+        out.sample(
+            "api_latency_seconds_bucket",
+            metrics.calls,
+            {"endpoint": endpoint, "le": "+Inf"},
+        )
+        out.sample(
+            "api_latency_seconds_sum",
+            metrics.latency_ms_total / 1000,
+            {"endpoint": endpoint},
+        )
+        out.sample("api_latency_seconds_count", metrics.calls, {"endpoint": endpoint})
+
+
+def render_openmetrics(stats: ProgressStats, registry: MetricsRegistry) -> str:
+    """Render progress and API metrics in the OpenMetrics text format.
+
+    Args:
+        stats: Aggregated progress events.
+        registry: Per-endpoint API metrics.
+
+    Returns:
+        The exposition text, terminated by ``# EOF``.
+    """
+    out = _Writer()
+    _render_progress(out, stats.snapshot())
+    _render_api(out, registry)
+    out.lines.append("# EOF")
+    return "\n".join(out.lines) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serves ``/metrics``; everything else is a 404."""
+
+    exporter: MetricsExporter
+
+    def do_GET(self) -> None:
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.exporter.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # Keep scrapes out of the console; they are only of interest in the
+        # debug log.
+        log_with_context(logging.DEBUG, "Metrics request: " + format, *args)
+
+
+class MetricsExporter:
+    """Serves migration progress and API metrics over HTTP.
+
+    Example::
+
+        exporter = MetricsExporter(tracker, port=9464, total_channels=47)
+        exporter.start()
+        try:
+            migrator.migrate(progress_tracker=tracker)
+        finally:
+            exporter.stop()
+    """
+
+    def __init__(
+        self,
+        tracker: ProgressTracker,
+        port: int,
+        host: str = METRICS_EXPORTER_HOST,
+        total_channels: int = 0,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self.stats = ProgressStats(total_channels=total_channels)
+        self._metrics = metrics
+        self._host = host
+        self._port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+        tracker.subscribe(self.stats.handle_event)
+
+    @property
+    def url(self) -> str:
+        """The metrics URL, using the bound port once started."""
+        port = self._server.server_address[1] if self._server else self._port
+        return f"http://{self._host}:{port}/metrics"
+
+    def render(self) -> str:
+        """Return the current metrics as OpenMetrics text."""
+        return render_openmetrics(self.stats, self._metrics or get_api_metrics())
+
+    def start(self) -> None:
+        """Bind the port and serve requests on a daemon thread.
+
+        Raises:
+            OSError: If the port cannot be bound.
+        """
+        handler = type("MetricsHandler", (_MetricsHandler,), {"exporter": self})
+        self._server = ThreadingHTTPServer((self._host, self._port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="metrics-exporter",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
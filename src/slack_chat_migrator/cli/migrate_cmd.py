@@ -21,6 +21,7 @@ from slack_chat_migrator.cli.common import (
     handle_exception,
     show_security_warning,
 )
+from slack_chat_migrator.cli.metrics_exporter import MetricsExporter
 from slack_chat_migrator.cli.report import (
     generate_report,
     print_dry_run_summary,
@@ -33,7 +34,9 @@ from slack_chat_migrator.exceptions import (
     ConfigError,
     PermissionCheckError,
 )
+from slack_chat_migrator.utils.events import start_event_stream, stop_event_stream
 from slack_chat_migrator.utils.logging import log_with_context, setup_logger
+from slack_chat_migrator.utils.metrics import dump_api_metrics
 from slack_chat_migrator.utils.permissions import validate_permissions
 
 # Create logger instance
@@ -77,6 +80,34 @@ logger = logging.getLogger("slack_chat_migrator")
     default=False,
     help="Skip permission checks (not recommended)",
 )
+@click.option(
+    "--channel_workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of channels to migrate concurrently",
+)
+@click.option(
+    "--low_memory",
+    is_flag=True,
+    default=False,
+    help="With --dry_run, keep only counters and a sample of payloads "
+    "so very large exports run in flat memory",
+)
+@click.option(
+    "--event_log",
+    is_flag=True,
+    default=False,
+    help="Write a JSONL record per API call, message, reaction and file "
+    "to events.jsonl in the run's output directory",
+)
+@click.option(
+    "--metrics_port",
+    type=click.IntRange(min=1, max=65535),
+    default=None,
+    help="Serve progress and API metrics in OpenMetrics format at "
+    "http://127.0.0.1:PORT/metrics while the migration runs",
+)
 def migrate(
     creds_path: str | None,
     export_path: str,
@@ -88,6 +119,10 @@ def migrate(
     resume: bool,
     complete: bool,
     skip_permission_check: bool,
+    channel_workers: int,
+    low_memory: bool,
+    event_log: bool,
+    metrics_port: int | None,
 ) -> None:
     """Run the full Slack-to-Google-Chat migration.
 
@@ -102,7 +137,14 @@ def migrate(
         resume: Resume a previous migration (reuse existing spaces).
         complete: Complete import mode on all spaces without migrating.
         skip_permission_check: Skip permission checks before migration.
+        channel_workers: Number of channels to migrate concurrently.
+        low_memory: Bound dry-run memory use (requires *dry_run*).
+        event_log: Write the structured event stream for this run.
+        metrics_port: Local port for the OpenMetrics endpoint, if any.
     """
+    if low_memory and not dry_run:
+        raise click.UsageError("--low_memory requires --dry_run")
+
     if complete:
         _run_complete_mode(creds_path, workspace_admin, config, verbose, debug_api)
         return
@@ -117,6 +159,9 @@ def migrate(
         dry_run=dry_run,
         update_mode=resume,
         skip_permission_check=skip_permission_check,
+        channel_workers=channel_workers,
+        low_memory=low_memory,
+        metrics_port=metrics_port,
     )
 
     # Create output directory early so all operations are logged to file
@@ -126,6 +171,9 @@ def migrate(
     # Suppress "Main log file created" from console on TTY (still goes to file)
     with _quiet_console() if sys.stdout.isatty() else contextlib.nullcontext():
         setup_logger(args.verbose, args.debug_api, output_dir)
+        if event_log:
+            events_path = start_event_stream(output_dir)
+            log_with_context(logging.INFO, f"Event log: {events_path}")
 
     # Show config panel (Rich on TTY, log lines otherwise)
     _print_config_panel(args, output_dir)
@@ -145,6 +193,9 @@ def migrate(
             sys.exit(1)
         finally:
             orchestrator.cleanup()
+            with _quiet_console() if sys.stdout.isatty() else contextlib.nullcontext():
+                dump_api_metrics(output_dir)
+            stop_event_stream()
             show_security_warning()
 
 
@@ -268,6 +319,8 @@ class MigrationOrchestrator:
             verbose=self.args.verbose,
             update_mode=self.args.update_mode,
             debug_api=self.args.debug_api,
+            channel_workers=getattr(self.args, "channel_workers", 1),
+            low_memory=getattr(self.args, "low_memory", False),
         )
 
         # Set output directory if we have one
@@ -614,6 +667,7 @@ class MigrationOrchestrator:
         renderer = create_renderer(
             tracker, total_channels=total_channels, dry_run=m.dry_run
         )
+        exporter = self._start_metrics_exporter(tracker, total_channels)
         renderer.start()
         try:
             m.migrate(progress_tracker=tracker)
@@ -621,8 +675,36 @@ class MigrationOrchestrator:
             renderer.stop()
             self._generate_partial_report(m, e)
             raise
+        finally:
+            if exporter is not None:
+                exporter.stop()
         renderer.stop()
 
+    def _start_metrics_exporter(
+        self, tracker: ProgressTracker, total_channels: int
+    ) -> MetricsExporter | None:
+        """Start the OpenMetrics endpoint if ``--metrics_port`` was given.
+
+        A port that cannot be bound is logged and the migration continues
+        without the endpoint.
+        """
+        port = getattr(self.args, "metrics_port", None)
+        if not port:
+            return None
+        exporter = MetricsExporter(tracker, port, total_channels=total_channels)
+        try:
+            exporter.start()
+        except OSError as e:
+            log_with_context(
+                logging.WARNING,
+                "Could not start metrics endpoint on port %s: %s",
+                port,
+                e,
+            )
+            return None
+        log_with_context(logging.INFO, "Serving metrics at %s", exporter.url)
+        return exporter
+
     @staticmethod
     def _generate_partial_report(m: SlackToChatMigrator, exc: BaseException) -> None:
         """Generate a report after a failed or interrupted migration."""
@@ -834,6 +916,11 @@ def _print_config_panel(args: SimpleNamespace, output_dir: str) -> None:
         log_with_context(logging.INFO, f"- Resume mode: {args.update_mode}")
         log_with_context(logging.INFO, f"- Verbose logging: {args.verbose}")
         log_with_context(logging.INFO, f"- Debug API calls: {args.debug_api}")
+        log_with_context(
+            logging.INFO, f"- Channel workers: {getattr(args, 'channel_workers', 1)}"
+        )
+        if getattr(args, "low_memory", False):
+            log_with_context(logging.INFO, "- Low-memory dry run: True")
 
     if not is_tty:
         return
@@ -7,6 +7,7 @@ import time
 from typing import TextIO
 
 from slack_chat_migrator.core.progress import EventType, ProgressEvent, ProgressTracker
+from slack_chat_migrator.utils.metrics import MetricsRegistry, get_api_metrics
 
 
 class PlainProgressRenderer:
@@ -22,8 +23,10 @@ class PlainProgressRenderer:
         output: TextIO | None = None,
         interval: float = 5.0,
         dry_run: bool = False,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         self._tracker = tracker
+        self._metrics = metrics
         self._output = output or sys.stderr
         self._interval = interval
         self._dry_run = dry_run
@@ -104,8 +107,20 @@ class PlainProgressRenderer:
                 f"Files: {self._files_uploaded}, "
                 f"Errors: {self._messages_failed}, "
                 f"Channels: {self._channels_complete}"
+                f"{self._api_status()}"
             )
 
+    def _api_status(self) -> str:
+        """Summarize API latency and 429s for the status line."""
+        totals = (self._metrics or get_api_metrics()).totals()
+        if not totals.calls:
+            return ""
+        p95 = totals.percentile(0.95) or 0.0
+        return (
+            f", API: {totals.calls} calls (p95 {p95:.0f}ms, "
+            f"{totals.rate_limited} x 429)"
+        )
+
     def _print(self, message: str) -> None:
         """Write a timestamped line to the output stream."""
         elapsed = time.time() - self._start_time if self._start_time else 0
@@ -21,6 +21,7 @@ from slack_chat_migrator.core.progress import (
     ProgressEvent,
     ProgressTracker,
 )
+from slack_chat_migrator.utils.metrics import MetricsRegistry, get_api_metrics
 
 
 class RichProgressRenderer:
@@ -44,8 +45,10 @@ class RichProgressRenderer:
         console: Console | None = None,
         total_channels: int = 0,
         dry_run: bool = False,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         self._tracker = tracker
+        self._metrics = metrics
         self._console = console or Console()
         self._live: Live | None = None
         self._start_time: float = 0.0
@@ -165,7 +168,7 @@ class RichProgressRenderer:
         layout.split_column(
             Layout(self._build_header_panel(), name="header", size=3),
             Layout(self._build_progress_section(), name="progress", size=7),
-            Layout(self._build_stats_table(), name="stats", size=10),
+            Layout(self._build_stats_table(), name="stats", size=12),
         )
         return layout
 
@@ -249,9 +252,31 @@ class RichProgressRenderer:
                 "Channels complete",
                 f"{self._channels_complete}/{self._total_channels}",
             )
+        self._add_api_rows(table)
 
         return table
 
+    def _add_api_rows(self, table: Table) -> None:
+        """Add API latency and rate-limit rows from the metrics registry."""
+        metrics = self._metrics or get_api_metrics()
+        endpoints = metrics.snapshot()
+        if not endpoints:
+            return
+        totals = metrics.totals()
+        p95 = totals.percentile(0.95) or 0.0
+        table.add_row("API calls", f"{totals.calls:,} (p95 {p95:,.0f}ms)")
+        if totals.rate_limited:
+            table.add_row(
+                Text("Rate limited (429)", style="yellow"),
+                Text(
+                    f"{totals.rate_limited:,} ({totals.backoff_seconds:,.0f}s backoff)",
+                    style="yellow",
+                ),
+            )
+        name, slowest = max(endpoints.items(), key=lambda i: i[1].latency_ms_total)
+        slowest_p95 = slowest.percentile(0.95) or 0.0
+        table.add_row("Slowest endpoint", f"{name} (p95 {slowest_p95:,.0f}ms)")
+
     # ------------------------------------------------------------------
     # Per-event-type handlers
     # ------------------------------------------------------------------
@@ -219,7 +219,7 @@ def print_rich_summary(
         f"{summary['messages_created']:,} messages \u2022 "
         f"{summary['files_created']:,} files"
     )
-    failed_count = len(state.messages.failed_messages)
+    failed_count = state.messages.failed_message_count
     if failed_count > 0:
         summary_line += f" \u2022 [red]{failed_count} failed[/red]"
 
@@ -279,7 +279,7 @@ def _print_migration_summary_plain(
     print(f"Reactions migrated: {summary['reactions_created']:,}")
     print(f"Files migrated:     {summary['files_created']:,}")
 
-    failed_count = len(state.messages.failed_messages)
+    failed_count = state.messages.failed_message_count
     if failed_count > 0:
         print(f"Failed messages:    {failed_count}")
 
@@ -322,7 +322,7 @@ def _group_failed_messages(
 
     log_with_context(
         logging.WARNING,
-        f"Migration completed with {len(state.messages.failed_messages)} failed messages across {len(failed_by_channel)} channels",
+        f"Migration completed with {state.messages.failed_message_count} failed messages across {len(failed_by_channel)} channels",
     )
 
     for channel, failures in failed_by_channel.items():
@@ -428,9 +428,29 @@ def _build_recommendations(
             }
         )
 
+    failed_reactions = _count_failed_reactions(state)
+    if failed_reactions:
+        recommendations.append(
+            {
+                "type": "failed_reactions",
+                "message": f"Failed to add {failed_reactions} reactions. "
+                "See failed_reactions in this report for the affected messages.",
+                "severity": "warning",
+            }
+        )
+
     return recommendations
 
 
+def _count_failed_reactions(state: MigrationState) -> int:
+    """Return the number of reactions that could not be added."""
+    return sum(
+        len(errors)
+        for by_message in state.messages.failed_reactions_by_channel.values()
+        for errors in by_message.values()
+    )
+
+
 def _build_space_details(
     state: MigrationState,
     user_map: dict[str, str],
@@ -467,6 +487,12 @@ def _build_space_details(
             "internal_users": [],
             "external_users": [],
             "failed_messages": len(failed_by_channel.get(channel, [])),
+            "failed_reactions": sum(
+                len(errors)
+                for errors in state.messages.failed_reactions_by_channel.get(
+                    channel, {}
+                ).values()
+            ),
         }
 
         if channel in state.progress.active_users_by_channel:
@@ -615,8 +641,9 @@ def generate_report(
             "messages_migrated": state.progress.migration_summary["messages_created"],
             "reactions_migrated": state.progress.migration_summary["reactions_created"],
             "files_migrated": state.progress.migration_summary["files_created"],
-            "failed_messages_count": len(state.messages.failed_messages),
+            "failed_messages_count": state.messages.failed_message_count,
             "channels_with_failures": len(failed_by_channel),
+            "failed_reactions_count": _count_failed_reactions(state),
         },
         "spaces": spaces,
         "skipped_channels": skipped_channels,
@@ -627,6 +654,7 @@ def generate_report(
         "users": users_section,
         "file_upload_details": file_stats,
         "skipped_reactions": list(state.users.skipped_reactions),
+        "failed_reactions": state.messages.failed_reactions_by_channel,
         "recommendations": recommendations,
     }
 
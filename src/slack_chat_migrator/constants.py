@@ -23,6 +23,15 @@ DIRECT_UPLOAD_MAX_BYTES = 25 * 1024 * 1024  # 25 MB
 RESUMABLE_UPLOAD_THRESHOLD_BYTES = 5 * 1024 * 1024  # 5 MB
 MAX_FILE_SIZE_BYTES = 200 * 1024 * 1024  # 200 MB (Drive API limit)
 FILE_READ_CHUNK_BYTES = 4096
+DOWNLOAD_CHUNK_BYTES = 1024 * 1024  # 1 MB per streamed read
+
+# --- Attachment Prefetch ---
+PREFETCH_WORKERS = 4
+PREFETCH_LOOKAHEAD_MESSAGES = 50
+PREFETCH_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 512 MB staged on disk
+
+# --- Attachment Store ---
+ATTACHMENT_STORE_VERIFY_SAMPLE = 20  # stored uploads re-checked in Drive per run
 
 # --- API Pagination ---
 SPACES_PAGE_SIZE = 100
@@ -54,10 +63,53 @@ ERROR_DETAIL_MAX_LENGTH = 500
 URL_TRUNCATION_LENGTH = 100
 ID_HASH_LENGTH = 8
 
+# --- Log File Writing ---
+LOG_FLUSH_INTERVAL_SECONDS = 1.0  # max delay before buffered log lines hit disk
+LOG_WRITE_BUFFER_BYTES = 64 * 1024  # per log file; a full buffer is written out
+LOG_DRAIN_TIMEOUT_SECONDS = 10.0
+CHANNEL_LOG_MAX_OPEN_FILES = 32  # idle channel logs beyond this are closed
+
 # --- Error Patterns ---
 PERMISSION_DENIED_ERROR = "PERMISSION_DENIED"
 
-# --- API Throttle Delays (seconds) ---
-API_THROTTLE_MESSAGE_SECONDS = 0.05
-API_THROTTLE_MEMBER_SECONDS = 0.1
-API_THROTTLE_DISCOVERY_SECONDS = 0.2
+# --- Reaction Batching ---
+REACTION_BATCH_MAX_SIZE = 100  # Google batch endpoints accept up to 100 calls
+REACTION_BATCH_FLUSH_SECONDS = 5.0
+
+# --- API Metrics ---
+# Upper bounds (ms) of the per-endpoint latency histogram buckets; slower
+# calls land in a final overflow bucket.
+API_LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+API_METRICS_FILENAME = "api_metrics.json"
+
+# --- Metrics Exporter ---
+METRICS_EXPORTER_HOST = "127.0.0.1"  # local scrapes only
+METRICS_RATE_WINDOW_SECONDS = 60  # window for the per-second throughput gauges
+
+# --- HTTP Transport ---
+HTTP_POOL_CONNECTIONS = 8  # hosts with a pool (chat, drive, oauth2, ...)
+HTTP_POOL_MAXSIZE = 64  # keep-alive connections kept per host
+HTTP_TIMEOUT_SECONDS = 60.0
+
+# --- Delegate Warm-up ---
+DELEGATE_WARMUP_WORKERS = 16  # impersonation checks run concurrently
+DELEGATE_TOKEN_REFRESH_MARGIN_SECONDS = 300  # refresh tokens this close to expiry
+
+# --- Simulated Backend ---
+SIMULATED_BACKEND_HOST = "127.0.0.1"
+SIMULATED_BATCH_MAX_PARTS = 100  # Google's limit on requests per batch
+
+# --- Dry Run ---
+DRY_RUN_CAPTURE_LIMIT = 10_000  # most recent message calls kept by the dry run
+DRY_RUN_SAMPLE_SIZE = 100  # payloads and failures sampled by --low_memory runs
+
+# --- Startup ---
+STARTUP_SCAN_WORKERS = 16  # channel directories checked concurrently at startup
+
+# --- API Rate Limiting (requests per second) ---
+RATE_LIMIT_USER_PER_SECOND = 20.0  # per impersonated user, per API
+RATE_LIMIT_API_PER_SECOND = 50.0  # shared by all users of one API
+RATE_LIMIT_BURST = 10
+RATE_LIMIT_MIN_PER_SECOND = 0.5
+RATE_LIMIT_BACKOFF_FACTOR = 0.5
+RATE_LIMIT_RECOVERY_STEP = 0.5
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import logging
-import time
 import traceback
+from collections import deque
+from collections.abc import Iterable, Iterator
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, NamedTuple
 
@@ -23,12 +24,18 @@ if TYPE_CHECKING:
 from google.auth.exceptions import RefreshError, TransportError
 from googleapiclient.errors import HttpError
 
-from slack_chat_migrator.constants import API_THROTTLE_MESSAGE_SECONDS
+from slack_chat_migrator.constants import PREFETCH_LOOKAHEAD_MESSAGES
 from slack_chat_migrator.core.config import (
     ImportCompletionStrategy,
     should_process_channel,
 )
+from slack_chat_migrator.core.processed_index import (
+    ProcessedIndex,
+    processed_index_path,
+)
 from slack_chat_migrator.exceptions import SpacePermissionError
+from slack_chat_migrator.services.export_catalog import channel_summary
+from slack_chat_migrator.services.messages.message_attachments import message_files
 from slack_chat_migrator.services.messages.message_builder import (
     build_user_map_with_overrides,
 )
@@ -36,11 +43,16 @@ from slack_chat_migrator.services.messages.message_sender import (
     send_message,
     track_message_stats,
 )
+from slack_chat_migrator.services.messages.message_stream import ChannelMessageStream
+from slack_chat_migrator.services.messages.reaction_processor import (
+    ReactionAccumulator,
+)
 from slack_chat_migrator.services.spaces.discovery import get_last_message_timestamp
 from slack_chat_migrator.services.spaces.historical_membership import add_users_to_space
 from slack_chat_migrator.services.spaces.regular_membership import add_regular_members
 from slack_chat_migrator.services.spaces.space_creator import create_space
-from slack_chat_migrator.types import MessageResult
+from slack_chat_migrator.types import MessageResult, SendResult
+from slack_chat_migrator.utils.events import timed_event
 from slack_chat_migrator.utils.logging import (
     is_debug_api_enabled,
     log_with_context,
@@ -55,6 +67,25 @@ class ChannelResult(NamedTuple):
     had_errors: bool
 
 
+def _message_event_fields(
+    message: dict[str, Any], result: SendResult
+) -> dict[str, Any]:
+    """Return the event-stream fields describing one send attempt."""
+    fields: dict[str, Any] = {
+        "bytes": len((message.get("text") or "").encode("utf-8")),
+        "files": len(message_files(message)),
+    }
+    if result.success:
+        fields["status"] = "sent"
+    elif result.skipped is not None:
+        fields["status"] = "skipped"
+        fields["reason"] = result.skipped.value
+    else:
+        fields["status"] = "failed"
+        fields["error_code"] = result.error_code
+    return fields
+
+
 class ChannelProcessor:
     """Handles per-channel processing during migration."""
 
@@ -80,7 +111,8 @@ class ChannelProcessor:
         """Process a single channel directory.
 
         Creates or reuses a space, imports messages, completes import mode,
-        and adds members.
+        and adds members.  In low-memory mode the channel's per-message
+        state is released on return.
 
         Args:
             ch_dir: Path to the channel's export directory.
@@ -88,6 +120,14 @@ class ChannelProcessor:
         Returns:
             ChannelResult with should_abort and had_errors fields.
         """
+        try:
+            return self._process_channel(ch_dir)
+        finally:
+            if self.ctx.low_memory:
+                self.state.release_channel(ch_dir.name)
+
+    def _process_channel(self, ch_dir: Path) -> ChannelResult:
+        """Run every step of :meth:`process_channel` for *ch_dir*."""
         channel = ch_dir.name
 
         self.state.context.current_channel = channel
@@ -107,7 +147,7 @@ class ChannelProcessor:
             )
             return ChannelResult(should_abort=False, had_errors=False)
 
-        self.state.progress.migration_summary["channels_processed"].append(channel)
+        self.state.record_channel_processed(channel)
 
         # Check for unresolved space conflicts
         if channel in self.state.errors.channel_conflicts:
@@ -151,7 +191,9 @@ class ChannelProcessor:
 
         log_with_context(
             logging.DEBUG,
-            f"Setting current space to {space} for channel {channel} and storing in channel_to_space mapping",
+            "Setting current space to %s for channel %s and storing in channel_to_space mapping",
+            space,
+            channel,
             channel=channel,
         )
 
@@ -212,7 +254,8 @@ class ChannelProcessor:
         # Log completion
         log_with_context(
             logging.DEBUG,
-            f"Channel log file completed for channel: {channel}",
+            "Channel log file completed for channel: %s",
+            channel,
             channel=channel,
         )
 
@@ -304,11 +347,10 @@ class ChannelProcessor:
             channel=channel,
         )
 
-        msgs = self._load_and_sort_messages(channel)
-        msgs = self._deduplicate_messages(msgs, channel)
+        msgs = ChannelMessageStream(self.ctx.export_root / channel, channel)
 
         # Emit message phase start so renderers can create a progress bar
-        message_count = sum(1 for m in msgs if m.get("type") == "message")
+        message_count = channel_summary(self.ctx, channel).unique_message_count
         if self.progress_tracker and message_count > 0:
             self.progress_tracker.message_phase_start(channel, total=message_count)
 
@@ -328,8 +370,18 @@ class ChannelProcessor:
         # Build user map with overrides once per channel.
         cached_user_map = build_user_map_with_overrides(self.ctx, self.user_resolver)
 
+        # Validate every author's impersonation before the first send, so
+        # the loop never stalls on a new author.
+        if not self.ctx.dry_run:
+            self._warm_up_delegates(channel, cached_user_map)
+
         processed_count, failed_count, channel_had_errors = self._send_messages_loop(
-            msgs, space, channel, channel_had_errors, cached_user_map
+            msgs,
+            space,
+            channel,
+            channel_had_errors,
+            cached_user_map,
+            total_sendable=message_count,
         )
 
         log_with_context(
@@ -340,133 +392,119 @@ class ChannelProcessor:
 
         return processed_count, failed_count, channel_had_errors
 
-    def _load_and_sort_messages(self, channel: str) -> list[dict[str, Any]]:
-        """Load all messages from JSON files and sort by timestamp."""
-        msg_dir = self.ctx.export_root / channel
-        msgs: list[dict[str, Any]] = []
-        for jf in sorted(msg_dir.glob("*.json")):
-            try:
-                with open(jf, encoding="utf-8") as f:
-                    msgs.extend(json.load(f))
-            except (OSError, ValueError) as e:
-                log_with_context(
-                    logging.WARNING,
-                    f"Failed to load messages from {jf}: {e}",
-                    channel=channel,
-                )
-
-        return sorted(msgs, key=lambda m: float(m.get("ts", "0")))
-
-    def _deduplicate_messages(
-        self, msgs: list[dict[str, Any]], channel: str
-    ) -> list[dict[str, Any]]:
-        """Remove duplicate messages based on timestamp."""
-        seen_timestamps: set[str] = set()
-        deduped: list[dict[str, Any]] = []
-        duplicate_count = 0
-
-        for msg in msgs:
-            ts = msg.get("ts")
-            if ts and ts not in seen_timestamps:
-                seen_timestamps.add(ts)
-                deduped.append(msg)
-            elif ts:
-                duplicate_count += 1
-                log_with_context(
-                    logging.DEBUG,
-                    f"Skipping duplicate message with timestamp {ts}",
-                    channel=channel,
-                    ts=ts,
-                )
-
-        if duplicate_count > 0:
-            log_with_context(
-                logging.INFO,
-                f"Deduplicated {duplicate_count} messages in channel {channel} (likely thread reply duplicates)",
-                channel=channel,
-            )
-
-        return deduped
+    def _warm_up_delegates(self, channel: str, user_map: dict[str, str]) -> None:
+        """Validate impersonation for the channel's senders and reactors."""
+        summary = channel_summary(self.ctx, channel)
+        emails = {
+            user_map[user_id]
+            for user_id in (*summary.users, *summary.reactors)
+            if user_id in user_map
+        }
+        if not emails:
+            return
+        with timed_event("delegate_warmup", channel=channel, users=len(emails)):
+            self.user_resolver.warm_up_delegates(emails)
 
     def _send_messages_loop(
         self,
-        msgs: list[dict[str, Any]],
+        msgs: Iterable[dict[str, Any]],
         space: str,
         channel: str,
         channel_had_errors: bool,
         user_map_with_overrides: dict[str, str] | None = None,
+        total_sendable: int | None = None,
     ) -> tuple[int, int, bool]:
         """Iterate over messages, sending each and tracking results.
 
+        *msgs* is consumed once, so it may be a stream.  Pass
+        *total_sendable* when it is; otherwise it is counted from *msgs*.
+
         Returns (processed_count, failed_count, channel_had_errors).
         """
-        processed_ts: list[str] = []
         processed_count = 0
         failed_count = 0
         max_failure_percentage = self.ctx.config.max_failure_percentage
         channel_failures: list[str] = []
-        total_sendable = sum(1 for m in msgs if m.get("type") == "message")
+        if total_sendable is None:
+            msgs = list(msgs)
+            total_sendable = sum(1 for m in msgs if m.get("type") == "message")
+
+        reactions = ReactionAccumulator(
+            self.state,
+            on_added=partial(self.progress_tracker.reaction_added, channel)
+            if self.progress_tracker
+            else None,
+        )
+        with self._open_processed_index(channel, space) as processed:
+            for m in self._prefetch_ahead(msgs, channel, processed):
+                # Messages without reactions never reach add(), so check the
+                # flush interval here as well.
+                reactions.flush_due()
 
-        for m in msgs:
-            if m.get("type") != "message":
-                continue
+                if m.get("type") != "message":
+                    continue
 
-            ts = m["ts"]
+                ts = m["ts"]
 
-            if ts in processed_ts:
-                processed_count += 1
-                continue
+                if ts in processed:
+                    processed_count += 1
+                    continue
 
-            track_message_stats(
-                self.ctx,
-                self.state,
-                self.user_resolver,
-                self.attachment_processor,
-                m,
-            )
-
-            result = send_message(
-                self.ctx,
-                self.state,
-                self.chat,
-                self.user_resolver,
-                self.attachment_processor,
-                space,
-                m,
-                user_map_with_overrides=user_map_with_overrides,
-            )
+                track_message_stats(
+                    self.ctx,
+                    self.state,
+                    self.user_resolver,
+                    self.attachment_processor,
+                    m,
+                )
 
-            if result.failed:
-                failed_count += 1
-                channel_failures.append(ts)
-                if self.progress_tracker:
-                    self.progress_tracker.message_failed(channel, detail=result.error)
-
-                if processed_count > 0:
-                    failure_percentage = (
-                        failed_count / (processed_count + failed_count)
-                    ) * 100
-                    if failure_percentage > max_failure_percentage:
-                        log_with_context(
-                            logging.WARNING,
-                            f"Failure rate {failure_percentage:.1f}% exceeds threshold {max_failure_percentage}% for channel {channel}",
-                            channel=channel,
+                with timed_event("message", channel=channel, ts=ts) as event:
+                    result = send_message(
+                        self.ctx,
+                        self.state,
+                        self.chat,
+                        self.user_resolver,
+                        self.attachment_processor,
+                        space,
+                        m,
+                        user_map_with_overrides=user_map_with_overrides,
+                        reaction_accumulator=reactions,
+                    )
+                    if event.enabled:
+                        event.update(**_message_event_fields(m, result))
+
+                if result.failed:
+                    failed_count += 1
+                    channel_failures.append(ts)
+                    if self.progress_tracker:
+                        self.progress_tracker.message_failed(
+                            channel, detail=result.error
                         )
-                        channel_had_errors = True
-                        self.state.errors.high_failure_rate_channels[channel] = (
-                            failure_percentage
+
+                    if processed_count > 0:
+                        failure_percentage = (
+                            failed_count / (processed_count + failed_count)
+                        ) * 100
+                        if failure_percentage > max_failure_percentage:
+                            log_with_context(
+                                logging.WARNING,
+                                f"Failure rate {failure_percentage:.1f}% exceeds threshold {max_failure_percentage}% for channel {channel}",
+                                channel=channel,
+                            )
+                            channel_had_errors = True
+                            self.state.errors.high_failure_rate_channels[channel] = (
+                                failure_percentage
+                            )
+                elif result.skipped != MessageResult.SKIPPED:
+                    processed.add(ts)
+                    processed_count += 1
+                    if self.progress_tracker:
+                        self.progress_tracker.message_sent(
+                            channel, count=processed_count, total=total_sendable
                         )
-            elif result.skipped != MessageResult.SKIPPED:
-                processed_ts.append(ts)
-                processed_count += 1
-                if self.progress_tracker:
-                    self.progress_tracker.message_sent(
-                        channel, count=processed_count, total=total_sendable
-                    )
 
-            time.sleep(
-                API_THROTTLE_MESSAGE_SECONDS
-            )  # Throttle to avoid Chat API rate limits
+        # Reactions must land before import mode is completed for the space.
+        reactions.flush()
 
         if channel_failures:
             self.state.messages.failed_messages_by_channel[channel] = channel_failures
@@ -474,6 +512,59 @@ class ChannelProcessor:
 
         return processed_count, failed_count, channel_had_errors
 
+    def _prefetch_ahead(
+        self,
+        msgs: Iterable[dict[str, Any]],
+        channel: str,
+        processed: ProcessedIndex,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield *msgs* unchanged while prefetching attachments ahead of them.
+
+        Messages are held back in a window of ``PREFETCH_LOOKAHEAD_MESSAGES``
+        so their files are downloading in the background by the time they
+        reach :func:`send_message`.  Files still staged when the generator
+        is closed (e.g. belonging to skipped messages) are discarded.
+        """
+        file_handler = self.file_handler
+        prefetcher = file_handler.prefetcher if file_handler else None
+        if file_handler is None or prefetcher is None or self.ctx.dry_run:
+            yield from msgs
+            return
+
+        window: deque[dict[str, Any]] = deque()
+        try:
+            for m in msgs:
+                if m.get("type") == "message" and m.get("ts") not in processed:
+                    for file_obj in message_files(m):
+                        if not file_handler.is_known_attachment(file_obj.get("id", "")):
+                            prefetcher.prefetch(file_obj, channel)
+                window.append(m)
+                if len(window) > PREFETCH_LOOKAHEAD_MESSAGES:
+                    yield window.popleft()
+            yield from window
+        finally:
+            prefetcher.discard(channel)
+
+    def _open_processed_index(self, channel: str, space: str) -> ProcessedIndex:
+        """Load the persisted index of messages already sent to *space*.
+
+        Dry runs keep the index in memory only.
+        """
+        output_dir = self.state.context.output_dir
+        path = (
+            processed_index_path(output_dir, channel)
+            if output_dir and not self.ctx.dry_run
+            else None
+        )
+        processed = ProcessedIndex.load(path, space, compact=True)
+        if len(processed):
+            log_with_context(
+                logging.INFO,
+                f"Resuming channel {channel}: {len(processed)} messages already imported",
+                channel=channel,
+            )
+        return processed
+
     def _complete_import_mode(
         self, space: str, channel: str, channel_had_errors: bool
     ) -> bool:
@@ -498,7 +589,8 @@ class ChannelProcessor:
             try:
                 log_with_context(
                     logging.DEBUG,
-                    f"Attempting to complete import mode for space {space}",
+                    "Attempting to complete import mode for space %s",
+                    space,
                     channel=channel,
                 )
 
@@ -566,7 +658,9 @@ class ChannelProcessor:
                 )
                 log_with_context(
                     logging.DEBUG,
-                    f"Successfully updated current members for space {space} and channel {channel}",
+                    "Successfully updated current members for space %s and channel %s",
+                    space,
+                    channel,
                     channel=channel,
                 )
             except (HttpError, RefreshError, TransportError) as e:
@@ -577,7 +671,8 @@ class ChannelProcessor:
                 )
                 log_with_context(
                     logging.DEBUG,
-                    f"Exception traceback: {traceback.format_exc()}",
+                    "Exception traceback: %s",
+                    traceback.format_exc(),
                     channel=channel,
                 )
                 channel_had_errors = True
@@ -591,7 +686,8 @@ class ChannelProcessor:
                 )
                 log_with_context(
                     logging.DEBUG,
-                    f"Exception traceback: {traceback.format_exc()}",
+                    "Exception traceback: %s",
+                    traceback.format_exc(),
                     channel=channel,
                 )
                 channel_had_errors = True
@@ -671,7 +767,7 @@ class ChannelProcessor:
                 del self.state.spaces.created_spaces[channel]
 
             # Decrement space count
-            self.state.progress.migration_summary["spaces_created"] -= 1
+            self.state.increment_summary("spaces_created", -1)
         except (HttpError, RefreshError, TransportError) as e:
             log_with_context(
                 logging.ERROR,
@@ -21,6 +21,9 @@ class CheckpointData:
     completed_channels: dict[str, str] = field(
         default_factory=dict
     )  # channel_name -> ISO 8601 completion timestamp
+    in_progress_channels: dict[str, str] = field(
+        default_factory=dict
+    )  # channel_name -> ISO 8601 start timestamp (still running when saved)
     started_at: str | None = None
     last_updated: str | None = None
 
@@ -51,6 +54,7 @@ def load_checkpoint(path: Path) -> CheckpointData | None:
         return CheckpointData(
             schema_version=raw.get("schema_version", CHECKPOINT_SCHEMA_VERSION),
             completed_channels=raw.get("completed_channels", {}),
+            in_progress_channels=raw.get("in_progress_channels", {}),
             started_at=raw.get("started_at"),
             last_updated=raw.get("last_updated"),
         )
@@ -73,6 +77,22 @@ def save_checkpoint(path: Path, data: CheckpointData) -> None:
         log_with_context(logging.ERROR, f"Failed to write checkpoint {path}: {e}")
 
 
+def mark_channel_started(data: CheckpointData, channel: str) -> None:
+    """Record that *channel* has been handed to a worker."""
+    data.in_progress_channels[channel] = now_iso()
+
+
+def mark_channel_finished(data: CheckpointData, channel: str, completed: bool) -> None:
+    """Record that *channel* has finished, in whatever order workers complete.
+
+    The channel is always removed from ``in_progress_channels``; it is only
+    added to ``completed_channels`` when *completed* is True (no errors).
+    """
+    data.in_progress_channels.pop(channel, None)
+    if completed:
+        data.completed_channels[channel] = now_iso()
+
+
 def clear_checkpoint(path: Path) -> None:
     """Remove the checkpoint file after successful migration."""
     try:
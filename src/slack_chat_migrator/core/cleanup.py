@@ -23,7 +23,11 @@ from slack_chat_migrator.constants import (
     SPACES_PAGE_SIZE,
 )
 from slack_chat_migrator.services.spaces.regular_membership import add_regular_members
-from slack_chat_migrator.utils.logging import log_with_context
+from slack_chat_migrator.utils.logging import (
+    flush_logs,
+    log_with_context,
+    remove_log_handler,
+)
 
 if TYPE_CHECKING:
     from slack_chat_migrator.core.context import MigrationContext
@@ -42,13 +46,14 @@ def cleanup_channel_handlers(state: MigrationState) -> None:
     if not state.spaces.channel_handlers:
         return
 
-    logger = logging.getLogger("slack_chat_migrator")
+    # Write out records still queued for these channels before closing them
+    flush_logs()
 
     for channel_name, handler in list(state.spaces.channel_handlers.items()):
         try:
+            remove_log_handler(handler)
             handler.flush()
             handler.close()
-            logger.removeHandler(handler)
             log_with_context(
                 logging.DEBUG, f"Cleaned up log handler for channel: {channel_name}"
             )
@@ -10,11 +10,14 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from slack_chat_migrator.core.config import MigrationConfig
 from slack_chat_migrator.types import SlackChannel
 
+if TYPE_CHECKING:
+    from slack_chat_migrator.services.export_catalog import ExportCatalog
+
 
 @dataclass(frozen=True)
 class MigrationContext:
@@ -49,6 +52,13 @@ class MigrationContext:
     channel_id_to_name: dict[str, str]
     channel_name_to_id: dict[str, str]
 
+    # Per-channel message summaries, parsed once and shared by every subsystem
+    export_catalog: ExportCatalog | None = None
+
+    # Dry run keeps counters and payload samples only, and releases
+    # per-message state as each channel finishes
+    low_memory: bool = False
+
     @property
     def import_mode(self) -> bool:
         """True when running in import mode (the default, opposite of update mode)."""
@@ -4,21 +4,31 @@ Main migrator class for the Slack to Google Chat migration tool
 
 from __future__ import annotations
 
+import contextlib
+import contextvars
 import datetime
 import json
 import logging
 import os
 import signal
 import time
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Any
 
-from slack_chat_migrator.constants import SPACE_NAME_PREFIX
-from slack_chat_migrator.core.channel_processor import ChannelProcessor
+from slack_chat_migrator.constants import (
+    DRY_RUN_SAMPLE_SIZE,
+    SPACE_NAME_PREFIX,
+    STARTUP_SCAN_WORKERS,
+)
+from slack_chat_migrator.core.channel_processor import ChannelProcessor, ChannelResult
 from slack_chat_migrator.core.checkpoint import (
     CheckpointData,
     clear_checkpoint,
     load_checkpoint,
+    mark_channel_finished,
+    mark_channel_started,
     now_iso,
     save_checkpoint,
 )
@@ -35,7 +45,13 @@ from slack_chat_migrator.services.chat.dry_run_service import DryRunChatService
 from slack_chat_migrator.services.chat_adapter import ChatAdapter
 from slack_chat_migrator.services.drive.dry_run_service import DryRunDriveService
 from slack_chat_migrator.services.drive_adapter import DriveAdapter
+from slack_chat_migrator.services.export_catalog import ExportCatalog
+from slack_chat_migrator.services.files.attachment_store import (
+    AttachmentStore,
+    attachment_store_path,
+)
 from slack_chat_migrator.services.files.file import FileHandler
+from slack_chat_migrator.services.files.file_prefetch import AttachmentPrefetcher
 from slack_chat_migrator.services.messages.message_attachments import (
     MessageAttachmentProcessor,
 )
@@ -44,7 +60,7 @@ from slack_chat_migrator.services.spaces.discovery import (
     load_space_mappings,
     log_space_mapping_conflicts,
 )
-from slack_chat_migrator.services.user import generate_user_map
+from slack_chat_migrator.services.user import generate_user_map, load_users_json
 from slack_chat_migrator.services.user_resolver import UserResolver
 from slack_chat_migrator.utils.api import get_gcp_service
 from slack_chat_migrator.utils.logging import log_with_context
@@ -55,6 +71,11 @@ from slack_chat_migrator.utils.user_validation import (
 )
 
 
+def _has_json_files(directory: Path) -> bool:
+    """Return True if *directory* contains at least one ``*.json`` file."""
+    return next(directory.glob("*.json"), None) is not None
+
+
 class SlackToChatMigrator:
     """Main class for migrating Slack exports to Google Chat."""
 
@@ -68,10 +89,20 @@ class SlackToChatMigrator:
         verbose: bool = False,
         update_mode: bool = False,
         debug_api: bool = False,
+        channel_workers: int = 1,
         message_error_schedule: dict[int, int] | None = None,
+        low_memory: bool = False,
     ):
         """Initialize the migrator with the required parameters.
 
+        ``channel_workers`` is the number of channels migrated concurrently;
+        ``1`` (the default) processes channels one at a time.
+
+        ``low_memory`` (dry run only) keeps counters plus a fixed-size
+        sample of message payloads and failures instead of every one, and
+        releases each channel's per-message state when it finishes, so
+        memory stays flat however large the export is.
+
         ``message_error_schedule`` is test-only: maps 1-based message
         ordinal to HTTP status code for error injection in dry-run mode.
 
@@ -90,6 +121,14 @@ class SlackToChatMigrator:
         self.update_mode = update_mode
         self._message_error_schedule = message_error_schedule
 
+        if channel_workers < 1:
+            raise ValueError(f"channel_workers must be >= 1, got {channel_workers}")
+        self.channel_workers = channel_workers
+
+        if low_memory and not dry_run:
+            raise ValueError("low_memory is only supported in dry-run mode")
+        self.low_memory = low_memory
+
         if self.update_mode:
             log_with_context(
                 logging.INFO, "Running in update mode - will update existing spaces"
@@ -122,31 +161,45 @@ class SlackToChatMigrator:
             self.workspace_admin.split("@")[1] if self.workspace_admin else ""
         )
 
-        # Initialize API clients
-        self._validate_export_format()
+        # Seconds spent in each startup phase, in the order they ran. Each
+        # export metadata file is read once and the parsed data handed to
+        # every step that needs it.
+        self.startup_timings: dict[str, float] = {}
 
-        # Load config using the shared load_config function
-        self.config = load_config(self.config_path)
+        with self._startup_phase("validate_export"):
+            self._validate_export_format()
 
-        # Load space_mapping overrides from config YAML into state
-        self.state.spaces.space_mapping = load_space_mapping(self.config_path)
+        with self._startup_phase("load_config"):
+            # Load config using the shared load_config function
+            self.config = load_config(self.config_path)
 
-        # Generate user mapping from users.json
-        self.user_map, self.users_without_email, self.bot_user_ids = generate_user_map(
-            self.export_root, self.config
-        )
+            # Load space_mapping overrides from config YAML into state
+            self.state.spaces.space_mapping = load_space_mapping(self.config_path)
+
+        with self._startup_phase("read_metadata"):
+            users = load_users_json(self.export_root / "users.json")
+            channels = self._read_channels_json()
+
+        with self._startup_phase("user_map"):
+            # Generate user mapping from users.json
+            self.user_map, self.users_without_email, self.bot_user_ids = (
+                generate_user_map(self.export_root, self.config, users)
+            )
 
         # Initialize simple unmapped user tracking
         self.unmapped_user_tracker = initialize_unmapped_user_tracking()
 
-        # Scan channel members to ensure all channel members have user mappings
-        # This is crucial because Google Chat needs to add all channel members to spaces
-        scan_channel_members_for_unmapped_users(
-            self.unmapped_user_tracker,
-            self.export_root,
-            self.config,
-            self.user_map,
-        )
+        with self._startup_phase("unmapped_user_scan"):
+            # Scan channel members to ensure all channel members have user mappings
+            # This is crucial because Google Chat needs to add all channel members to spaces
+            scan_channel_members_for_unmapped_users(
+                self.unmapped_user_tracker,
+                self.export_root,
+                self.config,
+                self.user_map,
+                channels_data=channels,
+                users_data=users,
+            )
 
         # API services are initialized lazily by _initialize_api_services(),
         # called from migrate() or validate_permissions(). Typed as Any so
@@ -166,13 +219,19 @@ class SlackToChatMigrator:
         self.user_resolver: Any = None
 
         # Load channel metadata from channels.json
-        self.channels_meta, self.channel_id_to_name = self._load_channels_meta()
+        self.channels_meta, self.channel_id_to_name = self._load_channels_meta(channels)
 
         # Create reverse mapping for convenience
         self.channel_name_to_id = {
             name: id for id, name in self.channel_id_to_name.items()
         }
 
+        # Channel summaries from a prior ``export index``, if any; channels
+        # missing or stale in it are scanned on first use and then shared.
+        with self._startup_phase("export_catalog"):
+            self.export_catalog = ExportCatalog.load(self.export_root)
+        self._log_startup_timings()
+
         # Build immutable context from the now-populated attributes.
         # During Phase 1 of DI refactoring, both self.ctx.X and self.X
         # coexist; later phases migrate callers to use ctx directly.
@@ -192,8 +251,13 @@ class SlackToChatMigrator:
             channels_meta=self.channels_meta,
             channel_id_to_name=self.channel_id_to_name,
             channel_name_to_id=self.channel_name_to_id,
+            export_catalog=self.export_catalog,
+            low_memory=self.low_memory,
         )
 
+        if self.low_memory:
+            self.state.messages.sample_failures(DRY_RUN_SAMPLE_SIZE)
+
     def _initialize_api_services(self) -> None:
         """Initialize Google API services after permission validation."""
         if self._api_services_initialized:
@@ -207,6 +271,7 @@ class SlackToChatMigrator:
             raw_chat = DryRunChatService(
                 self.state,
                 message_error_schedule=self._message_error_schedule,
+                payload_sample_size=DRY_RUN_SAMPLE_SIZE if self.low_memory else None,
             )
             self._dry_run_chat_service = raw_chat
             self.chat = ChatAdapter(raw_chat)
@@ -275,6 +340,8 @@ class SlackToChatMigrator:
             user_resolver=self.user_resolver,
             state=self.state,
             dry_run=self.dry_run,
+            # Dry runs never download attachments, so there is nothing to prefetch
+            prefetcher=None if self.dry_run else AttachmentPrefetcher(),
         )
         # FileHandler now handles its own drive folder initialization automatically
 
@@ -320,38 +387,71 @@ class SlackToChatMigrator:
             )
 
         # Check that at least one channel directory exists
-        channel_dirs = [d for d in self.export_root.iterdir() if d.is_dir()]
+        with os.scandir(self.export_root) as entries:
+            channel_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
         if not channel_dirs:
             raise ValueError(f"No channel directories found in {self.export_root}")
 
-        # Check that each channel directory has at least one JSON file
-        for ch_dir in channel_dirs:
-            if not list(ch_dir.glob("*.json")):
+        # Check that each channel directory has at least one JSON file.  Each
+        # listing is a round trip on network filesystems, so they run on a
+        # thread pool; warnings still come out in directory order.
+        with ThreadPoolExecutor(
+            max_workers=min(STARTUP_SCAN_WORKERS, len(channel_dirs)),
+            thread_name_prefix="export-scan",
+        ) as executor:
+            has_json = list(executor.map(_has_json_files, channel_dirs))
+        for ch_dir, found in zip(channel_dirs, has_json):
+            if not found:
                 log_with_context(
                     logging.WARNING,
                     f"No JSON files found in channel directory {ch_dir.name}",
                 )
 
-    def _load_channels_meta(self) -> tuple[dict[str, Any], dict[str, str]]:
+    def _read_channels_json(self) -> list[dict[str, Any]] | None:
+        """Read channels.json, or return None if the export has none."""
+        channels_file = self.export_root / "channels.json"
+        if not channels_file.exists():
+            return None
+        with open(channels_file, encoding="utf-8") as f_in:
+            channels: list[dict[str, Any]] = json.load(f_in)
+        return channels
+
+    def _load_channels_meta(
+        self, channels: list[dict[str, Any]] | None
+    ) -> tuple[dict[str, Any], dict[str, str]]:
         """
-        Load channel metadata from channels.json file.
+        Build channel metadata lookups from the parsed channels.json.
+
+        Args:
+            channels: Contents of channels.json, or None if it is missing.
 
         Returns:
             tuple: (name_to_data, id_to_name) where:
                 - name_to_data: Dict mapping channel names to their metadata
                 - id_to_name: Dict mapping channel IDs to channel names
         """
-        channels_file = self.export_root / "channels.json"
-        name_to_data = {}
-        id_to_name = {}
+        if not channels:
+            return {}, {}
+        name_to_data = {ch["name"]: ch for ch in channels}
+        id_to_name = {ch["id"]: ch["name"] for ch in channels}
+        return name_to_data, id_to_name
 
-        if channels_file.exists():
-            with open(channels_file, encoding="utf-8") as f_in:
-                channels = json.load(f_in)
-                name_to_data = {ch["name"]: ch for ch in channels}
-                id_to_name = {ch["id"]: ch["name"] for ch in channels}
+    @contextlib.contextmanager
+    def _startup_phase(self, phase: str) -> Iterator[None]:
+        """Time the enclosed block into ``startup_timings[phase]``."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_timings[phase] = time.perf_counter() - started
 
-        return name_to_data, id_to_name
+    def _log_startup_timings(self) -> None:
+        """Log how long startup took, broken down by phase."""
+        phases = ", ".join(
+            f"{phase} {seconds:.2f}s" for phase, seconds in self.startup_timings.items()
+        )
+        total = sum(self.startup_timings.values())
+        log_with_context(logging.INFO, f"Startup took {total:.2f}s ({phases})")
 
     def _get_space_name(self, channel: str) -> str:
         """Get a consistent display name for a Google Chat space based on channel name."""
@@ -366,6 +466,110 @@ class SlackToChatMigrator:
         if self._progress_tracker:
             self._progress_tracker.phase_change(phase)
 
+    def _process_channels_serially(
+        self,
+        channel_dirs: list[Path],
+        checkpoint: CheckpointData,
+        checkpoint_path: Path,
+    ) -> None:
+        """Process channels one at a time on the calling thread."""
+        for ch in channel_dirs:
+            result = self.channel_processor.process_channel(ch)
+            if result.should_abort:
+                break
+
+            # Only checkpoint channels that completed without errors
+            if not result.had_errors:
+                mark_channel_finished(checkpoint, ch.name, completed=True)
+                save_checkpoint(checkpoint_path, checkpoint)
+
+    def _process_channels_concurrently(
+        self,
+        channel_dirs: list[Path],
+        checkpoint: CheckpointData,
+        checkpoint_path: Path,
+    ) -> None:
+        """Process channels on a bounded pool of ``channel_workers`` threads.
+
+        At most ``channel_workers`` channels are in flight at once.  The
+        checkpoint is only touched from this (coordinating) thread: channels
+        are marked in progress when handed to a worker and moved to
+        ``completed_channels`` as they finish, in whatever order that is.
+        When a channel requests an abort, no further channels are started
+        and the ones already running are allowed to finish.
+        """
+        remaining = iter(channel_dirs)
+        in_flight: dict[Future[ChannelResult], str] = {}
+        should_abort = False
+
+        with ThreadPoolExecutor(
+            max_workers=self.channel_workers, thread_name_prefix="channel-worker"
+        ) as executor:
+
+            def submit_next() -> bool:
+                ch = next(remaining, None)
+                if ch is None:
+                    return False
+                mark_channel_started(checkpoint, ch.name)
+                # Each worker runs in a copy of the caller's context so that
+                # context variables (e.g. the --debug_api flag) carry over.
+                future = executor.submit(
+                    contextvars.copy_context().run,
+                    self.channel_processor.process_channel,
+                    ch,
+                )
+                in_flight[future] = ch.name
+                return True
+
+            while len(in_flight) < self.channel_workers and submit_next():
+                pass
+            save_checkpoint(checkpoint_path, checkpoint)
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    channel_name = in_flight.pop(future)
+                    result = future.result()
+                    mark_channel_finished(
+                        checkpoint, channel_name, completed=not result.had_errors
+                    )
+                    if result.should_abort:
+                        should_abort = True
+
+                if not should_abort:
+                    while len(in_flight) < self.channel_workers and submit_next():
+                        pass
+                save_checkpoint(checkpoint_path, checkpoint)
+
+        if should_abort:
+            log_with_context(
+                logging.WARNING,
+                "Stopped scheduling new channels after a channel requested abort",
+            )
+
+    def _open_attachment_store(self) -> None:
+        """Load the cross-run attachment store into the file handler.
+
+        Dry runs upload nothing, so they neither read nor extend the store.
+        """
+        if self.dry_run:
+            return
+        self.file_handler.attach_attachment_store(
+            AttachmentStore.load(
+                attachment_store_path(self.state.context.output_dir or ".")
+            )
+        )
+
+    def _close_file_services(self) -> None:
+        """Stop attachment prefetching and flush the attachment store."""
+        file_handler = getattr(self, "file_handler", None)
+        if file_handler is None:
+            return
+        if file_handler.prefetcher is not None:
+            file_handler.prefetcher.close()
+        if file_handler.attachment_store is not None:
+            file_handler.attachment_store.close()
+
     def migrate(self, progress_tracker: ProgressTracker | None = None) -> bool:
         """Main migration function that orchestrates the entire process.
 
@@ -382,7 +586,7 @@ class SlackToChatMigrator:
 
         # Set up signal handler to ensure we log migration status on interrupt
         def signal_handler(signum: int, frame: Any) -> None:
-            """Handle SIGINT (Ctrl+C) gracefully.
+            """Handle SIGINT (Ctrl+C) and SIGTERM gracefully.
 
             Raises KeyboardInterrupt so the existing ``except BaseException``
             block handles logging and cleanup in one place.
@@ -393,8 +597,10 @@ class SlackToChatMigrator:
             """
             raise KeyboardInterrupt("Migration interrupted by signal")
 
-        # Install the signal handler
+        # Install the signal handlers.  SIGTERM would otherwise end the
+        # process without draining buffered log files.
         old_signal_handler = signal.signal(signal.SIGINT, signal_handler)
+        old_sigterm_handler = signal.signal(signal.SIGTERM, signal_handler)
 
         try:
             self._emit_phase("Initializing")
@@ -417,6 +623,8 @@ class SlackToChatMigrator:
             # Reset per-run state
             self.state.reset_for_run()
 
+            self._open_attachment_store()
+
             # Load or create checkpoint for resumable migrations
             checkpoint_path = (
                 Path(self.state.context.output_dir or ".")
@@ -460,8 +668,11 @@ class SlackToChatMigrator:
                         "[UPDATE MODE] No existing spaces found via API. Will create new spaces.",
                     )
 
-            # Get all channel directories
-            all_channel_dirs = [d for d in self.export_root.iterdir() if d.is_dir()]
+            # Get all channel directories (sorted so scheduling is deterministic)
+            all_channel_dirs = sorted(
+                (d for d in self.export_root.iterdir() if d.is_dir()),
+                key=lambda d: d.name,
+            )
             log_with_context(
                 logging.INFO,
                 f"Found {len(all_channel_dirs)} channel directories in export",
@@ -470,32 +681,46 @@ class SlackToChatMigrator:
             # Process each channel
             self._emit_phase("Migrating channels")
 
+            file_handler = getattr(self, "file_handler", None)
+            if file_handler is not None:
+                file_handler.progress_tracker = self._progress_tracker
+
             self.channel_processor = ChannelProcessor(
                 ctx=self.ctx,
                 state=self.state,
                 chat=self.chat,
                 user_resolver=self.user_resolver,
-                file_handler=getattr(self, "file_handler", None),
+                file_handler=file_handler,
                 attachment_processor=self.attachment_processor,
                 progress_tracker=self._progress_tracker,
             )
+
+            if checkpoint.in_progress_channels:
+                log_with_context(
+                    logging.WARNING,
+                    "Channels interrupted mid-migration in a previous run will be "
+                    f"processed again: {', '.join(sorted(checkpoint.in_progress_channels))}",
+                )
+                checkpoint.in_progress_channels.clear()
+
+            pending_channel_dirs = []
             for ch in all_channel_dirs:
-                channel_name = ch.name
-                if channel_name in checkpoint.completed_channels:
+                if ch.name in checkpoint.completed_channels:
                     log_with_context(
                         logging.INFO,
-                        f"Skipping channel {channel_name} (already completed in previous run)",
+                        f"Skipping channel {ch.name} (already completed in previous run)",
                     )
                     continue
+                pending_channel_dirs.append(ch)
 
-                result = self.channel_processor.process_channel(ch)
-                if result.should_abort:
-                    break
-
-                # Only checkpoint channels that completed without errors
-                if not result.had_errors:
-                    checkpoint.completed_channels[channel_name] = now_iso()
-                    save_checkpoint(checkpoint_path, checkpoint)
+            if self.channel_workers > 1:
+                self._process_channels_concurrently(
+                    pending_channel_dirs, checkpoint, checkpoint_path
+                )
+            else:
+                self._process_channels_serially(
+                    pending_channel_dirs, checkpoint, checkpoint_path
+                )
 
             self._emit_phase("Finalizing")
 
@@ -556,7 +781,9 @@ class SlackToChatMigrator:
             # Re-raise the exception to maintain existing error handling behavior
             raise
         finally:
-            # Restore the original signal handler
+            # Restore the original signal handlers
             signal.signal(signal.SIGINT, old_signal_handler)
+            signal.signal(signal.SIGTERM, old_sigterm_handler)
             # Always ensure proper cleanup of channel log handlers
             cleanup_channel_handlers(self.state)
+            self._close_file_services()
@@ -0,0 +1,154 @@
+"""Per-channel index of Slack messages already imported into a space.
+
+The index is persisted as an append-only text file next to the per-run
+output directories (``migration_logs/.processed/<channel>.ts``): a header
+line naming the target space, then one Slack ``ts`` per line.  Appending is O(1) per message and
+survives interruption; on resume the file is re-read so already-sent
+messages are skipped without querying the Chat API.
+
+The index is bound to a space: if the channel is later imported into a
+different space the old entries are discarded.
+"""
+
+from __future__ import annotations
+
+import logging
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+from typing import IO
+
+from slack_chat_migrator.utils.logging import log_with_context
+
+PROCESSED_INDEX_DIR = ".processed"
+_SPACE_HEADER_PREFIX = "# space: "
+
+
+def processed_index_path(output_dir: str | Path, channel: str) -> Path:
+    """Return the index path for *channel* shared by all runs alongside *output_dir*."""
+    return Path(output_dir).parent / PROCESSED_INDEX_DIR / f"{channel}.ts"
+
+
+class ProcessedIndex:
+    """Set of Slack timestamps already imported for one channel.
+
+    Timestamps added during this run live in a ``set[str]``.  Timestamps
+    loaded from a previous run are kept either in that set or, with
+    ``compact=True``, as a sorted ``array('d')`` of floats (8 bytes per
+    entry) searched by bisection in O(log n).
+    """
+
+    def __init__(self, space: str, path: Path | None = None) -> None:
+        self.space = space
+        self.path = path
+        self._current: set[str] = set()
+        self._previous: array[float] = array("d")
+        self._fh: IO[str] | None = None
+        # True when the file on disk belongs to another space and must be
+        # truncated before the first append.
+        self._stale = False
+
+    @classmethod
+    def load(
+        cls, path: Path | None, space: str, *, compact: bool = False
+    ) -> ProcessedIndex:
+        """Load the index for *space* from *path*, or start an empty one.
+
+        Entries recorded for a different space are ignored and the file
+        is rewritten on the first :meth:`add`.
+
+        Args:
+            path: Index file, or ``None`` for an in-memory index.
+            space: Chat space resource name the messages were sent to.
+            compact: Keep previously recorded timestamps as a sorted float
+                array instead of a set of strings.
+
+        Returns:
+            The loaded index.
+        """
+        index = cls(space, path)
+        if path is None or not path.exists():
+            return index
+        try:
+            with open(path, encoding="utf-8") as f:
+                header = f.readline().rstrip("\n")
+                if header != f"{_SPACE_HEADER_PREFIX}{space}":
+                    log_with_context(
+                        logging.INFO,
+                        f"Processed index {path} belongs to another space, starting fresh",
+                    )
+                    index._stale = True
+                    return index
+                timestamps = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            log_with_context(
+                logging.WARNING, f"Failed to read processed index {path}: {e}"
+            )
+            return index
+
+        if compact:
+            index._previous = array("d", sorted(float(ts) for ts in timestamps))
+        else:
+            index._current.update(timestamps)
+        return index
+
+    def __contains__(self, ts: object) -> bool:
+        if not isinstance(ts, str):
+            return False
+        if ts in self._current:
+            return True
+        previous = self._previous
+        if not previous:
+            return False
+        value = float(ts)
+        i = bisect_left(previous, value)
+        return i < len(previous) and previous[i] == value
+
+    def __len__(self) -> int:
+        return len(self._current) + len(self._previous)
+
+    def add(self, ts: str) -> None:
+        """Record *ts* as imported and append it to the index file."""
+        if ts in self._current:
+            return
+        self._current.add(ts)
+        if self.path is None:
+            return
+        try:
+            if self._fh is None:
+                self._fh = self._open_for_append()
+            self._fh.write(f"{ts}\n")
+        except OSError as e:
+            log_with_context(
+                logging.WARNING,
+                f"Failed to update processed index {self.path}: {e}",
+            )
+            self.path = None
+
+    def _open_for_append(self) -> IO[str]:
+        assert self.path is not None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._stale or not self.path.exists():
+            fh = open(self.path, "w", encoding="utf-8", buffering=1)
+            fh.write(f"{_SPACE_HEADER_PREFIX}{self.space}\n")
+            self._stale = False
+            return fh
+        return open(self.path, "a", encoding="utf-8", buffering=1)
+
+    def sorted_timestamps(self) -> array[float]:
+        """Return every recorded timestamp as a sorted float array."""
+        merged = array("d", self._previous)
+        merged.extend(float(ts) for ts in self._current)
+        return array("d", sorted(merged))
+
+    def close(self) -> None:
+        """Close the index file if it is open."""
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> ProcessedIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
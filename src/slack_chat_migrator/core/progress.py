@@ -8,6 +8,7 @@ receive these events without the migration core knowing about UI details.
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum, auto
@@ -42,6 +43,7 @@ class ProgressEvent:
         detail: Human-readable detail string (e.g. error message).
         count: Current progress count within a phase.
         total: Total items expected in this phase.
+        size_bytes: Size of an uploaded file, when known.
         timestamp: Unix timestamp when the event was created.
     """
 
@@ -50,6 +52,7 @@ class ProgressEvent:
     detail: str | None = None
     count: int | None = None
     total: int | None = None
+    size_bytes: int | None = None
     timestamp: float = field(default_factory=time.time)
 
 
@@ -61,11 +64,13 @@ class ProgressTracker:
     """Event emitter for migration progress.
 
     Subscribers register via :meth:`subscribe` and receive every
-    :class:`ProgressEvent` that is emitted.
+    :class:`ProgressEvent` that is emitted.  Emission is serialized so
+    renderers never see events from concurrent channel workers interleave.
     """
 
     def __init__(self) -> None:
         self._subscribers: list[Subscriber] = []
+        self._lock = threading.Lock()
 
     def subscribe(self, callback: Subscriber) -> None:
         """Register a callback to receive progress events."""
@@ -77,16 +82,17 @@ class ProgressTracker:
         A failing subscriber is logged and skipped so that renderer errors
         never halt the migration.
         """
-        for callback in self._subscribers:
-            try:
-                callback(event)
-            except Exception:
-                logger.debug(
-                    "Subscriber %r failed for %s",
-                    callback,
-                    event.event_type,
-                    exc_info=True,
-                )
+        with self._lock:
+            for callback in self._subscribers:
+                try:
+                    callback(event)
+                except Exception:
+                    logger.debug(
+                        "Subscriber %r failed for %s",
+                        callback,
+                        event.event_type,
+                        exc_info=True,
+                    )
 
     # ------------------------------------------------------------------
     # Convenience helpers — thin wrappers around ``emit()``
@@ -145,12 +151,13 @@ class ProgressTracker:
             )
         )
 
-    def file_uploaded(self, channel: str) -> None:
-        """Record a file upload."""
+    def file_uploaded(self, channel: str, size_bytes: int | None = None) -> None:
+        """Record a file upload of *size_bytes* bytes (if known)."""
         self.emit(
             ProgressEvent(
                 event_type=EventType.FILE_UPLOADED,
                 channel=channel,
+                size_bytes=size_bytes,
             )
         )
 
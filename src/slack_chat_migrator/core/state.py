@@ -10,14 +10,22 @@ State is organized into typed sub-state dataclasses by concern area.
 from __future__ import annotations
 
 import logging
+import threading
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, overload
 
 from slack_chat_migrator.types import FailedMessage, MigrationSummary, SkippedReaction
+from slack_chat_migrator.utils.sampling import Reservoir
 
 if TYPE_CHECKING:
     from slack_chat_migrator.services.chat_adapter import ChatAdapter
 
+_T = TypeVar("_T")
+
+SummaryCounter = Literal[
+    "spaces_created", "messages_created", "reactions_created", "files_created"
+]
+
 
 def _default_migration_summary() -> MigrationSummary:
     """Return a fresh MigrationSummary with zeroed counters."""
@@ -49,13 +57,47 @@ class SpaceState:
 
 @dataclass
 class MessageState:
-    """Thread and message tracking state."""
+    """Thread and message tracking state.
+
+    ``thread_map`` and ``message_id_map`` are keyed by ``(channel, ts)`` so
+    that concurrent channel workers never read or overwrite each other's
+    entries; ``message_id_map`` keys edited messages as
+    ``(channel, "<ts>:edited:<edited_ts>")``.
+
+    ``failed_reactions_by_channel`` maps channel -> message ID -> the
+    reactions that could not be added to that message.
 
-    thread_map: dict[str, str] = field(default_factory=dict)
+    When ``failed_sample`` is set, ``failed_messages`` holds only a fixed-size
+    random sample of the failures; ``failed_message_count`` stays exact.
+    """
+
+    thread_map: dict[tuple[str, str], str] = field(default_factory=dict)
     sent_messages: set[str] = field(default_factory=set)
-    message_id_map: dict[str, str] = field(default_factory=dict)
+    message_id_map: dict[tuple[str, str], str] = field(default_factory=dict)
     failed_messages: list[FailedMessage] = field(default_factory=list)
     failed_messages_by_channel: dict[str, list[str]] = field(default_factory=dict)
+    failed_reactions_by_channel: dict[str, dict[str, list[str]]] = field(
+        default_factory=dict
+    )
+    failed_sample: Reservoir[FailedMessage] | None = None
+
+    def sample_failures(self, size: int) -> None:
+        """Keep only a random sample of *size* failures from now on."""
+        self.failed_sample = Reservoir(size, self.failed_messages)
+
+    def record_failure(self, failed: FailedMessage) -> None:
+        """Add *failed* to ``failed_messages`` (or offer it to the sample)."""
+        if self.failed_sample is not None:
+            self.failed_sample.add(failed)
+        else:
+            self.failed_messages.append(failed)
+
+    @property
+    def failed_message_count(self) -> int:
+        """Return the number of failures recorded, sampled or not."""
+        if self.failed_sample is not None:
+            return self.failed_sample.seen
+        return len(self.failed_messages)
 
 
 @dataclass
@@ -94,15 +136,54 @@ class ErrorState:
     channel_error_count: int = 0
 
 
+class _ThreadLocalField(Generic[_T]):
+    """Descriptor that stores its value per thread on the owning instance.
+
+    Lets concurrent channel workers each see their own "current" channel,
+    space and message while sharing a single :class:`ContextState`.
+    """
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(
+        self, obj: None, objtype: type | None = None
+    ) -> _ThreadLocalField[_T]: ...
+
+    @overload
+    def __get__(self, obj: ContextState, objtype: type | None = None) -> _T | None: ...
+
+    def __get__(
+        self, obj: ContextState | None, objtype: type | None = None
+    ) -> _ThreadLocalField[_T] | _T | None:
+        if obj is None:
+            return self
+        value: _T | None = getattr(obj._local, self._name, None)
+        return value
+
+    def __set__(self, obj: ContextState, value: _T | None) -> None:
+        setattr(obj._local, self._name, value)
+
+
 @dataclass
 class ContextState:
-    """Current operation context."""
+    """Current operation context.
+
+    ``current_channel``, ``current_space`` and ``current_message_ts`` are
+    thread-local so that channels processed concurrently do not overwrite
+    each other's context.
+    """
 
-    current_channel: str | None = None
-    current_space: str | None = None
-    current_message_ts: str | None = None
     output_dir: str | None = None
     first_channel_processed: bool = False
+    _local: threading.local = field(
+        default_factory=threading.local, repr=False, compare=False
+    )
+
+    current_channel = _ThreadLocalField[str]()
+    current_space = _ThreadLocalField[str]()
+    current_message_ts = _ThreadLocalField[str]()
 
 
 # ---------------------------------------------------------------------------
@@ -133,6 +214,15 @@ class MigrationState:
     # File and drive caching (standalone — doesn't fit neatly in a sub-state)
     drive_files_cache: dict[str, Any] = field(default_factory=dict)
 
+    # Guards read-modify-write updates that channel workers share (summary
+    # counters).  Other shared maps are either keyed by channel
+    # (channel_stats, failed_messages_by_channel, failed_reactions_by_channel) or by (channel, ts)
+    # (thread_map, message_id_map), so each worker only writes its own
+    # entries and single dict operations need no lock.
+    lock: threading.RLock = field(
+        default_factory=threading.RLock, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
         """Validate invariants after initialization."""
         if self.errors.channel_error_count < 0:
@@ -147,7 +237,8 @@ class MigrationState:
         - spaces.space_mapping, space_cache, created_spaces, channel_to_space,
           channel_id_to_space_id — cross-run mapping state
         - messages.sent_messages, message_id_map, failed_messages,
-          failed_messages_by_channel — deduplication and history
+          failed_messages_by_channel, failed_reactions_by_channel — deduplication
+          and history
         - users.* — cached validation and delegation state
         - progress.last_processed_timestamps, spaces_with_external_users
           — resumption bookmarks
@@ -167,6 +258,43 @@ class MigrationState:
         self.context.first_channel_processed = False
         self.drive_files_cache = {}
 
+    def release_channel(self, channel: str) -> None:
+        """Drop the per-message entries *channel* added once it is finished.
+
+        Removes its ``sent_messages`` keys along with its ``message_id_map``
+        and ``thread_map`` entries, so long runs keep only
+        the channels still in progress.  Other workers' channels are left
+        alone.
+
+        Args:
+            channel: Name of a channel whose processing has returned.
+        """
+        prefix = f"{channel}:"
+        # list() snapshots each container atomically while other workers add
+        # to it
+        for key in list(self.messages.sent_messages):
+            if key.startswith(prefix):
+                self.messages.sent_messages.discard(key)
+        for mapping in (self.messages.message_id_map, self.messages.thread_map):
+            for map_key in list(mapping):
+                if map_key[0] == channel:
+                    mapping.pop(map_key, None)
+
+    def increment_summary(self, key: SummaryCounter, amount: int = 1) -> None:
+        """Add *amount* to a ``migration_summary`` counter under the state lock.
+
+        Args:
+            key: Name of the numeric summary counter.
+            amount: Value to add (may be negative).
+        """
+        with self.lock:
+            self.progress.migration_summary[key] += amount
+
+    def record_channel_processed(self, channel: str) -> None:
+        """Append *channel* to ``migration_summary["channels_processed"]``."""
+        with self.lock:
+            self.progress.migration_summary["channels_processed"].append(channel)
+
     @property
     def has_errors(self) -> bool:
         """Return True if any migration errors or channel errors were recorded."""
@@ -178,7 +306,7 @@ class MigrationState:
     def total_messages_attempted(self) -> int:
         """Return total messages attempted (created + failed)."""
         created: int = self.progress.migration_summary["messages_created"]
-        failed = len(self.messages.failed_messages)
+        failed = self.messages.failed_message_count
         return created + failed
 
     @property
@@ -8,6 +8,7 @@ import json
 import logging
 import mimetypes
 import os
+import threading
 from typing import TYPE_CHECKING, Any
 
 from googleapiclient.errors import HttpError
@@ -31,8 +32,19 @@ class ChatFileUploader:
             chat_service: Google Chat API service instance (ChatAdapter)
         """
         self.chat_service = chat_service
-        # Set by FileHandler before each channel is processed
-        self.current_channel: str | None = None
+        # current_channel is set by FileHandler from each worker thread, so
+        # it is stored per thread
+        self._local = threading.local()
+
+    @property
+    def current_channel(self) -> str | None:
+        """Channel being processed by the calling thread, for logging context."""
+        channel: str | None = getattr(self._local, "channel", None)
+        return channel
+
+    @current_channel.setter
+    def current_channel(self, value: str | None) -> None:
+        self._local.channel = value
 
     def _get_current_channel(self) -> str | None:
         """Return the current channel name for logging context."""
@@ -68,7 +80,10 @@ class ChatFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Uploading file {filename} directly to Chat API (size: {file_size}, MIME: {mime_type})",
+                "Uploading file %s directly to Chat API (size: %s, MIME: %s)",
+                filename,
+                file_size,
+                mime_type,
                 channel=self._get_current_channel(),
             )
 
@@ -93,7 +108,8 @@ class ChatFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Executing Chat API media upload request for {filename}",
+                "Executing Chat API media upload request for %s",
+                filename,
                 api_data=json.dumps(
                     {
                         "parent_space": parent_space,
@@ -120,7 +136,8 @@ class ChatFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Successfully uploaded file {filename} to Chat API",
+                "Successfully uploaded file %s to Chat API",
+                filename,
                 channel=self._get_current_channel(),
             )
 
@@ -275,7 +292,8 @@ class ChatFileUploader:
         # Log the MIME type detection
         log_with_context(
             logging.DEBUG,
-            f"Checking if file type is supported for Chat API upload: {filename}",
+            "Checking if file type is supported for Chat API upload: %s",
+            filename,
             api_data=json.dumps(
                 {"filename": filename, "detected_mime_type": mime_type or "None"}
             ),
@@ -285,7 +303,8 @@ class ChatFileUploader:
         if not mime_type:
             log_with_context(
                 logging.DEBUG,
-                f"Could not determine MIME type for {filename}, defaulting to unsupported",
+                "Could not determine MIME type for %s, defaulting to unsupported",
+                filename,
                 channel=self._get_current_channel(),
             )
             return False
@@ -294,7 +313,9 @@ class ChatFileUploader:
         if not supported:
             log_with_context(
                 logging.DEBUG,
-                f"MIME type {mime_type} for {filename} is not supported by Chat API",
+                "MIME type %s for %s is not supported by Chat API",
+                mime_type,
+                filename,
                 channel=self._get_current_channel(),
             )
 
@@ -312,7 +333,8 @@ class ChatFileUploader:
         """
         log_with_context(
             logging.DEBUG,
-            f"Checking if file is suitable for direct Chat API upload: {filename}",
+            "Checking if file is suitable for direct Chat API upload: %s",
+            filename,
             api_data=json.dumps(
                 {
                     "filename": filename,
@@ -327,7 +349,8 @@ class ChatFileUploader:
         if not self.is_supported_file_type(filename):
             log_with_context(
                 logging.DEBUG,
-                f"File {filename} has unsupported MIME type for direct Chat API upload",
+                "File %s has unsupported MIME type for direct Chat API upload",
+                filename,
                 channel=self._get_current_channel(),
             )
             return False
@@ -338,14 +361,18 @@ class ChatFileUploader:
         if file_size > max_direct_upload_size:
             log_with_context(
                 logging.DEBUG,
-                f"File {filename} exceeds size limit for direct Chat API upload: {file_size} bytes > {max_direct_upload_size} bytes",
+                "File %s exceeds size limit for direct Chat API upload: %s bytes > %s bytes",
+                filename,
+                file_size,
+                max_direct_upload_size,
                 channel=self._get_current_channel(),
             )
             return False
 
         log_with_context(
             logging.DEBUG,
-            f"File {filename} is suitable for direct Chat API upload",
+            "File %s is suitable for direct Chat API upload",
+            filename,
             channel=self._get_current_channel(),
         )
         return True
@@ -11,13 +11,18 @@ when ``dry_run=True``, eliminating scattered ``if dry_run`` checks.
 
 from __future__ import annotations
 
+import itertools
 import logging
+from collections import deque
+from collections.abc import MutableSequence
 from typing import TYPE_CHECKING, Any
 
 from googleapiclient.errors import HttpError
 from httplib2 import Response
 
+from slack_chat_migrator.constants import DRY_RUN_CAPTURE_LIMIT
 from slack_chat_migrator.utils.logging import log_with_context
+from slack_chat_migrator.utils.sampling import Reservoir
 
 if TYPE_CHECKING:
     from slack_chat_migrator.core.state import MigrationState
@@ -70,16 +75,32 @@ class DryRunReactions:
 
 
 class DryRunMessages:
-    """Stub for ``spaces().messages()``."""
+    """Stub for ``spaces().messages()``.
+
+    ``captured_calls`` keeps the most recent *capture_limit* calls, or,
+    when *sample_size* is given, a uniform random sample of that many
+    calls from the whole run.
+    """
 
     def __init__(
         self,
         state: MigrationState,
         error_schedule: dict[int, int] | None = None,
+        capture_limit: int = DRY_RUN_CAPTURE_LIMIT,
+        sample_size: int | None = None,
     ) -> None:
         self._state = state
-        self._counter = 0
-        self.captured_calls: list[dict[str, Any]] = []
+        # itertools.count is advanced atomically, so concurrent channel
+        # workers never receive the same fake resource ID.
+        self._ids = itertools.count(1)
+        self.captured_calls: MutableSequence[dict[str, Any]]
+        self._sample: Reservoir[dict[str, Any]] | None = None
+        if sample_size is not None:
+            self._sample = Reservoir(sample_size)
+            self.captured_calls = self._sample.items
+        else:
+            # Only the most recent calls are kept so long dry runs stay bounded
+            self.captured_calls = deque(maxlen=capture_limit)
         self._error_schedule: dict[int, int] = error_schedule or {}
 
     def create(
@@ -90,29 +111,31 @@ class DryRunMessages:
         messageId: str = "",
         messageReplyOption: str = "",
     ) -> DryRunRequest | DryRunErrorRequest:
-        self._counter += 1
+        counter = next(self._ids)
 
         # Capture the call for test inspection
-        self.captured_calls.append(
-            {
-                "parent": parent,
-                "body": body,
-                "messageId": messageId,
-                "messageReplyOption": messageReplyOption,
-            }
-        )
+        call = {
+            "parent": parent,
+            "body": body,
+            "messageId": messageId,
+            "messageReplyOption": messageReplyOption,
+        }
+        if self._sample is not None:
+            self._sample.add(call)
+        else:
+            self.captured_calls.append(call)
 
         # Check error schedule
-        if self._counter in self._error_schedule:
-            status_code = self._error_schedule[self._counter]
+        if counter in self._error_schedule:
+            status_code = self._error_schedule[counter]
             log_with_context(
                 logging.DEBUG,
-                f"[DRY RUN] Injecting HTTP {status_code} error for message #{self._counter}",
+                f"[DRY RUN] Injecting HTTP {status_code} error for message #{counter}",
             )
             return DryRunErrorRequest(status_code)
 
-        thread_name = f"{parent}/threads/dry-run-{self._counter}"
-        msg_name = f"{parent}/messages/dry-run-{self._counter}"
+        thread_name = f"{parent}/threads/dry-run-{counter}"
+        msg_name = f"{parent}/messages/dry-run-{counter}"
         log_with_context(logging.DEBUG, f"[DRY RUN] Would send message to {parent}")
         return DryRunRequest(
             {
@@ -121,6 +144,15 @@ class DryRunMessages:
             }
         )
 
+    def get(self, *, name: str = "") -> DryRunRequest:
+        space, _, message_id = name.partition("/messages/")
+        return DryRunRequest(
+            {
+                "name": name,
+                "thread": {"name": f"{space}/threads/dry-run-{message_id}"},
+            }
+        )
+
     def list(
         self,
         *,
@@ -144,13 +176,13 @@ class DryRunMembers:
 
     def __init__(self, state: MigrationState) -> None:
         self._state = state
-        self._counter = 0
+        self._ids = itertools.count(1)
 
     def create(
         self, *, parent: str = "", body: dict[str, Any] | None = None
     ) -> DryRunRequest:
-        self._counter += 1
-        member_name = f"{parent}/members/dry-run-{self._counter}"
+        counter = next(self._ids)
+        member_name = f"{parent}/members/dry-run-{counter}"
         log_with_context(logging.DEBUG, f"[DRY RUN] Would add member to {parent}")
         return DryRunRequest({"name": member_name})
 
@@ -177,7 +209,7 @@ class DryRunMedia:
     """Stub for ``media()``."""
 
     def __init__(self) -> None:
-        self._counter = 0
+        self._ids = itertools.count(1)
 
     def upload(
         self,
@@ -186,7 +218,7 @@ class DryRunMedia:
         media_body: Any = None,
         body: dict[str, Any] | None = None,
     ) -> DryRunRequest:
-        self._counter += 1
+        counter = next(self._ids)
         filename = (body or {}).get("filename", "unknown")
         log_with_context(
             logging.DEBUG,
@@ -195,7 +227,7 @@ class DryRunMedia:
         return DryRunRequest(
             {
                 "attachmentDataRef": {
-                    "resourceName": f"dry-run-media-{self._counter}",
+                    "resourceName": f"dry-run-media-{counter}",
                 },
             }
         )
@@ -218,16 +250,21 @@ class DryRunSpaces:
         self,
         state: MigrationState,
         message_error_schedule: dict[int, int] | None = None,
+        payload_sample_size: int | None = None,
     ) -> None:
         self._state = state
-        self._counter = 0
-        self._messages = DryRunMessages(state, error_schedule=message_error_schedule)
+        self._ids = itertools.count(1)
+        self._messages = DryRunMessages(
+            state,
+            error_schedule=message_error_schedule,
+            sample_size=payload_sample_size,
+        )
         self._members = DryRunMembers(state)
 
     def create(self, *, body: dict[str, Any] | None = None) -> DryRunRequest:
-        self._counter += 1
+        counter = next(self._ids)
         display_name = (body or {}).get("displayName", "unknown")
-        space_name = f"spaces/dry-run-{self._counter}"
+        space_name = f"spaces/dry-run-{counter}"
         log_with_context(
             logging.DEBUG,
             f"[DRY RUN] Would create space '{display_name}'",
@@ -300,16 +337,22 @@ class DryRunChatService:
     Holds singleton ``_spaces`` and ``_media`` sub-objects so that state
     (counters, captured calls, error schedules) persists across the
     entire migration run.
+
+    Pass *payload_sample_size* to keep a fixed-size random sample of
+    message payloads instead of the most recent ones.
     """
 
     def __init__(
         self,
         state: MigrationState,
         message_error_schedule: dict[int, int] | None = None,
+        payload_sample_size: int | None = None,
     ) -> None:
         self._state = state
         self._spaces = DryRunSpaces(
-            state, message_error_schedule=message_error_schedule
+            state,
+            message_error_schedule=message_error_schedule,
+            payload_sample_size=payload_sample_size,
         )
         self._media = DryRunMedia()
 
@@ -321,5 +364,5 @@ class DryRunChatService:
 
     @property
     def captured_messages(self) -> list[dict[str, Any]]:
-        """All ``create()`` calls recorded by the messages stub."""
-        return self._spaces.messages().captured_calls
+        """The ``create()`` calls kept by the messages stub."""
+        return list(self._spaces.messages().captured_calls)
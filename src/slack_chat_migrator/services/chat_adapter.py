@@ -141,6 +141,18 @@ class ChatAdapter:
         )
         return result
 
+    def get_message(self, name: str) -> dict[str, Any]:
+        """Get a single message by resource name.
+
+        Args:
+            name: Message resource name (e.g. ``spaces/AAAA/messages/BBBB``).
+
+        Returns:
+            Message resource dict, including its ``thread``.
+        """
+        result: dict[str, Any] = self._svc.spaces().messages().get(name=name).execute()
+        return result
+
     def list_messages(
         self,
         parent: str,
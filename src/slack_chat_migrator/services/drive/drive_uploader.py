@@ -7,6 +7,7 @@ from __future__ import annotations
 import hashlib
 import logging
 import mimetypes
+import threading
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -46,8 +47,25 @@ class DriveFileUploader:
         self.service_account_email = service_account_email
         self.file_hash_cache: dict[str, tuple[str | None, str | None]] = {}
         self.folders_pre_cached: set[str] = set()
-        # Set by FileHandler before each channel is processed
-        self.current_channel: str | None = None
+        # current_channel is set by FileHandler from each worker thread, so
+        # it is stored per thread (as is the outcome of the last upload)
+        self._local = threading.local()
+
+    @property
+    def current_channel(self) -> str | None:
+        """Channel being processed by the calling thread, for logging context."""
+        channel: str | None = getattr(self._local, "channel", None)
+        return channel
+
+    @current_channel.setter
+    def current_channel(self, value: str | None) -> None:
+        self._local.channel = value
+
+    @property
+    def last_upload_reused(self) -> bool:
+        """True if this thread's last upload reused a file already in Drive."""
+        reused: bool = getattr(self._local, "reused", False)
+        return reused
 
     def _get_current_channel(self) -> str | None:
         """Return the current channel name for logging context."""
@@ -88,7 +106,8 @@ class DriveFileUploader:
         if folder_id in self.folders_pre_cached:
             log_with_context(
                 logging.DEBUG,
-                f"Folder {folder_id} already pre-cached, skipping",
+                "Folder %s already pre-cached, skipping",
+                folder_id,
                 channel=self._get_current_channel(),
             )
             return 0
@@ -96,7 +115,8 @@ class DriveFileUploader:
         try:
             log_with_context(
                 logging.DEBUG,
-                f"Pre-caching file hashes from folder {folder_id}",
+                "Pre-caching file hashes from folder %s",
+                folder_id,
                 channel=self._get_current_channel(),
             )
 
@@ -149,7 +169,9 @@ class DriveFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Successfully pre-cached {files_cached} files from folder {folder_id}",
+                "Successfully pre-cached %s files from folder %s",
+                files_cached,
+                folder_id,
             )
             return files_cached
 
@@ -188,7 +210,9 @@ class DriveFileUploader:
                 else:
                     log_with_context(
                         logging.DEBUG,
-                        f"Found cached file ID for hash {file_hash}: {cached_id}",
+                        "Found cached file ID for hash %s: %s",
+                        file_hash,
+                        cached_id,
                         channel=self._get_current_channel(),
                     )
 
@@ -220,7 +244,9 @@ class DriveFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Searching for files with hash {file_hash} using query: {query}",
+                "Searching for files with hash %s using query: %s",
+                file_hash,
+                query,
                 channel=self._get_current_channel(),
             )
 
@@ -254,7 +280,9 @@ class DriveFileUploader:
 
                 log_with_context(
                     logging.DEBUG,
-                    f"Found existing file with same hash: {filename} (ID: {file_id})",
+                    "Found existing file with same hash: %s (ID: %s)",
+                    filename,
+                    file_id,
                     channel=self._get_current_channel(),
                 )
                 return file_id, web_view_link
@@ -276,6 +304,7 @@ class DriveFileUploader:
         folder_id: str,
         shared_drive_id: str | None = None,
         message_poster_email: str | None = None,
+        file_hash: str | None = None,
     ) -> tuple[str | None, str | None]:
         """Upload a file to Google Drive.
 
@@ -286,6 +315,7 @@ class DriveFileUploader:
             shared_drive_id: ID of the shared drive (if applicable)
             message_poster_email: Email of the user who will post the message with this attachment
                                  This user will get editor permissions on the file
+            file_hash: MD5 of the file if already known; computed from the file otherwise
 
         We rely on folder permissions for access control instead of setting individual
         file permissions. Only the message poster gets explicit editor access to the file.
@@ -296,18 +326,22 @@ class DriveFileUploader:
         Returns:
             Tuple of (file_id, public_url) if successful, (None, None) otherwise
         """
+        self._local.reused = False
         try:
             # Get MIME type
             mime_type, _ = mimetypes.guess_type(filename)
             if not mime_type:
                 mime_type = "application/octet-stream"
 
-            # Calculate the file's MD5 hash
-            file_hash = self._calculate_file_hash(file_path)
+            # Calculate the file's MD5 hash unless the caller already has it
+            if file_hash is None:
+                file_hash = self._calculate_file_hash(file_path)
 
             log_with_context(
                 logging.DEBUG,
-                f"Calculated MD5 hash for {filename}: {file_hash}",
+                "Calculated MD5 hash for %s: %s",
+                filename,
+                file_hash,
                 channel=self._get_current_channel(),
             )
 
@@ -324,7 +358,9 @@ class DriveFileUploader:
             if existing_file_id and existing_url:
                 log_with_context(
                     logging.DEBUG,
-                    f"Reusing existing file with same hash: {filename} (ID: {existing_file_id})",
+                    "Reusing existing file with same hash: %s (ID: %s)",
+                    filename,
+                    existing_file_id,
                     channel=self._get_current_channel(),
                 )
 
@@ -334,12 +370,16 @@ class DriveFileUploader:
                         existing_file_id, message_poster_email, shared_drive_id
                     )
 
+                self._local.reused = True
                 return existing_file_id, existing_url
 
             # File doesn't exist yet, proceed with upload
             log_with_context(
                 logging.DEBUG,
-                f"Uploading file {filename} with MIME type {mime_type} to folder {folder_id}",
+                "Uploading file %s with MIME type %s to folder %s",
+                filename,
+                mime_type,
+                folder_id,
                 channel=self._get_current_channel(),
             )
 
@@ -367,7 +407,9 @@ class DriveFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Successfully uploaded file {filename} to Drive (ID: {file_id})",
+                "Successfully uploaded file %s to Drive (ID: %s)",
+                filename,
+                file_id,
                 channel=self._get_current_channel(),
             )
 
@@ -399,7 +441,9 @@ class DriveFileUploader:
         """
         log_with_context(
             logging.DEBUG,
-            f"Setting editor permission for message poster {message_poster_email} on file {file_id}",
+            "Setting editor permission for message poster %s on file %s",
+            message_poster_email,
+            file_id,
             channel=self._get_current_channel(),
         )
         try:
@@ -419,7 +463,9 @@ class DriveFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Successfully set editor permission for message poster {message_poster_email} on file {file_id}",
+                "Successfully set editor permission for message poster %s on file %s",
+                message_poster_email,
+                file_id,
                 channel=self._get_current_channel(),
             )
             return True
@@ -468,7 +514,9 @@ class DriveFileUploader:
                     editor_set = True
                     log_with_context(
                         logging.DEBUG,
-                        f"Granting editor permission to message poster {email} for file {file_id}",
+                        "Granting editor permission to message poster %s for file %s",
+                        email,
+                        file_id,
                         channel=self._get_current_channel(),
                     )
 
@@ -505,7 +553,9 @@ class DriveFileUploader:
 
                 log_with_context(
                     logging.DEBUG,
-                    f"Adding separate editor permission for message poster {message_poster_email} for file {file_id}",
+                    "Adding separate editor permission for message poster %s for file %s",
+                    message_poster_email,
+                    file_id,
                     channel=self._get_current_channel(),
                 )
                 self.drive_service.create_permission(
@@ -536,7 +586,9 @@ class DriveFileUploader:
 
                 log_with_context(
                     logging.DEBUG,
-                    f"Adding editor permission for service account {self.service_account_email} for file {file_id}",
+                    "Adding editor permission for service account %s for file %s",
+                    self.service_account_email,
+                    file_id,
                     channel=self._get_current_channel(),
                 )
                 self.drive_service.create_permission(
@@ -589,7 +641,9 @@ class DriveFileUploader:
 
             log_with_context(
                 logging.DEBUG,
-                f"Transferred ownership of file {file_id} to {new_owner_email}",
+                "Transferred ownership of file %s to %s",
+                file_id,
+                new_owner_email,
                 channel=self._get_current_channel(),
             )
 
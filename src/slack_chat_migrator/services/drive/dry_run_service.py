@@ -11,6 +11,7 @@ when ``dry_run=True``, eliminating scattered ``if dry_run`` checks.
 
 from __future__ import annotations
 
+import itertools
 import logging
 from typing import Any
 
@@ -40,14 +41,16 @@ class DryRunFiles:
     """Stub for ``files()``."""
 
     def __init__(self) -> None:
-        self._counter = 0
+        # itertools.count is advanced atomically, so concurrent channel
+        # workers never receive the same fake resource ID.
+        self._ids = itertools.count(1)
 
     def list(self, **kwargs: Any) -> DryRunRequest:
         return DryRunRequest({"files": [], "nextPageToken": ""})
 
     def get(self, **kwargs: Any) -> DryRunRequest:
-        self._counter += 1
-        file_id = kwargs.get("fileId", f"dry-run-file-{self._counter}")
+        counter = next(self._ids)
+        file_id = kwargs.get("fileId", f"dry-run-file-{counter}")
         return DryRunRequest(
             {
                 "id": file_id,
@@ -56,8 +59,8 @@ class DryRunFiles:
         )
 
     def create(self, **kwargs: Any) -> DryRunRequest:
-        self._counter += 1
-        file_id = f"dry-run-file-{self._counter}"
+        counter = next(self._ids)
+        file_id = f"dry-run-file-{counter}"
         body = kwargs.get("body", {})
         name = body.get("name", "unknown")
         log_with_context(
@@ -108,7 +111,7 @@ class DryRunDrives:
     """Stub for ``drives()``."""
 
     def __init__(self) -> None:
-        self._counter = 0
+        self._ids = itertools.count(1)
 
     def get(self, *, driveId: str = "") -> DryRunRequest:
         return DryRunRequest(
@@ -127,13 +130,13 @@ class DryRunDrives:
         body: dict[str, Any] | None = None,
         requestId: str = "",
     ) -> DryRunRequest:
-        self._counter += 1
+        counter = next(self._ids)
         name = (body or {}).get("name", "unknown")
         log_with_context(
             logging.DEBUG,
             f"[DRY RUN] Would create shared drive '{name}'",
         )
-        return DryRunRequest({"id": f"dry-run-drive-{self._counter}"})
+        return DryRunRequest({"id": f"dry-run-drive-{counter}"})
 
 
 # ---------------------------------------------------------------------------
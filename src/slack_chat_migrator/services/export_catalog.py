@@ -0,0 +1,323 @@
+"""Pre-indexed summary of a Slack export, parsed once and shared.
+
+Several subsystems need facts about a channel's message history: how many
+messages it holds, who posted in it, who joined or left, which files it
+references.  Rather than have each of them walk every daily ``*.json``
+file, :class:`ExportCatalog` parses a channel once into a
+:class:`ChannelSummary` and hands the same summary to every caller.
+
+``slack-chat-migrator export index`` writes the catalog to
+``<export>/.export_catalog.json`` so later runs skip the parse entirely.
+Each summary records the name, size and mtime of the files it was built
+from; a summary whose files have changed since is rebuilt on demand.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from slack_chat_migrator.constants import CHANNEL_JOIN_SUBTYPE, CHANNEL_LEAVE_SUBTYPE
+from slack_chat_migrator.utils.api import slack_ts_to_rfc3339
+from slack_chat_migrator.utils.logging import log_with_context
+
+if TYPE_CHECKING:
+    from slack_chat_migrator.core.context import MigrationContext
+
+CATALOG_FILENAME = ".export_catalog.json"
+CATALOG_SCHEMA_VERSION = 2
+
+
+@dataclass
+class ChannelSummary:
+    """Everything the migrator needs to know about one channel's history.
+
+    Attributes:
+        fingerprint: ``[name, size, mtime_ns]`` for each daily file the
+            summary was built from, sorted by name.
+        message_count: ``type == "message"`` entries across all files,
+            duplicates included.
+        unique_message_count: ``type == "message"`` entries left after
+            de-duplicating on ``ts``, i.e. what the send loop will see.
+        first_ts: Earliest message ``ts``, or ``None`` for an empty channel.
+        last_ts: Latest message ``ts``, or ``None`` for an empty channel.
+        users: Sorted IDs of users who posted at least one message.
+        reactors: Sorted IDs of users who reacted to at least one message.
+        file_count: Entries in ``files`` lists across all messages.
+        file_ids: Sorted, distinct Slack file IDs referenced by messages.
+        thread_roots: ``ts`` of each message that starts a thread.
+        membership: Per-user ``join_time``, ``leave_time``, ``active`` and
+            ``first_message_time`` derived from messages and join/leave
+            events.
+    """
+
+    fingerprint: list[list[Any]] = field(default_factory=list)
+    message_count: int = 0
+    unique_message_count: int = 0
+    first_ts: str | None = None
+    last_ts: str | None = None
+    users: list[str] = field(default_factory=list)
+    reactors: list[str] = field(default_factory=list)
+    file_count: int = 0
+    file_ids: list[str] = field(default_factory=list)
+    thread_roots: list[str] = field(default_factory=list)
+    membership: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def membership_snapshot(self) -> dict[str, dict[str, Any]]:
+        """Return a copy of :attr:`membership` that callers may mutate."""
+        return {user_id: dict(entry) for user_id, entry in self.membership.items()}
+
+
+def _fingerprint(ch_dir: Path) -> list[list[Any]]:
+    """Return ``[name, size, mtime_ns]`` for each daily file in *ch_dir*."""
+    entries: list[list[Any]] = []
+    for jf in sorted(ch_dir.glob("*.json")):
+        try:
+            st = jf.stat()
+        except OSError:
+            continue
+        entries.append([jf.name, st.st_size, st.st_mtime_ns])
+    return entries
+
+
+def _record_membership(
+    membership: dict[str, dict[str, Any]], msg: dict[str, Any]
+) -> None:
+    """Fold one message into the per-user join/leave/first-message history."""
+    user_id = msg.get("user")
+    if not user_id:
+        return
+    timestamp = slack_ts_to_rfc3339(msg["ts"])
+    entry = membership.get(user_id)
+
+    if entry is None:
+        membership[user_id] = {
+            "join_time": None,
+            "leave_time": None,
+            "active": True,
+            "first_message_time": timestamp,
+        }
+        entry = membership[user_id]
+    elif entry["first_message_time"] is None or (
+        timestamp < entry["first_message_time"]
+    ):
+        entry["first_message_time"] = timestamp
+
+    subtype = msg.get("subtype")
+    if subtype == CHANNEL_JOIN_SUBTYPE:
+        if not entry["join_time"] or timestamp < entry["join_time"]:
+            entry["join_time"] = timestamp
+            entry["active"] = True
+    elif subtype == CHANNEL_LEAVE_SUBTYPE:
+        if not entry["leave_time"] or timestamp > entry["leave_time"]:
+            entry["leave_time"] = timestamp
+            entry["active"] = False
+
+
+def _reactors(msg: dict[str, Any]) -> Iterator[str]:
+    """Yield the IDs of users listed on *msg*'s reactions."""
+    reactions = msg.get("reactions")
+    if not isinstance(reactions, list):
+        return
+    for reaction in reactions:
+        if isinstance(reaction, dict):
+            yield from (u for u in reaction.get("users") or [] if u)
+
+
+def _load_day_file(path: Path, channel: str) -> list[dict[str, Any]]:
+    """Return the message dicts in one daily file; ``[]`` if unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            msgs = json.load(f)
+    except (OSError, ValueError) as e:
+        log_with_context(
+            logging.WARNING,
+            f"Could not read {path.name} in {channel}: {e}",
+            channel=channel,
+        )
+        return []
+    if not isinstance(msgs, list):
+        return []
+    return [m for m in msgs if isinstance(m, dict)]
+
+
+def scan_channel(ch_dir: Path, channel: str) -> ChannelSummary:
+    """Parse every daily file in *ch_dir* once and summarize the channel.
+
+    Unreadable files are logged and skipped.
+
+    Args:
+        ch_dir: The channel's export directory.
+        channel: Channel name for log context.
+
+    Returns:
+        The channel summary.
+    """
+    summary = ChannelSummary(fingerprint=_fingerprint(ch_dir))
+    seen_ts: set[str] = set()
+    users: set[str] = set()
+    reactors: set[str] = set()
+    file_ids: set[str] = set()
+    thread_roots: list[str] = []
+    first_key = last_key = 0.0
+
+    for name, _, _ in summary.fingerprint:
+        for m in _load_day_file(ch_dir / name, channel):
+            files = m.get("files")
+            if isinstance(files, list):
+                summary.file_count += len(files)
+                file_ids.update(
+                    f["id"] for f in files if isinstance(f, dict) and f.get("id")
+                )
+
+            is_message = m.get("type") == "message"
+            ts = m.get("ts")
+            if is_message:
+                summary.message_count += 1
+                if m.get("user"):
+                    users.add(m["user"])
+                reactors.update(_reactors(m))
+            if not ts:
+                continue
+            if is_message:
+                _record_membership(summary.membership, m)
+            # The send loop keeps the first message it meets for each ts,
+            # visiting files in name order, so the first occurrence here wins.
+            if ts in seen_ts:
+                continue
+            seen_ts.add(ts)
+            if not is_message:
+                continue
+
+            summary.unique_message_count += 1
+            key = float(ts)
+            if summary.first_ts is None or key < first_key:
+                summary.first_ts, first_key = ts, key
+            if summary.last_ts is None or key > last_key:
+                summary.last_ts, last_key = ts, key
+            if m.get("thread_ts") == ts:
+                thread_roots.append(ts)
+
+    summary.users = sorted(users)
+    summary.reactors = sorted(reactors)
+    summary.file_ids = sorted(file_ids)
+    summary.thread_roots = sorted(thread_roots, key=float)
+    return summary
+
+
+class ExportCatalog:
+    """Per-channel summaries of an export, built lazily and kept fresh.
+
+    Safe to share between channel worker threads.
+    """
+
+    def __init__(
+        self,
+        export_root: Path,
+        channels: dict[str, ChannelSummary] | None = None,
+    ) -> None:
+        self.export_root = export_root
+        self._channels: dict[str, ChannelSummary] = dict(channels or {})
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, export_root: Path, path: Path | None = None) -> ExportCatalog:
+        """Load a saved catalog, or start an empty one.
+
+        A missing, unreadable or outdated catalog file is not an error:
+        channels are simply scanned again as they are requested.
+
+        Args:
+            export_root: Root of the Slack export.
+            path: Catalog file; defaults to :data:`CATALOG_FILENAME` in
+                *export_root*.
+
+        Returns:
+            The catalog.
+        """
+        path = path or export_root / CATALOG_FILENAME
+        if not path.exists():
+            return cls(export_root)
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("schema_version") != CATALOG_SCHEMA_VERSION:
+                raise ValueError(f"unsupported schema {data.get('schema_version')}")
+            channels = {
+                name: ChannelSummary(**entry)
+                for name, entry in data["channels"].items()
+            }
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            log_with_context(
+                logging.WARNING,
+                f"Ignoring export catalog {path}: {e}",
+            )
+            return cls(export_root)
+        log_with_context(
+            logging.DEBUG,
+            f"Loaded export catalog for {len(channels)} channels from {path}",
+        )
+        return cls(export_root, channels)
+
+    def __contains__(self, channel: str) -> bool:
+        with self._lock:
+            return channel in self._channels
+
+    def channel(self, channel: str) -> ChannelSummary:
+        """Return the summary for *channel*, scanning it if stale or missing."""
+        ch_dir = self.export_root / channel
+        with self._lock:
+            summary = self._channels.get(channel)
+        if summary is not None and summary.fingerprint == _fingerprint(ch_dir):
+            return summary
+
+        summary = scan_channel(ch_dir, channel)
+        with self._lock:
+            self._channels[channel] = summary
+        return summary
+
+    def build(self, channels: Iterable[str]) -> ExportCatalog:
+        """Make sure every channel in *channels* has a fresh summary."""
+        for channel in channels:
+            self.channel(channel)
+        return self
+
+    def save(self, path: Path | None = None) -> Path:
+        """Write the catalog atomically and return the path written.
+
+        Args:
+            path: Destination; defaults to :data:`CATALOG_FILENAME` in the
+                export root.
+        """
+        path = path or self.export_root / CATALOG_FILENAME
+        with self._lock:
+            data = {
+                "schema_version": CATALOG_SCHEMA_VERSION,
+                "channels": {
+                    name: asdict(summary)
+                    for name, summary in sorted(self._channels.items())
+                },
+            }
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        return path
+
+
+def channel_summary(ctx: MigrationContext, channel: str) -> ChannelSummary:
+    """Return *channel*'s summary from the run's catalog, or scan it directly."""
+    if ctx.export_catalog is None:
+        return scan_channel(ctx.export_root / channel, channel)
+    return ctx.export_catalog.channel(channel)
@@ -0,0 +1,588 @@
+"""Deterministic synthetic Slack exports for scale testing and benchmarks.
+
+The fixture exports in the test suite hold a handful of messages, which
+says nothing about how the migrator behaves on a workspace with tens of
+thousands of users and millions of messages.  :func:`generate_export`
+writes an export tree of any size in the layout Slack produces
+(``users.json``, ``channels.json`` and one ``YYYY-MM-DD.json`` per channel
+per active day).  It reads the same as a real export to
+:class:`~slack_chat_migrator.services.export_inspector.ExportInspector`
+and the migrator.
+
+Output depends only on the :class:`ExportSpec`.  Each channel draws from
+its own random stream seeded from ``(seed, channel index)``, so a channel's
+content does not change when other parameters such as the channel count
+change.  Messages are written one day file at a time, so memory stays
+bounded by the busiest day of a single channel.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import random
+from bisect import bisect
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import accumulate
+from pathlib import Path
+from typing import Any
+
+from slack_chat_migrator.constants import BOT_MESSAGE_SUBTYPE
+from slack_chat_migrator.utils.logging import log_with_context
+
+SECONDS_PER_DAY = 86400
+_MICROS = 1_000_000
+
+_FIRST_NAMES = (
+    "Ada", "Alan", "Barbara", "Claude", "Dennis", "Edsger", "Frances", "Grace",
+    "Guido", "Hedy", "Ivan", "John", "Ken", "Linus", "Margaret", "Niklaus",
+    "Radia", "Rob", "Shafi", "Tim",
+)  # fmt: skip
+_LAST_NAMES = (
+    "Allen", "Backus", "Cerf", "Dijkstra", "Engelbart", "Floyd", "Hamilton",
+    "Hopper", "Kay", "Knuth", "Lamport", "Liskov", "Lovelace", "McCarthy",
+    "Perlman", "Ritchie", "Thompson", "Turing", "Wirth", "Wozniak",
+)  # fmt: skip
+_WORDS = (
+    "deploy", "review", "merge", "build", "release", "ticket", "meeting",
+    "design", "latency", "budget", "customer", "roadmap", "incident", "query",
+    "cache", "schema", "draft", "launch", "metric", "sprint", "the", "a",
+    "we", "should", "can", "today", "tomorrow", "after", "before", "with",
+    "for", "on", "is", "looks", "good", "blocked", "done", "please", "check",
+    "update",
+)  # fmt: skip
+_EMOJI = (
+    "+1", "heart", "tada", "eyes", "joy", "white_check_mark", "rocket",
+    "pray", "fire", "thinking_face", "100", "raised_hands",
+)  # fmt: skip
+_FILE_TYPES = (
+    # (extension, filetype, mimetype, median size in bytes)
+    ("png", "png", "image/png", 250_000),
+    ("jpg", "jpg", "image/jpeg", 400_000),
+    ("pdf", "pdf", "application/pdf", 600_000),
+    ("txt", "text", "text/plain", 4_000),
+    ("csv", "csv", "text/csv", 60_000),
+    ("docx", "docx", "application/msword", 120_000),
+    ("zip", "zip", "application/zip", 2_000_000),
+    ("mp4", "mp4", "video/mp4", 12_000_000),
+)  # fmt: skip
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """Shape of a synthetic export.
+
+    Attributes:
+        users: Number of users in ``users.json``, bots included.
+        channels: Number of channel directories.
+        messages: Top-level messages and thread replies across all channels.
+            System messages are not counted.
+        days: Number of days the history spans.
+        start_ts: Epoch seconds of the first day (UTC midnight).
+        channel_skew: Zipf exponent for how messages spread over channels.
+            ``0`` is uniform; ``1`` gives a few busy channels and a long
+            tail of quiet ones, as in most workspaces.
+        user_skew: Zipf exponent for how often each channel member posts.
+        channel_members: Median members per channel.  The first channel
+            (``general``) always has every user.
+        thread_ratio: Fraction of top-level messages that start a thread.
+        max_thread_replies: Upper bound on replies per thread.  Reply
+            counts are drawn uniformly between 1 and this.
+        reaction_density: Mean reactions per message.
+        file_ratio: Fraction of messages with attachments.
+        edit_ratio: Fraction of messages marked as edited.
+        rich_text_ratio: Fraction of messages that carry ``rich_text``
+            blocks alongside ``text``.
+        mention_ratio: Fraction of messages that mention another member.
+        join_events: Emit a ``channel_join`` message for each human member
+            at the start of the first day.
+        bot_ratio: Fraction of users that are bots.
+        domain: Email domain of generated users.
+        seed: Random seed.  Equal specs produce byte-identical exports.
+    """
+
+    users: int = 50
+    channels: int = 10
+    messages: int = 1_000
+    days: int = 30
+    start_ts: int = 1_672_531_200  # 2023-01-01T00:00:00Z
+    channel_skew: float = 1.0
+    user_skew: float = 1.0
+    channel_members: int = 25
+    thread_ratio: float = 0.1
+    max_thread_replies: int = 8
+    reaction_density: float = 0.3
+    file_ratio: float = 0.05
+    edit_ratio: float = 0.05
+    rich_text_ratio: float = 0.5
+    mention_ratio: float = 0.1
+    join_events: bool = True
+    bot_ratio: float = 0.02
+    domain: str = "example.com"
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        """Reject specs that cannot produce a usable export.
+
+        Raises:
+            ValueError: If a count or ratio is out of range.
+        """
+        if self.users < 2:
+            raise ValueError("users must be at least 2")
+        if self.channels < 1:
+            raise ValueError("channels must be at least 1")
+        if self.messages < 0 or self.days < 1 or self.max_thread_replies < 1:
+            raise ValueError("messages, days and max_thread_replies out of range")
+        for name in (
+            "thread_ratio",
+            "file_ratio",
+            "edit_ratio",
+            "rich_text_ratio",
+            "mention_ratio",
+            "bot_ratio",
+        ):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.reaction_density < 0:
+            raise ValueError("reaction_density must not be negative")
+
+
+@dataclass
+class GeneratedExport:
+    """What :func:`generate_export` wrote.
+
+    Attributes:
+        root: The export directory.
+        users: Users written to ``users.json``.
+        channels: Channel directories written.
+        messages: Top-level messages and replies written.
+        threads: Messages that start a thread.
+        reactions: Reaction entries (emoji, user pairs).
+        files: File objects attached to messages.
+        edits: Messages marked as edited.
+        day_files: Daily message files written.
+        bytes_written: Total size of every file written.
+        channel_messages: Messages written per channel name.
+    """
+
+    root: Path
+    users: int = 0
+    channels: int = 0
+    messages: int = 0
+    threads: int = 0
+    reactions: int = 0
+    files: int = 0
+    edits: int = 0
+    day_files: int = 0
+    bytes_written: int = 0
+    channel_messages: dict[str, int] = field(default_factory=dict)
+
+
+def _split_evenly(total: int, weights: list[float], minimum: int = 0) -> list[int]:
+    """Split *total* into integer parts proportional to *weights*.
+
+    Uses largest remainders so the parts always sum to *total*.  Every
+    part gets at least *minimum* while ``total`` allows.
+
+    Args:
+        total: Amount to split.
+        weights: Non-negative weights, one per part.
+        minimum: Floor for each part.
+
+    Returns:
+        One count per weight.
+    """
+    n = len(weights)
+    if n == 0:
+        return []
+    floor = min(minimum, total // n)
+    rest = total - floor * n
+    weight_sum = sum(weights) or 1.0
+    shares = [rest * w / weight_sum for w in weights]
+    parts = [int(s) for s in shares]
+    leftover = rest - sum(parts)
+    by_remainder = sorted(range(n), key=lambda i: parts[i] - shares[i])
+    for i in by_remainder[:leftover]:
+        parts[i] += 1
+    return [floor + p for p in parts]
+
+
+def _zipf_weights(n: int, exponent: float) -> list[float]:
+    return [1.0 / (rank + 1) ** exponent for rank in range(n)]
+
+
+def _poisson(rng: random.Random, mean: float) -> int:
+    """Draw from a Poisson distribution (Knuth; fine for small means)."""
+    if mean <= 0:
+        return 0
+    limit, k, p = math.exp(-mean), 0, rng.random()
+    while p > limit:
+        k += 1
+        p *= rng.random()
+    return k
+
+
+def _format_ts(micros: int) -> str:
+    return f"{micros // _MICROS}.{micros % _MICROS:06d}"
+
+
+def _user_id(index: int, is_bot: bool) -> str:
+    return f"{'B' if is_bot else 'U'}{index:08d}"
+
+
+def _channel_name(index: int, width: int) -> str:
+    return "general" if index == 0 else f"channel-{index:0{width}d}"
+
+
+def _build_users(spec: ExportSpec, rng: random.Random) -> list[dict[str, Any]]:
+    bots = set(
+        rng.sample(range(1, spec.users), round((spec.users - 1) * spec.bot_ratio))
+    )
+    users = []
+    for i in range(spec.users):
+        is_bot = i in bots
+        first = _FIRST_NAMES[i % len(_FIRST_NAMES)]
+        last = _LAST_NAMES[(i // len(_FIRST_NAMES)) % len(_LAST_NAMES)]
+        handle = f"{first}.{last}.{i}".lower()
+        real_name = f"{first} {last}" if not is_bot else f"{first} Bot {i}"
+        profile: dict[str, Any] = {"real_name": real_name, "display_name": handle}
+        if not is_bot:
+            profile["email"] = f"{handle}@{spec.domain}"
+        else:
+            profile["bot_id"] = f"BOT{i:08d}"
+        users.append(
+            {
+                "id": _user_id(i, is_bot),
+                "name": handle,
+                "real_name": real_name,
+                "deleted": False,
+                "is_bot": is_bot,
+                "is_app_user": False,
+                "is_restricted": False,
+                "profile": profile,
+            }
+        )
+    return users
+
+
+class _ChannelWriter:
+    """Generates and writes one channel's history, a day at a time."""
+
+    def __init__(
+        self,
+        spec: ExportSpec,
+        index: int,
+        name: str,
+        users: list[dict[str, Any]],
+        out_dir: Path,
+        result: GeneratedExport,
+    ) -> None:
+        self.spec = spec
+        self.index = index
+        self.name = name
+        self.out_dir = out_dir
+        self.result = result
+        self.rng = random.Random(f"{spec.seed}:channel:{index}")  # noqa: S311
+        self.channel_id = f"C{index:08d}"
+        self.users = users
+
+        if index == 0:
+            members = list(range(len(users)))
+        else:
+            size = round(spec.channel_members * self.rng.lognormvariate(0, 0.75))
+            size = max(2, min(len(users), size))
+            members = sorted(self.rng.sample(range(len(users)), size))
+        self.members: list[str] = [users[i]["id"] for i in members]
+        posters = self.members[:]
+        self.rng.shuffle(posters)
+        self.posters: list[str] = posters
+        self.poster_weights = list(
+            accumulate(_zipf_weights(len(posters), spec.user_skew))
+        )
+        self.is_bot = {users[i]["id"]: users[i]["is_bot"] for i in members}
+        # Bots post but do not react, mention or join
+        self.humans = [m for m in self.members if not self.is_bot[m]] or self.members
+        self.file_seq = 0
+
+    # -- Metadata -----------------------------------------------------------
+
+    def metadata(self) -> dict[str, Any]:
+        """Return this channel's ``channels.json`` entry."""
+        creator = self.members[0]
+        created = self.spec.start_ts
+        return {
+            "id": self.channel_id,
+            "name": self.name,
+            "created": created,
+            "creator": creator,
+            "is_archived": False,
+            "is_general": self.index == 0,
+            "members": self.members,
+            "topic": {"value": "", "creator": "", "last_set": 0},
+            "purpose": {
+                "value": f"Synthetic channel {self.index}",
+                "creator": creator,
+                "last_set": created,
+            },
+        }
+
+    # -- Messages -----------------------------------------------------------
+
+    def _pick_poster(self) -> str:
+        roll = self.rng.random() * self.poster_weights[-1]
+        return self.posters[
+            min(bisect(self.poster_weights, roll), len(self.posters) - 1)
+        ]
+
+    def _text(self, author: str) -> str:
+        rng = self.rng
+        words = rng.choices(_WORDS, k=rng.randint(3, 24))
+        if rng.random() < 0.2:
+            words[rng.randrange(len(words))] = f"*{rng.choice(_WORDS)}*"
+        if rng.random() < 0.1:
+            words.append(f"`{rng.choice(_WORDS)}()`")
+        if rng.random() < 0.05:
+            words.append(f"<https://example.com/{rng.choice(_WORDS)}|link>")
+        if rng.random() < self.spec.mention_ratio:
+            other = rng.choice(self.humans)
+            if other != author:
+                words.insert(0, f"<@{other}>")
+        return " ".join(words)
+
+    @staticmethod
+    def _rich_text(text: str) -> list[dict[str, Any]]:
+        """Return ``rich_text`` blocks equivalent to *text*, as Slack sends."""
+        elements: list[dict[str, Any]] = []
+        plain: list[str] = []
+
+        def flush() -> None:
+            if plain:
+                elements.append({"type": "text", "text": " ".join(plain) + " "})
+                plain.clear()
+
+        for token in text.split(" "):
+            if token.startswith("<@") and token.endswith(">"):
+                flush()
+                elements.append({"type": "user", "user_id": token[2:-1]})
+                plain.append("")
+            elif token.startswith("*") and token.endswith("*") and len(token) > 2:
+                flush()
+                elements.append(
+                    {"type": "text", "text": token[1:-1], "style": {"bold": True}}
+                )
+                plain.append("")
+            else:
+                plain.append(token)
+        tail = " ".join(plain)
+        if tail:
+            elements.append({"type": "text", "text": tail})
+        return [
+            {
+                "type": "rich_text",
+                "block_id": "gen",
+                "elements": [{"type": "rich_text_section", "elements": elements}],
+            }
+        ]
+
+    def _files(self, author: str, ts_micros: int) -> list[dict[str, Any]]:
+        rng = self.rng
+        files = []
+        for _ in range(1 if rng.random() < 0.85 else rng.randint(2, 4)):
+            self.file_seq += 1
+            ext, filetype, mimetype, median = rng.choice(_FILE_TYPES)
+            file_id = f"F{self.index:06d}{self.file_seq:08d}"
+            name = f"{rng.choice(_WORDS)}_{self.file_seq}.{ext}"
+            url = f"https://files.slack.com/files-pri/T00000000-{file_id}/{name}"
+            files.append(
+                {
+                    "id": file_id,
+                    "created": ts_micros // _MICROS,
+                    "timestamp": ts_micros // _MICROS,
+                    "name": name,
+                    "title": name,
+                    "mimetype": mimetype,
+                    "filetype": filetype,
+                    "user": author,
+                    "mode": "hosted",
+                    "size": max(1, int(median * rng.lognormvariate(0, 1))),
+                    "url_private": url,
+                    "url_private_download": f"{url}?dl=1",
+                }
+            )
+        return files
+
+    def _reactions(self) -> list[dict[str, Any]]:
+        count = _poisson(self.rng, self.spec.reaction_density)
+        if not count:
+            return []
+        reactions: dict[str, list[str]] = {}
+        for _ in range(count):
+            name = self.rng.choice(_EMOJI)
+            user = self.rng.choice(self.humans)
+            users = reactions.setdefault(name, [])
+            if user not in users:
+                users.append(user)
+        self.result.reactions += sum(len(u) for u in reactions.values())
+        return [
+            {"name": name, "users": users, "count": len(users)}
+            for name, users in reactions.items()
+        ]
+
+    def _message(self, ts_micros: int, thread_ts: str | None) -> dict[str, Any]:
+        spec, rng = self.spec, self.rng
+        author = self._pick_poster()
+        ts = _format_ts(ts_micros)
+        text = self._text(author)
+        msg: dict[str, Any] = {"type": "message", "text": text, "ts": ts}
+        if self.is_bot[author]:
+            msg["subtype"] = BOT_MESSAGE_SUBTYPE
+            msg["bot_id"] = f"BOT{author[1:]}"
+            msg["username"] = author
+        else:
+            msg["user"] = author
+        if rng.random() < spec.rich_text_ratio:
+            msg["blocks"] = self._rich_text(text)
+        if thread_ts is not None:
+            msg["thread_ts"] = thread_ts
+        if rng.random() < spec.file_ratio:
+            msg["files"] = self._files(author, ts_micros)
+            self.result.files += len(msg["files"])
+        if rng.random() < spec.edit_ratio:
+            edited = ts_micros + rng.randint(1, 3600) * _MICROS
+            msg["edited"] = {"user": author, "ts": _format_ts(edited)}
+            self.result.edits += 1
+        reactions = self._reactions()
+        if reactions:
+            msg["reactions"] = reactions
+        return msg
+
+    def _day(self, day: int, count: int, joins: list[str]) -> list[dict[str, Any]]:
+        """Build one day's messages: joins first, then threads in ts order."""
+        rng = self.rng
+        day_start = (self.spec.start_ts + day * SECONDS_PER_DAY) * _MICROS
+        # Joins land in the first second; messages fill the rest of the day
+        stamps = sorted(
+            rng.randrange(_MICROS, SECONDS_PER_DAY * _MICROS) for _ in range(count)
+        )
+        for i in range(1, len(stamps)):
+            if stamps[i] <= stamps[i - 1]:
+                stamps[i] = stamps[i - 1] + 1
+
+        messages: list[dict[str, Any]] = [
+            {
+                "type": "message",
+                "subtype": "channel_join",
+                "user": user,
+                "text": f"<@{user}> has joined the channel",
+                "ts": _format_ts(day_start + i),
+            }
+            for i, user in enumerate(joins)
+        ]
+        i = 0
+        while i < count:
+            parent = self._message(day_start + stamps[i], None)
+            messages.append(parent)
+            i += 1
+            if i < count and rng.random() < self.spec.thread_ratio:
+                replies = min(rng.randint(1, self.spec.max_thread_replies), count - i)
+                parent["thread_ts"] = parent["ts"]
+                reply_msgs = [
+                    self._message(day_start + stamps[i + r], parent["ts"])
+                    for r in range(replies)
+                ]
+                i += replies
+                parent["reply_count"] = replies
+                parent["replies"] = [
+                    {"user": m.get("user", m.get("username")), "ts": m["ts"]}
+                    for m in reply_msgs
+                ]
+                parent["latest_reply"] = reply_msgs[-1]["ts"]
+                messages.extend(reply_msgs)
+                self.result.threads += 1
+        return messages
+
+    def write(self, message_count: int) -> None:
+        """Write every day file for *message_count* messages."""
+        spec = self.spec
+        ch_dir = self.out_dir / self.name
+        ch_dir.mkdir(parents=True, exist_ok=True)
+
+        day_weights = [self.rng.random() + 0.1 for _ in range(spec.days)]
+        per_day = _split_evenly(message_count, day_weights)
+        # Every member joins when the channel is created, on day 0
+        first_joins = (
+            [m for m in self.members if not self.is_bot[m]] if spec.join_events else []
+        )
+
+        for day, count in enumerate(per_day):
+            joins = first_joins if day == 0 else []
+            if not count and not joins:
+                continue
+            messages = self._day(day, count, joins)
+            date = _date_name(spec.start_ts + day * SECONDS_PER_DAY)
+            # json.dumps uses the C encoder; json.dump streams in Python
+            data = json.dumps(messages, separators=(",", ":")).encode("utf-8")
+            (ch_dir / f"{date}.json").write_bytes(data)
+            self.result.day_files += 1
+            self.result.bytes_written += len(data)
+
+        self.result.messages += message_count
+        self.result.channel_messages[self.name] = message_count
+
+
+def _date_name(epoch: int) -> str:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def generate_export(spec: ExportSpec, output_dir: Path) -> GeneratedExport:
+    """Write a synthetic Slack export for *spec* into *output_dir*.
+
+    Args:
+        spec: Shape of the export.
+        output_dir: Directory to write into; created if missing.  Files
+            already there with the same names are overwritten.
+
+    Returns:
+        Counts of what was written.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    result = GeneratedExport(root=output_dir)
+    rng = random.Random(f"{spec.seed}:workspace")  # noqa: S311
+
+    users = _build_users(spec, rng)
+    result.users = len(users)
+
+    width = len(str(spec.channels - 1))
+    channel_counts = _split_evenly(
+        spec.messages, _zipf_weights(spec.channels, spec.channel_skew), minimum=1
+    )
+    # Busiest channels are spread through the listing, as in real exports
+    order = list(range(spec.channels))
+    rng.shuffle(order)
+
+    channels_meta = []
+    for index in range(spec.channels):
+        writer = _ChannelWriter(
+            spec, index, _channel_name(index, width), users, output_dir, result
+        )
+        writer.write(channel_counts[order[index]])
+        channels_meta.append(writer.metadata())
+        result.channels += 1
+        if result.channels % 100 == 0:
+            log_with_context(
+                logging.INFO,
+                "Generated %d of %d channels (%d messages)",
+                result.channels,
+                spec.channels,
+                result.messages,
+            )
+
+    for filename, data in (("users.json", users), ("channels.json", channels_meta)):
+        path = output_dir / filename
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        result.bytes_written += path.stat().st_size
+
+    return result
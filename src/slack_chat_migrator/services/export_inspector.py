@@ -10,7 +10,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
-from slack_chat_migrator.utils.logging import log_with_context
+from slack_chat_migrator.services.export_catalog import ExportCatalog
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +21,15 @@ class ExportInspector:
     Args:
         export_path: Root of the Slack export (contains channels.json,
             users.json, and per-channel subdirectories).
+        catalog: Message summaries to read counts from; defaults to the
+            export's saved catalog, scanning channels it lacks.
     """
 
-    def __init__(self, export_path: Path) -> None:
+    def __init__(self, export_path: Path, catalog: ExportCatalog | None = None) -> None:
         self.export_path = export_path
+        self.catalog = (
+            catalog if catalog is not None else ExportCatalog.load(export_path)
+        )
         self._channels_data: list[dict[str, Any]] | None = None
         self._users_data: list[dict[str, Any]] | None = None
 
@@ -84,21 +89,10 @@ class ExportInspector:
 
     def get_message_counts(self) -> dict[str, int]:
         """Return ``{channel_name: message_count}`` for each channel dir."""
-        counts: dict[str, int] = {}
-        for ch_dir in self.get_channel_dirs():
-            total = 0
-            for jf in ch_dir.glob("*.json"):
-                try:
-                    with open(jf, encoding="utf-8") as f:
-                        msgs = json.load(f)
-                    total += sum(1 for m in msgs if m.get("type") == "message")
-                except (OSError, ValueError):
-                    log_with_context(
-                        logging.WARNING,
-                        f"Could not read {jf.name} in {ch_dir.name}",
-                    )
-            counts[ch_dir.name] = total
-        return counts
+        return {
+            ch_dir.name: self.catalog.channel(ch_dir.name).message_count
+            for ch_dir in self.get_channel_dirs()
+        }
 
     def get_total_message_count(self) -> int:
         """Total messages across all channels."""
@@ -106,19 +100,10 @@ class ExportInspector:
 
     def get_total_file_count(self) -> int:
         """Count file references across all messages."""
-        total = 0
-        for ch_dir in self.get_channel_dirs():
-            for jf in ch_dir.glob("*.json"):
-                try:
-                    with open(jf, encoding="utf-8") as f:
-                        msgs = json.load(f)
-                    for m in msgs:
-                        files = m.get("files", [])
-                        if isinstance(files, list):
-                            total += len(files)
-                except (OSError, ValueError):
-                    pass
-        return total
+        return sum(
+            self.catalog.channel(ch_dir.name).file_count
+            for ch_dir in self.get_channel_dirs()
+        )
 
     def get_export_date_range(self) -> tuple[str, str] | None:
         """Return (earliest_date, latest_date) from JSON filenames.
@@ -0,0 +1,171 @@
+"""Persistent record of attachments already uploaded to Google Drive.
+
+Each successful Drive upload is appended as one JSON line mapping the Slack
+file ID and content MD5 to the Drive file ID and link.  The log lives next
+to the per-run output directories (``migration_logs/.attachment_store.jsonl``)
+so re-runs, resumed runs and update mode reuse earlier uploads instead of
+downloading, hashing and uploading the same files again.
+
+Entries are never rewritten in place: removing one appends a tombstone,
+and :meth:`AttachmentStore.load` replays the log into in-memory indexes
+keyed by Slack file ID and by MD5.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import random
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO
+
+from slack_chat_migrator.utils.logging import log_with_context
+
+ATTACHMENT_STORE_FILENAME = ".attachment_store.jsonl"
+
+
+def attachment_store_path(output_dir: str | Path) -> Path:
+    """Return the store path shared by all runs alongside *output_dir*."""
+    return Path(output_dir).parent / ATTACHMENT_STORE_FILENAME
+
+
+@dataclass(frozen=True)
+class StoredAttachment:
+    """A Slack file previously uploaded to Drive."""
+
+    slack_file_id: str
+    md5: str
+    drive_file_id: str
+    url: str
+
+
+class AttachmentStore:
+    """Append-only log of Drive uploads indexed by Slack file ID and MD5.
+
+    Safe to share between channel worker threads.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._by_file_id: dict[str, StoredAttachment] = {}
+        self._by_md5: dict[str, StoredAttachment] = {}
+        self._lock = threading.Lock()
+        self._fh: IO[str] | None = None
+
+    @classmethod
+    def load(cls, path: Path | None) -> AttachmentStore:
+        """Replay the log at *path*, or start an empty store.
+
+        Malformed lines (e.g. a write cut short by a crash) are skipped.
+
+        Args:
+            path: Log file, or ``None`` for an in-memory store.
+
+        Returns:
+            The loaded store.
+        """
+        store = cls(path)
+        if path is None or not path.exists():
+            return store
+        skipped = 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                        if record.get("deleted"):
+                            store._forget(record["slack_file_id"])
+                        else:
+                            store._index(StoredAttachment(**record))
+                    except (ValueError, TypeError, KeyError):
+                        skipped += 1
+        except OSError as e:
+            log_with_context(
+                logging.WARNING,
+                f"Could not read attachment store {path}: {e}",
+            )
+            return cls(path)
+        if skipped:
+            log_with_context(
+                logging.WARNING,
+                f"Skipped {skipped} malformed entries in attachment store {path}",
+            )
+        log_with_context(
+            logging.DEBUG,
+            f"Loaded {len(store)} stored attachments from {path}",
+        )
+        return store
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_file_id)
+
+    def get(self, slack_file_id: str) -> StoredAttachment | None:
+        """Return the stored upload for a Slack file ID, if any."""
+        with self._lock:
+            return self._by_file_id.get(slack_file_id)
+
+    def find_by_md5(self, md5: str) -> StoredAttachment | None:
+        """Return a stored upload with the given content MD5, if any."""
+        with self._lock:
+            return self._by_md5.get(md5)
+
+    def entries(self) -> list[StoredAttachment]:
+        """Return a snapshot of all stored uploads."""
+        with self._lock:
+            return list(self._by_file_id.values())
+
+    def sample(self, k: int) -> list[StoredAttachment]:
+        """Return up to *k* stored uploads chosen at random."""
+        entries = self.entries()
+        if len(entries) <= k:
+            return entries
+        return random.sample(entries, k)
+
+    def add(self, entry: StoredAttachment) -> None:
+        """Record an upload, replacing any earlier entry for the same file."""
+        with self._lock:
+            self._index(entry)
+            self._append(asdict(entry))
+
+    def remove(self, slack_file_id: str) -> None:
+        """Forget the upload for *slack_file_id* (e.g. it was deleted in Drive)."""
+        with self._lock:
+            if slack_file_id not in self._by_file_id:
+                return
+            self._forget(slack_file_id)
+            self._append({"slack_file_id": slack_file_id, "deleted": True})
+
+    def close(self) -> None:
+        """Close the underlying file handle, if open."""
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def __enter__(self) -> AttachmentStore:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _index(self, entry: StoredAttachment) -> None:
+        self._forget(entry.slack_file_id)
+        self._by_file_id[entry.slack_file_id] = entry
+        self._by_md5[entry.md5] = entry
+
+    def _forget(self, slack_file_id: str) -> None:
+        old = self._by_file_id.pop(slack_file_id, None)
+        if old is not None and self._by_md5.get(old.md5) is old:
+            del self._by_md5[old.md5]
+
+    def _append(self, record: dict[str, object]) -> None:
+        if self.path is None:
+            return
+        if self._fh is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._fh = open(self.path, "a", encoding="utf-8")
+        self._fh.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._fh.flush()
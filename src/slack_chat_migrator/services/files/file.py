@@ -4,18 +4,18 @@ File handling module for the Slack to Google Chat migration tool
 
 from __future__ import annotations
 
-import hashlib
 import logging
 import mimetypes
-import os
-import re
-import tempfile
+import threading
 from typing import TYPE_CHECKING, Any, ClassVar
 
 import requests
 from googleapiclient.errors import HttpError
 
-from slack_chat_migrator.constants import DIRECT_UPLOAD_MAX_BYTES, MAX_FILE_SIZE_BYTES
+from slack_chat_migrator.constants import (
+    ATTACHMENT_STORE_VERIFY_SAMPLE,
+    DIRECT_UPLOAD_MAX_BYTES,
+)
 from slack_chat_migrator.core.config import MigrationConfig
 from slack_chat_migrator.core.state import MigrationState
 from slack_chat_migrator.services.chat import ChatFileUploader
@@ -24,7 +24,12 @@ from slack_chat_migrator.services.drive import (
     FolderManager,
     SharedDriveManager,
 )
+from slack_chat_migrator.services.files.attachment_store import (
+    AttachmentStore,
+    StoredAttachment,
+)
 from slack_chat_migrator.services.files.file_download import (
+    DownloadedFile,
     DownloadOutcome,
     create_drive_reference,
     download_file,
@@ -37,21 +42,19 @@ from slack_chat_migrator.services.files.file_permissions import (
 )
 from slack_chat_migrator.types import UploadResult
 from slack_chat_migrator.utils.api import escape_drive_query_value
+from slack_chat_migrator.utils.events import timed_event
 from slack_chat_migrator.utils.logging import log_with_context
 from slack_chat_migrator.utils.mime import resolve_drive_mime_type
 
 if TYPE_CHECKING:
+    from slack_chat_migrator.core.progress import ProgressTracker
     from slack_chat_migrator.services.chat_adapter import ChatAdapter
     from slack_chat_migrator.services.drive_adapter import DriveAdapter
+    from slack_chat_migrator.services.files.file_prefetch import AttachmentPrefetcher
 
 logger = logging.getLogger("slack_chat_migrator")
 
 
-def _safe_temp_suffix(name: str) -> str:
-    """Sanitize a filename for use as a temp file suffix."""
-    return "_" + re.sub(r"[^A-Za-z0-9._-]", "_", name)[:64]
-
-
 class FileHandler:
     """Handles file uploads and attachments during migration."""
 
@@ -75,6 +78,7 @@ class FileHandler:
         user_resolver: Any,
         state: MigrationState,
         dry_run: bool = False,
+        prefetcher: AttachmentPrefetcher | None = None,
     ) -> None:
         """Initialize the FileHandler.
 
@@ -88,6 +92,8 @@ class FileHandler:
             user_resolver: User resolver for external user detection
             state: Mutable migration state
             dry_run: Whether to run in dry run mode
+            prefetcher: Optional background downloader consulted before
+                fetching a file synchronously
         """
         self.drive_service = drive_service
         self.chat_service = chat_service
@@ -97,6 +103,17 @@ class FileHandler:
         self.user_resolver = user_resolver
         self.state = state
         self.dry_run = dry_run
+        self.prefetcher = prefetcher
+        # Notified of each successful upload; set by the migrator per run
+        self.progress_tracker: ProgressTracker | None = None
+
+        # Uploads recorded by earlier runs; see attach_attachment_store()
+        self.attachment_store: AttachmentStore | None = None
+        self._attachment_store_trusted: bool | None = None
+
+        # Guards processed_files and file_stats, which concurrent channel
+        # workers share
+        self._lock = threading.Lock()
 
         # Initialize the dictionary to track processed files
         self.processed_files: dict[str, Any] = {}
@@ -202,7 +219,8 @@ class FileHandler:
                 self._root_folder_id = self._shared_drive_id
                 log_with_context(
                     logging.DEBUG,
-                    f"Using shared drive root as attachment folder: {self._shared_drive_id}",
+                    "Using shared drive root as attachment folder: %s",
+                    self._shared_drive_id,
                 )
             else:
                 log_with_context(
@@ -245,7 +263,7 @@ class FileHandler:
             )
 
             log_with_context(
-                logging.DEBUG, f"Pre-cached {file_count} files from root folder"
+                logging.DEBUG, "Pre-cached %s files from root folder", file_count
             )
 
             # Then, find all channel subfolders and pre-cache them as well
@@ -291,12 +309,17 @@ class FileHandler:
                         if folders_processed % 10 == 0:
                             log_with_context(
                                 logging.DEBUG,
-                                f"Pre-cached {folders_processed}/{total_subfolders} subfolders ({total_files_cached} total files)",
+                                "Pre-cached %s/%s subfolders (%s total files)",
+                                folders_processed,
+                                total_subfolders,
+                                total_files_cached,
                             )
 
                 log_with_context(
                     logging.DEBUG,
-                    f"Completed pre-caching {total_files_cached} files from {folders_processed} channel folders",
+                    "Completed pre-caching %s files from %s channel folders",
+                    total_files_cached,
+                    folders_processed,
                 )
 
             except HttpError as e:
@@ -336,6 +359,27 @@ class FileHandler:
             UploadResult with upload details. Check ``.success``, ``.skipped``,
             or ``.error`` to determine outcome.
         """
+        with timed_event("file", channel=channel, file_id=file_obj.get("id")) as event:
+            result = self._upload_attachment(
+                file_obj, channel, space, user_service, sender_email
+            )
+            if event.enabled:
+                event.update(
+                    status=result.upload_type or "failed",
+                    bytes=file_obj.get("size", 0),
+                    cached=result.cached,
+                )
+            return result
+
+    def _upload_attachment(
+        self,
+        file_obj: dict[str, Any],
+        channel: str | None,
+        space: str | None,
+        user_service: ChatAdapter | None,
+        sender_email: str | None,
+    ) -> UploadResult:
+        """Implementation of :meth:`upload_attachment`."""
         self._sync_channel_context()
 
         try:
@@ -350,7 +394,10 @@ class FileHandler:
 
             log_with_context(
                 logging.DEBUG,
-                f"Processing file: {name} (MIME: {mime_type}, Size: {size})",
+                "Processing file: %s (MIME: %s, Size: %s)",
+                name,
+                mime_type,
+                size,
                 channel=channel,
                 file_id=file_id,
             )
@@ -360,70 +407,40 @@ class FileHandler:
                 cached.cached = True
                 return cached
 
-            file_content = self._download_file_content(file_obj, name, channel, file_id)
-            if file_content is None:
+            stored = self._check_attachment_store(file_obj, file_id, name, channel)
+            if stored is not None:
+                return stored
+
+            download = self._download_file_content(file_obj, name, channel, file_id)
+            if download is None:
                 return UploadResult(error="Download failed", name=name)
 
-            # Handle non-bytes download outcomes (Google Docs links, Drive files)
+            # Handle non-file download outcomes (Google Docs links, Drive files)
             handled, outcome_result = self._handle_download_outcome(
-                file_content, file_obj, name, channel, file_id
+                download, file_obj, name, channel, file_id
             )
             if handled:
                 return outcome_result
 
-            # After outcome handling, file_content is guaranteed to be bytes
-            assert isinstance(file_content, bytes)
-
-            # Validate size and resolve MIME type
-            if len(file_content) > MAX_FILE_SIZE_BYTES:
-                log_with_context(
-                    logging.WARNING,
-                    f"File {name} is very large ({len(file_content)} bytes), this may cause memory issues",
-                    channel=channel,
-                    file_id=file_id,
-                )
-
-            if not mime_type or mime_type == "null":
-                guessed_type, _ = mimetypes.guess_type(name)
-                mime_type = guessed_type if guessed_type else "application/octet-stream"
-                log_with_context(
-                    logging.DEBUG,
-                    f"Using guessed MIME type {mime_type} for file {name}",
-                    channel=channel,
-                    file_id=file_id,
+            # After outcome handling, download is guaranteed to be a spool file
+            assert isinstance(download, DownloadedFile)
+            try:
+                return self._upload_downloaded_file(
+                    file_obj,
+                    download,
+                    mime_type,
+                    channel,
+                    space,
+                    user_service,
+                    sender_email,
+                    file_id,
+                    name,
                 )
-
-            # Try direct Chat upload for eligible small images
-            direct_result = self._try_direct_upload(
-                file_obj,
-                file_content,
-                mime_type,
-                channel,
-                space,
-                user_service,
-                sender_email,
-                file_id,
-                name,
-            )
-            if direct_result:
-                return direct_result
-
-            # Fall back to Drive upload
-            drive_result = self._try_drive_upload(
-                file_obj,
-                file_content,
-                channel,
-                sender_email,
-                file_id,
-                name,
-            )
-            if drive_result:
-                return drive_result
-
-            return UploadResult(error="Upload failed", name=name)
+            finally:
+                download.discard()
 
         except (HttpError, requests.RequestException, OSError) as e:
-            self.file_stats["failed_uploads"] += 1
+            self._increment_stat("failed_uploads")
             log_with_context(
                 logging.ERROR,
                 f"Error uploading file: {e!s}",
@@ -433,24 +450,98 @@ class FileHandler:
             )
             return UploadResult(error=str(e), name=file_obj.get("name"))
 
+    def _upload_downloaded_file(
+        self,
+        file_obj: dict[str, Any],
+        download: DownloadedFile,
+        mime_type: str,
+        channel: str | None,
+        space: str | None,
+        user_service: ChatAdapter | None,
+        sender_email: str | None,
+        file_id: str,
+        name: str,
+    ) -> UploadResult:
+        """Upload a spooled download directly to Chat or, failing that, to Drive."""
+        # Size is already capped by download_file(); resolve the MIME type
+        if not mime_type or mime_type == "null":
+            guessed_type, _ = mimetypes.guess_type(name)
+            mime_type = guessed_type if guessed_type else "application/octet-stream"
+            log_with_context(
+                logging.DEBUG,
+                "Using guessed MIME type %s for file %s",
+                mime_type,
+                name,
+                channel=channel,
+                file_id=file_id,
+            )
+
+        # Try direct Chat upload for eligible small images
+        direct_result = self._try_direct_upload(
+            file_obj,
+            download,
+            mime_type,
+            channel,
+            space,
+            user_service,
+            sender_email,
+            file_id,
+            name,
+        )
+        if direct_result:
+            return direct_result
+
+        # Fall back to Drive upload
+        drive_result = self._try_drive_upload(
+            file_obj,
+            download,
+            channel,
+            sender_email,
+            file_id,
+            name,
+        )
+        if drive_result:
+            return drive_result
+
+        return UploadResult(error="Upload failed", name=name)
+
     def _sync_channel_context(self) -> None:
         """Propagate current channel to sub-uploaders for logging context."""
         current_ch = self.state.context.current_channel
         self.drive_uploader.current_channel = current_ch
         self.chat_uploader.current_channel = current_ch
 
+    def _increment_stat(self, key: str, amount: int = 1) -> None:
+        """Add *amount* to a ``file_stats`` counter under the handler lock."""
+        with self._lock:
+            self.file_stats[key] += amount
+
+    def _cache_result(self, file_id: str, result: UploadResult) -> None:
+        """Record *result* in ``processed_files`` under the handler lock."""
+        with self._lock:
+            self.processed_files[file_id] = result
+
+    def _report_uploaded(self, channel: str | None, size_bytes: int) -> None:
+        """Emit a FILE_UPLOADED progress event for *size_bytes* sent bytes."""
+        if self.progress_tracker is None:
+            return
+        self.progress_tracker.file_uploaded(
+            channel or self._get_current_channel() or "", size_bytes=size_bytes
+        )
+
     def _update_file_stats(self, file_obj: dict[str, Any], channel: str | None) -> None:
         """Update file processing statistics counters."""
-        self.file_stats["total_files"] += 1
-        if channel:
-            if channel not in self.file_stats["files_by_channel"]:
-                self.file_stats["files_by_channel"][channel] = 0
-            self.file_stats["files_by_channel"][channel] += 1
-
         username = file_obj.get("user", None)
-        if username:
-            user_email = self.user_map.get(username)
-            if user_email and self.user_resolver.is_external_user(user_email):
+        user_email = self.user_map.get(username) if username else None
+        is_external = bool(
+            user_email and self.user_resolver.is_external_user(user_email)
+        )
+        with self._lock:
+            self.file_stats["total_files"] += 1
+            if channel:
+                files_by_channel = self.file_stats["files_by_channel"]
+                files_by_channel[channel] = files_by_channel.get(channel, 0) + 1
+            if is_external:
                 self.file_stats["external_user_files"] += 1
 
     def _check_attachment_cache(
@@ -460,27 +551,133 @@ class FileHandler:
 
         Returns (found, cached_result). If found is False, cached_result is None.
         """
-        if file_id in self.processed_files:
-            cached_result: UploadResult | None = self.processed_files[file_id]
+        with self._lock:
+            found = file_id in self.processed_files
+            cached_result: UploadResult | None = self.processed_files.get(file_id)
+        if found:
             log_with_context(
                 logging.DEBUG,
-                f"File {name} already processed, using cached result",
+                "File %s already processed, using cached result",
+                name,
                 channel=channel,
                 file_id=file_id,
             )
             return True, cached_result
         return False, None
 
+    def attach_attachment_store(self, store: AttachmentStore) -> None:
+        """Reuse Drive uploads recorded in *store* and record new ones there.
+
+        Stored MD5s also seed the Drive uploader's hash cache so identical
+        content under a new Slack file ID is not uploaded again.
+        """
+        self.attachment_store = store
+        self._attachment_store_trusted = None
+        for entry in store.entries():
+            self.drive_uploader.file_hash_cache.setdefault(
+                entry.md5, (entry.drive_file_id, entry.url)
+            )
+
+    def is_known_attachment(self, file_id: str) -> bool:
+        """Return True if *file_id* was uploaded this run or a previous one."""
+        with self._lock:
+            if file_id in self.processed_files:
+                return True
+        return (
+            self.attachment_store is not None
+            and self.attachment_store.get(file_id) is not None
+        )
+
+    def _check_attachment_store(
+        self,
+        file_obj: dict[str, Any],
+        file_id: str,
+        name: str,
+        channel: str | None,
+    ) -> UploadResult | None:
+        """Return the Drive upload recorded for this file by an earlier run.
+
+        Entries are trusted once a random sample of the store has been
+        confirmed to still exist in Drive; otherwise each hit is checked
+        individually before it is reused.
+        """
+        store = self.attachment_store
+        if store is None:
+            return None
+        entry = store.get(file_id)
+        if entry is None:
+            return None
+
+        if self._attachment_store_trusted is None:
+            self._attachment_store_trusted = self._spot_check_attachment_store(store)
+        if not self._attachment_store_trusted and not self._drive_file_exists(
+            entry.drive_file_id
+        ):
+            store.remove(file_id)
+            return None
+
+        log_with_context(
+            logging.DEBUG,
+            "Reusing Drive file %s uploaded by a previous run for %s",
+            entry.drive_file_id,
+            name,
+            channel=channel,
+            file_id=file_id,
+        )
+        result = UploadResult(
+            upload_type="drive",
+            url=entry.url,
+            drive_id=entry.drive_file_id,
+            name=name,
+            mime_type=resolve_drive_mime_type(file_obj, name, channel, file_id),
+        )
+        self._cache_result(file_id, result)
+        return result
+
+    def _spot_check_attachment_store(self, store: AttachmentStore) -> bool:
+        """Verify a sample of stored uploads still exist in Drive.
+
+        Missing entries are removed from the store.
+
+        Returns:
+            True if every sampled entry was found.
+        """
+        sample = store.sample(ATTACHMENT_STORE_VERIFY_SAMPLE)
+        missing = [e for e in sample if not self._drive_file_exists(e.drive_file_id)]
+        for entry in missing:
+            store.remove(entry.slack_file_id)
+        if missing:
+            log_with_context(
+                logging.WARNING,
+                f"{len(missing)} of {len(sample)} sampled stored attachments are missing from Drive; verifying each stored attachment before reuse",
+            )
+        else:
+            log_with_context(
+                logging.INFO,
+                f"Verified {len(sample)} of {len(store)} stored attachments against Drive",
+            )
+        return not missing
+
+    def _drive_file_exists(self, drive_file_id: str) -> bool:
+        """Return True if *drive_file_id* exists in Drive and is not trashed."""
+        try:
+            file = self.drive_service.get_file(
+                drive_file_id, fields="id,trashed", supports_all_drives=True
+            )
+        except HttpError:
+            return False
+        return not file.get("trashed", False)
+
     def _download_file_content(
         self,
         file_obj: dict[str, Any],
         name: str,
         channel: str | None,
         file_id: str,
-    ) -> bytes | DownloadOutcome | None:
+    ) -> DownloadedFile | DownloadOutcome | None:
         """Download file content and return it, or None on failure."""
-        file_content = self._download_file(file_obj)
-        if file_content is None:
+        download = self._download_file(file_obj)
+        if download is None:
             log_with_context(
                 logging.ERROR,
                 f"Failed to download file {name}, skipping attachment processing",
@@ -488,13 +685,13 @@ class FileHandler:
                 file_id=file_id,
                 url_private=file_obj.get("url_private", "No URL")[:100],
             )
-            self.file_stats["failed_uploads"] += 1
+            self._increment_stat("failed_uploads")
             return None
-        return file_content
+        return download
 
     def _handle_download_outcome(
         self,
-        file_content: bytes | DownloadOutcome,
+        download: DownloadedFile | DownloadOutcome,
         file_obj: dict[str, Any],
         name: str,
         channel: str | None,
@@ -504,10 +701,11 @@ class FileHandler:
 
         Returns (handled, result). If handled is False, content should be uploaded normally.
         """
-        if file_content is DownloadOutcome.GOOGLE_DOCS_LINK:
+        if download is DownloadOutcome.GOOGLE_DOCS_LINK:
             log_with_context(
                 logging.DEBUG,
-                f"Google Docs/Sheets file cannot be attached - will appear as link in message text: {name}",
+                "Google Docs/Sheets file cannot be attached - will appear as link in message text: %s",
+                name,
                 channel=channel,
                 file_id=file_id,
             )
@@ -518,10 +716,11 @@ class FileHandler:
                 url=file_obj.get("url_private", ""),
             )
 
-        if file_content is DownloadOutcome.GOOGLE_DRIVE_FILE:
+        if download is DownloadOutcome.GOOGLE_DRIVE_FILE:
             log_with_context(
                 logging.DEBUG,
-                f"Creating direct Google Drive reference for file: {name}",
+                "Creating direct Google Drive reference for file: %s",
+                name,
                 channel=channel,
                 file_id=file_id,
             )
@@ -537,7 +736,7 @@ class FileHandler:
     def _try_direct_upload(
         self,
         file_obj: dict[str, Any],
-        file_content: bytes,
+        download: DownloadedFile,
         mime_type: str,
         channel: str | None,
         space: str | None,
@@ -550,7 +749,7 @@ class FileHandler:
 
         Returns the UploadResult if successful, None to fall through to Drive.
         """
-        actual_size = len(file_content)
+        actual_size = download.size
         use_direct = (
             space is not None
             and mime_type in self.DIRECT_UPLOAD_MIME_TYPES
@@ -562,22 +761,26 @@ class FileHandler:
 
         log_with_context(
             logging.DEBUG,
-            f"Attempting direct Chat upload for small image: {name} ({actual_size} bytes)",
+            "Attempting direct Chat upload for small image: %s (%s bytes)",
+            name,
+            actual_size,
             channel=channel,
             file_id=file_id,
         )
 
         direct_result = self._upload_direct_to_chat(
-            file_obj, file_content, channel, space, user_service, sender_email
+            file_obj, download, channel, space, user_service, sender_email
         )
         if direct_result:
-            self.processed_files[file_id] = direct_result
-            self.file_stats["direct_uploads"] += 1
+            self._cache_result(file_id, direct_result)
+            self._increment_stat("direct_uploads")
+            self._report_uploaded(channel, actual_size)
             return direct_result
 
         log_with_context(
             logging.DEBUG,
-            f"Direct upload failed for {name}, falling back to Drive upload",
+            "Direct upload failed for %s, falling back to Drive upload",
+            name,
             channel=channel,
             file_id=file_id,
         )
@@ -586,30 +789,34 @@ class FileHandler:
     def _try_drive_upload(
         self,
         file_obj: dict[str, Any],
-        file_content: bytes,
+        download: DownloadedFile,
         channel: str | None,
         sender_email: str | None,
         file_id: str,
         name: str,
     ) -> UploadResult | None:
         """Upload file to Google Drive and cache the result."""
-        actual_size = len(file_content)
+        actual_size = download.size
         log_with_context(
             logging.DEBUG,
-            f"Using Google Drive upload for file: {name} ({actual_size} bytes)",
+            "Using Google Drive upload for file: %s (%s bytes)",
+            name,
+            actual_size,
             channel=channel,
             file_id=file_id,
         )
 
-        drive_result = self._upload_to_drive(
-            file_obj, file_content, channel, sender_email
-        )
+        drive_result = self._upload_to_drive(file_obj, download, channel, sender_email)
         if drive_result:
-            self.processed_files[file_id] = drive_result
-            self.file_stats["drive_uploads"] += 1
+            self._cache_result(file_id, drive_result)
+            self._increment_stat("drive_uploads")
+            if not drive_result.metadata.get("reused"):
+                self._report_uploaded(channel, actual_size)
             log_with_context(
                 logging.DEBUG,
-                f"Successfully uploaded file {name} to Drive: {drive_result.url}",
+                "Successfully uploaded file %s to Drive: %s",
+                name,
+                drive_result.url,
                 channel=channel,
                 file_id=file_id,
                 drive_file_id=drive_result.drive_id,
@@ -622,7 +829,7 @@ class FileHandler:
             channel=channel,
             file_id=file_id,
         )
-        self.file_stats["failed_uploads"] += 1
+        self._increment_stat("failed_uploads")
         return None
 
     def upload_file(
@@ -659,7 +866,7 @@ class FileHandler:
     def _upload_direct_to_chat(
         self,
         file_obj: dict[str, Any],
-        file_content: bytes,
+        download: DownloadedFile,
         channel: str | None = None,
         space: str | None = None,
         user_service: ChatAdapter | None = None,
@@ -669,7 +876,7 @@ class FileHandler:
 
         Args:
             file_obj: The file object from Slack
-            file_content: The binary content of the file
+            download: The downloaded file content spooled on disk
             channel: Optional channel name for context
             space: Optional space ID where the file will be used (e.g., "spaces/AAAAy2-BTIA")
             user_service: Optional user-specific Chat service to use for upload
@@ -685,81 +892,57 @@ class FileHandler:
 
             user_chat_uploader = None  # Ensure variable is always defined
 
-            # Create a temporary file for the chat uploader
-            with tempfile.NamedTemporaryFile(
-                delete=False, suffix=_safe_temp_suffix(name)
-            ) as temp_file:
-                temp_file.write(file_content)
-                temp_file_path = temp_file.name
-
-            try:
-                # Use user-specific service if provided, otherwise use default chat uploader
-                if user_service:
-                    # Create a temporary chat uploader with the user's service
-                    user_chat_uploader = ChatFileUploader(user_service)
-                    # Set channel context for logging
-                    user_chat_uploader.current_channel = (
-                        self.state.context.current_channel
-                    )
-                    upload_response, attachment_metadata = (
-                        user_chat_uploader.upload_file_to_chat(
-                            temp_file_path, name, space
-                        )
-                    )
-                else:
-                    # Use the default chat uploader (admin service)
-                    user_chat_uploader = self.chat_uploader
-                    upload_response, attachment_metadata = (
-                        self.chat_uploader.upload_file_to_chat(
-                            temp_file_path, name, space
-                        )
-                    )
-
-                if upload_response and attachment_metadata:
-                    # Create the attachment reference for Chat API
-                    # According to API docs, use the complete upload response
-                    attachment_ref = user_chat_uploader.create_attachment_for_message(
-                        upload_response, attachment_metadata
-                    )
+            # Use user-specific service if provided, otherwise use default chat uploader
+            if user_service:
+                # Create a temporary chat uploader with the user's service
+                user_chat_uploader = ChatFileUploader(user_service)
+                # Set channel context for logging
+                user_chat_uploader.current_channel = self.state.context.current_channel
+                upload_response, attachment_metadata = (
+                    user_chat_uploader.upload_file_to_chat(download.path, name, space)
+                )
+            else:
+                # Use the default chat uploader (admin service)
+                user_chat_uploader = self.chat_uploader
+                upload_response, attachment_metadata = (
+                    self.chat_uploader.upload_file_to_chat(download.path, name, space)
+                )
 
-                    result = UploadResult(
-                        upload_type="direct",
-                        attachment_ref=attachment_ref,
-                        name=name,
-                        mime_type=mime_type,
-                        metadata={
-                            "upload_response": upload_response,
-                            "attachment_metadata": attachment_metadata,
-                        },
-                    )
+            if upload_response and attachment_metadata:
+                # Create the attachment reference for Chat API
+                # According to API docs, use the complete upload response
+                attachment_ref = user_chat_uploader.create_attachment_for_message(
+                    upload_response, attachment_metadata
+                )
 
-                    log_with_context(
-                        logging.DEBUG,
-                        f"Successfully uploaded file {name} directly to Chat API",
-                        channel=channel,
-                        file_id=file_id,
-                    )
+                result = UploadResult(
+                    upload_type="direct",
+                    attachment_ref=attachment_ref,
+                    name=name,
+                    mime_type=mime_type,
+                    metadata={
+                        "upload_response": upload_response,
+                        "attachment_metadata": attachment_metadata,
+                    },
+                )
 
-                    return result
-                else:
-                    log_with_context(
-                        logging.WARNING,
-                        f"Failed to get valid response from Chat API upload for {name}",
-                        channel=channel,
-                        file_id=file_id,
-                    )
-                    return None
+                log_with_context(
+                    logging.DEBUG,
+                    "Successfully uploaded file %s directly to Chat API",
+                    name,
+                    channel=channel,
+                    file_id=file_id,
+                )
 
-            finally:
-                # Clean up the temporary file
-                try:
-                    os.unlink(temp_file_path)
-                except OSError as cleanup_error:
-                    log_with_context(
-                        logging.WARNING,
-                        f"Failed to clean up temporary file: {cleanup_error}",
-                        file_id=file_id,
-                    )
+                return result
+            else:
+                log_with_context(
+                    logging.WARNING,
+                    f"Failed to get valid response from Chat API upload for {name}",
+                    channel=channel,
+                    file_id=file_id,
+                )
+                return None
 
         except (HttpError, OSError) as e:
             log_with_context(
@@ -774,7 +957,7 @@ class FileHandler:
     def _upload_to_drive(
         self,
         file_obj: dict[str, Any],
-        file_content: bytes,
+        download: DownloadedFile,
         channel: str | None = None,
         sender_email: str | None = None,
     ) -> UploadResult | None:
@@ -782,7 +965,7 @@ class FileHandler:
 
         Args:
             file_obj: The file object from Slack
-            file_content: The binary content of the file
+            download: The downloaded file content spooled on disk
             channel: Optional channel name for context
             sender_email: Email address of the message sender (for permissions handling)
 
@@ -798,7 +981,10 @@ class FileHandler:
 
             log_with_context(
                 logging.DEBUG,
-                f"Uploading file to Drive: {name} (Size: {len(file_content)} bytes, MIME: {mime_type})",
+                "Uploading file to Drive: %s (Size: %s bytes, MIME: %s)",
+                name,
+                download.size,
+                mime_type,
                 channel=channel,
                 file_id=file_id,
             )
@@ -810,7 +996,7 @@ class FileHandler:
                 return None
 
             return self._execute_drive_upload(
-                file_content,
+                download,
                 name,
                 mime_type,
                 folder_id,
@@ -846,14 +1032,16 @@ class FileHandler:
             if folder_id and channel_folder_key not in self.shared_channel_folders:
                 log_with_context(
                     logging.DEBUG,
-                    f"Channel folder created for {channel}, permissions will be set after migration completes",
+                    "Channel folder created for %s, permissions will be set after migration completes",
+                    channel,
                     channel=channel,
                 )
                 self.shared_channel_folders.add(channel_folder_key)
             else:
                 log_with_context(
                     logging.DEBUG,
-                    f"Channel folder for {channel} already processed",
+                    "Channel folder for %s already processed",
+                    channel,
                     channel=channel,
                 )
 
@@ -878,7 +1066,7 @@ class FileHandler:
 
     def _execute_drive_upload(
         self,
-        file_content: bytes,
+        download: DownloadedFile,
         name: str,
         mime_type: str,
         folder_id: str,
@@ -887,85 +1075,85 @@ class FileHandler:
         user_email: str | None,
         sender_email: str | None,
     ) -> UploadResult | None:
-        """Write content to a temp file, upload to Drive, and handle permissions.
+        """Upload a spooled download to Drive and handle permissions.
 
         Returns the UploadResult or None on failure.
         """
-        with tempfile.NamedTemporaryFile(
-            delete=False, suffix=_safe_temp_suffix(name)
-        ) as temp_file:
-            temp_file.write(file_content)
-            temp_file_path = temp_file.name
+        message_poster_email = sender_email or user_email
 
-        try:
-            message_poster_email = sender_email or user_email
+        log_with_context(
+            logging.DEBUG,
+            "File content hash: %s",
+            download.md5,
+            channel=channel,
+            file_id=file_id,
+        )
 
-            content_hash = hashlib.md5(file_content).hexdigest()  # noqa: S324 — not used for security
+        drive_file_id, public_url = self.drive_uploader.upload_file_to_drive(
+            download.path,
+            name,
+            folder_id,
+            self._shared_drive_id,
+            message_poster_email=message_poster_email,
+            file_hash=download.md5,
+        )
+
+        if not drive_file_id:
             log_with_context(
-                logging.DEBUG,
-                f"File content hash: {content_hash}",
+                logging.ERROR,
+                f"Failed to upload file {name} to Drive",
                 channel=channel,
                 file_id=file_id,
             )
+            return None
 
-            drive_file_id, public_url = self.drive_uploader.upload_file_to_drive(
-                temp_file_path,
-                name,
-                folder_id,
-                self._shared_drive_id,
-                message_poster_email=message_poster_email,
-            )
-
-            if not drive_file_id:
-                log_with_context(
-                    logging.ERROR,
-                    f"Failed to upload file {name} to Drive",
-                    channel=channel,
-                    file_id=file_id,
-                )
-                return None
-
-            if message_poster_email:
-                log_with_context(
-                    logging.DEBUG,
-                    f"Gave editor permission to message poster {message_poster_email} for file {drive_file_id}",
-                    channel=channel,
-                    file_id=file_id,
-                )
-            else:
-                log_with_context(
-                    logging.WARNING,
-                    "No user email available for message poster, could not assign editor permissions",
-                    channel=channel,
-                    file_id=file_id,
-                )
-
-            self._handle_ownership_transfer(drive_file_id, user_email, channel, file_id)
-
+        if message_poster_email:
             log_with_context(
                 logging.DEBUG,
-                f"Successfully uploaded file to Drive: {name}",
+                "Gave editor permission to message poster %s for file %s",
+                message_poster_email,
+                drive_file_id,
                 channel=channel,
                 file_id=file_id,
-                drive_file_id=drive_file_id,
             )
-
-            return UploadResult(
-                upload_type="drive",
-                url=public_url
-                or f"https://drive.google.com/file/d/{drive_file_id}/view",
-                drive_id=drive_file_id,
-                name=name,
-                mime_type=mime_type,
+        else:
+            log_with_context(
+                logging.WARNING,
+                "No user email available for message poster, could not assign editor permissions",
+                channel=channel,
+                file_id=file_id,
             )
 
-        finally:
-            try:
-                os.unlink(temp_file_path)
-            except OSError:
-                logger.debug(
-                    "Failed to clean up temp file %s", temp_file_path, exc_info=True
+        self._handle_ownership_transfer(drive_file_id, user_email, channel, file_id)
+
+        url = public_url or f"https://drive.google.com/file/d/{drive_file_id}/view"
+        if self.attachment_store is not None and file_id != "unknown":
+            self.attachment_store.add(
+                StoredAttachment(
+                    slack_file_id=file_id,
+                    md5=download.md5,
+                    drive_file_id=drive_file_id,
+                    url=url,
                 )
+            )
+
+        log_with_context(
+            logging.DEBUG,
+            "Successfully uploaded file to Drive: %s",
+            name,
+            channel=channel,
+            file_id=file_id,
+            drive_file_id=drive_file_id,
+        )
+
+        return UploadResult(
+            upload_type="drive",
+            url=url,
+            drive_id=drive_file_id,
+            name=name,
+            mime_type=mime_type,
+            metadata={"reused": True} if self.drive_uploader.last_upload_reused else {},
+        )
 
     def _handle_ownership_transfer(
         self,
@@ -986,16 +1174,17 @@ class FileHandler:
         ):
             try:
                 self._transfer_file_ownership(drive_file_id, user_email)
-                self.file_stats["ownership_transferred"] += 1
+                self._increment_stat("ownership_transferred")
                 log_with_context(
                     logging.DEBUG,
-                    f"Transferred file ownership to original poster: {user_email}",
+                    "Transferred file ownership to original poster: %s",
+                    user_email,
                     channel=channel,
                     file_id=file_id,
                     drive_file_id=drive_file_id,
                 )
             except HttpError as e:
-                self.file_stats["ownership_transfer_failed"] += 1
+                self._increment_stat("ownership_transfer_failed")
                 log_with_context(
                     logging.WARNING,
                     f"Could not transfer file ownership to {user_email}: {e}",
@@ -1005,7 +1194,8 @@ class FileHandler:
         elif user_email and self.user_resolver.is_external_user(user_email):
             log_with_context(
                 logging.DEBUG,
-                f"External user {user_email} cannot be made file owner, using service account ownership",
+                "External user %s cannot be made file owner, using service account ownership",
+                user_email,
                 channel=channel,
                 file_id=file_id,
                 drive_file_id=drive_file_id,
@@ -1026,22 +1216,21 @@ class FileHandler:
             Dictionary containing file upload statistics including counts
             by upload method, external user files, and ownership transfers.
         """
+        with self._lock:
+            stats = dict(self.file_stats)
+            stats["files_by_channel"] = dict(stats["files_by_channel"])
         return {
-            "total_files_processed": self.file_stats["total_files"],
-            "successful_uploads": self.file_stats["drive_uploads"]
-            + self.file_stats["direct_uploads"],
-            "failed_uploads": self.file_stats["failed_uploads"],
-            "drive_uploads": self.file_stats["drive_uploads"],
-            "direct_uploads": self.file_stats["direct_uploads"],
-            "external_user_files": self.file_stats["external_user_files"],
-            "ownership_transferred": self.file_stats["ownership_transferred"],
-            "ownership_transfer_failed": self.file_stats["ownership_transfer_failed"],
-            "files_by_channel": dict(self.file_stats["files_by_channel"]),
-            "success_rate": (
-                int(self.file_stats["drive_uploads"])
-                + int(self.file_stats["direct_uploads"])
-            )
-            / max(1, int(self.file_stats["total_files"]))
+            "total_files_processed": stats["total_files"],
+            "successful_uploads": stats["drive_uploads"] + stats["direct_uploads"],
+            "failed_uploads": stats["failed_uploads"],
+            "drive_uploads": stats["drive_uploads"],
+            "direct_uploads": stats["direct_uploads"],
+            "external_user_files": stats["external_user_files"],
+            "ownership_transferred": stats["ownership_transferred"],
+            "ownership_transfer_failed": stats["ownership_transfer_failed"],
+            "files_by_channel": stats["files_by_channel"],
+            "success_rate": (int(stats["drive_uploads"]) + int(stats["direct_uploads"]))
+            / max(1, int(stats["total_files"]))
             * 100,
         }
 
@@ -1054,11 +1243,16 @@ class FileHandler:
 
     def _download_file(
         self, file_obj: dict[str, Any]
-    ) -> bytes | DownloadOutcome | None:
+    ) -> DownloadedFile | DownloadOutcome | None:
         """Download a file from Slack export or URL.
 
-        Delegates to :func:`file_download.download_file`.
+        Uses content already fetched by the prefetcher when available and
+        otherwise delegates to :func:`file_download.download_file`.
         """
+        if self.prefetcher is not None:
+            found, content = self.prefetcher.take(file_obj.get("id", ""))
+            if found:
+                return content
         return download_file(file_obj, self._get_current_channel())
 
     def _create_drive_reference(
@@ -1068,9 +1262,10 @@ class FileHandler:
 
         Delegates to :func:`file_download.create_drive_reference`.
         """
-        return create_drive_reference(
-            file_obj, channel, self.processed_files, self.file_stats
-        )
+        with self._lock:
+            return create_drive_reference(
+                file_obj, channel, self.processed_files, self.file_stats
+            )
 
     def share_file_with_members(self, drive_file_id: str, channel: str) -> bool:
         """Share a Drive file with all active members of a channel.
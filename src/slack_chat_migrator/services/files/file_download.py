@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import enum
+import hashlib
 import ipaddress
 import logging
+import os
+import re
+import tempfile
+from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlparse
 
 import requests
 
 from slack_chat_migrator.constants import (
+    DOWNLOAD_CHUNK_BYTES,
     HTTP_FORBIDDEN,
     HTTP_OK,
     HTTP_UNAUTHORIZED,
+    MAX_FILE_SIZE_BYTES,
 )
 from slack_chat_migrator.types import UploadResult
 from slack_chat_migrator.utils.logging import log_with_context
@@ -28,6 +35,65 @@ class DownloadOutcome(enum.Enum):
     GOOGLE_DRIVE_FILE = "google_drive_file"
 
 
+@dataclass
+class DownloadedFile:
+    """A downloaded attachment spooled to a local file.
+
+    The owner of the instance is responsible for calling :meth:`discard`
+    once the file has been uploaded.
+    """
+
+    path: str
+    md5: str
+    size: int
+
+    def discard(self) -> None:
+        """Delete the spool file, ignoring files that are already gone."""
+        try:
+            os.unlink(self.path)
+        except OSError:
+            logger.debug("Failed to remove spool file %s", self.path, exc_info=True)
+
+
+def _safe_temp_suffix(name: str) -> str:
+    """Sanitize a filename for use as a temp file suffix."""
+    return "_" + re.sub(r"[^A-Za-z0-9._-]", "_", name)[:64]
+
+
+def _spool_response(
+    response: requests.Response,
+    name: str,
+    spool_dir: str | None,
+    max_bytes: int = MAX_FILE_SIZE_BYTES,
+) -> DownloadedFile | None:
+    """Stream *response* into a new temp file, hashing it on the way.
+
+    Returns None, and removes the partial spool file, as soon as the body
+    grows past *max_bytes*.
+    """
+    fd, path = tempfile.mkstemp(dir=spool_dir, suffix=_safe_temp_suffix(name))
+    digest = hashlib.md5()  # noqa: S324 — not used for security
+    size = 0
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                if chunk:
+                    size += len(chunk)
+                    if size > max_bytes:
+                        break
+                    f.write(chunk)
+                    digest.update(chunk)
+    except BaseException:
+        os.unlink(path)
+        raise
+    finally:
+        response.close()
+    if size > max_bytes:
+        os.unlink(path)
+        return None
+    return DownloadedFile(path=path, md5=digest.hexdigest(), size=size)
+
+
 def _is_internal_host(hostname: str) -> bool:
     """Check if hostname is an internal/private IP literal.
 
@@ -45,19 +111,24 @@ def _is_internal_host(hostname: str) -> bool:
 def download_file(
     file_obj: dict[str, Any],
     channel: str | None,
-) -> bytes | DownloadOutcome | None:
+    spool_dir: str | None = None,
+) -> DownloadedFile | DownloadOutcome | None:
     """Download a file from Slack export or URL.
 
+    The body is streamed to a temp file in chunks while its MD5 is
+    computed, so attachment content is never held in memory as a whole.
+
     Handles Google Docs links (returns :attr:`DownloadOutcome.GOOGLE_DOCS_LINK`)
     and Google Drive files (returns :attr:`DownloadOutcome.GOOGLE_DRIVE_FILE`).
 
     Args:
         file_obj: The file object from Slack.
         channel: Current channel name for logging context.
+        spool_dir: Directory for the spool file; the system temp dir if None.
 
     Returns:
-        File content as bytes, a :class:`DownloadOutcome` variant, or None if
-        download failed.
+        A :class:`DownloadedFile`, a :class:`DownloadOutcome` variant, or
+        None if download failed.
     """
     try:
         file_id = file_obj.get("id", "unknown")
@@ -111,7 +182,9 @@ def download_file(
         if is_google_docs:
             log_with_context(
                 logging.DEBUG,
-                f"Skipping Google Docs link - not a downloadable file: {url_private[:100]}{'...' if len(url_private) > 100 else ''}",
+                "Skipping Google Docs link - not a downloadable file: %s%s",
+                url_private[:100],
+                "..." if len(url_private) > 100 else "",
                 file_id=file_id,
                 file_name=name,
                 channel=channel,
@@ -121,7 +194,9 @@ def download_file(
         if is_google_drive_file:
             log_with_context(
                 logging.DEBUG,
-                f"Google Drive file detected - will create direct reference instead of downloading: {url_private[:100]}{'...' if len(url_private) > 100 else ''}",
+                "Google Drive file detected - will create direct reference instead of downloading: %s%s",
+                url_private[:100],
+                "..." if len(url_private) > 100 else "",
                 file_id=file_id,
                 file_name=name,
                 channel=channel,
@@ -130,7 +205,9 @@ def download_file(
 
         log_with_context(
             logging.DEBUG,
-            f"Downloading file from URL: {url_private[:100]}{'...' if len(url_private) > 100 else ''}",
+            "Downloading file from URL: %s%s",
+            url_private[:100],
+            "..." if len(url_private) > 100 else "",
             file_id=file_id,
             file_name=name,
             channel=channel,
@@ -161,20 +238,33 @@ def download_file(
         if content_length:
             log_with_context(
                 logging.DEBUG,
-                f"File size from headers: {content_length} bytes",
+                "File size from headers: %s bytes",
+                content_length,
                 file_id=file_id,
                 channel=channel,
             )
 
-        # Return the actual file content
-        content = response.content
+        downloaded = _spool_response(
+            response, name, spool_dir, max_bytes=MAX_FILE_SIZE_BYTES
+        )
+        if downloaded is None:
+            log_with_context(
+                logging.WARNING,
+                f"File {name} exceeds the {MAX_FILE_SIZE_BYTES} byte upload limit,"
+                " download aborted",
+                file_id=file_id,
+                channel=channel,
+            )
+            return None
         log_with_context(
             logging.DEBUG,
-            f"Successfully downloaded file: {name} (Size: {len(content)} bytes)",
+            "Successfully downloaded file: %s (Size: %s bytes)",
+            name,
+            downloaded.size,
             file_id=file_id,
             channel=channel,
         )
-        return content
+        return downloaded
 
     except requests.exceptions.RequestException as e:
         # Check for authentication errors (401, 403) which are unlikely to be resolved by retrying
@@ -269,7 +359,9 @@ def create_drive_reference(
 
         log_with_context(
             logging.DEBUG,
-            f"Created direct Drive reference for existing file: {name} (Drive ID: {drive_file_id})",
+            "Created direct Drive reference for existing file: %s (Drive ID: %s)",
+            name,
+            drive_file_id,
             channel=channel,
             file_id=file_id,
             drive_file_id=drive_file_id,
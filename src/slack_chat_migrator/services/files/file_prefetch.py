@@ -0,0 +1,230 @@
+"""Background prefetch of Slack attachments ahead of the send path.
+
+Downloads run on a small thread pool while earlier messages are still
+being sent.  Files are spooled into a temporary directory whose total
+size is bounded; :meth:`AttachmentPrefetcher.take` hands the spool file
+to the uploader and frees its share of the budget.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+import shutil
+import tempfile
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from slack_chat_migrator.constants import (
+    MAX_FILE_SIZE_BYTES,
+    PREFETCH_CACHE_MAX_BYTES,
+    PREFETCH_WORKERS,
+)
+from slack_chat_migrator.services.files.file_download import (
+    DownloadedFile,
+    DownloadOutcome,
+    download_file,
+)
+from slack_chat_migrator.utils.logging import log_with_context
+
+DownloadFn = Callable[
+    [dict[str, Any], "str | None", "str | None"],
+    "DownloadedFile | DownloadOutcome | None",
+]
+
+
+@dataclass
+class _Entry:
+    future: Future[DownloadedFile | DownloadOutcome | None]
+    channel: str | None
+    reserved: int
+
+
+class AttachmentPrefetcher:
+    """Downloads attachments on a thread pool into a bounded on-disk cache.
+
+    Each Slack file ID is fetched at most once while staged.  Scheduling is
+    refused once the staged (or in-flight) bytes would exceed
+    *max_cache_bytes*; such files are simply downloaded synchronously by
+    the caller when they are needed.  A file whose export entry has no
+    size reserves ``MAX_FILE_SIZE_BYTES``, the most a download may
+    spool, until its real size is known.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PREFETCH_WORKERS,
+        max_cache_bytes: int = PREFETCH_CACHE_MAX_BYTES,
+        download: DownloadFn = download_file,
+    ) -> None:
+        """Initialize the prefetcher.
+
+        Args:
+            max_workers: Number of concurrent download threads.
+            max_cache_bytes: Upper bound on bytes staged on disk at once.
+            download: Function used to fetch a Slack file object.
+        """
+        self.max_cache_bytes = max_cache_bytes
+        self._download = download
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="attachment-prefetch"
+        )
+        self._lock = threading.Lock()
+        self._entries: dict[str, _Entry] = {}
+        self._reserved_bytes = 0
+        self._cache_dir: str | None = None
+        self._closed = False
+
+    @property
+    def reserved_bytes(self) -> int:
+        """Bytes currently staged on disk or reserved for in-flight downloads."""
+        with self._lock:
+            return self._reserved_bytes
+
+    def __contains__(self, file_id: str) -> bool:
+        with self._lock:
+            return file_id in self._entries
+
+    def prefetch(self, file_obj: dict[str, Any], channel: str | None) -> bool:
+        """Schedule a background download of *file_obj*.
+
+        Args:
+            file_obj: The file object from Slack.
+            channel: Channel the file belongs to, for logging and cleanup.
+
+        Returns:
+            True if the file is (now) being prefetched, False if it was
+            refused because the cache budget is exhausted.
+        """
+        file_id = file_obj.get("id")
+        if not file_id:
+            return False
+        # Downloads are capped at MAX_FILE_SIZE_BYTES, so that bounds an
+        # undeclared size.
+        size = int(file_obj.get("size") or 0) or MAX_FILE_SIZE_BYTES
+
+        with self._lock:
+            if self._closed:
+                return False
+            if file_id in self._entries:
+                return True
+            if self._reserved_bytes + size > self.max_cache_bytes:
+                return False
+            if self._cache_dir is None:
+                self._cache_dir = tempfile.mkdtemp(prefix="slack-chat-migrator-")
+            self._reserved_bytes += size
+            ctx = contextvars.copy_context()
+            future = self._executor.submit(
+                ctx.run, self._fetch, file_id, file_obj, channel, self._cache_dir
+            )
+            self._entries[file_id] = _Entry(future, channel, size)
+        return True
+
+    def take(
+        self, file_id: str
+    ) -> tuple[bool, DownloadedFile | DownloadOutcome | None]:
+        """Claim the prefetched download for *file_id*.
+
+        Waits for an in-flight download to finish.  A download that has not
+        started yet is cancelled so the caller can fetch it directly rather
+        than queue behind other files.  A returned spool file belongs to the
+        caller, who must discard it, and no longer counts against the cache
+        budget.
+
+        Returns:
+            (found, result).  If found is False the caller must download
+            the file itself; otherwise *result* has the same meaning as the
+            return value of :func:`file_download.download_file`.
+        """
+        with self._lock:
+            entry = self._entries.pop(file_id, None)
+        if entry is None:
+            return False, None
+        if entry.future.cancel():
+            self._release(entry.reserved)
+            return False, None
+
+        try:
+            result = entry.future.result()
+        except Exception as e:
+            self._release(entry.reserved)
+            log_with_context(
+                logging.DEBUG,
+                "Prefetch of file %s failed, downloading directly: %s",
+                file_id,
+                e,
+                channel=entry.channel,
+                file_id=file_id,
+            )
+            return False, None
+
+        self._release(entry.reserved)
+        return True, result
+
+    def discard(self, channel: str | None) -> None:
+        """Drop every staged file prefetched for *channel* and not taken."""
+        with self._lock:
+            stale = [
+                (file_id, entry)
+                for file_id, entry in self._entries.items()
+                if entry.channel == channel
+            ]
+            for file_id, _ in stale:
+                del self._entries[file_id]
+        for _, entry in stale:
+            self._drop(entry)
+
+    def close(self) -> None:
+        """Stop the worker threads and delete the staging directory."""
+        with self._lock:
+            self._closed = True
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            entry.future.cancel()
+        self._executor.shutdown(wait=True)
+        for entry in entries:
+            self._drop(entry)
+        if self._cache_dir is not None:
+            shutil.rmtree(self._cache_dir, ignore_errors=True)
+            self._cache_dir = None
+
+    def _fetch(
+        self,
+        file_id: str,
+        file_obj: dict[str, Any],
+        channel: str | None,
+        cache_dir: str,
+    ) -> DownloadedFile | DownloadOutcome | None:
+        """Worker: download one file and stage it under *cache_dir*."""
+        result = self._download(file_obj, channel, cache_dir)
+        if isinstance(result, DownloadedFile):
+            self._resize(file_id, result.size)
+        return result
+
+    def _resize(self, file_id: str, actual_size: int) -> None:
+        """Swap an entry's size estimate for the real downloaded size."""
+        with self._lock:
+            entry = self._entries.get(file_id)
+            if entry is None:
+                return
+            self._reserved_bytes += actual_size - entry.reserved
+            entry.reserved = actual_size
+
+    def _drop(self, entry: _Entry) -> None:
+        """Release an unclaimed entry, deleting its staged file if any."""
+        if not entry.future.cancel():
+            try:
+                result = entry.future.result()
+            except Exception:
+                result = None
+            if isinstance(result, DownloadedFile):
+                result.discard()
+        self._release(entry.reserved)
+
+    def _release(self, size: int) -> None:
+        with self._lock:
+            self._reserved_bytes -= size
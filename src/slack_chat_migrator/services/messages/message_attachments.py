@@ -15,6 +15,21 @@ if TYPE_CHECKING:
     from slack_chat_migrator.services.files.file import FileHandler
 
 
+def message_files(message: dict[str, Any]) -> list[dict[str, Any]]:
+    """Return the files attached to a message, including forwarded ones.
+
+    Files nested in shared or unfurled message attachments are appended
+    after the message's own files.  The message itself is not modified.
+    """
+    files = list(message.get("files", []))
+    for attachment in message.get("attachments", []):
+        if (
+            attachment.get("is_share") or attachment.get("is_msg_unfurl")
+        ) and "files" in attachment:
+            files.extend(attachment.get("files", []))
+    return files
+
+
 class MessageAttachmentProcessor:
     """Handles file attachments during message creation."""
 
@@ -54,22 +69,15 @@ class MessageAttachmentProcessor:
         Returns:
             List of attachment objects for Google Chat message payload
         """
-        files = message.get("files", [])
-
-        # Also check for files in forwarded message attachments
-        attachments = message.get("attachments", [])
-        for attachment in attachments:
-            # Check if this is a forwarded/shared message with files
-            if (
-                attachment.get("is_share") or attachment.get("is_msg_unfurl")
-            ) and "files" in attachment:
-                forwarded_files = attachment.get("files", [])
-                files.extend(forwarded_files)
-                log_with_context(
-                    logging.DEBUG,
-                    f"Found {len(forwarded_files)} files in forwarded message attachment",
-                    channel=channel,
-                )
+        files = message_files(message)
+        forwarded_count = len(files) - len(message.get("files", []))
+        if forwarded_count:
+            log_with_context(
+                logging.DEBUG,
+                "Found %s files in forwarded message attachments",
+                forwarded_count,
+                channel=channel,
+            )
 
         if not files:
             return []
@@ -77,7 +85,8 @@ class MessageAttachmentProcessor:
         if self.dry_run:
             log_with_context(
                 logging.DEBUG,
-                f"[DRY RUN] Would process {len(files)} attachments",
+                "[DRY RUN] Would process %s attachments",
+                len(files),
                 channel=channel,
             )
             # Return mock attachment objects for dry run
@@ -98,7 +107,8 @@ class MessageAttachmentProcessor:
 
         log_with_context(
             logging.DEBUG,
-            f"Processing {len(files)} attachments for message",
+            "Processing %s attachments for message",
+            len(files),
             channel=channel,
         )
 
@@ -116,7 +126,9 @@ class MessageAttachmentProcessor:
                 if upload_result.skipped:
                     log_with_context(
                         logging.DEBUG,
-                        f"Skipping attachment (reason: {upload_result.skip_reason or 'unknown'}): {upload_result.name or 'unknown'}",
+                        "Skipping attachment (reason: %s): %s",
+                        upload_result.skip_reason or "unknown",
+                        upload_result.name or "unknown",
                         channel=channel,
                         file_id=file_obj.get("id", "unknown"),
                     )
@@ -128,7 +140,8 @@ class MessageAttachmentProcessor:
                         attachments.append(attachment)
                         log_with_context(
                             logging.DEBUG,
-                            f"Added attachment to message: {upload_result.name or 'unknown'}",
+                            "Added attachment to message: %s",
+                            upload_result.name or "unknown",
                             channel=channel,
                             file_id=file_obj.get("id", "unknown"),
                         )
@@ -174,7 +187,8 @@ class MessageAttachmentProcessor:
         """
         log_with_context(
             logging.DEBUG,
-            f"Creating attachment from upload result: type={upload_result.upload_type}",
+            "Creating attachment from upload result: type=%s",
+            upload_result.upload_type,
             upload_type=upload_result.upload_type,
             channel=self._get_current_channel(),
         )
@@ -184,7 +198,9 @@ class MessageAttachmentProcessor:
 
             log_with_context(
                 logging.DEBUG,
-                f"Processing Drive attachment: drive_id={drive_id}, file_name={upload_result.name}",
+                "Processing Drive attachment: drive_id=%s, file_name=%s",
+                drive_id,
+                upload_result.name,
                 drive_id=drive_id,
                 file_name=upload_result.name,
                 channel=self._get_current_channel(),
@@ -195,7 +211,8 @@ class MessageAttachmentProcessor:
 
                 log_with_context(
                     logging.DEBUG,
-                    f"Created Drive attachment with driveFileId: {drive_id}",
+                    "Created Drive attachment with driveFileId: %s",
+                    drive_id,
                     drive_id=drive_id,
                     file_name=upload_result.name,
                     channel=self._get_current_channel(),
@@ -214,7 +231,8 @@ class MessageAttachmentProcessor:
             if attachment_ref and isinstance(attachment_ref, dict):
                 log_with_context(
                     logging.DEBUG,
-                    f"Using direct upload attachment: {attachment_ref}",
+                    "Using direct upload attachment: %s",
+                    attachment_ref,
                     attachment_ref=attachment_ref,
                     channel=self._get_current_channel(),
                 )
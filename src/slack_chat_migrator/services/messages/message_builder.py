@@ -5,8 +5,6 @@ from __future__ import annotations
 import datetime
 import hashlib
 import logging
-import time
-import uuid
 from typing import TYPE_CHECKING, Any
 
 from slack_chat_migrator.utils.api import slack_ts_to_rfc3339
@@ -136,7 +134,9 @@ def build_message_payload(
     # Log the final payload for debugging
     log_with_context(
         logging.DEBUG,
-        f"Final formatted text for message {ts}: '{final_text}'",
+        "Final formatted text for message %s: '%s'",
+        ts,
+        final_text,
         channel=channel,
         ts=ts,
     )
@@ -152,11 +152,14 @@ def build_message_payload(
         thread_ts_str = str(thread_ts)
 
         # Check if we have the thread name from a previous message
-        existing_thread_name = state.messages.thread_map.get(thread_ts_str)
+        existing_thread_name = state.messages.thread_map.get((channel, thread_ts_str))
 
         log_with_context(
             logging.DEBUG,
-            f"Processing thread reply: ts={ts}, thread_ts={thread_ts_str}, existing_thread_name={existing_thread_name}",
+            "Processing thread reply: ts=%s, thread_ts=%s, existing_thread_name=%s",
+            ts,
+            thread_ts_str,
+            existing_thread_name,
             channel=channel,
             ts=ts,
             thread_ts=thread_ts_str,
@@ -167,7 +170,10 @@ def build_message_payload(
             payload["thread"] = {"name": existing_thread_name}
             log_with_context(
                 logging.DEBUG,
-                f"Message {ts} is replying to existing thread {existing_thread_name} (original ts={thread_ts_str})",
+                "Message %s is replying to existing thread %s (original ts=%s)",
+                ts,
+                existing_thread_name,
+                thread_ts_str,
                 channel=channel,
                 ts=ts,
                 thread_ts=thread_ts_str,
@@ -192,7 +198,8 @@ def build_message_payload(
         payload["thread"] = {"thread_key": str(ts)}
         log_with_context(
             logging.DEBUG,
-            f"Creating new thread with thread.thread_key: {ts}",
+            "Creating new thread with thread.thread_key: %s",
+            ts,
             channel=channel,
             ts=ts,
         )
@@ -200,44 +207,52 @@ def build_message_payload(
     return payload, user_email, is_thread_reply, message_reply_option
 
 
-def generate_message_id(ts: str, is_edited: bool, edited_ts: str) -> str:
-    """Generate a unique Google Chat ``messageId`` for a Slack message.
+def _message_id_component(value: str) -> str:
+    """Return *value* as a ``messageId``-safe token (``[a-z0-9]``).
 
-    Combines the Slack timestamp, current wall-clock milliseconds, and a
-    random UUID fragment.  Falls back to an MD5-based shorter form when
-    the raw ID exceeds the Google Chat 63-character limit.
+    Slack channel IDs are already alphanumeric and are just lower-cased;
+    anything else (e.g. a channel name used as a fallback) is hashed.
     """
-    clean_ts = ts.replace(".", "-")
-    current_ms = int(time.time() * 1000)
-    unique_id = str(uuid.uuid4()).replace("-", "")[:8]
+    lowered = value.lower()
+    if lowered.isascii() and lowered.isalnum():
+        return lowered
+    return hashlib.md5(value.encode()).hexdigest()[:10]  # noqa: S324 — not used for security
 
-    # For edited messages, include the edited timestamp in the message ID
+
+def generate_message_id(
+    ts: str, is_edited: bool, edited_ts: str, channel_id: str = ""
+) -> str:
+    """Generate a deterministic Google Chat ``messageId`` for a Slack message.
+
+    The same channel, ``ts`` and edit ``ts`` always map to the same ID, so
+    a retried ``create`` for a message that already landed fails with
+    409 ALREADY_EXISTS instead of creating a duplicate.  When the readable
+    form exceeds ``MESSAGE_ID_MAX_LENGTH`` a SHA-256 digest of the same
+    inputs is used instead.
+
+    Args:
+        ts: Slack message timestamp.
+        is_edited: Whether the message has been edited.
+        edited_ts: Slack timestamp of the edit (ignored unless *is_edited*).
+        channel_id: Slack channel ID the message belongs to.
+
+    Returns:
+        A ``client-``-prefixed ID of at most ``MESSAGE_ID_MAX_LENGTH`` chars.
+    """
+    prefix = CLIENT_EDIT_PREFIX if is_edited else CLIENT_MESSAGE_PREFIX
+    parts = [ts.replace(".", "-")]
+    if channel_id:
+        parts.insert(0, _message_id_component(channel_id))
     if is_edited:
-        message_id = f"{CLIENT_EDIT_PREFIX}{clean_ts}-{current_ms}-{unique_id}"
-    else:
-        message_id = f"{CLIENT_MESSAGE_PREFIX}{clean_ts}-{current_ms}-{unique_id}"
-
-    # Ensure the ID is within the Google Chat character limit
-    if len(message_id) > MESSAGE_ID_MAX_LENGTH:
-        # Hash the timestamps and use a shorter ID format
-        hash_input = ts
-        if is_edited:
-            hash_input = f"{ts}:{edited_ts}"
-
-        hash_obj = hashlib.md5(hash_input.encode())  # noqa: S324 — not used for security
-        hash_digest = hash_obj.hexdigest()[:8]
-
-        # Create a shorter ID that still maintains uniqueness
-        if is_edited:
-            message_id = (
-                f"{CLIENT_EDIT_PREFIX}{hash_digest}-{current_ms}-{unique_id[:4]}"
-            )
-        else:
-            message_id = (
-                f"{CLIENT_MESSAGE_PREFIX}{hash_digest}-{current_ms}-{unique_id[:4]}"
-            )
+        parts.append(edited_ts.replace(".", "-"))
+
+    message_id = prefix + "-".join(parts)
+    if len(message_id) <= MESSAGE_ID_MAX_LENGTH:
+        return message_id
 
-    return message_id
+    hash_input = f"{channel_id}:{ts}:{edited_ts if is_edited else ''}"
+    digest = hashlib.sha256(hash_input.encode()).hexdigest()
+    return prefix + digest[: MESSAGE_ID_MAX_LENGTH - len(prefix)]
 
 
 def process_attachments(
@@ -289,7 +304,8 @@ def process_attachments(
                     drive_links.append(drive_link)
                     log_with_context(
                         logging.DEBUG,
-                        f"Converting Drive attachment to link: {drive_link}",
+                        "Converting Drive attachment to link: %s",
+                        drive_link,
                         channel=channel,
                         ts=ts,
                         drive_file_id=drive_file_id,
@@ -312,7 +328,9 @@ def process_attachments(
             payload["text"] = payload["text"] + links_text
             log_with_context(
                 logging.DEBUG,
-                f"Appended {len(drive_links)} Drive links to message text for {ts}",
+                "Appended %s Drive links to message text for %s",
+                len(drive_links),
+                ts,
                 channel=channel,
                 ts=ts,
             )
@@ -322,14 +340,17 @@ def process_attachments(
             payload["attachment"] = non_drive_attachments
             log_with_context(
                 logging.DEBUG,
-                f"Added {len(non_drive_attachments)} non-Drive attachments to message payload for {ts}",
+                "Added %s non-Drive attachments to message payload for %s",
+                len(non_drive_attachments),
+                ts,
                 channel=channel,
                 ts=ts,
             )
     else:
         log_with_context(
             logging.DEBUG,
-            f"No attachments processed for message {ts}",
+            "No attachments processed for message %s",
+            ts,
             channel=channel,
             ts=ts,
         )
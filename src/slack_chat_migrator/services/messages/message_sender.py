@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 from googleapiclient.errors import HttpError
 
-from slack_chat_migrator.constants import BOT_SUBTYPES, SYSTEM_SUBTYPES
+from slack_chat_migrator.constants import BOT_SUBTYPES, HTTP_CONFLICT, SYSTEM_SUBTYPES
 from slack_chat_migrator.services.messages.message_builder import (
     build_message_payload,
     build_user_map_with_overrides,
@@ -17,6 +17,7 @@ from slack_chat_migrator.services.messages.message_builder import (
     process_attachments,
 )
 from slack_chat_migrator.services.messages.reaction_processor import (
+    ReactionAccumulator,
     process_reactions_batch,
 )
 from slack_chat_migrator.services.spaces.discovery import should_process_message
@@ -55,7 +56,9 @@ def _is_bot_message(
         bot_name = message.get("username", user_id or "Unknown Bot")
         log_with_context(
             logging.DEBUG,
-            f"Skipping bot message from {bot_name} (subtype: {message.get('subtype')}) - ignore_bots enabled",
+            "Skipping bot message from %s (subtype: %s) - ignore_bots enabled",
+            bot_name,
+            message.get("subtype"),
             channel=channel,
             ts=ts,
             user_id=user_id,
@@ -69,7 +72,9 @@ def _is_bot_message(
         if user_data and user_data.get("is_bot", False):
             log_with_context(
                 logging.DEBUG,
-                f"Skipping message from bot user {user_id} ({user_data.get('real_name', 'Unknown')}) - ignore_bots enabled",
+                "Skipping message from bot user %s (%s) - ignore_bots enabled",
+                user_id,
+                user_data.get("real_name", "Unknown"),
                 channel=channel,
                 ts=ts,
                 user_id=user_id,
@@ -186,7 +191,9 @@ def _should_skip_message(
     if message.get("subtype") in SYSTEM_SUBTYPES:
         log_with_context(
             logging.DEBUG,
-            f"Skipping {message.get('subtype')} message from {user_id}",
+            "Skipping %s message from %s",
+            message.get("subtype"),
+            user_id,
             channel=channel,
             ts=ts,
             user_id=user_id,
@@ -196,7 +203,8 @@ def _should_skip_message(
     if _is_empty_message(message):
         log_with_context(
             logging.DEBUG,
-            f"Skipping empty message from {user_id}",
+            "Skipping empty message from %s",
+            user_id,
             channel=channel,
             ts=ts,
             user_id=user_id,
@@ -218,32 +226,35 @@ def _handle_send_result(
     ts: str,
     edited_ts: str,
     thread_ts: str | None,
-    channel: str | None,
+    channel: str,
     is_edited: bool,
     is_thread_reply: bool,
+    reaction_accumulator: ReactionAccumulator | None = None,
 ) -> None:
     """Process a successful API response after sending a message.
 
     Updates ``messages_created`` counter, ``message_id_map``, ``thread_map``,
     ``sent_messages``, and triggers reaction processing when applicable.
     """
-    state.progress.migration_summary["messages_created"] += 1
+    state.increment_summary("messages_created")
 
     # Store the message ID mapping for potential future edits
     if message_name:
         # For edited messages, store with a special key that includes the edit timestamp
         if is_edited:
             edit_key = f"{ts}:edited:{edited_ts}"
-            state.messages.message_id_map[edit_key] = message_name
+            state.messages.message_id_map[(channel, edit_key)] = message_name
             log_with_context(
                 logging.DEBUG,
-                f"Stored message ID mapping for edited message: {edit_key} -> {message_name}",
+                "Stored message ID mapping for edited message: %s -> %s",
+                edit_key,
+                message_name,
                 channel=channel,
                 ts=ts,
                 edited_ts=edited_ts,
             )
         else:
-            state.messages.message_id_map[ts] = message_name
+            state.messages.message_id_map[(channel, ts)] = message_name
 
     # Store thread mapping for both parent messages and thread replies
     if message_name:
@@ -252,7 +263,10 @@ def _handle_send_result(
         # Debug log the thread information from the API response
         log_with_context(
             logging.DEBUG,
-            f"API response thread info - name: {thread_name}, is_thread_reply: {is_thread_reply}, thread_ts: {thread_ts}",
+            "API response thread info - name: %s, is_thread_reply: %s, thread_ts: %s",
+            thread_name,
+            is_thread_reply,
+            thread_ts,
             channel=channel,
             ts=ts,
         )
@@ -260,29 +274,34 @@ def _handle_send_result(
         if thread_name:
             if not is_thread_reply:
                 # For new thread starters, store the mapping using their own timestamp
-                state.messages.thread_map[str(ts)] = thread_name
+                state.messages.thread_map[(channel, str(ts))] = thread_name
                 log_with_context(
                     logging.DEBUG,
-                    f"Stored new thread mapping: {ts} -> {thread_name}",
+                    "Stored new thread mapping: %s -> %s",
+                    ts,
+                    thread_name,
                     channel=channel,
                     ts=ts,
                 )
             else:
                 # For thread replies, ensure the original thread timestamp mapping exists
                 thread_ts_str = str(thread_ts)
-                if thread_ts_str not in state.messages.thread_map:
+                thread_key = (channel, thread_ts_str)
+                if thread_key not in state.messages.thread_map:
                     # Store the mapping using the original thread timestamp
-                    state.messages.thread_map[thread_ts_str] = thread_name
+                    state.messages.thread_map[thread_key] = thread_name
                     log_with_context(
                         logging.DEBUG,
-                        f"Stored thread mapping from reply: {thread_ts_str} -> {thread_name}",
+                        "Stored thread mapping from reply: %s -> %s",
+                        thread_ts_str,
+                        thread_name,
                         channel=channel,
                         ts=ts,
                         thread_ts=thread_ts_str,
                     )
                 else:
                     # Verify the mapping is consistent
-                    existing_thread_name = state.messages.thread_map[thread_ts_str]
+                    existing_thread_name = state.messages.thread_map[thread_key]
                     if existing_thread_name != thread_name:
                         log_with_context(
                             logging.WARNING,
@@ -294,7 +313,9 @@ def _handle_send_result(
                     else:
                         log_with_context(
                             logging.DEBUG,
-                            f"Confirmed existing thread mapping: {thread_ts_str} -> {thread_name}",
+                            "Confirmed existing thread mapping: %s -> %s",
+                            thread_ts_str,
+                            thread_name,
                             channel=channel,
                             ts=ts,
                             thread_ts=thread_ts_str,
@@ -316,7 +337,9 @@ def _handle_send_result(
         final_message_id = message_name.split("/")[-1]
         log_with_context(
             logging.DEBUG,
-            f"Processing {len(message['reactions'])} reaction types for message {ts}",
+            "Processing %s reaction types for message %s",
+            len(message["reactions"]),
+            ts,
             channel=channel,
             ts=ts,
             message_id=final_message_id,
@@ -329,11 +352,14 @@ def _handle_send_result(
             message_name,
             message["reactions"],
             final_message_id,
+            accumulator=reaction_accumulator,
         )
 
     log_with_context(
         logging.DEBUG,
-        f"Successfully sent message TS={ts} \u2192 {message_name}",
+        "Successfully sent message TS=%s → %s",
+        ts,
+        message_name,
         channel=channel,
         ts=ts,
         message_name=message_name,
@@ -343,6 +369,54 @@ def _handle_send_result(
     state.messages.sent_messages.add(message_key)
 
 
+def _create_message_idempotent(
+    chat_service: ChatAdapter,
+    space: str,
+    payload: dict[str, Any],
+    message_id: str,
+    message_reply_option: str | None,
+    channel: str,
+    ts: str,
+) -> dict[str, Any]:
+    """Create a message, treating 409 ALREADY_EXISTS as success.
+
+    Message IDs are deterministic, so a conflict means an earlier attempt
+    (e.g. one retried after a timeout) already created this message.  The
+    existing message is fetched so its thread can still be mapped.
+
+    Returns:
+        The API response, or on conflict the existing message (a bare
+        ``{"name": ...}`` if it cannot be read back).
+    """
+    try:
+        return chat_service.create_message(
+            parent=space,
+            body=payload,
+            message_id=message_id,
+            message_reply_option=message_reply_option,
+        )
+    except HttpError as e:
+        if e.resp.status != HTTP_CONFLICT:
+            raise
+        log_with_context(
+            logging.INFO,
+            f"Message {message_id} already exists, treating as sent",
+            channel=channel,
+            ts=ts,
+        )
+        message_name = f"{space}/messages/{message_id}"
+        try:
+            return chat_service.get_message(message_name)
+        except HttpError as get_error:
+            log_with_context(
+                logging.WARNING,
+                f"Could not read back existing message {message_name}: {get_error}",
+                channel=channel,
+                ts=ts,
+            )
+            return {"name": message_name}
+
+
 def _handle_send_error(
     state: MigrationState,
     error: HttpError,
@@ -399,7 +473,7 @@ def _handle_send_error(
         error_details=error_details,
         payload=message,
     )
-    state.messages.failed_messages.append(failed_msg)
+    state.messages.record_failure(failed_msg)
 
     retryable = status_code is not None and (status_code == 429 or status_code >= 500)
     return SendResult(
@@ -436,7 +510,8 @@ def _resolve_chat_service(
     if chat_service != chat:
         log_with_context(
             logging.DEBUG,
-            f"Using impersonated service for user {user_email}",
+            "Using impersonated service for user %s",
+            user_email,
             channel=channel,
             ts=ts,
             user_id=user_id,
@@ -444,7 +519,8 @@ def _resolve_chat_service(
     else:
         log_with_context(
             logging.DEBUG,
-            f"Using admin service for user {user_email} (impersonation not available)",
+            "Using admin service for user %s (impersonation not available)",
+            user_email,
             channel=channel,
             ts=ts,
             user_id=user_id,
@@ -462,6 +538,7 @@ def send_message(
     space: str,
     message: dict[str, Any],
     user_map_with_overrides: dict[str, str] | None = None,
+    reaction_accumulator: ReactionAccumulator | None = None,
 ) -> SendResult:
     """Send a message to a Google Chat space.
 
@@ -476,6 +553,9 @@ def send_message(
         user_map_with_overrides: Pre-computed user map with overrides applied.
             If None, an empty dict is used (callers should compute this once
             per channel via :func:`build_user_map_with_overrides`).
+        reaction_accumulator: Queue reactions here to batch them across
+            messages; the caller must flush it.  If None, reactions are
+            sent immediately.
 
     Returns:
         A :class:`SendResult` encoding success, skip, or failure.
@@ -550,7 +630,11 @@ def send_message(
 
     log_with_context(
         logging.DEBUG,
-        f"{mode_prefix}Sending message TS={ts} from user={user_id}{' (thread reply)' if is_thread_reply else ''}",
+        "%sSending message TS=%s from user=%s%s",
+        mode_prefix,
+        ts,
+        user_id,
+        " (thread reply)" if is_thread_reply else "",
         channel=channel,
         ts=ts,
         user_id=user_id,
@@ -568,7 +652,9 @@ def send_message(
             dry_run=ctx.dry_run,
         )
 
-        message_id = generate_message_id(ts, is_edited, edited_ts)
+        message_id = generate_message_id(
+            ts, is_edited, edited_ts, ctx.channel_name_to_id.get(channel, channel)
+        )
 
         process_attachments(
             user_resolver,
@@ -586,15 +672,20 @@ def send_message(
         # Send the message using the appropriate service
         log_with_context(
             logging.DEBUG,
-            f"Complete message payload for {ts}: {payload}",
+            "Complete message payload for %s: %s",
+            ts,
+            payload,
             channel=channel,
             ts=ts,
         )
-        result = chat_service.create_message(
-            parent=space,
-            body=payload,
-            message_id=message_id,
-            message_reply_option=message_reply_option,
+        result = _create_message_idempotent(
+            chat_service,
+            space,
+            payload,
+            message_id,
+            message_reply_option,
+            channel,
+            ts,
         )
         message_name: str | None = result.get("name")
 
@@ -613,6 +704,7 @@ def send_message(
             channel,
             is_edited,
             is_thread_reply,
+            reaction_accumulator,
         )
 
         return SendResult(message_name=message_name)
@@ -663,7 +755,8 @@ def track_message_stats(
         if message_key in state.messages.sent_messages:
             log_with_context(
                 logging.DEBUG,
-                f"[UPDATE MODE] Skipping stats for already sent message {ts}",
+                "[UPDATE MODE] Skipping stats for already sent message %s",
+                ts,
                 channel=channel,
                 ts=ts,
             )
@@ -683,12 +776,15 @@ def track_message_stats(
         mode_prefix = "[UPDATE MODE] " if ctx.update_mode else ""
         log_with_context(
             logging.DEBUG,
-            f"{mode_prefix}Found {file_count} files to process in message {ts}",
+            "%sFound %s files to process in message %s",
+            mode_prefix,
+            file_count,
+            ts,
             channel=channel,
             ts=ts,
         )
         state.progress.channel_stats[channel]["file_count"] += file_count
-        state.progress.migration_summary["files_created"] += file_count
+        state.increment_summary("files_created", file_count)
 
 
 def send_intro(
@@ -764,7 +860,7 @@ def send_intro(
         # Send the message
         chat.create_message(parent=space, body=message_body)
         # Increment the counter
-        state.progress.migration_summary["messages_created"] += 1
+        state.increment_summary("messages_created")
 
         log_with_context(
             logging.INFO, f"Sent intro message to space {space}", channel=channel
@@ -0,0 +1,183 @@
+"""Streaming, time-ordered reader for a channel's Slack export files.
+
+Slack exports one JSON file per channel per day (``YYYY-MM-DD.json``).
+Rather than loading every file into one list and sorting it, this module
+k-way merges the daily files by ``ts`` and de-duplicates on the fly.
+Each daily file is sorted on its own when it is opened, and a file is
+only opened once the merge reaches its date.  Peak memory is therefore
+about one or two days of messages, not the whole channel.
+"""
+
+from __future__ import annotations
+
+import datetime
+import heapq
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from slack_chat_migrator.utils.logging import log_with_context
+
+# Daily files are named by the exporting workspace's local date, so a
+# message can carry a ``ts`` up to a day before its file's UTC midnight.
+_DAY_FILE_TS_SLACK_SECONDS = 86400.0
+
+
+def _message_key(msg: dict[str, Any]) -> float:
+    return float(msg.get("ts", "0"))
+
+
+def _day_file_lower_bound(path: Path) -> float:
+    """Return the earliest ``ts`` that *path* could plausibly contain.
+
+    Files whose names are not ISO dates get ``-inf`` so they are opened
+    immediately.
+    """
+    try:
+        day = datetime.date.fromisoformat(path.stem)
+    except ValueError:
+        return float("-inf")
+    midnight = datetime.datetime(
+        day.year, day.month, day.day, tzinfo=datetime.timezone.utc
+    )
+    return midnight.timestamp() - _DAY_FILE_TS_SLACK_SECONDS
+
+
+def _load_day_file(path: Path, channel: str, quiet: bool) -> list[dict[str, Any]]:
+    """Load and sort one daily export file; return ``[]`` on read errors."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            msgs = json.load(f)
+    except (OSError, ValueError) as e:
+        if not quiet:
+            log_with_context(
+                logging.WARNING,
+                f"Failed to load messages from {path}: {e}",
+                channel=channel,
+            )
+        return []
+    if not isinstance(msgs, list):
+        return []
+    msgs.sort(key=_message_key)
+    return msgs
+
+
+def merge_day_files(
+    day_files: list[Path], channel: str, *, quiet: bool = False
+) -> Iterator[dict[str, Any]]:
+    """Yield messages from *day_files* in ``ts`` order.
+
+    Files are opened lazily: file *i* is loaded only when the smallest
+    pending ``ts`` reaches its lower bound.  Messages with equal ``ts``
+    keep file order, then in-file order, like a stable sort would.
+
+    Args:
+        day_files: Daily export files, sorted by name.
+        channel: Channel name for log context.
+        quiet: Suppress warnings about unreadable files.
+
+    Yields:
+        Message dicts in ascending ``ts`` order.
+    """
+    pending = [(_day_file_lower_bound(p), p) for p in day_files]
+    next_file = 0
+    # Heap entries: (ts, file index, position in file, message, iterator)
+    heap: list[tuple[float, int, int, dict[str, Any], Iterator[dict[str, Any]]]] = []
+
+    def open_file(index: int) -> None:
+        it = iter(_load_day_file(pending[index][1], channel, quiet))
+        push(index, 0, it)
+
+    def push(index: int, position: int, it: Iterator[dict[str, Any]]) -> None:
+        msg = next(it, None)
+        if msg is not None:
+            heapq.heappush(heap, (_message_key(msg), index, position, msg, it))
+
+    while next_file < len(pending) or heap:
+        while next_file < len(pending) and (
+            not heap or pending[next_file][0] <= heap[0][0]
+        ):
+            open_file(next_file)
+            next_file += 1
+        if not heap:
+            continue
+        _, index, position, msg, it = heapq.heappop(heap)
+        push(index, position + 1, it)
+        yield msg
+
+
+def dedupe_messages(
+    msgs: Iterator[dict[str, Any]], channel: str, *, quiet: bool = False
+) -> Iterator[dict[str, Any]]:
+    """Drop messages without a ``ts`` and repeats of an already-seen ``ts``.
+
+    *msgs* must be in ``ts`` order, so identical timestamps are adjacent
+    and only the timestamps at the current instant need remembering.
+
+    Args:
+        msgs: Messages in ascending ``ts`` order.
+        channel: Channel name for log context.
+        quiet: Suppress duplicate logging.
+
+    Yields:
+        The first message for each distinct ``ts``.
+    """
+    current_key: float | None = None
+    seen: set[str] = set()
+    duplicate_count = 0
+
+    for msg in msgs:
+        ts = msg.get("ts")
+        if not ts:
+            continue
+        key = float(ts)
+        if key != current_key:
+            current_key = key
+            seen.clear()
+        if ts in seen:
+            duplicate_count += 1
+            if not quiet:
+                log_with_context(
+                    logging.DEBUG,
+                    "Skipping duplicate message with timestamp %s",
+                    ts,
+                    channel=channel,
+                    ts=ts,
+                )
+            continue
+        seen.add(ts)
+        yield msg
+
+    if duplicate_count > 0 and not quiet:
+        log_with_context(
+            logging.INFO,
+            f"Deduplicated {duplicate_count} messages in channel {channel} (likely thread reply duplicates)",
+            channel=channel,
+        )
+
+
+class ChannelMessageStream:
+    """Re-iterable, ``ts``-ordered, de-duplicated view of one channel.
+
+    Each iteration re-reads the daily files, so a cheap counting pass
+    (:meth:`count_messages`) can precede the sending pass without keeping
+    the channel in memory.
+    """
+
+    def __init__(self, channel_dir: Path, channel: str) -> None:
+        self.channel_dir = channel_dir
+        self.channel = channel
+
+    def _iter(self, quiet: bool) -> Iterator[dict[str, Any]]:
+        day_files = sorted(self.channel_dir.glob("*.json"))
+        merged = merge_day_files(day_files, self.channel, quiet=quiet)
+        return dedupe_messages(merged, self.channel, quiet=quiet)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return self._iter(quiet=False)
+
+    def count_messages(self) -> int:
+        """Return the number of ``type == "message"`` entries, without logging."""
+        return sum(1 for m in self._iter(quiet=True) if m.get("type") == "message")
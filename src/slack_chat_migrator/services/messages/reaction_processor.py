@@ -1,19 +1,29 @@
 """
 Batch reaction processing for Google Chat message import.
 
-Handles grouping reactions by user, batch API requests, and fallback
-to synchronous processing when impersonation is unavailable.
+Handles grouping reactions by user and accumulating them across messages
+into per-user batch API requests.  Batches are flushed when they reach
+``REACTION_BATCH_MAX_SIZE`` requests, when their oldest reaction has
+waited ``REACTION_BATCH_FLUSH_SECONDS``, or explicitly at the end of a
+channel.  Failures are recorded in ``state.messages.failed_reactions_by_channel``
+per message.
 """
 
 from __future__ import annotations
 
 import logging
+import time
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
 
 from googleapiclient.errors import HttpError
-from googleapiclient.http import BatchHttpRequest
 
+from slack_chat_migrator.constants import (
+    HTTP_CONFLICT,
+    REACTION_BATCH_FLUSH_SECONDS,
+    REACTION_BATCH_MAX_SIZE,
+)
+from slack_chat_migrator.utils.events import events_enabled, record_event
 from slack_chat_migrator.utils.logging import log_with_context
 
 if TYPE_CHECKING:
@@ -31,6 +41,7 @@ def process_reactions_batch(
     message_name: str,
     reactions: list[dict[str, Any]],
     message_id: str,
+    accumulator: ReactionAccumulator | None = None,
 ) -> None:
     """Process reactions for a message in import mode.
 
@@ -42,19 +53,23 @@ def process_reactions_batch(
         message_name: Google Chat resource name of the parent message.
         reactions: List of Slack reaction dicts (each with ``name`` and ``users``).
         message_id: Short message identifier for logging.
+        accumulator: Queue the reactions here to be sent with other
+            messages' reactions.  When ``None`` they are sent immediately.
     """
     requests_by_user, reaction_count = _group_and_filter_reactions(
         ctx, state, user_resolver, reactions, message_id
     )
 
-    state.progress.migration_summary["reactions_created"] += reaction_count
+    state.increment_summary("reactions_created", reaction_count)
 
     # Impersonation in _build_user_batches() requires real credentials
     # outside the DI boundary, so skip API execution in dry-run mode.
     if ctx.dry_run:
         log_with_context(
             logging.DEBUG,
-            f"[DRY RUN] Would add {reaction_count} reactions to message {message_id}",
+            "[DRY RUN] Would add %s reactions to message %s",
+            reaction_count,
+            message_id,
             message_id=message_id,
             channel=state.context.current_channel,
         )
@@ -62,17 +77,43 @@ def process_reactions_batch(
 
     log_with_context(
         logging.DEBUG,
-        f"Adding {reaction_count} reactions from"
-        f" {len(requests_by_user)} users to message {message_id}",
+        "Adding %s reactions from %s users to message %s",
+        reaction_count,
+        len(requests_by_user),
+        message_id,
         message_id=message_id,
         channel=state.context.current_channel,
     )
 
-    user_batches = _build_user_batches(
-        state, chat, user_resolver, requests_by_user, message_name, message_id
-    )
+    queue = accumulator if accumulator is not None else ReactionAccumulator(state)
 
-    _execute_reaction_batches(state, user_batches, message_id)
+    for email, emojis in requests_by_user.items():
+        if user_resolver.is_external_user(email):
+            log_with_context(
+                logging.INFO,
+                f"Skipping {len(emojis)} reactions from external user"
+                f" {email} to avoid admin attribution",
+                message_id=message_id,
+                user=email,
+                channel=state.context.current_channel,
+            )
+            continue
+
+        svc = user_resolver.get_delegate(email)
+        if svc == chat:
+            log_with_context(
+                logging.DEBUG,
+                "Using admin account for user %s (impersonation not available)",
+                email,
+                message_id=message_id,
+                user=email,
+                channel=state.context.current_channel,
+            )
+
+        queue.add(email, svc, message_name, message_id, emojis)
+
+    if accumulator is None:
+        queue.flush()
 
 
 def _group_and_filter_reactions(
@@ -93,7 +134,9 @@ def _group_and_filter_reactions(
 
     log_with_context(
         logging.DEBUG,
-        f"Processing {len(reactions)} reaction types for message {message_id}",
+        "Processing %s reaction types for message %s",
+        len(reactions),
+        message_id,
         message_id=message_id,
         channel=state.context.current_channel,
     )
@@ -108,7 +151,9 @@ def _group_and_filter_reactions(
 
             log_with_context(
                 logging.DEBUG,
-                f"Processing emoji :{emoji_name}: with {len(emoji_users)} users",
+                "Processing emoji :%s: with %s users",
+                emoji_name,
+                len(emoji_users),
                 message_id=message_id,
                 emoji=emoji_name,
                 channel=state.context.current_channel,
@@ -160,8 +205,10 @@ def _should_skip_bot_reaction(
     if user_data and user_data.get("is_bot", False):
         log_with_context(
             logging.DEBUG,
-            f"Skipping reaction :{emoji_name}: from bot user {uid}"
-            f" ({user_data.get('real_name', 'Unknown')}) - ignore_bots enabled",
+            "Skipping reaction :%s: from bot user %s (%s) - ignore_bots enabled",
+            emoji_name,
+            uid,
+            user_data.get("real_name", "Unknown"),
             message_id=message_id,
             emoji=emoji_name,
             user_id=uid,
@@ -171,177 +218,216 @@ def _should_skip_bot_reaction(
     return False
 
 
-def _build_user_batches(
-    state: MigrationState,
-    chat: ChatAdapter,
-    user_resolver: UserResolver,
-    requests_by_user: dict[str, list[str]],
-    message_name: str,
-    message_id: str,
-) -> dict[str, BatchHttpRequest]:
-    """Build batched reaction requests, falling back to sync for admin.
+class _PendingReaction(NamedTuple):
+    message_name: str
+    message_id: str
+    emoji: str
 
-    Returns:
-        Dict mapping email → BatchHttpRequest for impersonated users.
-        Admin reactions are processed synchronously and not returned.
-    """
-    user_batches: dict[str, BatchHttpRequest] = {}
 
-    def reaction_callback(
-        request_id: str,
-        response: dict[str, Any] | None,
-        exception: HttpError | None,
-    ) -> None:
-        if exception:
-            log_with_context(
-                logging.WARNING,
-                "Failed to add reaction in batch",
-                error=str(exception),
-                message_id=message_id,
-                request_id=request_id,
-                channel=state.context.current_channel,
-            )
-        else:
-            log_with_context(
-                logging.DEBUG,
-                "Successfully added reaction in batch",
-                message_id=message_id,
-                request_id=request_id,
-                channel=state.context.current_channel,
-            )
-
-    for email, emojis in requests_by_user.items():
-        if user_resolver.is_external_user(email):
-            log_with_context(
-                logging.INFO,
-                f"Skipping {len(emojis)} reactions from external user"
-                f" {email} to avoid admin attribution",
-                message_id=message_id,
-                user=email,
-                channel=state.context.current_channel,
-            )
-            continue
+class _UserQueue:
+    """Reactions waiting to be sent as one impersonated user."""
 
-        svc = user_resolver.get_delegate(email)
-
-        if svc == chat:
-            _process_admin_reactions(
-                state, chat, message_name, message_id, email, emojis
-            )
-            continue
+    def __init__(self, svc: ChatAdapter, queued_at: float) -> None:
+        self.svc = svc
+        self.queued_at = queued_at
+        self.items: list[_PendingReaction] = []
 
-        log_with_context(
-            logging.DEBUG,
-            f"Creating batch request for user {email} with {len(emojis)} reactions",
-            message_id=message_id,
-            user=email,
-            channel=state.context.current_channel,
-        )
 
-        if email not in user_batches:
-            user_batches[email] = svc.new_batch_http_request(callback=reaction_callback)
+class ReactionAccumulator:
+    """Queues reactions across messages and sends them in per-user batches.
 
-        _add_reactions_to_batch(
-            state, svc, user_batches[email], message_name, message_id, email, emojis
-        )
+    Each impersonated user (or the admin, when impersonation is not
+    available) gets its own queue.  A queue is flushed as a single
+    ``BatchHttpRequest`` once it holds *max_batch_size* reactions or its
+    oldest reaction has waited *flush_interval* seconds; :meth:`flush`
+    sends everything that is left.  *on_added*, if given, is called once
+    for every reaction that was created.
 
-    return user_batches
+    Reactions that fail are recorded per message in
+    ``state.messages.failed_reactions_by_channel`` when :meth:`flush` runs.
+    Callers sending a long run of messages should call :meth:`flush_due`
+    for each of them so that queued reactions are not held until the end.
 
+    An accumulator is owned by a single channel worker and is not
+    thread-safe.
+    """
 
-def _process_admin_reactions(
-    state: MigrationState,
-    chat: ChatAdapter,
-    message_name: str,
-    message_id: str,
-    email: str,
-    emojis: list[str],
-) -> None:
-    """Process reactions synchronously via admin when impersonation is unavailable."""
-    log_with_context(
-        logging.DEBUG,
-        f"Using admin account for user {email} (impersonation not available)",
-        message_id=message_id,
-        user=email,
-        channel=state.context.current_channel,
-    )
-
-    for emo in emojis:
-        try:
-            reaction_body = {"emoji": {"unicode": emo}}
-            chat.create_reaction(parent=message_name, body=reaction_body)
-        except HttpError as e:
-            log_with_context(
-                logging.WARNING,
-                f"Failed to add reaction via admin fallback: {e}",
-                error_code=e.resp.status,
-                user=email,
-                message_id=message_id,
-                channel=state.context.current_channel,
-            )
-
+    def __init__(
+        self,
+        state: MigrationState,
+        max_batch_size: int = REACTION_BATCH_MAX_SIZE,
+        flush_interval: float = REACTION_BATCH_FLUSH_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+        on_added: Callable[[], Any] | None = None,
+    ) -> None:
+        self._state = state
+        self._on_added = on_added
+        self._max_batch_size = max_batch_size
+        self._flush_interval = flush_interval
+        self._clock = clock
+        self._queues: dict[str, _UserQueue] = {}
+        self._failures: dict[str, list[str]] = defaultdict(list)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of reactions queued but not yet sent."""
+        return sum(len(q.items) for q in self._queues.values())
+
+    def add(
+        self,
+        email: str,
+        svc: ChatAdapter,
+        message_name: str,
+        message_id: str,
+        emojis: list[str],
+    ) -> None:
+        """Queue *emojis* from *email* on *message_name*.
+
+        Args:
+            email: Internal email of the reacting user.
+            svc: Chat service acting as that user (or the admin service).
+            message_name: Google Chat resource name of the parent message.
+            message_id: Short message identifier for logging and failures.
+            emojis: Unicode emoji strings to add.
+        """
+        for emo in emojis:
+            queue = self._queues.get(email)
+            if queue is None:
+                queue = _UserQueue(svc, self._clock())
+                self._queues[email] = queue
+            queue.items.append(_PendingReaction(message_name, message_id, emo))
+            if len(queue.items) >= self._max_batch_size:
+                self._flush_user(email)
+        self.flush_due()
+
+    def flush_due(self) -> None:
+        """Flush every queue whose oldest reaction has waited too long."""
+        now = self._clock()
+        for email in [
+            e
+            for e, q in self._queues.items()
+            if now - q.queued_at >= self._flush_interval
+        ]:
+            self._flush_user(email)
+
+    def flush(self) -> None:
+        """Send every queued reaction and record all failures in the state."""
+        for email in list(self._queues):
+            self._flush_user(email)
+        if not self._failures:
+            return
+        channel = self._state.context.current_channel or ""
+        by_message = self._state.messages.failed_reactions_by_channel.setdefault(
+            channel, {}
+        )
+        for message_id, errors in self._failures.items():
+            by_message.setdefault(message_id, []).extend(errors)
+        self._failures.clear()
+
+    def _flush_user(self, email: str) -> None:
+        queue = self._queues.pop(email, None)
+        if queue is None or not queue.items:
+            return
+        items = queue.items
+        channel = self._state.context.current_channel
+        batch_failures: dict[str, list[str]] = defaultdict(list)
+        statuses: dict[int, Any] = {}
+
+        def reaction_callback(
+            request_id: str,
+            response: dict[str, Any] | None,
+            exception: HttpError | None,
+        ) -> None:
+            if exception is not None:
+                statuses[int(request_id)] = exception.resp.status
+                self._record_failure(items[int(request_id)], exception, batch_failures)
 
-def _add_reactions_to_batch(
-    state: MigrationState,
-    svc: ChatAdapter,
-    batch: BatchHttpRequest,
-    message_name: str,
-    message_id: str,
-    email: str,
-    emojis: list[str],
-) -> None:
-    """Add individual reaction requests to a user's batch."""
-    for emo in emojis:
-        reaction_body = {"emoji": {"unicode": emo}}
+        log_with_context(
+            logging.DEBUG,
+            "Executing reaction batch of %s for user %s",
+            len(items),
+            email,
+            user=email,
+            channel=channel,
+        )
 
-        try:
-            request = svc.build_create_reaction_request(
-                parent=message_name, body=reaction_body
-            )
-            batch.add(request)
-        except AttributeError as e:
-            log_with_context(
-                logging.WARNING,
-                f"Failed to create reaction request: {e}."
-                " Falling back to direct API call.",
-                message_id=message_id,
-                user=email,
-                emoji=emo,
-                channel=state.context.current_channel,
-            )
+        batch = queue.svc.new_batch_http_request(callback=reaction_callback)
+        for index, item in enumerate(items):
+            body = {"emoji": {"unicode": item.emoji}}
             try:
-                svc.create_reaction(parent=message_name, body=reaction_body)
-            except HttpError as inner_e:
+                request = queue.svc.build_create_reaction_request(
+                    parent=item.message_name, body=body
+                )
+            except AttributeError as e:
                 log_with_context(
                     logging.WARNING,
-                    f"Failed to add reaction in fallback mode: {inner_e}",
-                    message_id=message_id,
+                    f"Failed to create reaction request: {e}."
+                    " Falling back to direct API call.",
+                    message_id=item.message_id,
                     user=email,
-                    emoji=emo,
+                    emoji=item.emoji,
+                    channel=channel,
                 )
-
-
-def _execute_reaction_batches(
-    state: MigrationState,
-    user_batches: dict[str, BatchHttpRequest],
-    message_id: str,
-) -> None:
-    """Execute all queued batch reaction requests."""
-    for email, batch in user_batches.items():
+                try:
+                    queue.svc.create_reaction(parent=item.message_name, body=body)
+                except HttpError as inner_e:
+                    statuses[index] = inner_e.resp.status
+                    self._record_failure(item, inner_e, batch_failures)
+                continue
+            batch.add(request, request_id=str(index))
+
+        started = time.perf_counter()
         try:
-            log_with_context(
-                logging.DEBUG,
-                f"Executing batch request for user {email}",
-                message_id=message_id,
-                user=email,
-                channel=state.context.current_channel,
-            )
             batch.execute()
         except HttpError as e:
             log_with_context(
                 logging.WARNING,
                 f"Reaction batch execution failed for user {email}: {e}",
-                message_id=message_id,
                 user=email,
-                channel=state.context.current_channel,
+                channel=channel,
                 error=str(e),
             )
+            statuses = dict.fromkeys(range(len(items)), e.resp.status)
+            for item in items:
+                self._record_failure(item, e, batch_failures)
+
+        if events_enabled():
+            latency_ms = round((time.perf_counter() - started) * 1000, 3)
+            for index, item in enumerate(items):
+                record_event(
+                    "reaction",
+                    latency_ms=latency_ms,
+                    retries=0,
+                    channel=channel,
+                    message_id=item.message_id,
+                    status=statuses.get(index, "ok"),
+                    batch_size=len(items),
+                )
+
+        if self._on_added is not None:
+            for index in range(len(items)):
+                if index not in statuses:
+                    self._on_added()
+
+        for message_id, errors in batch_failures.items():
+            self._failures[message_id].extend(errors)
+            log_with_context(
+                logging.WARNING,
+                f"Failed to add {len(errors)} reactions to message"
+                f" {message_id}: {'; '.join(errors)}",
+                message_id=message_id,
+                user=email,
+                channel=channel,
+            )
+
+    def _record_failure(
+        self,
+        item: _PendingReaction,
+        error: HttpError,
+        batch_failures: dict[str, list[str]],
+    ) -> None:
+        # The reaction was already present (e.g. a resumed run); nothing lost.
+        if error.resp.status == HTTP_CONFLICT:
+            return
+        batch_failures[item.message_id].append(f":{item.emoji}: ({error.resp.status})")
+        self._state.increment_summary("reactions_created", -1)
@@ -0,0 +1,724 @@
+"""Simulated Google Chat and Drive APIs for offline throughput benchmarks.
+
+The dry-run services answer instantly, so a dry run measures only the
+migrator's own CPU time.  :class:`SimulatedBackend` answers real
+``googleapiclient`` requests with realistic behavior instead:
+
+* Each endpoint has a log-normal latency distribution
+  (:class:`LatencyModel`).
+* Write quotas apply per user and per project, enforced in fixed windows
+  like Google's per-minute quotas.  Requests over quota get a 429.
+* A configurable share of requests fail with a 5xx.
+* Batch requests follow Google's multipart semantics.  Every part counts
+  against quota and can fail on its own.
+
+Everything above the HTTP layer stays real: request building, batching,
+:class:`~slack_chat_migrator.utils.api.RetryWrapper` retries and the
+adaptive rate limiter.  Benchmarks of concurrency, batching and
+rate-limit strategies therefore behave as they would against Google,
+without network access or credentials.
+
+There are two ways to reach the backend:
+
+* In process: :meth:`SimulatedBackend.http_for` returns an
+  ``httplib2``-compatible client that handles requests directly.
+* Over HTTP: :class:`SimulatedBackendServer` serves the backend on a local
+  port.  Clients use the shared pooled transport, so connection handling
+  is measured too.
+
+Both provide ``build_service(api, version, user_email)``.  After
+:func:`~slack_chat_migrator.utils.api.set_service_factory`, every service
+from :func:`~slack_chat_migrator.utils.api.get_gcp_service` talks to the
+simulator::
+
+    backend = SimulatedBackend(SimulationProfile(time_scale=0.1))
+    set_service_factory(backend)
+    try:
+        SlackToChatMigrator(..., dry_run=False).migrate()
+    finally:
+        set_service_factory(None)
+    print(backend.stats())
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from email.message import Message
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
+
+import httplib2
+from google.auth.credentials import Credentials
+
+from slack_chat_migrator.constants import (
+    HTTP_RATE_LIMIT,
+    SIMULATED_BACKEND_HOST,
+    SIMULATED_BATCH_MAX_PARTS,
+)
+from slack_chat_migrator.utils.discovery_docs import build_service
+from slack_chat_migrator.utils.logging import log_with_context
+from slack_chat_migrator.utils.transport import authorized_http
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z99 = 2.326
+
+
+@dataclass(frozen=True)
+class LatencyModel:
+    """Log-normal request latency, set by its median and 99th percentile.
+
+    Attributes:
+        median: Median latency in seconds.
+        p99: 99th-percentile latency in seconds.
+    """
+
+    median: float
+    p99: float
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds."""
+        if self.p99 <= self.median:
+            return self.median
+        sigma = math.log(self.p99 / self.median) / _Z99
+        return self.median * math.exp(rng.gauss(0.0, sigma))
+
+
+# Rough figures observed against the production APIs
+DEFAULT_LATENCIES: dict[str, LatencyModel] = {
+    "chat.spaces.create": LatencyModel(0.6, 2.5),
+    "chat.spaces.completeImport": LatencyModel(0.8, 3.0),
+    "chat.spaces.members.create": LatencyModel(0.25, 1.2),
+    "chat.spaces.messages.create": LatencyModel(0.25, 1.2),
+    "chat.spaces.messages.reactions.create": LatencyModel(0.15, 0.8),
+    "chat.media.upload": LatencyModel(0.8, 4.0),
+    "drive.files.create": LatencyModel(0.7, 3.0),
+    "drive.permissions.create": LatencyModel(0.3, 1.5),
+    "batch": LatencyModel(0.05, 0.2),
+}
+
+
+@dataclass
+class SimulationProfile:
+    """How the simulated APIs behave.
+
+    Attributes:
+        latencies: Latency per endpoint (``methodId`` such as
+            ``"chat.spaces.messages.create"``, or ``"batch"`` for the batch
+            envelope's own overhead).
+        default_latency: Latency of endpoints missing from *latencies*.
+        user_write_quota: Writes each user may make per quota window.
+        project_write_quota: Writes all users together may make per window.
+        quota_window_seconds: Length of a quota window.
+        server_error_rate: Share of requests answered with a 5xx.
+        server_error_status: Status returned for injected server errors.
+        batch_max_parts: Most requests one batch may hold; larger batches
+            are rejected with a 400.
+        time_scale: Multiplier for every latency and quota window.
+            ``0.01`` runs a simulated hour in 36 seconds.  ``0`` skips
+            sleeping entirely and leaves quota windows unscaled.
+        seed: Seed for latency and error draws.
+    """
+
+    latencies: dict[str, LatencyModel] = field(
+        default_factory=lambda: dict(DEFAULT_LATENCIES)
+    )
+    default_latency: LatencyModel = LatencyModel(0.1, 0.5)
+    user_write_quota: int = 600
+    project_write_quota: int = 3000
+    quota_window_seconds: float = 60.0
+    server_error_rate: float = 0.0
+    server_error_status: int = 503
+    batch_max_parts: int = SIMULATED_BATCH_MAX_PARTS
+    time_scale: float = 1.0
+    seed: int = 0
+
+
+class SimulatedCredentials(Credentials):
+    """Credentials whose bearer token is the user's email.
+
+    The simulator reads the caller's identity from that token, so requests
+    and batch parts are attributed to the right user's quota.
+    """
+
+    def __init__(self, user_email: str) -> None:
+        super().__init__()
+        self.token = user_email
+
+    def refresh(self, request: Any) -> None:
+        """Nothing to refresh: the token never expires."""
+
+
+# ---------------------------------------------------------------------------
+# Routing
+# ---------------------------------------------------------------------------
+
+_SPACE = r"(?P<space>spaces/[^/:]+)"
+_ROUTES: list[tuple[str, re.Pattern[str], str]] = [
+    (method, re.compile(path), endpoint)
+    for method, path, endpoint in (
+        ("GET", r"/v1/spaces", "chat.spaces.list"),
+        ("POST", r"/v1/spaces", "chat.spaces.create"),
+        ("POST", rf"/v1/{_SPACE}:completeImport", "chat.spaces.completeImport"),
+        ("GET", rf"/v1/{_SPACE}", "chat.spaces.get"),
+        ("PATCH", rf"/v1/{_SPACE}", "chat.spaces.patch"),
+        ("DELETE", rf"/v1/{_SPACE}", "chat.spaces.delete"),
+        ("GET", rf"/v1/{_SPACE}/members", "chat.spaces.members.list"),
+        ("POST", rf"/v1/{_SPACE}/members", "chat.spaces.members.create"),
+        ("DELETE", rf"/v1/{_SPACE}/members/[^/]+", "chat.spaces.members.delete"),
+        ("GET", rf"/v1/{_SPACE}/messages", "chat.spaces.messages.list"),
+        ("POST", rf"/v1/{_SPACE}/messages", "chat.spaces.messages.create"),
+        (
+            "POST",
+            rf"/v1/(?P<message>{_SPACE}/messages/[^/]+)/reactions",
+            "chat.spaces.messages.reactions.create",
+        ),
+        ("POST|PUT", rf"/upload/v1/{_SPACE}/attachments:upload", "chat.media.upload"),
+        ("GET", r"/drive/v3/files", "drive.files.list"),
+        ("POST|PUT", r"(/upload)?/drive/v3/files", "drive.files.create"),
+        ("GET", r"/drive/v3/files/(?P<file>[^/]+)", "drive.files.get"),
+        ("PATCH", r"(/upload)?/drive/v3/files/(?P<file>[^/]+)", "drive.files.update"),
+        ("DELETE", r"/drive/v3/files/[^/]+", "drive.files.delete"),
+        ("GET", r"/drive/v3/files/[^/]+/permissions", "drive.permissions.list"),
+        ("POST", r"/drive/v3/files/[^/]+/permissions", "drive.permissions.create"),
+        ("GET", r"/drive/v3/drives", "drive.drives.list"),
+        ("POST", r"/drive/v3/drives", "drive.drives.create"),
+        ("GET", r"/drive/v3/drives/(?P<drive>[^/]+)", "drive.drives.get"),
+        ("POST", r"/batch(/drive/v3)?", "batch"),
+    )
+]
+
+
+def route(method: str, path: str) -> tuple[str, dict[str, str]] | None:
+    """Return ``(endpoint, path parameters)`` for a request, or ``None``."""
+    for methods, pattern, endpoint in _ROUTES:
+        if method in methods.split("|"):
+            match = pattern.fullmatch(path)
+            if match:
+                return endpoint, {k: v for k, v in match.groupdict().items() if v}
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Backend
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class SimulatedResponse:
+    """One HTTP response from the simulator."""
+
+    status: int
+    body: bytes = b"{}"
+    headers: dict[str, str] = field(
+        default_factory=lambda: {"content-type": "application/json; charset=UTF-8"}
+    )
+    latency: float = 0.0
+
+
+def _error(status: int, message: str, reason: str) -> SimulatedResponse:
+    body = {"error": {"code": status, "message": message, "status": reason}}
+    return SimulatedResponse(status, json.dumps(body).encode("utf-8"))
+
+
+class _QuotaWindows:
+    """Fixed-window request counters, one per key."""
+
+    def __init__(self, limit: int, window: float) -> None:
+        self.limit = limit
+        self.window = window
+        self._counts: dict[str, tuple[int, int]] = {}
+
+    def take(self, key: str, now: float) -> bool:
+        """Count one request for *key*; False if its window is used up."""
+        window = int(now / self.window) if self.window > 0 else 0
+        current, used = self._counts.get(key, (window, 0))
+        if current != window:
+            used = 0
+        if used >= self.limit:
+            return False
+        self._counts[key] = (window, used + 1)
+        return True
+
+
+class SimulatedBackend:
+    """In-process model of the Google Chat and Drive REST APIs.
+
+    Thread-safe: one backend serves every worker thread of a migration.
+
+    Args:
+        profile: Latency, quota and error behavior.
+        sleep: Called with each response's latency; tests pass a stub.
+        clock: Monotonic clock used for quota windows.
+    """
+
+    def __init__(
+        self,
+        profile: SimulationProfile | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.profile = profile or SimulationProfile()
+        self._sleep = sleep
+        self._clock = clock
+        self._rng = random.Random(self.profile.seed)  # noqa: S311
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        window = self.profile.quota_window_seconds
+        if self.profile.time_scale > 0:
+            window *= self.profile.time_scale
+        self._user_quota = _QuotaWindows(self.profile.user_write_quota, window)
+        self._project_quota = _QuotaWindows(self.profile.project_write_quota, window)
+        self._calls: Counter[tuple[str, int]] = Counter()
+
+    # -- Client side ---------------------------------------------------------
+
+    def http_for(self, user_email: str) -> SimulatedHttp:
+        """Return an ``httplib2``-compatible client acting as *user_email*."""
+        return SimulatedHttp(self, user_email)
+
+    def build_service(self, api: str, version: str, user_email: str) -> Any:
+        """Build a ``googleapiclient`` service answered by this backend."""
+        return build_service(api, version, http=self.http_for(user_email))
+
+    # -- Request handling ----------------------------------------------------
+
+    def handle(
+        self,
+        method: str,
+        uri: str,
+        headers: dict[str, str],
+        body: bytes,
+        user: str = "",
+    ) -> SimulatedResponse:
+        """Answer one HTTP request, sleeping for its simulated latency.
+
+        Args:
+            method: HTTP method.
+            uri: Absolute or path-only request URI.
+            headers: Request headers (any case).
+            body: Request body.
+            user: Caller, if the request carries no bearer token.
+
+        Returns:
+            The response.
+        """
+        response = self._respond(method, uri, headers, body, user)
+        if response.latency > 0 and self.profile.time_scale > 0:
+            self._sleep(response.latency * self.profile.time_scale)
+        return response
+
+    def _respond(
+        self,
+        method: str,
+        uri: str,
+        headers: dict[str, str],
+        body: bytes,
+        user: str,
+    ) -> SimulatedResponse:
+        """Answer one request without sleeping."""
+        headers = {k.lower(): v for k, v in headers.items()}
+        auth = headers.get("authorization", "")
+        if auth.startswith("Bearer "):
+            user = auth[len("Bearer ") :]
+        parts = urlsplit(uri)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        routed = route(method.upper(), parts.path)
+        if routed is None:
+            response = _error(
+                404, f"No simulated endpoint for {parts.path}", "NOT_FOUND"
+            )
+            self._record("unknown", response)
+            return response
+
+        endpoint, params = routed
+        if endpoint == "batch":
+            return self._batch(headers, body, user)
+
+        latency = self._latency(endpoint)
+        # The PUT finishing a resumable upload belongs to the POST before it
+        write = method.upper() != "GET" and "upload_id" not in query
+        rejected = self._admit(endpoint, write, user)
+        if rejected is not None:
+            response = rejected
+        else:
+            payload = _json_body(headers, body)
+            response = SimulatedResponse(
+                200,
+                json.dumps(self._result(endpoint, params, query, payload)).encode(),
+            )
+            if query.get("uploadType") == "resumable" and method.upper() == "POST":
+                # Resumable sessions continue with a PUT to this location
+                response.headers["location"] = f"{uri}&upload_id={next(self._ids)}"
+        response.latency = latency
+        self._record(endpoint, response)
+        return response
+
+    def _latency(self, endpoint: str) -> float:
+        model = self.profile.latencies.get(endpoint, self.profile.default_latency)
+        with self._lock:
+            return model.sample(self._rng)
+
+    def _admit(self, endpoint: str, write: bool, user: str) -> SimulatedResponse | None:
+        """Apply injected errors and quotas; ``None`` lets the request through."""
+        with self._lock:
+            if (
+                self.profile.server_error_rate > 0
+                and self._rng.random() < self.profile.server_error_rate
+            ):
+                return _error(
+                    self.profile.server_error_status,
+                    "The service is currently unavailable.",
+                    "UNAVAILABLE",
+                )
+            if not write:
+                return None
+            now = self._clock()
+            if not self._user_quota.take(user, now):
+                return _error(
+                    HTTP_RATE_LIMIT,
+                    f"Quota exceeded for quota metric 'Write requests per user' ({endpoint})",
+                    "RESOURCE_EXHAUSTED",
+                )
+            if not self._project_quota.take("project", now):
+                return _error(
+                    HTTP_RATE_LIMIT,
+                    f"Quota exceeded for quota metric 'Write requests' ({endpoint})",
+                    "RESOURCE_EXHAUSTED",
+                )
+        return None
+
+    def _result(
+        self,
+        endpoint: str,
+        params: dict[str, str],
+        query: dict[str, str],
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Return the JSON body of a successful *endpoint* call."""
+        n = next(self._ids)
+        space = params.get("space", "")
+        if endpoint == "chat.spaces.create":
+            return {
+                "name": f"spaces/sim-{n}",
+                "displayName": payload.get("displayName", ""),
+                "spaceType": "SPACE",
+                "importMode": payload.get("importMode", False),
+            }
+        if endpoint == "chat.spaces.get":
+            return {
+                "name": space,
+                "displayName": "simulated-space",
+                "importMode": False,
+                "externalUserAllowed": False,
+                "createTime": "",
+                "spaceType": "SPACE",
+            }
+        if endpoint == "chat.spaces.messages.create":
+            # Replies land in the thread they name, or the one their key opened
+            thread = payload.get("thread") or {}
+            key = thread.get("threadKey") or thread.get("thread_key") or f"sim-{n}"
+            return {
+                "name": f"{space}/messages/sim-{n}",
+                "thread": {"name": thread.get("name") or f"{space}/threads/{key}"},
+                "createTime": payload.get("createTime", ""),
+            }
+        if endpoint == "chat.spaces.messages.reactions.create":
+            return {
+                "name": f"{params['message']}/reactions/sim-{n}",
+                "emoji": payload.get("emoji", {}),
+            }
+        if endpoint == "chat.spaces.members.create":
+            return {"name": f"{space}/members/sim-{n}"}
+        if endpoint == "chat.media.upload":
+            return {"attachmentDataRef": {"resourceName": f"sim-media-{n}"}}
+        if endpoint in ("drive.files.create", "drive.files.get", "drive.files.update"):
+            file_id = params.get("file", f"sim-file-{n}")
+            return {
+                "id": file_id,
+                "name": payload.get("name", ""),
+                "webViewLink": f"https://drive.google.com/sim/{file_id}",
+            }
+        if endpoint == "drive.permissions.create":
+            return {"id": f"sim-permission-{n}"}
+        if endpoint == "drive.drives.create":
+            return {"id": f"sim-drive-{n}", "name": payload.get("name", "")}
+        if endpoint == "drive.drives.get":
+            return {"id": params["drive"], "name": "simulated-drive"}
+        if endpoint.endswith(".list"):
+            key = {
+                "chat.spaces.list": "spaces",
+                "chat.spaces.members.list": "memberships",
+                "chat.spaces.messages.list": "messages",
+                "drive.files.list": "files",
+                "drive.permissions.list": "permissions",
+                "drive.drives.list": "drives",
+            }[endpoint]
+            return {key: []}
+        return {}
+
+    # -- Batches -------------------------------------------------------------
+
+    def _batch(
+        self, headers: dict[str, str], body: bytes, user: str
+    ) -> SimulatedResponse:
+        """Answer a ``multipart/mixed`` batch, one response part per request.
+
+        The parts are served concurrently, so the batch takes its own
+        overhead plus the slowest part's latency.
+        """
+        parts = _multipart(headers.get("content-type", ""), body)
+        if not parts:
+            response = _error(400, "Batch request has no parts.", "INVALID_ARGUMENT")
+            self._record("batch", response)
+            return response
+        if len(parts) > self.profile.batch_max_parts:
+            response = _error(
+                400,
+                f"A batch may hold at most {self.profile.batch_max_parts} requests.",
+                "INVALID_ARGUMENT",
+            )
+            self._record("batch", response)
+            return response
+
+        boundary = f"batch_sim_{next(self._ids)}"
+        chunks: list[bytes] = []
+        slowest = 0.0
+        for part in parts:
+            method, uri, part_headers, part_body = _parse_http_part(part.get_payload())
+            inner = self._respond(method, uri, part_headers, part_body, user)
+            slowest = max(slowest, inner.latency)
+            content_id = part.get("Content-ID", "<>")
+            chunks.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                f"Content-ID: <response-{content_id[1:]}\r\n\r\n"
+                f"HTTP/1.1 {inner.status} {_reason(inner.status)}\r\n"
+                "Content-Type: application/json; charset=UTF-8\r\n\r\n".encode()
+                + inner.body
+                + b"\r\n"
+            )
+        chunks.append(f"--{boundary}--".encode())
+
+        response = SimulatedResponse(
+            200,
+            b"".join(chunks),
+            {"content-type": f"multipart/mixed; boundary={boundary}"},
+            latency=self._latency("batch") + slowest,
+        )
+        self._record("batch", response)
+        return response
+
+    # -- Statistics ----------------------------------------------------------
+
+    def _record(self, endpoint: str, response: SimulatedResponse) -> None:
+        with self._lock:
+            self._calls[(endpoint, response.status)] += 1
+
+    def stats(self) -> dict[str, dict[int, int]]:
+        """Return ``{endpoint: {status: count}}`` for every request so far."""
+        with self._lock:
+            result: dict[str, dict[int, int]] = {}
+            for (endpoint, status), count in sorted(self._calls.items()):
+                result.setdefault(endpoint, {})[status] = count
+            return result
+
+
+def _multipart(content_type: str, body: bytes) -> list[Message]:
+    """Return the parts of a multipart body, or ``[]`` if it has none."""
+    message = BytesParser().parsebytes(
+        b"Content-Type: " + content_type.encode("latin-1") + b"\r\n\r\n" + body
+    )
+    parts = message.get_payload() if message.is_multipart() else []
+    if not isinstance(parts, list):
+        return []
+    return [part for part in parts if isinstance(part, Message)]
+
+
+def _json_body(headers: dict[str, str], body: bytes) -> dict[str, Any]:
+    content_type = headers.get("content-type", "")
+    if body and content_type.startswith("multipart/related"):
+        # Media uploads send their metadata as the first part
+        parts = _multipart(content_type, body)
+        if not parts:
+            return {}
+        content_type = parts[0].get_content_type()
+        metadata = parts[0].get_payload(decode=True)
+        body = metadata if isinstance(metadata, bytes) else b""
+    if not body or "json" not in content_type:
+        return {}
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _parse_http_part(
+    payload: Any,
+) -> tuple[str, str, dict[str, str], bytes]:
+    """Split one ``application/http`` batch part into its request."""
+    raw = payload.encode("utf-8") if isinstance(payload, str) else bytes(payload)
+    head, _, body = raw.partition(b"\r\n\r\n")
+    if not body and b"\n\n" in raw:
+        head, _, body = raw.partition(b"\n\n")
+    lines = head.decode("utf-8").splitlines()
+    method, uri = lines[0].split(" ")[:2]
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method, uri, headers, body.rstrip(b"\r\n")
+
+
+def _reason(status: int) -> str:
+    return {
+        200: "OK",
+        400: "Bad Request",
+        404: "Not Found",
+        HTTP_RATE_LIMIT: "Too Many Requests",
+        500: "Internal Server Error",
+        503: "Service Unavailable",
+    }.get(status, "Error")
+
+
+# ---------------------------------------------------------------------------
+# In-process client
+# ---------------------------------------------------------------------------
+
+
+class SimulatedHttp:
+    """``httplib2``-compatible client answered by a :class:`SimulatedBackend`.
+
+    Attributes:
+        credentials: Identifies the user to the backend, also in batches.
+    """
+
+    def __init__(self, backend: SimulatedBackend, user_email: str) -> None:
+        self._backend = backend
+        self.credentials = SimulatedCredentials(user_email)
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: str | bytes | None = None,
+        headers: dict[str, str] | None = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+    ) -> tuple[httplib2.Response, bytes]:
+        """Answer a request the way ``httplib2.Http.request`` would."""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        response = self._backend.handle(
+            method, uri, headers or {}, body or b"", user=self.credentials.token or ""
+        )
+        info: dict[str, Any] = dict(response.headers)
+        info["status"] = response.status
+        resp = httplib2.Response(info)
+        resp.reason = _reason(response.status)
+        return resp, response.body
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+# ---------------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------------
+
+
+class _BackendHandler(BaseHTTPRequestHandler):
+    server_version = "SimulatedGoogleApis/1.0"
+    protocol_version = "HTTP/1.1"
+    backend: SimulatedBackend
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        # Absolute, so resumable-upload locations point back at this server
+        uri = f"http://{self.headers.get('Host', '')}{self.path}"
+        response = self.backend.handle(
+            self.command, uri, dict(self.headers.items()), body
+        )
+        self.send_response(response.status)
+        for name, value in response.headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(response.body)))
+        self.end_headers()
+        self.wfile.write(response.body)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _serve
+
+    def log_message(self, format: str, *args: Any) -> None:
+        log_with_context(logging.DEBUG, "Simulated API: " + format, *args)
+
+
+class SimulatedBackendServer:
+    """Serves a :class:`SimulatedBackend` on a local port.
+
+    Services from :meth:`build_service` send their requests, uploads and
+    batches there over the shared connection pool.
+    """
+
+    def __init__(
+        self,
+        backend: SimulatedBackend,
+        port: int = 0,
+        host: str = SIMULATED_BACKEND_HOST,
+    ) -> None:
+        self.backend = backend
+        self._host = host
+        self._port = port
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Root URL of the server, using the bound port once started."""
+        port = self._server.server_address[1] if self._server else self._port
+        return f"http://{self._host}:{port}/"
+
+    def build_service(self, api: str, version: str, user_email: str) -> Any:
+        """Build a ``googleapiclient`` service that calls this server."""
+        http = authorized_http(SimulatedCredentials(user_email))
+        return build_service(api, version, http=http, root_url=self.url)
+
+    def start(self) -> None:
+        """Bind the port and serve requests on a daemon thread.
+
+        Raises:
+            OSError: If the port cannot be bound.
+        """
+        handler = type(
+            "SimulatedBackendHandler", (_BackendHandler,), {"backend": self.backend}
+        )
+        self._server = ThreadingHTTPServer((self._host, self._port), handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="simulated-backend",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
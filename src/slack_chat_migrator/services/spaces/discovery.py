@@ -6,13 +6,11 @@ from __future__ import annotations
 
 import datetime
 import logging
-import time
 from typing import TYPE_CHECKING, Any
 
 from googleapiclient.errors import HttpError
 
 from slack_chat_migrator.constants import (
-    API_THROTTLE_DISCOVERY_SECONDS,
     SPACE_NAME_PREFIX,
     SPACES_PAGE_SIZE,
 )
@@ -82,7 +80,6 @@ def _fetch_all_migration_spaces(
         page_token = response.get("nextPageToken")
         if not page_token:
             break
-        time.sleep(API_THROTTLE_DISCOVERY_SECONDS)
 
     return all_spaces_by_channel
 
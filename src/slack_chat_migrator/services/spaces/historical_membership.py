@@ -3,25 +3,20 @@
 from __future__ import annotations
 
 import datetime
-import json
 import logging
-import time
 from collections.abc import Mapping
-from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from googleapiclient.errors import HttpError
 
 from slack_chat_migrator.constants import (
-    API_THROTTLE_MEMBER_SECONDS,
-    CHANNEL_JOIN_SUBTYPE,
-    CHANNEL_LEAVE_SUBTYPE,
     DEFAULT_FALLBACK_JOIN_TIME,
     EARLIEST_MESSAGE_OFFSET_MINUTES,
     FIRST_MESSAGE_OFFSET_MINUTES,
     HISTORICAL_DELETE_TIME_OFFSET_SECONDS,
     HTTP_CONFLICT,
 )
+from slack_chat_migrator.services.export_catalog import channel_summary
 from slack_chat_migrator.utils.api import slack_ts_to_rfc3339
 from slack_chat_migrator.utils.logging import log_with_context
 
@@ -33,83 +28,6 @@ if TYPE_CHECKING:
     from slack_chat_migrator.services.user_resolver import UserResolver
 
 
-def _scan_message_files_for_membership(
-    ch_dir: Path,
-    channel: str,
-) -> tuple[dict[str, dict[str, Any]], set[str]]:
-    """Scan all JSON message files to build user join/leave/message history.
-
-    Returns (user_membership, active_users) populated from message data only.
-    """
-    user_membership: dict[str, dict[str, Any]] = {}
-    active_users: set[str] = set()
-
-    for jf in sorted(ch_dir.glob("*.json")):
-        try:
-            with open(jf, encoding="utf-8") as f:
-                msgs = json.load(f)
-            for m in msgs:
-                if m.get("type") != "message":
-                    continue
-
-                user_id = m.get("user")
-                if user_id:
-                    timestamp = slack_ts_to_rfc3339(m["ts"])
-                    if user_id not in user_membership:
-                        user_membership[user_id] = {
-                            "join_time": None,
-                            "leave_time": None,
-                            "active": True,
-                            "first_message_time": timestamp,
-                        }
-                        active_users.add(user_id)
-                    elif timestamp < user_membership[user_id].get(
-                        "first_message_time", timestamp
-                    ):
-                        user_membership[user_id]["first_message_time"] = timestamp
-
-                subtype = m.get("subtype")
-                if subtype == CHANNEL_JOIN_SUBTYPE and "user" in m:
-                    user_id = m["user"]
-                    timestamp = slack_ts_to_rfc3339(m["ts"])
-                    if user_id not in user_membership:
-                        user_membership[user_id] = {
-                            "join_time": timestamp,
-                            "leave_time": None,
-                            "active": True,
-                            "first_message_time": None,
-                        }
-                        active_users.add(user_id)
-                    elif (
-                        not user_membership[user_id]["join_time"]
-                        or timestamp < user_membership[user_id]["join_time"]
-                    ):
-                        user_membership[user_id]["join_time"] = timestamp
-                        user_membership[user_id]["active"] = True
-                        active_users.add(user_id)
-
-                elif subtype == CHANNEL_LEAVE_SUBTYPE and "user" in m:
-                    user_id = m["user"]
-                    timestamp = slack_ts_to_rfc3339(m["ts"])
-                    if user_id not in user_membership:
-                        continue
-                    if (
-                        not user_membership[user_id]["leave_time"]
-                        or timestamp > user_membership[user_id]["leave_time"]
-                    ):
-                        user_membership[user_id]["leave_time"] = timestamp
-                        user_membership[user_id]["active"] = False
-                        active_users.discard(user_id)
-        except (OSError, json.JSONDecodeError) as e:
-            log_with_context(
-                logging.WARNING,
-                f"Failed to process file {jf} when collecting user membership data: {e}",
-                channel=channel,
-            )
-
-    return user_membership, active_users
-
-
 def _apply_channel_metadata_members(
     meta: Mapping[str, Any],
     user_membership: dict[str, dict[str, Any]],
@@ -137,8 +55,8 @@ def _collect_user_membership_data(
 ) -> tuple[dict[str, dict[str, Any]], set[str]]:
     """Collect user participation data from message files and channel metadata.
 
-    Scans all JSON message files in the channel directory to build a map of
-    user membership events (join/leave times, first message times). Then
+    Reads the map of user membership events (join/leave times, first
+    message times) from the channel's export catalog summary.  Then
     augments with the definitive member list from channel metadata.
 
     Also stores the active user set on ``state.progress.active_users_by_channel``
@@ -155,8 +73,7 @@ def _collect_user_membership_data(
         ``active``, and ``first_message_time`` keys, and *active_users* is
         the set of user IDs considered currently active.
     """
-    ch_dir = ctx.export_root / channel
-    user_membership, _ = _scan_message_files_for_membership(ch_dir, channel)
+    user_membership = channel_summary(ctx, channel).membership_snapshot()
 
     # Channel metadata is the authoritative source for active members
     meta = ctx.channels_meta.get(channel, {})
@@ -430,9 +347,6 @@ def _add_historical_members_batch(
             )
             failed_count += 1
 
-        # Add a small delay to avoid rate limiting
-        time.sleep(API_THROTTLE_MEMBER_SECONDS)
-
     # Log summary
     active_count = len(active_users)
     total_attempted = added_count + failed_count
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import json
 import logging
-import time
 import traceback
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -12,7 +11,6 @@ from typing import TYPE_CHECKING, Any
 from googleapiclient.errors import HttpError
 
 from slack_chat_migrator.constants import (
-    API_THROTTLE_MEMBER_SECONDS,
     HTTP_BAD_REQUEST,
     HTTP_CONFLICT,
     HTTP_FORBIDDEN,
@@ -257,9 +255,6 @@ def _add_regular_members_batch(
                 channel=channel,
             )
 
-        # Add a small delay to avoid rate limiting
-        time.sleep(API_THROTTLE_MEMBER_SECONDS)
-
     # Log summary
     log_with_context(
         logging.INFO,
@@ -7,7 +7,6 @@ of spaces stuck in import mode.
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -24,6 +23,7 @@ from slack_chat_migrator.constants import (
     SPACES_PAGE_SIZE,
 )
 from slack_chat_migrator.exceptions import SpacePermissionError
+from slack_chat_migrator.services.export_catalog import channel_summary
 from slack_chat_migrator.utils.api import slack_ts_to_rfc3339
 from slack_chat_migrator.utils.logging import log_with_context
 
@@ -51,27 +51,9 @@ def channel_has_external_users(
     meta = ctx.channels_meta.get(channel, {})
     members = meta.get("members", [])
 
-    # If no members in metadata, check message history
+    # If no members in metadata, fall back to who posted in the channel
     if not members:
-        ch_dir = ctx.export_root / channel
-        user_ids: set[str] = set()
-
-        # Scan message files for unique user IDs
-        for jf in ch_dir.glob("*.json"):
-            try:
-                with open(jf, encoding="utf-8") as f:
-                    msgs = json.load(f)
-                for m in msgs:
-                    if m.get("type") == "message" and "user" in m and m["user"]:
-                        user_ids.add(m["user"])
-            except (OSError, json.JSONDecodeError) as e:
-                log_with_context(
-                    logging.WARNING,
-                    f"Failed to process {jf} when checking for external users: {e}",
-                    channel=channel,
-                )
-
-        members = list(user_ids)
+        members = channel_summary(ctx, channel).users
 
     # Check if any member is an external user (excluding bots)
     for user_id in members:
@@ -186,7 +168,7 @@ def create_space(
         space_name: str = space["name"]
 
         # Increment the spaces created counter
-        state.progress.migration_summary["spaces_created"] += 1
+        state.increment_summary("spaces_created")
 
         log_with_context(
             logging.INFO,
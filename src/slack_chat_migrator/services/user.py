@@ -17,7 +17,7 @@ from slack_chat_migrator.utils.logging import log_with_context
 logger = logging.getLogger("slack_chat_migrator")
 
 
-def _load_users_json(users_file: Path) -> list[dict[str, Any]]:
+def load_users_json(users_file: Path) -> list[dict[str, Any]]:
     """Load and parse users.json, raising ExportError on failure."""
     if not users_file.exists():
         raise ExportError("users.json not found in export directory")
@@ -117,13 +117,17 @@ def _log_unmapped_users(users_without_email: list[dict[str, Any]]) -> None:
 
 
 def generate_user_map(
-    export_root: Path, config: MigrationConfig
+    export_root: Path,
+    config: MigrationConfig,
+    users: list[dict[str, Any]] | None = None,
 ) -> tuple[dict[str, str], list[dict[str, Any]], frozenset[str]]:
     """Generate user mapping from users.json file.
 
     Args:
         export_root: Path to the Slack export directory
         config: Configuration dictionary
+        users: Parsed contents of users.json, if the caller has already
+            loaded it; read from *export_root* otherwise.
 
     Returns:
         Tuple of (user_map, users_without_email, bot_user_ids) where:
@@ -134,7 +138,8 @@ def generate_user_map(
     user_map: dict[str, str] = {}
     users_without_email: list[dict[str, Any]] = []
     bot_user_ids: set[str] = set()
-    users = _load_users_json(export_root / "users.json")
+    if users is None:
+        users = load_users_json(export_root / "users.json")
 
     ignored_bots_count = 0
     for user in users:
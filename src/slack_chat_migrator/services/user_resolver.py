@@ -7,8 +7,12 @@ impersonation delegation, external user detection, and unmapped user handling.
 
 from __future__ import annotations
 
+import contextvars
 import json
 import logging
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -22,7 +26,8 @@ if TYPE_CHECKING:
 from google.auth.exceptions import RefreshError, TransportError
 from googleapiclient.errors import HttpError
 
-from slack_chat_migrator.utils.api import get_gcp_service
+from slack_chat_migrator.constants import DELEGATE_WARMUP_WORKERS
+from slack_chat_migrator.utils.api import get_gcp_service, refresh_if_expiring
 from slack_chat_migrator.utils.logging import log_with_context
 
 
@@ -65,6 +70,8 @@ class UserResolver:
         self.workspace_admin: str | None = workspace_admin
         self.workspace_domain = workspace_domain
         self._users_data: dict[str, dict[str, Any]] | None = None
+        # Validated impersonated services, kept for proactive token refresh
+        self._delegate_services: dict[str, Any] = {}
 
     def get_delegate(self, email: str) -> ChatAdapter:
         """Get a Google Chat API service with user impersonation.
@@ -87,33 +94,123 @@ class UserResolver:
             )
 
         if email not in self.state.users.valid_users:
-            try:
-                raw_service = get_gcp_service(
-                    str(self.creds_path),
-                    email,
-                    "chat",
-                    "v1",
-                    self.state.context.current_channel,
-                    max_retries=self.config.max_retries,
-                    retry_delay=self.config.retry_delay,
-                )
-                # Validate impersonation with a lightweight API call
-                raw_service.spaces().list(pageSize=1).execute()
-                self.state.users.valid_users[email] = True
-                self.state.users.chat_delegates[email] = ChatAdapter(raw_service)
-            except (HttpError, RefreshError, TransportError) as e:
-                error_code = e.resp.status if isinstance(e, HttpError) else "N/A"
-                log_with_context(
-                    logging.WARNING,
-                    f"Impersonation failed for {email}, falling back to admin user. Error: {e}",
-                    user=email,
-                    error_code=error_code,
-                )
-                self.state.users.valid_users[email] = False
-                return self.chat
+            self._validate_delegate(email, self.state.context.current_channel)
 
         return self.state.users.chat_delegates.get(email, self.chat)
 
+    def _validate_delegate(self, email: str, channel: str | None) -> bool:
+        """Build and validate an impersonated service for *email*.
+
+        Records the outcome in ``state.users.valid_users`` and, on success,
+        caches the delegate in ``state.users.chat_delegates``.
+
+        Args:
+            email: The Google Workspace email to impersonate.
+            channel: Channel name for log context.
+
+        Returns:
+            True if impersonation works for *email*.
+        """
+        try:
+            raw_service = get_gcp_service(
+                str(self.creds_path),
+                email,
+                "chat",
+                "v1",
+                channel,
+                max_retries=self.config.max_retries,
+                retry_delay=self.config.retry_delay,
+            )
+            # Validate impersonation with a lightweight API call
+            raw_service.spaces().list(pageSize=1).execute()
+        except (HttpError, RefreshError, TransportError) as e:
+            error_code = e.resp.status if isinstance(e, HttpError) else "N/A"
+            log_with_context(
+                logging.WARNING,
+                f"Impersonation failed for {email}, falling back to admin user. Error: {e}",
+                user=email,
+                error_code=error_code,
+            )
+            self.state.users.valid_users[email] = False
+            return False
+
+        self._delegate_services[email] = raw_service
+        self.state.users.chat_delegates[email] = ChatAdapter(raw_service)
+        self.state.users.valid_users[email] = True
+        return True
+
+    def _refresh_delegate(self, email: str) -> bool:
+        """Refresh *email*'s access token if it is close to expiry."""
+        try:
+            return refresh_if_expiring(self._delegate_services[email])
+        except (RefreshError, TransportError) as e:
+            log_with_context(
+                logging.WARNING,
+                f"Token refresh failed for {email}; it will be retried on next use. Error: {e}",
+                user=email,
+            )
+            return False
+
+    def warm_up_delegates(
+        self,
+        emails: Iterable[str],
+        max_workers: int = DELEGATE_WARMUP_WORKERS,
+    ) -> int:
+        """Validate impersonation for many users at once, ahead of sending.
+
+        :meth:`get_delegate` validates a user the first time they send,
+        which stalls the send loop on one blocking API call per new author.
+        This runs those validations concurrently instead, so the send loop
+        finds every delegate already cached.  Users validated earlier get
+        their access token refreshed if it is about to expire.
+
+        Args:
+            emails: Emails of users about to be impersonated.  Empty and
+                external addresses are skipped.
+            max_workers: Maximum number of concurrent validations.
+
+        Returns:
+            The number of users newly validated for impersonation.
+        """
+        if self.creds_path is None:
+            return 0
+
+        candidates = {e for e in emails if e and not self.is_external_user(e)}
+        pending = sorted(candidates.difference(self.state.users.valid_users))
+        known = sorted(candidates.intersection(self._delegate_services))
+        if not pending and not known:
+            return 0
+
+        channel = self.state.context.current_channel
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="delegate-warmup"
+        ) as pool:
+            # Each task runs in its own copy of the caller's context so that
+            # context variables (e.g. the --debug_api flag) carry over.
+            validate = partial(self._validate_delegate, channel=channel)
+            validated = [
+                pool.submit(contextvars.copy_context().run, validate, email)
+                for email in pending
+            ]
+            refreshed = [
+                pool.submit(
+                    contextvars.copy_context().run, self._refresh_delegate, email
+                )
+                for email in known
+            ]
+            validated_count = sum(future.result() for future in validated)
+            refreshed_count = sum(future.result() for future in refreshed)
+
+        log_with_context(
+            logging.INFO,
+            "Delegate warm-up: %d of %d users validated, %d tokens refreshed",
+            validated_count,
+            len(pending),
+            refreshed_count,
+            channel=channel,
+        )
+        return validated_count
+
     def get_internal_email(
         self, user_id: str, user_email: str | None = None
     ) -> str | None:
@@ -4,20 +4,40 @@ API utilities for the Slack to Google Chat migration tool
 
 from __future__ import annotations
 
-import functools
 import json
 import logging
 import threading
 import time
-from typing import Any
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Protocol
 
+from google.auth.credentials import Credentials
 from google.auth.exceptions import TransportError
 from google.oauth2 import service_account
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from slack_chat_migrator.constants import HTTP_RATE_LIMIT
-from slack_chat_migrator.utils.logging import log_with_context
+from slack_chat_migrator.constants import (
+    DELEGATE_TOKEN_REFRESH_MARGIN_SECONDS,
+    HTTP_RATE_LIMIT,
+)
+from slack_chat_migrator.utils.discovery_docs import build_service
+from slack_chat_migrator.utils.events import note_retry, timed_event
+from slack_chat_migrator.utils.logging import (
+    is_debug_api_enabled,
+    log_api_request,
+    log_api_response,
+    log_with_context,
+)
+from slack_chat_migrator.utils.metrics import ApiCall, get_api_metrics
+from slack_chat_migrator.utils.rate_limit import get_rate_limiter
+from slack_chat_migrator.utils.transport import (
+    authorized_http,
+    get_shared_transport,
+)
+
+if TYPE_CHECKING:
+    from slack_chat_migrator.utils.events import NullEvent, TimedEvent
+    from slack_chat_migrator.utils.rate_limit import RateLimit
 
 logger = logging.getLogger("slack_chat_migrator")
 
@@ -53,6 +73,36 @@ _service_cache_lock = threading.Lock()
 _SERVICE_CACHE_TTL = 2700  # 45 minutes
 
 
+class ServiceFactory(Protocol):
+    """Anything that builds ``googleapiclient`` services for a user."""
+
+    def build_service(self, api: str, version: str, user_email: str) -> Any:
+        """Build the *api* *version* service acting as *user_email*."""
+
+
+_service_factory: ServiceFactory | None = None
+_service_factory_lock = threading.Lock()
+
+
+def set_service_factory(factory: ServiceFactory | None) -> None:
+    """Build new API services with *factory*, or with Google if ``None``.
+
+    Benchmarks and tests use this to point every service from
+    :func:`get_gcp_service` at a stand-in backend such as
+    :class:`~slack_chat_migrator.services.simulated_backend.SimulatedBackend`.
+    Services already cached keep the factory that built them.
+    """
+    global _service_factory
+    with _service_factory_lock:
+        _service_factory = factory
+
+
+def get_service_factory() -> ServiceFactory | None:
+    """Return the installed service factory, or ``None`` when talking to Google."""
+    with _service_factory_lock:
+        return _service_factory
+
+
 def clear_service_cache() -> None:
     """Clear the cached GCP service instances.
 
@@ -63,8 +113,39 @@ def clear_service_cache() -> None:
         _service_cache.clear()
 
 
+def _is_user_quota_error(error: HttpError) -> bool:
+    """True if a 429 was caused by a per-user quota rather than the project's.
+
+    Google names the exhausted quota in the error body, e.g. "Write requests
+    per minute per user", or uses the legacy ``userRateLimitExceeded`` reason.
+    """
+    content = error.content
+    body = content.decode("utf-8", "replace") if isinstance(content, bytes) else ""
+    body = body.lower()
+    return "per user" in body or "userratelimitexceeded" in body
+
+
+def _is_chainable(result: Any) -> bool:
+    """True for API resources and requests that need wrapping in turn."""
+    return (
+        hasattr(result, "execute")
+        or hasattr(result, "list")
+        or hasattr(result, "create")
+    )
+
+
 class RetryWrapper:
-    """Wrapper that adds retry logic to any object's methods."""
+    """Wrapper that adds retry logic to any object's methods.
+
+    When a ``rate_limit`` handle is supplied, every ``execute()`` attempt
+    first waits for a token and reports the outcome back so the limiter
+    can slow down on 429s and speed up again on clean responses.
+
+    Argument-less resource hops such as ``.spaces()`` or ``.messages()``
+    are wrapped once and reused, so a chain like
+    ``svc.spaces().messages().create(...)`` only allocates a wrapper for
+    the request itself.
+    """
 
     def __init__(
         self,
@@ -72,11 +153,15 @@ class RetryWrapper:
         channel_context_getter: Any = None,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        rate_limit: RateLimit | None = None,
     ) -> None:
         self._wrapped_obj = wrapped_obj
         self._channel_context_getter = channel_context_getter
         self._max_retries = max_retries
         self._retry_delay = retry_delay
+        self._rate_limit = rate_limit
+        # Wrapped results of argument-less resource methods, by name
+        self._resources: dict[str, RetryWrapper] = {}
 
     def __getattr__(self, name: str) -> Any:
         attr = getattr(self._wrapped_obj, name)
@@ -94,21 +179,31 @@ class RetryWrapper:
                     Returns:
                         The method result, wrapped in a RetryWrapper if chainable.
                     """
+                    if not args and not kwargs:
+                        cached = self._resources.get(name)
+                        if cached is not None:
+                            return cached
                     result = attr(*args, **kwargs)
                     # If the result has methods that might need retry, wrap it too
-                    if (
-                        hasattr(result, "execute")
-                        or hasattr(result, "list")
-                        or hasattr(result, "create")
-                    ):
-                        return RetryWrapper(
-                            result,
-                            self._channel_context_getter,
-                            self._max_retries,
-                            self._retry_delay,
-                        )
-                    return result
-
+                    if not _is_chainable(result):
+                        return result
+                    wrapped = RetryWrapper(
+                        result,
+                        self._channel_context_getter,
+                        self._max_retries,
+                        self._retry_delay,
+                        self._rate_limit,
+                    )
+                    # Resources are stateless and safe to reuse; requests
+                    # (anything with execute()) are not.
+                    if not args and not kwargs and not hasattr(result, "execute"):
+                        self._resources[name] = wrapped
+                    return wrapped
+
+                # A resource's methods never change, so later lookups can
+                # skip __getattr__ entirely.
+                if not hasattr(self._wrapped_obj, "execute"):
+                    self.__dict__[name] = wrapped_method
                 return wrapped_method
 
         return attr
@@ -118,6 +213,9 @@ class RetryWrapper:
     ) -> tuple[str | None, dict[str, str], dict[str, str | None] | None]:
         """Build channel context and log kwargs for a retry-wrapped execute call.
 
+        Request details are only extracted when API debug logging is on;
+        otherwise they are ``None`` and no request or response is logged.
+
         Returns:
             (channel_context, log_kwargs, request_details) tuple.
         """
@@ -132,6 +230,9 @@ class RetryWrapper:
         if channel_context and isinstance(channel_context, str):
             log_kwargs["channel"] = channel_context
 
+        if not is_debug_api_enabled():
+            return channel_context, log_kwargs, None
+
         request_details = self._extract_request_details(execute_method)
         if request_details:
             self._log_api_request(request_details, channel_context)
@@ -147,8 +248,12 @@ class RetryWrapper:
         backoff_factor: float,
         max_delay: float,
         log_kwargs: dict[str, str],
-    ) -> None:
-        """Log a retryable error and sleep, or re-raise on final attempt."""
+    ) -> float:
+        """Log a retryable error and sleep, or re-raise on final attempt.
+
+        Returns:
+            Seconds slept before the next attempt.
+        """
         if isinstance(error, HttpError):
             log_with_context(
                 logging.WARNING,
@@ -163,6 +268,7 @@ class RetryWrapper:
             )
 
         if attempt < max_retries:
+            note_retry()
             sleep_time = min(delay * (backoff_factor**attempt), max_delay)
             log_with_context(
                 logging.INFO,
@@ -170,95 +276,175 @@ class RetryWrapper:
                 **log_kwargs,
             )
             time.sleep(sleep_time)
-        else:
-            log_with_context(
-                logging.ERROR,
-                f"Max retries reached. Last error: {error}",
-                **log_kwargs,
-            )
-            raise
+            return sleep_time
+        log_with_context(
+            logging.ERROR,
+            f"Max retries reached. Last error: {error}",
+            **log_kwargs,
+        )
+        raise
 
     def _wrap_execute(self, execute_method: Any) -> Any:
         """Wrap an execute method with retry logic and automatic API logging."""
 
-        @functools.wraps(execute_method)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             """Execute the API call with exponential-backoff retry.
 
             Returns:
                 The result of the underlying ``execute()`` call.
             """
-            max_retries = self._max_retries
-            delay = self._retry_delay
-            max_delay = 60
-            backoff_factor = 2.0
-
             channel_context, log_kwargs, request_details = (
                 self._build_request_log_context(execute_method)
             )
 
-            last_exception = None
-            request_logged = False
+            call = ApiCall(self._endpoint_name(execute_method))
+            started = time.perf_counter()
+            try:
+                with timed_event(
+                    "api_call", channel=channel_context, endpoint=call.endpoint
+                ) as event:
+                    if event.enabled:
+                        event.update(bytes=self._request_bytes(execute_method))
+                    return self._execute_with_retry(
+                        execute_method,
+                        args,
+                        kwargs,
+                        call,
+                        event,
+                        channel_context,
+                        log_kwargs,
+                        request_details,
+                    )
+            except HttpError as e:
+                call.error = str(e.resp.status)
+                raise
+            except Exception as e:
+                call.error = type(e).__name__
+                raise
+            finally:
+                get_api_metrics().observe(call, time.perf_counter() - started)
 
-            for attempt in range(max_retries + 1):
-                try:
-                    result = execute_method(*args, **kwargs)
+        return wrapper
 
-                    if request_details and not request_logged:
-                        status_code = self._extract_status_code(execute_method, result)
+    def _execute_with_retry(
+        self,
+        execute_method: Any,
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        call: ApiCall,
+        event: TimedEvent | NullEvent,
+        channel_context: str | None,
+        log_kwargs: dict[str, str],
+        request_details: dict[str, str | None] | None,
+    ) -> Any:
+        """Run *execute_method* with exponential-backoff retry.
+
+        Returns:
+            The result of the underlying ``execute()`` call.
+        """
+        max_retries = self._max_retries
+        delay = self._retry_delay
+        max_delay = 60
+        backoff_factor = 2.0
+
+        last_exception = None
+        request_logged = False
+        rate_limit = self._rate_limit
+
+        for attempt in range(max_retries + 1):
+            call.retries = attempt
+            if rate_limit is not None:
+                call.throttle_seconds += rate_limit.acquire()
+            try:
+                result = execute_method(*args, **kwargs)
+
+                if rate_limit is not None:
+                    rate_limit.on_success()
+
+                log_response = request_details and not request_logged
+                if log_response or event.enabled:
+                    status_code = self._extract_status_code(execute_method, result)
+                    event.update(status=status_code)
+                    if request_details and log_response:
                         self._log_api_response(
                             status_code, request_details, result, channel_context
                         )
                         request_logged = True
 
-                    return result
-                except HttpError as e:
-                    last_exception = e
-                    if (
-                        request_details
-                        and not request_logged
-                        and attempt == max_retries
-                    ):
-                        self._log_api_response(
-                            e.resp.status, request_details, None, channel_context
-                        )
-                        request_logged = True
-                    # Don't retry client errors (4xx) except rate limits (429)
-                    if e.resp.status // 100 == 4 and e.resp.status != HTTP_RATE_LIMIT:
-                        if e.resp.status == 401:
-                            clear_service_cache()
-                        log_with_context(
-                            logging.WARNING,
-                            f"Client error ({e.resp.status}) not retried: {e}",
-                            **log_kwargs,
-                        )
-                        raise
-                    self._handle_retryable_error(
-                        e,
-                        attempt,
-                        max_retries,
-                        delay,
-                        backoff_factor,
-                        max_delay,
-                        log_kwargs,
+                return result
+            except HttpError as e:
+                last_exception = e
+                event.update(status=e.resp.status)
+                if e.resp.status == HTTP_RATE_LIMIT:
+                    call.rate_limited += 1
+                    if rate_limit is not None:
+                        rate_limit.on_rate_limited(user_scoped=_is_user_quota_error(e))
+                if request_details and not request_logged and attempt == max_retries:
+                    self._log_api_response(
+                        e.resp.status, request_details, None, channel_context
                     )
-                except (TransportError, OSError) as e:
-                    last_exception = e
-                    self._handle_retryable_error(
-                        e,
-                        attempt,
-                        max_retries,
-                        delay,
-                        backoff_factor,
-                        max_delay,
-                        log_kwargs,
+                    request_logged = True
+                # Don't retry client errors (4xx) except rate limits (429)
+                if e.resp.status // 100 == 4 and e.resp.status != HTTP_RATE_LIMIT:
+                    if e.resp.status == 401:
+                        clear_service_cache()
+                    log_with_context(
+                        logging.WARNING,
+                        f"Client error ({e.resp.status}) not retried: {e}",
+                        **log_kwargs,
                     )
+                    raise
+                call.backoff_seconds += self._handle_retryable_error(
+                    e,
+                    attempt,
+                    max_retries,
+                    delay,
+                    backoff_factor,
+                    max_delay,
+                    log_kwargs,
+                )
+            except (TransportError, OSError) as e:
+                last_exception = e
+                call.backoff_seconds += self._handle_retryable_error(
+                    e,
+                    attempt,
+                    max_retries,
+                    delay,
+                    backoff_factor,
+                    max_delay,
+                    log_kwargs,
+                )
 
-            if last_exception:
-                raise last_exception
-            raise RuntimeError("Exited retry loop unexpectedly.")
+        if last_exception:
+            raise last_exception
+        raise RuntimeError("Exited retry loop unexpectedly.")
 
-        return wrapper
+    @staticmethod
+    def _endpoint_name(execute_method: Any) -> str:
+        """Return the API method ID (e.g. ``chat.spaces.messages.create``)."""
+        method_self = getattr(execute_method, "__self__", None)
+        method_id = getattr(method_self, "methodId", None)
+        if isinstance(method_id, str):
+            return method_id
+        if type(method_self).__name__ == "BatchHttpRequest":
+            return "batch"
+        return "unknown"
+
+    @staticmethod
+    def _request_bytes(execute_method: Any) -> int:
+        """Return the size of the request body plus any media upload."""
+        method_self = getattr(execute_method, "__self__", None)
+        size = 0
+        body = getattr(method_self, "body", None)
+        if isinstance(body, (str, bytes)):
+            size += len(body)
+        resumable = getattr(method_self, "resumable", None)
+        if resumable is not None:
+            try:
+                size += int(resumable.size() or 0)
+            except (AttributeError, TypeError, ValueError):
+                pass
+        return size
 
     def _extract_request_details(
         self, execute_method: Any
@@ -390,15 +576,9 @@ class RetryWrapper:
     ) -> None:
         """Log API request automatically if debug mode is enabled."""
         try:
-            # Import here to avoid circular imports
-            from slack_chat_migrator.utils.logging import is_debug_api_enabled
-
             if not is_debug_api_enabled():
                 return
 
-            # Import the actual logging function only when needed
-            from slack_chat_migrator.utils.logging import log_api_request
-
             # Prepare request data for logging
             request_data = None
             if request_details.get("body"):
@@ -433,15 +613,9 @@ class RetryWrapper:
     ) -> None:
         """Log API response automatically if debug mode is enabled."""
         try:
-            # Import here to avoid circular imports
-            from slack_chat_migrator.utils.logging import is_debug_api_enabled
-
             if not is_debug_api_enabled():
                 return
 
-            # Import the actual logging function only when needed
-            from slack_chat_migrator.utils.logging import log_api_response
-
             uri = request_details.get("uri")
             if uri is not None:
                 log_api_response(
@@ -497,7 +671,10 @@ def get_gcp_service(
         FileNotFoundError: If *creds_path* does not exist.
         ValueError: If the credentials file has an invalid format.
     """
+    factory = get_service_factory()
     cache_key = f"{creds_path}:{user_email}:{api}:{version}"
+    if factory is not None:
+        cache_key += f":factory-{id(factory)}"
     with _service_cache_lock:
         if cache_key in _service_cache:
             cached_service, created_at = _service_cache[cache_key]
@@ -525,24 +702,29 @@ def get_gcp_service(
             channel=channel,
         )
 
-        # This is the critical step: The code must explicitly request the
-        # scopes that you authorized in the Admin Console.
-        try:
-            creds = service_account.Credentials.from_service_account_file(
-                creds_path, scopes=REQUIRED_SCOPES
-            )
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"Credential file not found: {creds_path}") from e
-        except (ValueError, json.JSONDecodeError) as e:
-            raise ValueError(
-                f"Invalid credential file format in {creds_path}: {e}"
-            ) from e
+        if factory is not None:
+            service = factory.build_service(api, version, user_email)
+        else:
+            # This is the critical step: The code must explicitly request the
+            # scopes that you authorized in the Admin Console.
+            try:
+                creds = service_account.Credentials.from_service_account_file(
+                    creds_path, scopes=REQUIRED_SCOPES
+                )
+            except FileNotFoundError as e:
+                raise FileNotFoundError(
+                    f"Credential file not found: {creds_path}"
+                ) from e
+            except (ValueError, json.JSONDecodeError) as e:
+                raise ValueError(
+                    f"Invalid credential file format in {creds_path}: {e}"
+                ) from e
 
-        # Impersonate the target user
-        delegated = creds.with_subject(user_email)
+            # Impersonate the target user
+            delegated = creds.with_subject(user_email)
 
-        # Build the API service object
-        service = build(api, version, credentials=delegated, cache_discovery=False)
+            # Build the API service object on the shared connection pool
+            service = build_service(api, version, http=authorized_http(delegated))
 
         # Wrap the service with retry logic
         # Use the explicitly passed channel parameter for context
@@ -555,7 +737,11 @@ def get_gcp_service(
             return channel
 
         wrapped_service = RetryWrapper(
-            service, get_channel_context, max_retries, retry_delay
+            service,
+            get_channel_context,
+            max_retries,
+            retry_delay,
+            rate_limit=get_rate_limiter(api, user_email),
         )
 
         with _service_cache_lock:
@@ -570,3 +756,43 @@ def get_gcp_service(
             version=version,
         )
         raise
+
+
+def _service_credentials(service: Any) -> Credentials | None:
+    """Return the credentials *service* signs its requests with, if known."""
+    raw = service._wrapped_obj if isinstance(service, RetryWrapper) else service
+    credentials = getattr(getattr(raw, "_http", None), "credentials", None)
+    return credentials if isinstance(credentials, Credentials) else None
+
+
+def refresh_if_expiring(
+    service: Any, margin: float = DELEGATE_TOKEN_REFRESH_MARGIN_SECONDS
+) -> bool:
+    """Refresh the access token behind *service* if it is about to expire.
+
+    ``google-auth`` refreshes an expired token on the next request, which
+    stalls that request for a round trip to the token endpoint.  Calling
+    this ahead of time moves the refresh off the send path.
+
+    Args:
+        service: A service returned by :func:`get_gcp_service`.
+        margin: Refresh when the token expires within this many seconds.
+
+    Returns:
+        True if the token was refreshed.
+
+    Raises:
+        RefreshError: If the token endpoint rejects the refresh.
+        TransportError: If the token endpoint cannot be reached.
+    """
+    credentials = _service_credentials(service)
+    if credentials is None:
+        return False
+    if credentials.token is not None:
+        expiry = credentials.expiry
+        # google-auth keeps expiry as a naive UTC datetime
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        if expiry is None or expiry - now > timedelta(seconds=margin):
+            return False
+    get_shared_transport().refresh(credentials)
+    return True
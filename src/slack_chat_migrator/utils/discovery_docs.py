@@ -0,0 +1,106 @@
+"""Process-wide cache of parsed Google API discovery documents.
+
+``googleapiclient.discovery.build`` reads and parses the API's discovery
+document on every call. That is about 400 KB of JSON for Chat and 200 KB
+for Drive. The migrator builds one service per impersonated user, so a
+workspace with thousands of authors paid that cost thousands of times.
+
+:func:`build_service` loads each document once from the copies bundled
+with ``googleapiclient`` and builds services from the parsed dict with
+``build_from_document``. Building a delegate's service then costs well
+under a millisecond.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from typing import Any
+
+import httplib2
+from googleapiclient import discovery_cache
+from googleapiclient.discovery import build, build_from_document
+
+from slack_chat_migrator.utils.logging import log_with_context
+
+_documents: dict[tuple[str, str], dict[str, Any]] = {}
+_documents_lock = threading.Lock()
+
+
+def _touch_all_resources(resource: Any, description: dict[str, Any]) -> None:
+    """Instantiate every nested resource of *resource*, depth first."""
+    for name, child in description.get("resources", {}).items():
+        _touch_all_resources(getattr(resource, name)(), child)
+
+
+def _load_document(api: str, version: str) -> dict[str, Any] | None:
+    content = discovery_cache.get_static_doc(api, version)
+    if content is None:
+        return None
+    document: dict[str, Any] = json.loads(content)
+    # Building resources fixes up method descriptions in place (adding
+    # media and body parameters). Doing it for every resource now, before
+    # the dict is shared, leaves later builds only rewriting existing keys
+    # with equal values, which is safe across threads.
+    service = build_from_document(document, http=httplib2.Http())
+    _touch_all_resources(service, document)
+    return document
+
+
+def get_discovery_document(api: str, version: str) -> dict[str, Any] | None:
+    """Return the parsed discovery document for *api* *version*.
+
+    Args:
+        api: Google API name (e.g. ``"chat"``).
+        version: API version (e.g. ``"v1"``).
+
+    Returns:
+        The shared document, or ``None`` if ``googleapiclient`` does not
+        bundle one for this API.
+    """
+    key = (api, version)
+    with _documents_lock:
+        document = _documents.get(key)
+        if document is None:
+            document = _load_document(api, version)
+            if document is None:
+                return None
+            _documents[key] = document
+            log_with_context(
+                logging.DEBUG, "Loaded discovery document for %s %s", api, version
+            )
+        return document
+
+
+def build_service(
+    api: str, version: str, http: Any, root_url: str | None = None
+) -> Any:
+    """Build a Google API client from the cached discovery document.
+
+    Falls back to ``build()`` (which may fetch the document) for APIs
+    without a bundled copy.
+
+    Args:
+        api: Google API name.
+        version: API version.
+        http: Authorized, ``httplib2``-compatible HTTP client.
+        root_url: Send requests, media uploads and batches to this root
+            (e.g. ``"http://127.0.0.1:8080/"``) instead of Google's.
+
+    Returns:
+        A ``googleapiclient`` service resource.
+    """
+    document = get_discovery_document(api, version)
+    if document is None:
+        return build(api, version, http=http, cache_discovery=False)
+    if root_url is not None:
+        # Only the top-level URLs change, so the shared resources are reused
+        document = {**document, "rootUrl": root_url}
+    return build_from_document(document, http=http)
+
+
+def clear_discovery_documents() -> None:
+    """Drop every cached document."""
+    with _documents_lock:
+        _documents.clear()
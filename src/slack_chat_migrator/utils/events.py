@@ -0,0 +1,201 @@
+"""Opt-in JSONL event stream for post-run throughput and latency analysis.
+
+When enabled with ``migrate --event_log``, every API call, message,
+reaction and file upload is written to ``<output_dir>/events.jsonl`` as one
+compact JSON object::
+
+    {"time":1717000000.123,"event":"api_call","latency_ms":84.2,
+     "retries":0,"endpoint":"chat.spaces.messages.create","status":200,
+     "bytes":512}
+
+Records go through their own logger and :class:`AsyncLogSink`, so
+producers only pay for a queue put and the file is written in batches.
+When the stream is off, :func:`record_event` and :func:`timed_event`
+return immediately.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from slack_chat_migrator.utils.logging import AsyncLogSink, BufferedFileHandler
+
+EVENTS_FILENAME = "events.jsonl"
+EVENT_LOGGER_NAME = "slack_chat_migrator.events"
+
+_event_logger = logging.getLogger(EVENT_LOGGER_NAME)
+# Events never reach the console or the human-readable log files
+_event_logger.propagate = False
+
+_event_sink: AsyncLogSink | None = None
+_event_sink_lock = threading.Lock()
+
+# Retries performed by the current thread, so an enclosing timed event can
+# report how many of them happened while it was open.
+_retry_state = threading.local()
+
+
+class EventFormatter(logging.Formatter):
+    """Formats event records as compact, single-line JSON."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format an event record as a JSON string.
+
+        Args:
+            record: Record logged by :func:`record_event`.
+
+        Returns:
+            A JSON object with ``time``, ``event`` and the event's fields.
+        """
+        data: dict[str, Any] = {
+            "time": round(record.created, 6),
+            "event": record.msg,
+        }
+        data.update(getattr(record, "event_fields", {}))
+        return json.dumps(data, separators=(",", ":"), default=str)
+
+
+def start_event_stream(output_dir: str | Path) -> Path:
+    """Start writing events to :data:`EVENTS_FILENAME` in *output_dir*.
+
+    Args:
+        output_dir: The run's output directory.
+
+    Returns:
+        Path of the event file.
+    """
+    path = Path(output_dir) / EVENTS_FILENAME
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = BufferedFileHandler(str(path), mode="w")
+    handler.setFormatter(EventFormatter())
+
+    global _event_sink
+    with _event_sink_lock:
+        old, _event_sink = _event_sink, AsyncLogSink(EVENT_LOGGER_NAME)
+        _event_logger.setLevel(logging.INFO)
+        _event_sink.add_handler(handler)
+    if old is not None:
+        old.shutdown()
+    return path
+
+
+def stop_event_stream() -> None:
+    """Flush and close the event file, if the stream is running."""
+    global _event_sink
+    with _event_sink_lock:
+        sink, _event_sink = _event_sink, None
+    if sink is not None:
+        sink.shutdown()
+
+
+# Daemon writer threads are not joined at exit; drain them explicitly.
+atexit.register(stop_event_stream)
+
+
+def events_enabled() -> bool:
+    """Return True while the event stream is running."""
+    return _event_sink is not None
+
+
+def record_event(event: str, **fields: Any) -> None:
+    """Append one event to the stream; a no-op when it is not running.
+
+    Args:
+        event: Event type, e.g. ``"api_call"`` or ``"message"``.
+        **fields: JSON-serialisable event fields.
+    """
+    if _event_sink is None:
+        return
+    _event_logger.info(event, extra={"event_fields": fields})
+
+
+def note_retry() -> None:
+    """Count one retry against the current thread."""
+    _retry_state.count = getattr(_retry_state, "count", 0) + 1
+
+
+def retry_count() -> int:
+    """Return the number of retries the current thread has performed."""
+    count: int = getattr(_retry_state, "count", 0)
+    return count
+
+
+class TimedEvent:
+    """Times a unit of work and records it as one event on exit.
+
+    ``latency_ms`` and ``retries`` are filled in automatically; ``status``
+    defaults to ``"ok"``, or ``"error"`` if the block raised.
+    """
+
+    enabled = True
+
+    def __init__(self, event: str, fields: dict[str, Any]) -> None:
+        self.event = event
+        self.fields = fields
+        self._start = 0.0
+        self._retries = 0
+
+    def update(self, **fields: Any) -> None:
+        """Add or replace fields recorded with the event."""
+        self.fields.update(fields)
+
+    def __enter__(self) -> TimedEvent:
+        self._retries = retry_count()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        latency_ms = round((time.perf_counter() - self._start) * 1000, 3)
+        self.fields.setdefault("status", "error" if exc_type else "ok")
+        record_event(
+            self.event,
+            latency_ms=latency_ms,
+            retries=retry_count() - self._retries,
+            **self.fields,
+        )
+
+
+class NullEvent:
+    """Stand-in for :class:`TimedEvent` while the stream is off."""
+
+    enabled = False
+
+    def update(self, **fields: Any) -> None:
+        pass
+
+    def __enter__(self) -> NullEvent:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        pass
+
+
+_NULL_EVENT = NullEvent()
+
+
+def timed_event(event: str, **fields: Any) -> TimedEvent | NullEvent:
+    """Return a context manager that records *event* with its latency.
+
+    Args:
+        event: Event type.
+        **fields: Fields known up front; more can be added with ``update``.
+
+    Returns:
+        A :class:`TimedEvent`, or a shared no-op object when the stream is
+        not running.
+    """
+    if _event_sink is None:
+        return _NULL_EVENT
+    return TimedEvent(event, fields)
@@ -4,14 +4,26 @@ Logging module for the Slack to Google Chat migration tool
 
 from __future__ import annotations
 
+import atexit
 import contextvars
+import io
 import json
 import logging
 import os
+import queue
 import re
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from logging.handlers import QueueHandler
+from typing import IO, Any
 
 from slack_chat_migrator.constants import (
+    CHANNEL_LOG_MAX_OPEN_FILES,
+    LOG_DRAIN_TIMEOUT_SECONDS,
+    LOG_FLUSH_INTERVAL_SECONDS,
+    LOG_WRITE_BUFFER_BYTES,
     RESPONSE_FALLBACK_LENGTH,
     RESPONSE_MAX_LENGTH,
 )
@@ -39,12 +51,429 @@ def sanitize_for_log(text: str) -> str:
     return text
 
 
-class ImmediateFlushHandler(logging.FileHandler):
-    """FileHandler that flushes after every emit for real-time log visibility."""
+class BufferedFileHandler(logging.FileHandler):
+    """FileHandler that leaves flushing to its :class:`AsyncLogSink`.
+
+    Lines accumulate in a write buffer of :data:`LOG_WRITE_BUFFER_BYTES`
+    that the OS sees whenever it fills; the sink flushes it on a timer,
+    on WARNING+ records and on shutdown.
+    """
+
+    def _open(self) -> io.TextIOWrapper:
+        return open(  # type: ignore[return-value]  # mode is text, typeshed can't tell
+            self.baseFilename,
+            self.mode,
+            buffering=LOG_WRITE_BUFFER_BYTES,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
 
     def emit(self, record: logging.LogRecord) -> None:
-        super().emit(record)
-        self.flush()
+        stream = self.stream
+        if stream is None:
+            if self.mode == "w" and self._closed:  # type: ignore[attr-defined]  # set by FileHandler.close
+                return
+            stream = self.stream = self._open()
+        try:
+            stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class ChannelFilter(logging.Filter):
+    """Filter that only passes records whose ``channel`` matches."""
+
+    def __init__(self, channel: str) -> None:
+        super().__init__()
+        self.channel = channel
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return True if *record* belongs to this channel.
+
+        Args:
+            record: The log record to evaluate.
+
+        Returns:
+            True if the record matches this channel.
+        """
+        return getattr(record, "channel", None) == self.channel
+
+
+class ChannelLogHandle(logging.Handler):
+    """One channel's log file, written through a :class:`ChannelLogRouter`.
+
+    Kept in ``MigrationState.spaces.channel_handlers`` so the channel's log
+    can be flushed and closed like any other handler.
+    """
+
+    def __init__(self, router: ChannelLogRouter, channel: str, filename: str) -> None:
+        super().__init__(logging.DEBUG)
+        self.router = router
+        self.channel = channel
+        self.baseFilename = filename
+        self.addFilter(ChannelFilter(channel))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.router.write(self, record)
+
+    def flush(self) -> None:
+        self.router.flush_channel(self.channel)
+
+    def close(self) -> None:
+        self.router.close_channel(self.channel)
+        super().close()
+
+
+class ChannelLogRouter(logging.Handler):
+    """Routes each record to its channel's log file by ``record.channel``.
+
+    Lookup is a dict access, so cost does not grow with the number of open
+    channels.  At most *max_open* files are kept open; the least recently
+    written one is closed when another is needed and reopened for append
+    when its channel logs again.
+    """
+
+    terminator = "\n"
+
+    def __init__(self, max_open: int = CHANNEL_LOG_MAX_OPEN_FILES) -> None:
+        super().__init__(logging.DEBUG)
+        self.max_open = max_open
+        self._channels: dict[str, ChannelLogHandle] = {}
+        self._streams: OrderedDict[str, IO[str]] = OrderedDict()
+        self._io_lock = threading.Lock()
+
+    @property
+    def open_files(self) -> int:
+        """Number of channel log files currently open."""
+        return len(self._streams)
+
+    def open_channel(self, channel: str, filename: str) -> ChannelLogHandle:
+        """Start a fresh log file for *channel* and return its handle."""
+        handle = ChannelLogHandle(self, channel, filename)
+        with self._io_lock:
+            self._close_stream(channel)
+            self._channels[channel] = handle
+            self._open_stream(channel, filename, "w")
+        return handle
+
+    def close_channel(self, channel: str) -> None:
+        """Stop routing *channel* and close its file."""
+        with self._io_lock:
+            self._channels.pop(channel, None)
+            self._close_stream(channel)
+
+    def flush_channel(self, channel: str) -> None:
+        """Flush *channel*'s file if it is open."""
+        with self._io_lock:
+            stream = self._streams.get(channel)
+            if stream is not None:
+                stream.flush()
+
+    def write(self, handle: ChannelLogHandle, record: logging.LogRecord) -> None:
+        """Append *record*, formatted by *handle*, to the handle's file."""
+        try:
+            line = handle.format(record) + self.terminator
+            with self._io_lock:
+                if self._channels.get(handle.channel) is not handle:
+                    return
+                stream = self._streams.get(handle.channel)
+                if stream is None:
+                    stream = self._open_stream(handle.channel, handle.baseFilename, "a")
+                else:
+                    self._streams.move_to_end(handle.channel)
+                stream.write(line)
+        except Exception:
+            self.handleError(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        handle = self._channels.get(getattr(record, "channel", None) or "")
+        if handle is not None and record.levelno >= handle.level:
+            self.write(handle, record)
+
+    def flush(self) -> None:
+        with self._io_lock:
+            for stream in self._streams.values():
+                stream.flush()
+
+    def close(self) -> None:
+        with self._io_lock:
+            for channel in list(self._streams):
+                self._close_stream(channel)
+            self._channels.clear()
+        super().close()
+
+    def _open_stream(self, channel: str, filename: str, mode: str) -> IO[str]:
+        while len(self._streams) >= self.max_open:
+            _, idle = self._streams.popitem(last=False)
+            idle.close()
+        stream = open(
+            filename, mode, buffering=LOG_WRITE_BUFFER_BYTES, encoding="utf-8"
+        )
+        self._streams[channel] = stream
+        return stream
+
+    def _close_stream(self, channel: str) -> None:
+        stream = self._streams.pop(channel, None)
+        if stream is not None:
+            stream.close()
+
+
+class _Barrier:
+    """Queue marker: set once every record enqueued before it is on disk."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+# Argument types that cannot change between enqueue and the writer thread
+_IMMUTABLE_LOG_ARG_TYPES = (str, int, float, bool, type(None))
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves ``msg % args`` to the writer thread.
+
+    The stock ``prepare`` formats every record on the producer thread.
+    Records whose arguments are immutable scalars are safe to format later,
+    so they are queued as-is; anything else (mutable args, exception or
+    stack info) takes the stock path.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if (
+            not record.exc_info
+            and not record.stack_info
+            and isinstance(args, tuple)
+            and all(isinstance(a, _IMMUTABLE_LOG_ARG_TYPES) for a in args)
+        ):
+            return record
+        prepared: logging.LogRecord = super().prepare(record)
+        return prepared
+
+
+class AsyncLogSink:
+    """Writes log files from a background thread, in batches.
+
+    Producers only pay for a :class:`~logging.handlers.QueueHandler` put;
+    the writer thread merges message arguments, formats records, dispatches them to the registered
+    file handlers and flushes those after :data:`LOG_FLUSH_INTERVAL_SECONDS`,
+    immediately for WARNING+ records, and when drained or shut down.
+    """
+
+    def __init__(
+        self,
+        logger_name: str = "slack_chat_migrator",
+        flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize the sink; the writer thread starts with the first handler.
+
+        Args:
+            logger_name: Logger whose records are routed to the sink.
+            flush_interval: Longest time a record may sit in a buffer.
+        """
+        self.logger_name = logger_name
+        self.flush_interval = flush_interval
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self.queue_handler = _DeferredQueueHandler(self._queue)
+        self._handlers: tuple[logging.Handler, ...] = ()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def handlers(self) -> tuple[logging.Handler, ...]:
+        """File handlers currently fed by the sink."""
+        return self._handlers
+
+    def add_handler(self, handler: logging.Handler) -> None:
+        """Route the sink's records to *handler* from now on."""
+        with self._lock:
+            if handler not in self._handlers:
+                self._handlers = (*self._handlers, handler)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="log-writer", daemon=True
+                )
+                self._thread.start()
+        logger = logging.getLogger(self.logger_name)
+        if self.queue_handler not in logger.handlers:
+            logger.addHandler(self.queue_handler)
+        self._sync_levels()
+
+    def remove_handler(self, handler: logging.Handler) -> None:
+        """Write out records already queued for *handler*, then detach it."""
+        if handler not in self._handlers:
+            return
+        self.drain()
+        with self._lock:
+            self._handlers = tuple(h for h in self._handlers if h is not handler)
+        self._sync_levels()
+
+    def _sync_levels(self) -> None:
+        """Queue only records that at least one file handler will write."""
+        self.queue_handler.setLevel(_lowest_level(self._handlers))
+        sync_logger_level(logging.getLogger(self.logger_name))
+
+    def drain(self, timeout: float = LOG_DRAIN_TIMEOUT_SECONDS) -> bool:
+        """Block until everything logged so far has been written and flushed.
+
+        Returns:
+            False if the writer did not catch up within *timeout* seconds.
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return True
+        barrier = _Barrier()
+        self._queue.put(barrier)
+        return barrier.done.wait(timeout)
+
+    def shutdown(self, timeout: float = LOG_DRAIN_TIMEOUT_SECONDS) -> None:
+        """Drain the queue, stop the writer and close every handler."""
+        logger = logging.getLogger(self.logger_name)
+        logger.removeHandler(self.queue_handler)
+        sync_logger_level(logger)
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(_STOP)
+            thread.join(timeout)
+        with self._lock:
+            handlers, self._handlers = self._handlers, ()
+        for handler in handlers:
+            handler.close()
+
+    def _run(self) -> None:
+        """Writer thread: dispatch queued records and flush on schedule."""
+        dirty: set[logging.Handler] = set()
+        last_flush = time.monotonic()
+        while True:
+            timeout = None
+            if dirty:
+                timeout = max(0.0, last_flush + self.flush_interval - time.monotonic())
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            urgent = stop = False
+            barriers: list[_Barrier] = []
+            for item in batch:
+                if item is _STOP:
+                    stop = True
+                elif isinstance(item, _Barrier):
+                    barriers.append(item)
+                else:
+                    urgent |= item.levelno >= logging.WARNING
+                    dirty.update(self._dispatch(item))
+
+            now = time.monotonic()
+            if urgent or barriers or stop or now - last_flush >= self.flush_interval:
+                for handler in dirty:
+                    handler.flush()
+                dirty.clear()
+                last_flush = now
+            for barrier in barriers:
+                barrier.done.set()
+            if stop:
+                return
+
+    def _dispatch(self, record: logging.LogRecord) -> list[logging.Handler]:
+        """Hand *record* to each interested handler; return the ones written."""
+        written = []
+        for handler in self._handlers:
+            if record.levelno >= handler.level and handler.handle(record):
+                written.append(handler)
+        return written
+
+
+def _lowest_level(handlers: Iterable[logging.Handler]) -> int:
+    """Return the most verbose level any of *handlers* accepts.
+
+    ``NOTSET`` handlers count as DEBUG; with no handlers, only WARNING+.
+    """
+    levels = [h.level or logging.DEBUG for h in handlers]
+    return min(levels, default=logging.WARNING)
+
+
+def sync_logger_level(logger: logging.Logger) -> None:
+    """Set *logger*'s level to the most verbose level its handlers write.
+
+    :func:`log_with_context` returns before building a record whenever
+    ``logger.isEnabledFor(level)`` is false, so keeping the logger no more
+    verbose than its handlers lets that check skip records no handler would
+    write.  The sink's queue handler carries the lowest level of the file
+    handlers behind it.
+    """
+    logger.setLevel(_lowest_level(logger.handlers))
+
+
+_log_sink: AsyncLogSink | None = None
+_log_sink_lock = threading.Lock()
+
+
+def get_log_sink() -> AsyncLogSink:
+    """Return the process-wide log sink, creating it on first use."""
+    global _log_sink
+    with _log_sink_lock:
+        if _log_sink is None:
+            _log_sink = AsyncLogSink()
+        return _log_sink
+
+
+_channel_router: ChannelLogRouter | None = None
+
+
+def get_channel_log_router() -> ChannelLogRouter:
+    """Return the router for channel log files, attaching it to the sink."""
+    global _channel_router
+    with _log_sink_lock:
+        router = _channel_router
+        if router is None:
+            router = _channel_router = ChannelLogRouter()
+    get_log_sink().add_handler(router)
+    return router
+
+
+def flush_logs(timeout: float = LOG_DRAIN_TIMEOUT_SECONDS) -> bool:
+    """Block until every record logged so far is on disk.
+
+    Returns:
+        False if the writer did not catch up within *timeout* seconds.
+    """
+    sink = _log_sink
+    return sink.drain(timeout) if sink is not None else True
+
+
+def remove_log_handler(handler: logging.Handler) -> None:
+    """Detach *handler* from the log sink and the package logger.
+
+    Records already queued for it are written first; closing it is left to
+    the caller.
+    """
+    sink = _log_sink
+    if sink is not None:
+        sink.remove_handler(handler)
+    logger = logging.getLogger("slack_chat_migrator")
+    logger.removeHandler(handler)
+    sync_logger_level(logger)
+
+
+def shutdown_log_sink() -> None:
+    """Flush and close every log file written through the sink."""
+    global _log_sink, _channel_router
+    with _log_sink_lock:
+        sink, _log_sink = _log_sink, None
+        _channel_router = None
+    if sink is not None:
+        sink.shutdown()
+
+
+# Daemon writer threads are not joined at exit; drain them explicitly.
+atexit.register(shutdown_log_sink)
 
 
 class JsonFormatter(logging.Formatter):
@@ -98,7 +527,7 @@ class JsonFormatter(logging.Formatter):
 
 def setup_main_log_file(
     output_dir: str, debug_api: bool = False
-) -> ImmediateFlushHandler:
+) -> BufferedFileHandler:
     """
     Set up a file handler for the main log file that contains non-channel-specific logs.
 
@@ -115,9 +544,9 @@ def setup_main_log_file(
     # Create the log file path
     log_file = os.path.join(output_dir, "migration.log")
 
-    # Create file handler with immediate flushing for real-time log visibility.
-    # This is important in case the migration fails and we want to preserve logs.
-    file_handler = ImmediateFlushHandler(log_file, mode="w")
+    # Written by the background log sink, which flushes on a short timer and
+    # on every WARNING+ so the log survives a failed migration.
+    file_handler = BufferedFileHandler(log_file, mode="w")
     file_handler.setLevel(logging.DEBUG)  # Always use DEBUG level for file handlers
 
     # Create formatter - always use EnhancedFormatter but conditionally include API details
@@ -181,10 +610,10 @@ def setup_main_log_file(
     main_filter = MainLogFilter()
     file_handler.addFilter(main_filter)
 
-    # Add handler to the logger
-    logger = logging.getLogger("slack_chat_migrator")
-    logger.addHandler(file_handler)
+    # Feed the handler from the log sink rather than the logger directly
+    get_log_sink().add_handler(file_handler)
 
+    logger = logging.getLogger("slack_chat_migrator")
     logger.info(f"Main log file created at: {log_file}")
     return file_handler
 
@@ -268,6 +697,11 @@ def setup_logger(
     """
     Set up and return the logger with appropriate formatting.
 
+    The logger's level follows its most verbose handler (see
+    :func:`sync_logger_level`).  Log files always record DEBUG, so with an
+    *output_dir* DEBUG records are still built; without one and without
+    *verbose*, they are skipped before any formatting work.
+
     Args:
         verbose: If True, set console handler to DEBUG level; otherwise INFO level
         debug_api: If True, enable detailed API request/response logging
@@ -280,13 +714,14 @@ def setup_logger(
 
     logger = logging.getLogger("slack_chat_migrator")
 
+    # Close log files from any earlier setup before replacing them
+    shutdown_log_sink()
+
     # Clear any existing handlers to prevent duplicate messages
     if logger.handlers:
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
 
-    logger.setLevel(logging.DEBUG)  # Always set logger to DEBUG to capture all logs
-
     # Create console handler with appropriate level based on verbose flag
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.DEBUG if verbose else logging.INFO)
@@ -303,6 +738,10 @@ def setup_logger(
     if output_dir:
         setup_main_log_file(output_dir, debug_api)
 
+    # File logs always keep DEBUG; without them and without --verbose the
+    # logger drops DEBUG records before they are built.
+    sync_logger_level(logger)
+
     # Configure API debugging if enabled
     if debug_api:
         # Enable httplib (http.client) debug logging
@@ -354,17 +793,21 @@ def _enable_http_client_debug() -> None:
 
 def setup_channel_logger(
     output_dir: str, channel: str, verbose: bool = False, debug_api: bool = False
-) -> ImmediateFlushHandler:
+) -> ChannelLogHandle:
     """
     Set up a file handler for channel-specific logging.
 
+    Records are routed to the file by their ``channel`` attribute, including
+    API request/response logs when ``debug_api`` is enabled.
+
     Args:
         output_dir: The output directory path
         channel: The channel name
-        verbose: If True, set file handler to DEBUG level; otherwise INFO level
+        verbose: If True, use the verbose line format
+        debug_api: If True, include API request/response data
 
     Returns:
-        The file handler for the channel log
+        The handle for the channel log
     """
     # Create the channel logs directory if it doesn't exist
     logs_dir = os.path.join(output_dir, "channel_logs")
@@ -373,56 +816,17 @@ def setup_channel_logger(
     # Create the log file path
     log_file = os.path.join(logs_dir, f"{channel}_migration.log")
 
-    # Create file handler with immediate flushing for real-time log visibility.
-    # This is important in case the migration fails and we want to preserve logs.
-    file_handler = ImmediateFlushHandler(log_file, mode="w")
-    file_handler.setLevel(logging.DEBUG)  # Always use DEBUG level for file handlers
+    # One router serves every channel, so adding a channel costs a dict
+    # entry rather than another filtered handler on the logger.
+    handle = get_channel_log_router().open_channel(channel, log_file)
 
     # Create formatter - use EnhancedFormatter with appropriate settings
     formatter = EnhancedFormatter(verbose=verbose, include_api_details=debug_api)
-    file_handler.setFormatter(formatter)
-
-    # Create a filter to only include logs for this specific channel and related API calls
-    class ChannelFilter(logging.Filter):
-        """Filter that only passes records matching a specific channel."""
-
-        def filter(self, record: logging.LogRecord) -> bool:
-            """Return True if *record* belongs to this channel.
-
-            Args:
-                record: The log record to evaluate.
-
-            Returns:
-                True if the record matches this channel.
-            """
-            # Always include logs that have a channel attribute matching this channel
-            record_channel = getattr(record, "channel", None)
-            if record_channel == channel:
-                return True
-
-            # For API debug logs, only include them if they have the matching channel context
-            if debug_api and (
-                hasattr(record, "api_data") or hasattr(record, "response")
-            ):
-                # Only include API logs that have a channel context matching this channel
-                return record_channel == channel
-
-            # Include HTTP client logs only when API debug is enabled AND they have matching channel context
-            if debug_api and record.name == "http.client":
-                return record_channel == channel
-
-            return False
-
-    # Add the filter to the handler
-    channel_filter = ChannelFilter()
-    file_handler.addFilter(channel_filter)
+    handle.setFormatter(formatter)
 
-    # Add handler to the logger
     logger = logging.getLogger("slack_chat_migrator")
-    logger.addHandler(file_handler)
-
     logger.info(f"Channel log file created at: {log_file}", extra={"channel": channel})
-    return file_handler
+    return handle
 
 
 def ensure_channel_log_created(
@@ -471,20 +875,9 @@ def ensure_channel_log_created(
     )
 
 
-def log_with_context(level: int, message: str, **kwargs: Any) -> None:
-    """
-    Log a message with additional context information.
-
-    Args:
-        level: The logging level (e.g., logging.INFO)
-        message: The log message
-        **kwargs: Additional context to include in the log record
-    """
-    # Filter out None values from kwargs
-    filtered_kwargs = {k: v for k, v in kwargs.items() if v is not None}
-
-    # Filter out reserved logging attributes to avoid conflicts
-    reserved_attributes = {
+# LogRecord attributes that context kwargs must not overwrite
+_RESERVED_ATTRIBUTES = frozenset(
+    {
         "name",
         "msg",
         "args",
@@ -509,24 +902,43 @@ def log_with_context(level: int, message: str, **kwargs: Any) -> None:
         "message",
         "asctime",
     }
+)
+
+# Defaults so formatters never see API logs without both API attributes
+_API_LOG_DEFAULTS = {"api_data": "", "response": ""}
 
-    # Remove any reserved attributes from kwargs
-    filtered_kwargs = {
-        k: v for k, v in filtered_kwargs.items() if k not in reserved_attributes
+
+def log_with_context(level: int, message: str, *args: Any, **kwargs: Any) -> None:
+    """
+    Log a message with additional context information.
+
+    Pass values as ``%``-style *args* rather than pre-formatting them into
+    *message*: they are only merged in if the record is actually written,
+    and nothing at all is built when *level* is disabled.
+
+    Args:
+        level: The logging level (e.g., logging.INFO)
+        message: The log message, a ``%``-format string if *args* are given
+        *args: Values substituted into *message* when the record is emitted
+        **kwargs: Additional context to include in the log record
+    """
+    logger = logging.getLogger("slack_chat_migrator")
+    if not logger.isEnabledFor(level):
+        return
+
+    # Drop None values and anything that would clobber a LogRecord attribute
+    extras = {
+        k: v
+        for k, v in kwargs.items()
+        if v is not None and k not in _RESERVED_ATTRIBUTES
     }
 
     # Make sure extra attributes don't cause issues with standard formatters
     # by ensuring all potentially missing attributes have default values
-    default_extras = {"api_data": "", "response": ""}
+    if "api_data" in extras or "response" in extras:
+        extras = {**_API_LOG_DEFAULTS, **extras}
 
-    # Only add defaults for API-related logs to avoid unnecessary processing
-    if "api_data" in filtered_kwargs or "response" in filtered_kwargs:
-        extras = {**default_extras, **filtered_kwargs}
-    else:
-        extras = filtered_kwargs
-
-    logger = logging.getLogger("slack_chat_migrator")
-    logger.log(level, message, extra=extras)
+    logger.log(level, message, *args, extra=extras)
 
 
 def _extract_api_operation(method: str, url: str) -> str:
@@ -0,0 +1,274 @@
+"""In-process metrics for Google API calls, broken down by endpoint.
+
+:class:`~slack_chat_migrator.utils.api.RetryWrapper` reports every
+``execute()`` to the process-wide :class:`MetricsRegistry`: one call per
+endpoint (``chat.spaces.messages.create``, ``drive.files.create``, ...),
+its latency across all attempts, the retries it took, any 429 responses,
+and the time spent in retry backoff or waiting for rate-limit tokens.
+
+The progress renderers read the registry while the migration runs, and
+:func:`dump_api_metrics` writes it next to the run's logs when it ends, so
+a slow run can be attributed to uploads, memberships or rate limiting.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from slack_chat_migrator.constants import API_LATENCY_BUCKETS_MS, API_METRICS_FILENAME
+from slack_chat_migrator.utils.logging import log_with_context
+
+
+@dataclass
+class ApiCall:
+    """What happened during one ``execute()``, filled in as it runs.
+
+    Attributes:
+        endpoint: API method ID, e.g. ``chat.spaces.messages.create``.
+        error: HTTP status or exception class of the final failure, or
+            ``None`` if the call succeeded.
+        retries: Attempts made after the first.
+        rate_limited: 429 responses received, retried or not.
+        backoff_seconds: Time slept between attempts.
+        throttle_seconds: Time spent waiting for rate-limit tokens.
+    """
+
+    endpoint: str
+    error: str | None = None
+    retries: int = 0
+    rate_limited: int = 0
+    backoff_seconds: float = 0.0
+    throttle_seconds: float = 0.0
+
+
+class EndpointMetrics:
+    """Counters and a latency histogram for one endpoint."""
+
+    def __init__(
+        self, bucket_bounds: tuple[float, ...] = API_LATENCY_BUCKETS_MS
+    ) -> None:
+        self.bucket_bounds = bucket_bounds
+        # One count per bound plus an overflow bucket
+        self.bucket_counts = [0] * (len(bucket_bounds) + 1)
+        self.calls = 0
+        self.errors: dict[str, int] = {}
+        self.retries = 0
+        self.rate_limited = 0
+        self.backoff_seconds = 0.0
+        self.throttle_seconds = 0.0
+        self.latency_ms_total = 0.0
+        self.latency_ms_max = 0.0
+
+    @property
+    def error_count(self) -> int:
+        """Calls that ultimately failed."""
+        return sum(self.errors.values())
+
+    @property
+    def mean_ms(self) -> float | None:
+        """Mean latency, or ``None`` before the first call."""
+        return self.latency_ms_total / self.calls if self.calls else None
+
+    def observe(self, call: ApiCall, latency_ms: float) -> None:
+        """Fold one finished call into the counters."""
+        self.calls += 1
+        if call.error is not None:
+            self.errors[call.error] = self.errors.get(call.error, 0) + 1
+        self.retries += call.retries
+        self.rate_limited += call.rate_limited
+        self.backoff_seconds += call.backoff_seconds
+        self.throttle_seconds += call.throttle_seconds
+        self.latency_ms_total += latency_ms
+        self.latency_ms_max = max(self.latency_ms_max, latency_ms)
+        self.bucket_counts[bisect.bisect_left(self.bucket_bounds, latency_ms)] += 1
+
+    def merge(self, other: EndpointMetrics) -> None:
+        """Add *other*'s counters to this one's; bucket bounds must match."""
+        self.calls += other.calls
+        for error, count in other.errors.items():
+            self.errors[error] = self.errors.get(error, 0) + count
+        self.retries += other.retries
+        self.rate_limited += other.rate_limited
+        self.backoff_seconds += other.backoff_seconds
+        self.throttle_seconds += other.throttle_seconds
+        self.latency_ms_total += other.latency_ms_total
+        self.latency_ms_max = max(self.latency_ms_max, other.latency_ms_max)
+        for i, count in enumerate(other.bucket_counts):
+            self.bucket_counts[i] += count
+
+    def copy(self) -> EndpointMetrics:
+        """Return an independent copy."""
+        clone = EndpointMetrics(self.bucket_bounds)
+        clone.merge(self)
+        return clone
+
+    def percentile(self, q: float) -> float | None:
+        """Estimate the *q*-quantile latency (0 < q <= 1) from the histogram.
+
+        Interpolates linearly within the bucket holding the target rank.
+
+        Returns:
+            Latency in milliseconds, or ``None`` before the first call.
+        """
+        if not self.calls:
+            return None
+        rank = q * self.calls
+        seen = 0
+        lower = 0.0
+        bounds = (*self.bucket_bounds, self.latency_ms_max)
+        for bound, count in zip(bounds, self.bucket_counts):
+            if count and seen + count >= rank:
+                upper = min(bound, self.latency_ms_max)
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+            lower = bound
+        return self.latency_ms_max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary."""
+        return {
+            "calls": self.calls,
+            "errors": dict(sorted(self.errors.items())),
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "backoff_seconds": round(self.backoff_seconds, 3),
+            "throttle_seconds": round(self.throttle_seconds, 3),
+            "latency_ms": {
+                "mean": _round(self.mean_ms),
+                "p50": _round(self.percentile(0.5)),
+                "p95": _round(self.percentile(0.95)),
+                "p99": _round(self.percentile(0.99)),
+                "max": round(self.latency_ms_max, 1),
+            },
+            "histogram_ms": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(self.bucket_bounds, self.bucket_counts)
+                },
+                "overflow": self.bucket_counts[-1],
+            },
+        }
+
+
+def _round(value: float | None) -> float | None:
+    return None if value is None else round(value, 1)
+
+
+class MetricsRegistry:
+    """Per-endpoint :class:`EndpointMetrics`, safe to share between threads."""
+
+    def __init__(
+        self, bucket_bounds: tuple[float, ...] = API_LATENCY_BUCKETS_MS
+    ) -> None:
+        self._bucket_bounds = bucket_bounds
+        self._endpoints: dict[str, EndpointMetrics] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._endpoints)
+
+    def observe(self, call: ApiCall, latency_seconds: float) -> None:
+        """Record one finished call.
+
+        Args:
+            call: The call's outcome.
+            latency_seconds: Wall time across all attempts.
+        """
+        with self._lock:
+            metrics = self._endpoints.get(call.endpoint)
+            if metrics is None:
+                metrics = EndpointMetrics(self._bucket_bounds)
+                self._endpoints[call.endpoint] = metrics
+            metrics.observe(call, latency_seconds * 1000)
+
+    def snapshot(self) -> dict[str, EndpointMetrics]:
+        """Return a copy of every endpoint's metrics, keyed by endpoint."""
+        with self._lock:
+            return {name: m.copy() for name, m in self._endpoints.items()}
+
+    def totals(self) -> EndpointMetrics:
+        """Return all endpoints' metrics merged into one."""
+        total = EndpointMetrics(self._bucket_bounds)
+        with self._lock:
+            for metrics in self._endpoints.values():
+                total.merge(metrics)
+        return total
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable summary, slowest total time first."""
+        endpoints = sorted(
+            self.snapshot().items(), key=lambda item: -item[1].latency_ms_total
+        )
+        return {
+            "totals": self.totals().as_dict(),
+            "endpoints": {name: m.as_dict() for name, m in endpoints},
+        }
+
+
+_registry = MetricsRegistry()
+_registry_lock = threading.Lock()
+
+
+def get_api_metrics() -> MetricsRegistry:
+    """Return the process-wide API metrics registry."""
+    with _registry_lock:
+        return _registry
+
+
+def reset_api_metrics() -> None:
+    """Discard every recorded call."""
+    global _registry
+    with _registry_lock:
+        _registry = MetricsRegistry()
+
+
+def dump_api_metrics(output_dir: str | Path) -> Path | None:
+    """Write the registry to :data:`API_METRICS_FILENAME` and log a summary.
+
+    Args:
+        output_dir: The run's output directory.
+
+    Returns:
+        The path written, or ``None`` if no API calls were recorded or the
+        file could not be written.
+    """
+    registry = get_api_metrics()
+    if not len(registry):
+        return None
+    data = registry.as_dict()
+    path = Path(output_dir) / API_METRICS_FILENAME
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    except OSError as e:
+        log_with_context(logging.WARNING, f"Could not write API metrics: {e}")
+        return None
+
+    log_with_context(logging.INFO, "API call summary (slowest total time first):")
+    for endpoint, stats in data["endpoints"].items():
+        latency = stats["latency_ms"]
+        log_with_context(
+            logging.INFO,
+            "  %s: %d calls, %d errors, %d retries, %d x 429, "
+            "p50 %sms, p95 %sms, p99 %sms, backoff %.1fs",
+            endpoint,
+            stats["calls"],
+            sum(stats["errors"].values()),
+            stats["retries"],
+            stats["rate_limited"],
+            latency["p50"],
+            latency["p95"],
+            latency["p99"],
+            stats["backoff_seconds"],
+            endpoint=endpoint,
+        )
+    log_with_context(logging.INFO, "API metrics written to %s", path)
+    return path
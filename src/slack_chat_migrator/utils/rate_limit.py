@@ -0,0 +1,213 @@
+"""Adaptive token-bucket rate limiting for Google API calls.
+
+Every request made through :class:`~slack_chat_migrator.utils.api.RetryWrapper`
+takes a token from two buckets: one shared by all callers of the same API
+(``chat``, ``drive``) and one for the impersonated user.  Buckets adjust
+their refill rate AIMD-style: a 429 response multiplies the rate by
+``RATE_LIMIT_BACKOFF_FACTOR``; each clean response adds
+``RATE_LIMIT_RECOVERY_STEP`` back, up to the configured ceiling.  A 429
+against a per-user quota slows only that user's bucket; any other 429 is
+treated as a project-level quota and slows the API bucket as well.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+from slack_chat_migrator.constants import (
+    RATE_LIMIT_API_PER_SECOND,
+    RATE_LIMIT_BACKOFF_FACTOR,
+    RATE_LIMIT_BURST,
+    RATE_LIMIT_MIN_PER_SECOND,
+    RATE_LIMIT_RECOVERY_STEP,
+    RATE_LIMIT_USER_PER_SECOND,
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to 429 responses.
+
+    ``acquire()`` reserves a token under the lock and sleeps outside it,
+    so concurrent callers queue in arrival order without holding the lock
+    while waiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = RATE_LIMIT_BURST,
+        *,
+        min_rate: float = RATE_LIMIT_MIN_PER_SECOND,
+        backoff_factor: float = RATE_LIMIT_BACKOFF_FACTOR,
+        recovery_step: float = RATE_LIMIT_RECOVERY_STEP,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.max_rate = rate
+        self.capacity = capacity
+        self.min_rate = min(min_rate, rate)
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self._rate = rate
+        self._tokens = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._last = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Current refill rate in tokens per second."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+            self._last = now
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait for it.
+
+        Returns:
+            Seconds until the reserved token is available (0 if immediate).
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    def acquire(self) -> float:
+        """Block until a token is available.
+
+        Returns:
+            Seconds spent waiting.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        """Additively raise the rate after a clean response."""
+        with self._lock:
+            if self._rate < self.max_rate:
+                self._refill(self._clock())
+                self._rate = min(self.max_rate, self._rate + self.recovery_step)
+
+    def on_rate_limited(self) -> None:
+        """Multiplicatively lower the rate after a 429 response."""
+        with self._lock:
+            self._refill(self._clock())
+            self._rate = max(self.min_rate, self._rate * self.backoff_factor)
+            # Drop any banked burst so the slowdown takes effect immediately.
+            self._tokens = min(self._tokens, 0.0)
+
+
+class RateLimit:
+    """Rate-limit handle for one (API, impersonated user) pair.
+
+    Combines the API-wide bucket with the user's own bucket; a request
+    must obtain a token from both.
+    """
+
+    def __init__(self, api_bucket: TokenBucket, user_bucket: TokenBucket) -> None:
+        self._buckets = (api_bucket, user_bucket)
+
+    def acquire(self) -> float:
+        """Wait for a token from every bucket.
+
+        Returns:
+            Total seconds spent waiting.
+        """
+        return sum(bucket.acquire() for bucket in self._buckets)
+
+    def on_success(self) -> None:
+        """Record a clean response on every bucket."""
+        for bucket in self._buckets:
+            bucket.on_success()
+
+    def on_rate_limited(self, *, user_scoped: bool = False) -> None:
+        """Record a 429 response.
+
+        Args:
+            user_scoped: The 429 came from the impersonated user's own quota,
+                so only the user's bucket slows down.  Otherwise every bucket
+                does, since the project-wide quota is exhausted.
+        """
+        api_bucket, user_bucket = self._buckets
+        user_bucket.on_rate_limited()
+        if not user_scoped:
+            api_bucket.on_rate_limited()
+
+
+class RateLimiterRegistry:
+    """Creates and shares token buckets per API and per impersonated user."""
+
+    def __init__(
+        self,
+        api_rate: float = RATE_LIMIT_API_PER_SECOND,
+        user_rate: float = RATE_LIMIT_USER_PER_SECOND,
+        burst: float = RATE_LIMIT_BURST,
+    ) -> None:
+        self._api_rate = api_rate
+        self._user_rate = user_rate
+        self._burst = burst
+        self._api_buckets: dict[str, TokenBucket] = {}
+        self._user_buckets: dict[tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def for_user(self, api: str, user_email: str) -> RateLimit:
+        """Return the rate-limit handle for *user_email* calling *api*.
+
+        Args:
+            api: Google API name (e.g. ``"chat"``, ``"drive"``).
+            user_email: Email of the impersonated user.
+
+        Returns:
+            A :class:`RateLimit` sharing buckets with every other handle
+            for the same API and user.
+        """
+        with self._lock:
+            api_bucket = self._api_buckets.get(api)
+            if api_bucket is None:
+                api_bucket = TokenBucket(self._api_rate, self._burst)
+                self._api_buckets[api] = api_bucket
+            key = (api, user_email)
+            user_bucket = self._user_buckets.get(key)
+            if user_bucket is None:
+                user_bucket = TokenBucket(self._user_rate, self._burst)
+                self._user_buckets[key] = user_bucket
+        return RateLimit(api_bucket, user_bucket)
+
+
+_registry = RateLimiterRegistry()
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter(api: str, user_email: str) -> RateLimit:
+    """Return the process-wide rate-limit handle for *api* and *user_email*.
+
+    Args:
+        api: Google API name (e.g. ``"chat"``, ``"drive"``).
+        user_email: Email of the impersonated user.
+
+    Returns:
+        The shared :class:`RateLimit` handle.
+    """
+    with _registry_lock:
+        registry = _registry
+    return registry.for_user(api, user_email)
+
+
+def reset_rate_limiters() -> None:
+    """Discard all buckets, restoring every limiter to its initial rate."""
+    global _registry
+    with _registry_lock:
+        _registry = RateLimiterRegistry()
@@ -0,0 +1,44 @@
+"""Fixed-size uniform samples of unbounded streams."""
+
+from __future__ import annotations
+
+import random
+import threading
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+
+class Reservoir(Generic[_T]):
+    """Uniform random sample of at most *size* items from a stream.
+
+    Uses reservoir sampling (Algorithm R): every item offered so far has
+    the same chance of being in :attr:`items`, however long the stream
+    grows, while memory stays bounded by *size*.
+
+    Args:
+        size: Most items kept.
+        items: List to keep the sample in; it is updated in place, so
+            callers may hand out a reference to it.
+        seed: Seed for the replacement draws, so samples are repeatable.
+    """
+
+    def __init__(self, size: int, items: list[_T] | None = None, seed: int = 0) -> None:
+        if size < 1:
+            raise ValueError(f"size must be >= 1, got {size}")
+        self.size = size
+        self.items: list[_T] = items if items is not None else []
+        self.seen = len(self.items)
+        self._rng = random.Random(seed)  # noqa: S311
+        self._lock = threading.Lock()
+
+    def add(self, item: _T) -> None:
+        """Offer one more item from the stream."""
+        with self._lock:
+            self.seen += 1
+            if len(self.items) < self.size:
+                self.items.append(item)
+                return
+            slot = self._rng.randrange(self.seen)
+            if slot < self.size:
+                self.items[slot] = item
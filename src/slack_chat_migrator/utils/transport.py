@@ -0,0 +1,159 @@
+"""Pooled, thread-safe HTTP transport for Google API clients.
+
+``googleapiclient`` defaults to one ``httplib2.Http`` per service object.
+Every impersonated user then gets a private connection, so each new
+delegate pays a TCP and TLS handshake. Those objects are also not safe to
+share between threads.
+
+:func:`authorized_http` instead returns a :class:`SessionHttp`. This is an
+``httplib2``-compatible facade over a ``google-auth``
+:class:`~google.auth.transport.requests.AuthorizedSession`. Every session
+mounts the same process-wide ``requests`` adapter, so all delegates share
+one urllib3 pool of keep-alive connections per host. Each session still
+adds its own user's ``Authorization`` header to every request. Token
+refreshes go through the same pool.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+import httplib2
+from google.auth.transport.requests import AuthorizedSession, Request
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from slack_chat_migrator.constants import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_TIMEOUT_SECONDS,
+)
+
+if TYPE_CHECKING:
+    from google.auth.credentials import Credentials
+
+
+class SessionHttp:
+    """Adapts an :class:`AuthorizedSession` to the ``httplib2.Http`` API.
+
+    ``googleapiclient`` only calls ``request()`` and reads ``credentials``
+    (batch requests sign their parts themselves), so that is all this
+    implements.
+
+    Attributes:
+        credentials: The session's credentials, read by batch requests.
+        timeout: Per-request timeout in seconds.
+    """
+
+    def __init__(
+        self, session: AuthorizedSession, timeout: float = HTTP_TIMEOUT_SECONDS
+    ) -> None:
+        self._session = session
+        self.credentials = session.credentials
+        self.timeout = timeout
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: str | bytes | None = None,
+        headers: dict[str, str] | None = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+    ) -> tuple[httplib2.Response, bytes]:
+        """Send a request the way ``httplib2.Http.request`` would.
+
+        Args:
+            uri: Absolute request URI.
+            method: HTTP method.
+            body: Request body. Text is sent as UTF-8.
+            headers: Request headers.
+            redirections: Accepted for compatibility; redirects are followed
+                by ``requests``.
+            connection_type: Accepted for compatibility and ignored.
+
+        Returns:
+            ``(response, content)``, with the status, reason and lower-cased
+            headers in an :class:`httplib2.Response`.
+        """
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        response = self._session.request(
+            method, uri, data=body, headers=headers, timeout=self.timeout
+        )
+        info: dict[str, Any] = {k.lower(): v for k, v in response.headers.items()}
+        info["status"] = response.status_code
+        resp = httplib2.Response(info)
+        resp.reason = response.reason
+        return resp, response.content
+
+    def close(self) -> None:
+        """Release nothing: connections belong to the shared pool."""
+
+
+class SharedTransport:
+    """One connection pool shared by every authorized session."""
+
+    def __init__(
+        self,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = HTTP_POOL_MAXSIZE,
+        timeout: float = HTTP_TIMEOUT_SECONDS,
+    ) -> None:
+        # Retries stay with RetryWrapper, which also feeds the rate limiter
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.timeout = timeout
+        self._auth_session = Session()
+        self._mount(self._auth_session)
+        self._auth_request = Request(session=self._auth_session)
+
+    def _mount(self, session: Session) -> None:
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+
+    def http_for(self, credentials: Credentials) -> SessionHttp:
+        """Return an ``httplib2``-compatible client acting as *credentials*."""
+        session = AuthorizedSession(credentials, auth_request=self._auth_request)
+        self._mount(session)
+        return SessionHttp(session, self.timeout)
+
+    def refresh(self, credentials: Credentials) -> None:
+        """Fetch a new access token for *credentials* over the shared pool."""
+        credentials.refresh(self._auth_request)
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.adapter.close()
+
+
+_registry: SharedTransport | None = None
+_registry_lock = threading.Lock()
+
+
+def get_shared_transport() -> SharedTransport:
+    """Return the process-wide transport, creating it on first use."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = SharedTransport()
+        return _registry
+
+
+def reset_shared_transport() -> None:
+    """Close the process-wide pool; the next client gets a fresh one."""
+    global _registry
+    with _registry_lock:
+        transport, _registry = _registry, None
+    if transport is not None:
+        transport.close()
+
+
+def authorized_http(credentials: Credentials) -> SessionHttp:
+    """Return a pooled, thread-safe HTTP client for *credentials*.
+
+    Pass the result as ``http=`` to ``googleapiclient.discovery.build``.
+    """
+    return get_shared_transport().http_for(credentials)
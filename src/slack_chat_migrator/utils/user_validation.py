@@ -372,6 +372,8 @@ def scan_channel_members_for_unmapped_users(
     export_root: Path | str,
     config: MigrationConfig,
     user_map: dict[str, str],
+    channels_data: list[dict[str, Any]] | None = None,
+    users_data: list[dict[str, Any]] | None = None,
 ) -> None:
     """Scan channels.json for users listed as members but not in user_map.
 
@@ -383,20 +385,25 @@ def scan_channel_members_for_unmapped_users(
         export_root: Path to the Slack export directory.
         config: Migration configuration (for include/exclude channels, ignore_bots).
         user_map: Mapping of Slack user IDs to Google email addresses.
+        channels_data: Parsed contents of channels.json, if already loaded;
+            read from *export_root* otherwise.
+        users_data: Parsed contents of users.json, if already loaded; read
+            from *export_root* (only when ``ignore_bots`` is set) otherwise.
     """
     tracker = unmapped_user_tracker
 
     try:
-        channels_file = Path(export_root) / "channels.json"
-        if not channels_file.exists():
-            log_with_context(
-                logging.WARNING,
-                "channels.json not found, skipping channel member validation",
-            )
-            return
+        if channels_data is None:
+            channels_file = Path(export_root) / "channels.json"
+            if not channels_file.exists():
+                log_with_context(
+                    logging.WARNING,
+                    "channels.json not found, skipping channel member validation",
+                )
+                return
 
-        with open(channels_file, encoding="utf-8") as f:
-            channels_data = json.load(f)
+            with open(channels_file, encoding="utf-8") as f:
+                channels_data = json.load(f)
 
         channels_to_check = []
 
@@ -420,7 +427,9 @@ def scan_channel_members_for_unmapped_users(
         # Load user data once if ignore_bots is enabled
         user_lookup = {}
         ignore_bots = config.ignore_bots
-        if ignore_bots:
+        if ignore_bots and users_data is not None:
+            user_lookup = {user["id"]: user for user in users_data}
+        elif ignore_bots:
             try:
                 users_file = Path(export_root) / "users.json"
                 if users_file.exists():
@@ -0,0 +1,56 @@
+"""Dry-run migrations of synthetic exports from the export generator.
+
+These check that what ``export generate`` writes is an export the migrator
+accepts end to end, with every generated message, reaction and file
+accounted for.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from slack_chat_migrator.constants import DRY_RUN_SAMPLE_SIZE
+from slack_chat_migrator.services.export_generator import ExportSpec, generate_export
+from tests.integration.conftest import make_migrator
+
+pytestmark = pytest.mark.integration
+
+
+class TestGeneratedExportMigration:
+    """A generated export migrates cleanly in dry-run mode."""
+
+    def test_summary_matches_generated_counts(self, tmp_path: Path) -> None:
+        generated = generate_export(
+            ExportSpec(users=20, channels=4, messages=300, file_ratio=0.1, seed=3),
+            tmp_path / "export",
+        )
+        m = make_migrator(generated.root)
+
+        assert m.migrate() is True
+
+        summary = m.state.progress.migration_summary
+        assert summary["spaces_created"] == 4
+        assert summary["messages_created"] == generated.messages
+        assert summary["reactions_created"] == generated.reactions
+        assert summary["files_created"] == generated.files
+        assert m.state.messages.failed_messages == []
+
+    def test_low_memory_matches_full_dry_run(self, tmp_path: Path) -> None:
+        generated = generate_export(
+            ExportSpec(users=20, channels=4, messages=300, file_ratio=0.1, seed=3),
+            tmp_path / "export",
+        )
+        m = make_migrator(generated.root, low_memory=True)
+
+        assert m.migrate() is True
+
+        summary = m.state.progress.migration_summary
+        assert summary["messages_created"] == generated.messages
+        assert summary["reactions_created"] == generated.reactions
+        assert len(m._dry_run_chat_service.captured_messages) == DRY_RUN_SAMPLE_SIZE
+        # Every channel released its per-message state on return
+        assert m.state.messages.sent_messages == set()
+        assert m.state.messages.thread_map == {}
+        assert m.state.messages.message_id_map == {}
@@ -15,6 +15,7 @@ import pytest
 from slack_chat_migrator.core.config import MigrationConfig
 from slack_chat_migrator.core.context import MigrationContext
 from slack_chat_migrator.core.state import MigrationState
+from slack_chat_migrator.utils.metrics import reset_api_metrics
 
 # ---------------------------------------------------------------------------
 # MigrationContext factory
@@ -66,6 +67,13 @@ def fresh_state():
     return MigrationState()
 
 
+@pytest.fixture(autouse=True)
+def _reset_api_metrics():
+    """Keep API calls made by one test out of the next test's metrics."""
+    yield
+    reset_api_metrics()
+
+
 # ---------------------------------------------------------------------------
 # Data builders — common dict shapes
 # ---------------------------------------------------------------------------
@@ -1,11 +1,14 @@
 """Unit tests for the API utilities module."""
 
 import json
+import time
+from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import httplib2
 import pytest
+from google.auth.credentials import Credentials
 from googleapiclient.errors import HttpError
 
 from slack_chat_migrator.utils.api import (
@@ -13,8 +16,11 @@ from slack_chat_migrator.utils.api import (
     _service_cache,
     escape_drive_query_value,
     get_gcp_service,
+    refresh_if_expiring,
+    set_service_factory,
     slack_ts_to_rfc3339,
 )
+from slack_chat_migrator.utils.transport import SessionHttp
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -164,6 +170,95 @@ class TestRetryWrapperExecuteSuccess:
         inner.execute.assert_called_once_with(num_retries=0)
 
 
+# ---------------------------------------------------------------------------
+# RetryWrapper — rate limiting
+# ---------------------------------------------------------------------------
+
+
+class TestRetryWrapperRateLimit:
+    """Execute calls report outcomes to the attached rate limiter."""
+
+    def test_acquires_token_and_reports_success(self):
+        inner = MagicMock()
+        inner.execute.return_value = "ok"
+        limit = MagicMock()
+
+        wrapper = RetryWrapper(inner, rate_limit=limit)
+        wrapper.execute()
+
+        limit.acquire.assert_called_once()
+        limit.on_success.assert_called_once()
+        limit.on_rate_limited.assert_not_called()
+
+    @patch("slack_chat_migrator.utils.api.time.sleep")
+    def test_429_reports_rate_limited(self, _sleep):
+        inner = MagicMock()
+        inner.execute.side_effect = [
+            _make_http_error(429, "Too Many Requests"),
+            "ok",
+        ]
+        limit = MagicMock()
+
+        wrapper = RetryWrapper(inner, rate_limit=limit)
+        assert wrapper.execute() == "ok"
+
+        assert limit.acquire.call_count == 2
+        limit.on_rate_limited.assert_called_once()
+        limit.on_success.assert_called_once()
+
+    @patch("slack_chat_migrator.utils.api.time.sleep")
+    def test_user_quota_429_is_user_scoped(self, _sleep):
+        error = HttpError(
+            httplib2.Response({"status": 429}),
+            b'{"error": {"code": 429, "message": "Quota exceeded for quota metric'
+            b" 'Write requests' and limit 'Write requests per minute per user'"
+            b' of service chat.googleapis.com", "status": "RESOURCE_EXHAUSTED"}}',
+        )
+        inner = MagicMock()
+        inner.execute.side_effect = [error, "ok"]
+        limit = MagicMock()
+
+        RetryWrapper(inner, rate_limit=limit).execute()
+
+        limit.on_rate_limited.assert_called_once_with(user_scoped=True)
+
+    @patch("slack_chat_migrator.utils.api.time.sleep")
+    def test_project_quota_429_is_not_user_scoped(self, _sleep):
+        error = HttpError(
+            httplib2.Response({"status": 429}),
+            b'{"error": {"code": 429, "message": "Quota exceeded for quota metric'
+            b" 'Write requests' and limit 'Write requests per minute'"
+            b' of service chat.googleapis.com", "status": "RESOURCE_EXHAUSTED"}}',
+        )
+        inner = MagicMock()
+        inner.execute.side_effect = [error, "ok"]
+        limit = MagicMock()
+
+        RetryWrapper(inner, rate_limit=limit).execute()
+
+        limit.on_rate_limited.assert_called_once_with(user_scoped=False)
+
+    @patch("slack_chat_migrator.utils.api.time.sleep")
+    def test_500_does_not_report_rate_limited(self, _sleep):
+        inner = MagicMock()
+        inner.execute.side_effect = [_make_http_error(500), "ok"]
+        limit = MagicMock()
+
+        RetryWrapper(inner, rate_limit=limit).execute()
+
+        limit.on_rate_limited.assert_not_called()
+
+    def test_chained_wrappers_share_limiter(self):
+        inner = MagicMock()
+        inner.spaces.return_value.create.return_value.execute.return_value = {}
+        limit = MagicMock()
+
+        wrapper = RetryWrapper(inner, rate_limit=limit)
+        wrapper.spaces().create(body={}).execute()
+
+        limit.acquire.assert_called_once()
+
+
 # ---------------------------------------------------------------------------
 # RetryWrapper — retry on retryable errors
 # ---------------------------------------------------------------------------
@@ -481,6 +576,112 @@ class TestRetryWrapperChaining:
         result = wrapper.spaces().messages().list().execute()
         assert result == {"messages": []}
 
+    def test_resource_hops_are_reused(self):
+        service = _FakeService()
+        wrapper = RetryWrapper(service)
+
+        spaces = wrapper.spaces()
+        assert wrapper.spaces() is spaces
+        assert spaces.messages() is spaces.messages()
+        assert service.spaces_calls == 1
+
+    def test_requests_are_not_reused(self):
+        wrapper = RetryWrapper(_FakeService())
+        messages = wrapper.spaces().messages()
+        assert messages.create(parent="p") is not messages.create(parent="p")
+        assert messages.list() is not messages.list()
+
+
+class _FakeRequest:
+    """Minimal stand-in for googleapiclient's HttpRequest."""
+
+    methodId = "chat.spaces.messages.create"
+    method = "POST"
+    uri = "https://chat.googleapis.com/v1/spaces/S/messages?alt=json"
+    body = '{"text": "hello"}'
+
+    def execute(self):
+        return {"name": "spaces/S/messages/M"}
+
+
+class _FakeMessages:
+    def create(self, **kwargs):
+        return _FakeRequest()
+
+    def list(self, **kwargs):
+        return _FakeRequest()
+
+
+class _FakeSpaces:
+    def messages(self):
+        return _FakeMessages()
+
+    def create(self, **kwargs):
+        return _FakeRequest()
+
+
+class _FakeService:
+    """Builds a fresh resource per hop, like a discovery-built service."""
+
+    def __init__(self):
+        self.spaces_calls = 0
+
+    def spaces(self):
+        self.spaces_calls += 1
+        return _FakeSpaces()
+
+
+# ---------------------------------------------------------------------------
+# RetryWrapper — per-call overhead
+# ---------------------------------------------------------------------------
+
+
+def _best_per_call(fn, calls: int = 2000, repeats: int = 5) -> float:
+    """Return the fastest mean time per call, in seconds, over *repeats*."""
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, (time.perf_counter() - started) / calls)
+    return best
+
+
+class TestRetryWrapperOverhead:
+    """RetryWrapper should cost little more than a plain execute()."""
+
+    def test_no_introspection_when_debug_disabled(self):
+        wrapper = RetryWrapper(_FakeService())
+        with (
+            patch.object(
+                RetryWrapper, "_extract_request_details", side_effect=AssertionError
+            ),
+            patch.object(RetryWrapper, "_log_api_request", side_effect=AssertionError),
+            patch.object(RetryWrapper, "_log_api_response", side_effect=AssertionError),
+        ):
+            result = wrapper.spaces().messages().create(parent="p").execute()
+        assert result == {"name": "spaces/S/messages/M"}
+
+    @pytest.mark.slow
+    def test_wrapped_chain_overhead(self):
+        """Microbenchmark guard for the disabled-debug fast path.
+
+        The wrapper still times the call and records API metrics, which
+        costs around 10us per call on a developer laptop; the budget leaves
+        headroom for slow CI machines while catching a return of
+        per-call introspection or wrapper allocation.
+        """
+        service = _FakeService()
+        wrapper = RetryWrapper(service)
+
+        plain = _best_per_call(
+            lambda: service.spaces().messages().create(parent="p").execute()
+        )
+        wrapped = _best_per_call(
+            lambda: wrapper.spaces().messages().create(parent="p").execute()
+        )
+        assert wrapped - plain < 50e-6
+
 
 # ---------------------------------------------------------------------------
 # RetryWrapper — _extract_request_details
@@ -690,6 +891,10 @@ class TestRetryWrapperApiLogging:
 
         wrapper = RetryWrapper(inner)
         with (
+            patch(
+                "slack_chat_migrator.utils.api.is_debug_api_enabled",
+                return_value=True,
+            ),
             patch.object(wrapper, "_log_api_request") as mock_log_req,
             patch.object(wrapper, "_log_api_response"),
         ):
@@ -707,6 +912,10 @@ class TestRetryWrapperApiLogging:
 
         wrapper = RetryWrapper(inner)
         with (
+            patch(
+                "slack_chat_migrator.utils.api.is_debug_api_enabled",
+                return_value=True,
+            ),
             patch.object(wrapper, "_log_api_request"),
             patch.object(wrapper, "_log_api_response") as mock_log_resp,
         ):
@@ -717,7 +926,7 @@ class TestRetryWrapperApiLogging:
         """_log_api_request silently returns when debug is disabled."""
         wrapper = RetryWrapper(MagicMock())
         with patch(
-            "slack_chat_migrator.utils.logging.is_debug_api_enabled", return_value=False
+            "slack_chat_migrator.utils.api.is_debug_api_enabled", return_value=False
         ):
             # Should not raise
             wrapper._log_api_request(
@@ -729,10 +938,10 @@ class TestRetryWrapperApiLogging:
         wrapper = RetryWrapper(MagicMock())
         with (
             patch(
-                "slack_chat_migrator.utils.logging.is_debug_api_enabled",
+                "slack_chat_migrator.utils.api.is_debug_api_enabled",
                 return_value=True,
             ),
-            patch("slack_chat_migrator.utils.logging.log_api_request") as mock_log,
+            patch("slack_chat_migrator.utils.api.log_api_request") as mock_log,
         ):
             wrapper._log_api_request(
                 {
@@ -750,10 +959,10 @@ class TestRetryWrapperApiLogging:
         wrapper = RetryWrapper(MagicMock())
         with (
             patch(
-                "slack_chat_migrator.utils.logging.is_debug_api_enabled",
+                "slack_chat_migrator.utils.api.is_debug_api_enabled",
                 return_value=True,
             ),
-            patch("slack_chat_migrator.utils.logging.log_api_request") as mock_log,
+            patch("slack_chat_migrator.utils.api.log_api_request") as mock_log,
         ):
             wrapper._log_api_request(
                 {
@@ -771,10 +980,10 @@ class TestRetryWrapperApiLogging:
         wrapper = RetryWrapper(MagicMock())
         with (
             patch(
-                "slack_chat_migrator.utils.logging.is_debug_api_enabled",
+                "slack_chat_migrator.utils.api.is_debug_api_enabled",
                 return_value=True,
             ),
-            patch("slack_chat_migrator.utils.logging.log_api_request") as mock_log,
+            patch("slack_chat_migrator.utils.api.log_api_request") as mock_log,
         ):
             wrapper._log_api_request(
                 {
@@ -792,7 +1001,7 @@ class TestRetryWrapperApiLogging:
     def test_log_api_response_no_crash_when_debug_disabled(self):
         wrapper = RetryWrapper(MagicMock())
         with patch(
-            "slack_chat_migrator.utils.logging.is_debug_api_enabled", return_value=False
+            "slack_chat_migrator.utils.api.is_debug_api_enabled", return_value=False
         ):
             wrapper._log_api_response(
                 200,
@@ -805,10 +1014,10 @@ class TestRetryWrapperApiLogging:
         wrapper = RetryWrapper(MagicMock())
         with (
             patch(
-                "slack_chat_migrator.utils.logging.is_debug_api_enabled",
+                "slack_chat_migrator.utils.api.is_debug_api_enabled",
                 return_value=True,
             ),
-            patch("slack_chat_migrator.utils.logging.log_api_response") as mock_log,
+            patch("slack_chat_migrator.utils.api.log_api_response") as mock_log,
         ):
             wrapper._log_api_response(
                 201,
@@ -839,7 +1048,7 @@ class TestGetGcpService:
         yield
         _service_cache.clear()
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -868,11 +1077,12 @@ class TestGetGcpService:
             ),
         )
         mock_cred_instance.with_subject.assert_called_once_with("user@example.com")
-        mock_build.assert_called_once_with(
-            "chat", "v1", credentials=mock_delegated, cache_discovery=False
-        )
+        mock_build.assert_called_once_with("chat", "v1", http=ANY)
+        http = mock_build.call_args.kwargs["http"]
+        assert isinstance(http, SessionHttp)
+        assert http.credentials is mock_delegated
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -889,7 +1099,7 @@ class TestGetGcpService:
         # build should only be called once — second call uses cache
         mock_build.assert_called_once()
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -905,7 +1115,7 @@ class TestGetGcpService:
         assert svc1 is not svc2
         assert mock_build.call_count == 2
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -948,7 +1158,7 @@ class TestGetGcpService:
         with pytest.raises(ValueError, match="Invalid credential file format"):
             get_gcp_service("/bad/creds.json", "user@example.com", "chat", "v1")
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -961,7 +1171,7 @@ class TestGetGcpService:
         with pytest.raises(Exception, match="discovery failed"):
             get_gcp_service("/path/creds.json", "user@example.com", "chat", "v1")
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -983,7 +1193,7 @@ class TestGetGcpService:
         assert result._max_retries == 7
         assert result._retry_delay == 5
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -1000,7 +1210,7 @@ class TestGetGcpService:
         # The channel context getter should return the channel passed
         assert result._channel_context_getter() == "general"
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -1063,7 +1273,7 @@ class TestServiceCacheTTL:
         yield
         _service_cache.clear()
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -1087,7 +1297,7 @@ class TestServiceCacheTTL:
         assert mock_build.call_count == 2
         assert svc1 is not svc2
 
-    @patch("slack_chat_migrator.utils.api.build")
+    @patch("slack_chat_migrator.utils.api.build_service")
     @patch(
         "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
     )
@@ -1146,3 +1356,72 @@ class TestServiceCache401Eviction:
 
         # Cache should NOT have been cleared
         assert len(_service_cache) == 1
+
+
+# ---------------------------------------------------------------------------
+# refresh_if_expiring
+# ---------------------------------------------------------------------------
+
+
+class _ExpiringCredentials(Credentials):
+    """Credentials whose token expires in *expires_in* seconds."""
+
+    def __init__(self, token: str | None, expires_in: float | None) -> None:
+        super().__init__()
+        self.token = token
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        self.expiry = (
+            None if expires_in is None else now + timedelta(seconds=expires_in)
+        )
+        self.refreshes = 0
+
+    def refresh(self, request):
+        self.refreshes += 1
+        self.token = "fresh"  # noqa: S105
+
+
+def _service_with(credentials) -> RetryWrapper:
+    return RetryWrapper(SimpleNamespace(_http=SimpleNamespace(credentials=credentials)))
+
+
+class TestRefreshIfExpiring:
+    """Tests for refresh_if_expiring()."""
+
+    def test_refreshes_token_close_to_expiry(self):
+        creds = _ExpiringCredentials("old", expires_in=60)
+        assert refresh_if_expiring(_service_with(creds), margin=300) is True
+        assert creds.refreshes == 1
+        assert creds.token == "fresh"  # noqa: S105
+
+    def test_leaves_fresh_token_alone(self):
+        creds = _ExpiringCredentials("old", expires_in=3000)
+        assert refresh_if_expiring(_service_with(creds), margin=300) is False
+        assert creds.refreshes == 0
+
+    def test_mints_missing_token(self):
+        creds = _ExpiringCredentials(None, expires_in=None)
+        assert refresh_if_expiring(_service_with(creds)) is True
+
+    def test_non_expiring_token_left_alone(self):
+        creds = _ExpiringCredentials("old", expires_in=None)
+        assert refresh_if_expiring(_service_with(creds)) is False
+
+    def test_service_without_credentials(self):
+        assert refresh_if_expiring(MagicMock()) is False
+
+    @patch(
+        "slack_chat_migrator.utils.api.service_account.Credentials.from_service_account_file"
+    )
+    def test_uses_installed_service_factory(self, mock_creds):
+        factory = MagicMock()
+        set_service_factory(factory)
+        try:
+            result = get_gcp_service(
+                "/path/creds.json", "user@example.com", "chat", "v1"
+            )
+        finally:
+            set_service_factory(None)
+
+        assert isinstance(result, RetryWrapper)
+        factory.build_service.assert_called_once_with("chat", "v1", "user@example.com")
+        mock_creds.assert_not_called()
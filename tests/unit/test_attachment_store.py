@@ -0,0 +1,96 @@
+"""Unit tests for the persistent attachment store."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from slack_chat_migrator.services.files.attachment_store import (
+    AttachmentStore,
+    StoredAttachment,
+    attachment_store_path,
+)
+
+
+def _entry(file_id: str, md5: str = "", drive_id: str = "") -> StoredAttachment:
+    return StoredAttachment(
+        slack_file_id=file_id,
+        md5=md5 or f"md5-{file_id}",
+        drive_file_id=drive_id or f"drive-{file_id}",
+        url=f"https://drive.google.com/file/d/{drive_id or file_id}/view",
+    )
+
+
+class TestAttachmentStorePath:
+    def test_shared_by_sibling_runs(self):
+        a = attachment_store_path("migration_logs/run_20240101_000000")
+        b = attachment_store_path("migration_logs/run_20240102_000000")
+        assert a == b == Path("migration_logs/.attachment_store.jsonl")
+
+
+class TestAttachmentStore:
+    """Tests for AttachmentStore."""
+
+    def test_lookup_by_file_id_and_md5(self):
+        store = AttachmentStore()
+        entry = _entry("F1", md5="abc")
+        store.add(entry)
+        assert store.get("F1") == entry
+        assert store.find_by_md5("abc") == entry
+        assert store.get("F2") is None
+        assert len(store) == 1
+
+    def test_round_trip_through_log(self, tmp_path):
+        path = tmp_path / "store.jsonl"
+        with AttachmentStore.load(path) as store:
+            store.add(_entry("F1"))
+            store.add(_entry("F2"))
+
+        reloaded = AttachmentStore.load(path)
+        assert reloaded.get("F1") == _entry("F1")
+        assert reloaded.get("F2") == _entry("F2")
+
+    def test_remove_appends_tombstone(self, tmp_path):
+        path = tmp_path / "store.jsonl"
+        with AttachmentStore.load(path) as store:
+            store.add(_entry("F1", md5="abc"))
+            store.remove("F1")
+            store.remove("F404")
+
+        assert len(path.read_text().splitlines()) == 2
+        reloaded = AttachmentStore.load(path)
+        assert reloaded.get("F1") is None
+        assert reloaded.find_by_md5("abc") is None
+
+    def test_later_entry_replaces_earlier(self, tmp_path):
+        path = tmp_path / "store.jsonl"
+        with AttachmentStore.load(path) as store:
+            store.add(_entry("F1", md5="old"))
+            store.add(_entry("F1", md5="new"))
+
+        reloaded = AttachmentStore.load(path)
+        assert reloaded.get("F1").md5 == "new"
+        assert reloaded.find_by_md5("old") is None
+
+    def test_malformed_lines_skipped(self, tmp_path):
+        path = tmp_path / "store.jsonl"
+        with AttachmentStore.load(path) as store:
+            store.add(_entry("F1"))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"slack_file_id": "F2", "md5"\n')
+            f.write('{"unexpected": 1}\n')
+
+        reloaded = AttachmentStore.load(path)
+        assert len(reloaded) == 1
+        assert reloaded.get("F1") is not None
+
+    def test_missing_file_is_empty(self, tmp_path):
+        store = AttachmentStore.load(tmp_path / "absent.jsonl")
+        assert len(store) == 0
+        assert not (tmp_path / "absent.jsonl").exists()
+
+    def test_sample_is_bounded(self):
+        store = AttachmentStore()
+        for i in range(10):
+            store.add(_entry(f"F{i}"))
+        assert len(store.sample(3)) == 3
+        assert len(store.sample(50)) == 10
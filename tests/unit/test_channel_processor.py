@@ -78,7 +78,9 @@ def _make_processor(
     state.context.current_channel = "general"
     state.context.current_space = None
     state.progress.migration_summary = _default_migration_summary()
-    state.context.output_dir = Path("/tmp/test_output")
+    state.context.output_dir = (
+        str(export_root / "_output") if export_root else "/tmp/test_output"
+    )
 
     return ChannelProcessor(
         ctx=ctx,
@@ -490,6 +492,60 @@ class TestProcessMessages:
         assert had_errors is False
         assert mock_send.call_count == 2
 
+    @patch(
+        "slack_chat_migrator.core.channel_processor.build_user_map_with_overrides",
+        return_value={"U1": "u1@example.com", "U2": "u2@example.com"},
+    )
+    @patch(
+        "slack_chat_migrator.core.channel_processor.send_message",
+        return_value=SendResult(message_name="spaces/S/messages/M1"),
+    )
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_warms_up_senders_and_reactors_before_sending(
+        self, mock_track, mock_send, _mock_map, tmp_path
+    ):
+        processor = _make_processor(export_root=tmp_path)
+        warm_up = processor.user_resolver.warm_up_delegates
+        warm_up.side_effect = lambda emails: mock_send.assert_not_called()
+
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps(
+                [
+                    {
+                        "type": "message",
+                        "user": "U1",
+                        "ts": "100.0",
+                        "reactions": [{"name": "+1", "users": ["U2", "U9"]}],
+                    }
+                ]
+            )
+        )
+
+        with patch.object(processor, "_discover_channel_resources"):
+            processor._process_messages(ch_dir, "spaces/S1", False)
+
+        warm_up.assert_called_once_with({"u1@example.com", "u2@example.com"})
+        assert mock_send.call_count == 1
+
+    @patch(
+        "slack_chat_migrator.core.channel_processor.build_user_map_with_overrides",
+        return_value={"U1": "u1@example.com"},
+    )
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_dry_run_skips_delegate_warm_up(self, mock_track, _mock_map, tmp_path):
+        processor = _make_processor(dry_run=True, export_root=tmp_path)
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps([{"type": "message", "user": "U1", "ts": "1.0"}])
+        )
+
+        processor._process_messages(ch_dir, "spaces/S1", False)
+
+        processor.user_resolver.warm_up_delegates.assert_not_called()
+
     @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
     def test_message_loading_failure_bad_json(self, mock_track, tmp_path):
         """Bad JSON files are skipped with a warning; valid files still process."""
@@ -600,6 +656,175 @@ class TestProcessMessages:
         assert had_errors is True
         assert "general" in processor.state.errors.high_failure_rate_channels
 
+    @patch(
+        "slack_chat_migrator.core.channel_processor.send_message",
+        return_value=SendResult(message_name="spaces/S/messages/M1"),
+    )
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_resume_skips_persisted_messages(self, mock_track, mock_send, tmp_path):
+        """Messages recorded in the processed index are not re-sent."""
+        processor = _make_processor(export_root=tmp_path)
+        processor.state.spaces.channel_to_space = {"general": "spaces/S1"}
+
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps(
+                [
+                    {"type": "message", "ts": "100.0", "text": "a"},
+                    {"type": "message", "ts": "200.0", "text": "b"},
+                ]
+            )
+        )
+
+        with patch.object(processor, "_discover_channel_resources"):
+            processor._process_messages(ch_dir, "spaces/S1", False)
+            assert mock_send.call_count == 2
+
+            mock_send.reset_mock()
+            processed, failed, _ = processor._process_messages(
+                ch_dir, "spaces/S1", False
+            )
+
+        assert mock_send.call_count == 0
+        assert processed == 2
+        assert failed == 0
+
+    @patch(
+        "slack_chat_migrator.core.channel_processor.send_message",
+        return_value=SendResult(message_name="spaces/S/messages/M1"),
+    )
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_resume_from_previous_run_directory(self, mock_track, mock_send, tmp_path):
+        """A later run with a fresh output directory skips earlier sends."""
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps(
+                [
+                    {"type": "message", "ts": "100.0", "text": "a"},
+                    {"type": "message", "ts": "200.0", "text": "b"},
+                ]
+            )
+        )
+        logs_dir = tmp_path / "migration_logs"
+
+        first = _make_processor(export_root=tmp_path)
+        first.state.context.output_dir = str(logs_dir / "run_1")
+        with patch.object(first, "_discover_channel_resources"):
+            first._process_messages(ch_dir, "spaces/S1", False)
+        assert mock_send.call_count == 2
+
+        mock_send.reset_mock()
+        second = _make_processor(export_root=tmp_path)
+        second.state.context.output_dir = str(logs_dir / "run_2")
+        with patch.object(second, "_discover_channel_resources"):
+            processed, failed, _ = second._process_messages(ch_dir, "spaces/S1", False)
+
+        assert mock_send.call_count == 0
+        assert processed == 2
+        assert failed == 0
+
+    @patch("slack_chat_migrator.core.channel_processor.send_message")
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_dry_run_does_not_persist_index(self, mock_track, mock_send, tmp_path):
+        processor = _make_processor(dry_run=True, export_root=tmp_path)
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps([{"type": "message", "ts": "100.0", "text": "a"}])
+        )
+        mock_send.return_value = SendResult(message_name="spaces/S1/messages/M1")
+
+        processor._process_messages(ch_dir, "spaces/S1", False)
+
+        assert not (tmp_path / ".processed").exists()
+
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_attachments_prefetched_before_send(self, mock_track, tmp_path):
+        """Files are scheduled for prefetch before their message is sent."""
+        processor = _make_processor(export_root=tmp_path)
+        prefetcher = processor.file_handler.prefetcher
+        processor.file_handler.is_known_attachment.side_effect = lambda file_id: (
+            file_id == "F_DONE"
+        )
+        events: list[str] = []
+        prefetcher.prefetch.side_effect = lambda f, ch: events.append(f["id"])
+
+        def fake_send(*args, **kwargs):
+            events.append(f"send:{args[6]['ts']}")
+            return SendResult(message_name="spaces/S1/messages/M1")
+
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps(
+                [
+                    {"type": "message", "ts": "100.0", "files": [{"id": "F1"}]},
+                    {"type": "message", "ts": "200.0", "files": [{"id": "F2"}]},
+                    {"type": "message", "ts": "300.0", "files": [{"id": "F_DONE"}]},
+                ]
+            )
+        )
+
+        with (
+            patch.object(processor, "_discover_channel_resources"),
+            patch(
+                "slack_chat_migrator.core.channel_processor.send_message",
+                side_effect=fake_send,
+            ),
+        ):
+            processor._process_messages(ch_dir, "spaces/S1", False)
+
+        assert events == ["F1", "F2", "send:100.0", "send:200.0", "send:300.0"]
+        prefetcher.discard.assert_called_once_with("general")
+
+    @patch("slack_chat_migrator.core.channel_processor.send_message")
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_dry_run_skips_prefetch(self, mock_track, mock_send, tmp_path):
+        processor = _make_processor(dry_run=True, export_root=tmp_path)
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps([{"type": "message", "ts": "100.0", "files": [{"id": "F1"}]}])
+        )
+        mock_send.return_value = SendResult(message_name="spaces/S1/messages/M1")
+
+        processor._process_messages(ch_dir, "spaces/S1", False)
+
+        processor.file_handler.prefetcher.prefetch.assert_not_called()
+
+    @patch("slack_chat_migrator.core.channel_processor.send_message")
+    @patch("slack_chat_migrator.core.channel_processor.track_message_stats")
+    def test_checks_reaction_flush_interval_on_every_message(
+        self, mock_track, mock_send, tmp_path
+    ):
+        """Queued reactions are flushed on time even when later messages have none."""
+        processor = _make_processor(export_root=tmp_path)
+        ch_dir = tmp_path / "general"
+        ch_dir.mkdir()
+        (ch_dir / "2024-01-01.json").write_text(
+            json.dumps(
+                [
+                    {"type": "message", "ts": "100.0", "text": "a"},
+                    {"type": "message", "ts": "200.0", "text": "b"},
+                    {"type": "message", "ts": "300.0", "text": "c"},
+                ]
+            )
+        )
+        mock_send.return_value = SendResult(message_name="spaces/S1/messages/M1")
+
+        with (
+            patch(
+                "slack_chat_migrator.core.channel_processor.ReactionAccumulator"
+            ) as mock_acc,
+            patch.object(processor, "_discover_channel_resources"),
+        ):
+            processor._process_messages(ch_dir, "spaces/S1", False)
+
+        assert mock_acc.return_value.flush_due.call_count == 3
+        mock_acc.return_value.flush.assert_called_once()
+
 
 # ---------------------------------------------------------------------------
 # _complete_import_mode
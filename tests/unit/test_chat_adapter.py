@@ -114,6 +114,18 @@ class TestCreateMessage:
         assert "messageReplyOption" not in kwargs
 
 
+class TestGetMessage:
+    def test_calls_get_with_name(self, adapter, mock_service):
+        mock_service.spaces().messages().get().execute.return_value = {
+            "name": "spaces/AAA/messages/M1"
+        }
+        result = adapter.get_message("spaces/AAA/messages/M1")
+        mock_service.spaces().messages().get.assert_called_with(
+            name="spaces/AAA/messages/M1"
+        )
+        assert result == {"name": "spaces/AAA/messages/M1"}
+
+
 class TestListMessages:
     def test_default_args(self, adapter, mock_service):
         adapter.list_messages("spaces/AAA")
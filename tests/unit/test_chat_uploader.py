@@ -1,6 +1,7 @@
 """Unit tests for the ChatFileUploader class."""
 
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -42,6 +43,18 @@ class TestGetCurrentChannel:
 
         assert uploader._get_current_channel() is None
 
+    def test_channel_is_per_thread(self):
+        uploader = _make_uploader()
+        uploader.current_channel = "general"
+        seen: list[str | None] = []
+
+        worker = threading.Thread(target=lambda: seen.append(uploader.current_channel))
+        worker.start()
+        worker.join()
+
+        assert seen == [None]
+        assert uploader.current_channel == "general"
+
 
 # ===========================================================================
 # is_suitable_for_direct_upload tests (can_upload_directly)
@@ -11,6 +11,8 @@ from slack_chat_migrator.core.checkpoint import (
     CheckpointData,
     clear_checkpoint,
     load_checkpoint,
+    mark_channel_finished,
+    mark_channel_started,
     save_checkpoint,
 )
 
@@ -206,3 +208,59 @@ class TestRoundTrip:
         assert "channel_b" in loaded.completed_channels
         assert loaded.completed_channels["channel_a"] == "100.0"
         assert loaded.completed_channels["channel_b"] == "200.0"
+
+
+class TestInProgressChannels:
+    """Tests for out-of-order channel completion tracking."""
+
+    def test_started_then_completed(self) -> None:
+        data = CheckpointData()
+        mark_channel_started(data, "general")
+        assert "general" in data.in_progress_channels
+
+        mark_channel_finished(data, "general", completed=True)
+        assert "general" not in data.in_progress_channels
+        assert "general" in data.completed_channels
+
+    def test_failed_channel_not_completed(self) -> None:
+        data = CheckpointData()
+        mark_channel_started(data, "general")
+        mark_channel_finished(data, "general", completed=False)
+
+        assert data.in_progress_channels == {}
+        assert "general" not in data.completed_channels
+
+    def test_out_of_order_completion(self) -> None:
+        data = CheckpointData()
+        for ch in ("a", "b", "c"):
+            mark_channel_started(data, ch)
+        mark_channel_finished(data, "c", completed=True)
+        mark_channel_finished(data, "a", completed=True)
+
+        assert set(data.completed_channels) == {"a", "c"}
+        assert set(data.in_progress_channels) == {"b"}
+
+    def test_in_progress_round_trip(self, tmp_path: Path) -> None:
+        cp_path = tmp_path / "checkpoint.json"
+        data = CheckpointData()
+        mark_channel_started(data, "random")
+        save_checkpoint(cp_path, data)
+
+        loaded = load_checkpoint(cp_path)
+        assert loaded is not None
+        assert set(loaded.in_progress_channels) == {"random"}
+
+    def test_missing_in_progress_defaults_empty(self, tmp_path: Path) -> None:
+        cp_path = tmp_path / "checkpoint.json"
+        cp_path.write_text(
+            json.dumps(
+                {
+                    "schema_version": CHECKPOINT_SCHEMA_VERSION,
+                    "completed_channels": {"general": "2024-01-01T00:00:00"},
+                }
+            )
+        )
+
+        loaded = load_checkpoint(cp_path)
+        assert loaded is not None
+        assert loaded.in_progress_channels == {}
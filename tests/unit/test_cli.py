@@ -30,6 +30,7 @@ class TestCLIGroup:
             "cleanup",
             "init",
             "setup",
+            "export",
         }
         assert set(cli.commands.keys()) == expected
 
@@ -606,6 +607,97 @@ class TestMigrateResumeFlag:
         assert args.update_mode is True
 
 
+class TestMigrateLowMemory:
+    """Tests for --low_memory."""
+
+    @patch("slack_chat_migrator.cli.migrate_cmd.show_security_warning")
+    @patch("slack_chat_migrator.cli.migrate_cmd.create_migration_output_directory")
+    @patch("slack_chat_migrator.cli.migrate_cmd.setup_logger")
+    @patch("slack_chat_migrator.cli.migrate_cmd.MigrationOrchestrator")
+    def test_passed_to_orchestrator(
+        self, mock_orch_cls, mock_logger, mock_outdir, mock_warn
+    ):
+        mock_outdir.return_value = "/tmp/fake"
+        mock_orch_cls.return_value = MagicMock()
+
+        result = CliRunner().invoke(
+            cli,
+            ["migrate", "--export_path", "fake", "--dry_run", "--low_memory"],
+        )
+        assert result.exit_code == 0, result.output
+        assert mock_orch_cls.call_args[0][0].low_memory is True
+
+    def test_requires_dry_run(self):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "migrate",
+                "--creds_path",
+                "fake.json",
+                "--export_path",
+                "fake",
+                "--workspace_admin",
+                "a@b.com",
+                "--low_memory",
+            ],
+        )
+        assert result.exit_code == 2
+        assert "--low_memory requires --dry_run" in result.output
+
+
+class TestMigrateMetricsPort:
+    """Tests for --metrics_port."""
+
+    @patch("slack_chat_migrator.cli.migrate_cmd.show_security_warning")
+    @patch("slack_chat_migrator.cli.migrate_cmd.create_migration_output_directory")
+    @patch("slack_chat_migrator.cli.migrate_cmd.setup_logger")
+    @patch("slack_chat_migrator.cli.migrate_cmd.MigrationOrchestrator")
+    def test_port_passed_to_orchestrator(
+        self, mock_orch_cls, mock_logger, mock_outdir, mock_warn
+    ):
+        mock_outdir.return_value = "/tmp/fake"
+        mock_orch_cls.return_value = MagicMock()
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "migrate",
+                "--creds_path",
+                "fake.json",
+                "--export_path",
+                "fake",
+                "--workspace_admin",
+                "a@b.com",
+                "--metrics_port",
+                "9464",
+            ],
+        )
+        assert result.exit_code == 0
+        assert mock_orch_cls.call_args[0][0].metrics_port == 9464
+
+    def test_exporter_not_started_without_port(self):
+        from types import SimpleNamespace
+
+        from slack_chat_migrator.cli.migrate_cmd import MigrationOrchestrator
+        from slack_chat_migrator.core.progress import ProgressTracker
+
+        orchestrator = MigrationOrchestrator(SimpleNamespace(metrics_port=None))
+        assert orchestrator._start_metrics_exporter(ProgressTracker(), 1) is None
+
+    def test_bind_failure_does_not_abort(self):
+        from types import SimpleNamespace
+
+        from slack_chat_migrator.cli.migrate_cmd import MigrationOrchestrator
+        from slack_chat_migrator.core.progress import ProgressTracker
+
+        orchestrator = MigrationOrchestrator(SimpleNamespace(metrics_port=9464))
+        with patch(
+            "slack_chat_migrator.cli.metrics_exporter.ThreadingHTTPServer",
+            side_effect=OSError("Address already in use"),
+        ):
+            assert orchestrator._start_metrics_exporter(ProgressTracker(), 1) is None
+
+
 class TestMigrateCompleteFlag:
     """Tests for --complete flag."""
 
@@ -44,8 +44,7 @@ def _setup_list_response(chat, pages):
 class TestDiscoverExistingSpaces:
     """Tests for discover_existing_spaces()."""
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_single_space_found(self, mock_sleep):
+    def test_single_space_found(self):
         """A single matching space is discovered and mapped correctly."""
         chat = MagicMock()
         state = MigrationState()
@@ -69,8 +68,7 @@ class TestDiscoverExistingSpaces:
         assert duplicate_spaces == {}
         assert state.spaces.channel_id_to_space_id["C001"] == "abc123"
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_empty_response(self, mock_sleep):
+    def test_empty_response(self):
         """No spaces returned from the API."""
         chat = MagicMock()
         state = MigrationState()
@@ -81,8 +79,7 @@ class TestDiscoverExistingSpaces:
         assert space_mappings == {}
         assert duplicate_spaces == {}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_no_spaces_key(self, mock_sleep):
+    def test_no_spaces_key(self):
         """API response with no 'spaces' key at all."""
         chat = MagicMock()
         state = MigrationState()
@@ -93,8 +90,7 @@ class TestDiscoverExistingSpaces:
         assert space_mappings == {}
         assert duplicate_spaces == {}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_non_matching_spaces_ignored(self, mock_sleep):
+    def test_non_matching_spaces_ignored(self):
         """Spaces without the 'Slack #' prefix are ignored."""
         chat = MagicMock()
         state = MigrationState()
@@ -115,8 +111,7 @@ class TestDiscoverExistingSpaces:
         assert space_mappings == {}
         assert duplicate_spaces == {}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_pagination_two_pages(self, mock_sleep):
+    def test_pagination_two_pages(self):
         """Spaces spread across two pages are both discovered."""
         chat = MagicMock()
         state = MigrationState()
@@ -144,11 +139,8 @@ class TestDiscoverExistingSpaces:
         }
         assert duplicate_spaces == {}
         assert state.spaces.channel_id_to_space_id == {"C001": "abc", "C002": "def"}
-        # Verify sleep was called between pages
-        mock_sleep.assert_called_once_with(0.2)
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_pagination_three_pages(self, mock_sleep):
+    def test_pagination_three_pages(self):
         """Three pages of results are all processed."""
         chat = MagicMock()
         state = MigrationState()
@@ -173,10 +165,9 @@ class TestDiscoverExistingSpaces:
         space_mappings, _ = discover_existing_spaces(chat, channel_name_to_id, state)
 
         assert len(space_mappings) == 3
-        assert mock_sleep.call_count == 2
+        assert chat.list_spaces.call_count == 3
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_duplicate_spaces_detected(self, mock_sleep):
+    def test_duplicate_spaces_detected(self):
         """Multiple spaces with the same channel name are flagged as duplicates."""
         chat = MagicMock()
         state = MigrationState()
@@ -223,8 +214,7 @@ class TestDiscoverExistingSpaces:
         # Channel ID mapping should be removed for ambiguous channels
         assert "C001" not in state.spaces.channel_id_to_space_id
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_duplicate_spaces_member_count(self, mock_sleep):
+    def test_duplicate_spaces_member_count(self):
         """Member count is populated for duplicate spaces."""
         chat = MagicMock()
         state = MigrationState()
@@ -257,8 +247,7 @@ class TestDiscoverExistingSpaces:
         for space_info in duplicate_spaces["general"]:
             assert space_info["member_count"] == "1+"
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_duplicate_spaces_member_fetch_error(self, mock_sleep):
+    def test_duplicate_spaces_member_fetch_error(self):
         """Errors fetching member counts for duplicates are handled gracefully."""
         chat = MagicMock()
         state = MigrationState()
@@ -289,8 +278,7 @@ class TestDiscoverExistingSpaces:
         for space_info in duplicate_spaces["general"]:
             assert space_info["member_count"] == 0
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_http_error_handled(self, mock_sleep):
+    def test_http_error_handled(self):
         """HttpError from the API is caught and returns empty results."""
         chat = MagicMock()
         state = MigrationState()
@@ -305,8 +293,7 @@ class TestDiscoverExistingSpaces:
         assert space_mappings == {}
         assert duplicate_spaces == {}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_channel_id_to_space_id_stays_empty_with_no_matches(self, mock_sleep):
+    def test_channel_id_to_space_id_stays_empty_with_no_matches(self):
         """channel_id_to_space_id remains empty when no spaces match."""
         chat = MagicMock()
         state = MigrationState()
@@ -316,8 +303,7 @@ class TestDiscoverExistingSpaces:
 
         assert state.spaces.channel_id_to_space_id == {}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_channel_id_to_space_id_preserved_when_exists(self, mock_sleep):
+    def test_channel_id_to_space_id_preserved_when_exists(self):
         """Existing channel_id_to_space_id entries are preserved."""
         chat = MagicMock()
         state = MigrationState()
@@ -328,8 +314,7 @@ class TestDiscoverExistingSpaces:
 
         assert state.spaces.channel_id_to_space_id["C999"] == "existing"
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_space_without_display_name_ignored(self, mock_sleep):
+    def test_space_without_display_name_ignored(self):
         """Spaces with empty or missing displayName are skipped."""
         chat = MagicMock()
         state = MigrationState()
@@ -350,8 +335,7 @@ class TestDiscoverExistingSpaces:
         assert space_mappings == {}
         assert duplicate_spaces == {}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_space_with_prefix_only_ignored(self, mock_sleep):
+    def test_space_with_prefix_only_ignored(self):
         """A space named exactly 'Slack #' with no channel name after prefix is ignored."""
         chat = MagicMock()
         state = MigrationState()
@@ -369,8 +353,7 @@ class TestDiscoverExistingSpaces:
         # "Slack #" with nothing after it -> channel_name is empty string -> skipped
         assert space_mappings == {}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_channel_without_id_mapping(self, mock_sleep):
+    def test_channel_without_id_mapping(self):
         """Space is mapped by name even when channel has no ID in channel_name_to_id."""
         chat = MagicMock()
         state = MigrationState()
@@ -387,8 +370,7 @@ class TestDiscoverExistingSpaces:
 
         assert space_mappings == {"orphan": "spaces/xyz"}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_mixed_matching_and_nonmatching_spaces(self, mock_sleep):
+    def test_mixed_matching_and_nonmatching_spaces(self):
         """Only spaces with the migration prefix are included in results."""
         chat = MagicMock()
         state = MigrationState()
@@ -410,8 +392,7 @@ class TestDiscoverExistingSpaces:
 
         assert space_mappings == {"general": "spaces/gen"}
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_space_id_extraction_from_name(self, mock_sleep):
+    def test_space_id_extraction_from_name(self):
         """space_id is correctly extracted from 'spaces/{id}' format."""
         chat = MagicMock()
         state = MigrationState()
@@ -431,8 +412,7 @@ class TestDiscoverExistingSpaces:
 
         assert state.spaces.channel_id_to_space_id["C010"] == "AAAA1234"
 
-    @patch("slack_chat_migrator.services.spaces.discovery.time.sleep")
-    def test_duplicate_channel_id_first_occurrence_wins_in_pagination(self, mock_sleep):
+    def test_duplicate_channel_id_first_occurrence_wins_in_pagination(self):
         """When the same channel appears on different pages, first occurrence sets the ID mapping."""
         chat = MagicMock()
         state = MigrationState()
@@ -0,0 +1,86 @@
+"""Unit tests for the discovery-document cache."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import pytest
+from googleapiclient import discovery_cache
+
+from slack_chat_migrator.utils.discovery_docs import (
+    build_service,
+    clear_discovery_documents,
+    get_discovery_document,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_documents():
+    clear_discovery_documents()
+    yield
+    clear_discovery_documents()
+
+
+class TestGetDiscoveryDocument:
+    """Tests for get_discovery_document()."""
+
+    def test_loaded_once(self):
+        with patch(
+            "slack_chat_migrator.utils.discovery_docs.discovery_cache.get_static_doc",
+            wraps=discovery_cache.get_static_doc,
+        ) as get_static_doc:
+            first = get_discovery_document("chat", "v1")
+            second = get_discovery_document("chat", "v1")
+        assert first is second
+        assert first["name"] == "chat"
+        get_static_doc.assert_called_once_with("chat", "v1")
+
+    def test_unknown_api_returns_none(self):
+        assert get_discovery_document("no-such-api", "v0") is None
+
+
+class TestBuildService:
+    """Tests for build_service()."""
+
+    def test_builds_working_requests(self):
+        service = build_service("chat", "v1", http=httplib2.Http())
+        request = (
+            service.spaces().messages().create(parent="spaces/S", body={"text": "hi"})
+        )
+        assert request.methodId == "chat.spaces.messages.create"
+        assert request.uri.startswith(
+            "https://chat.googleapis.com/v1/spaces/S/messages"
+        )
+
+    def test_media_upload_methods(self):
+        service = build_service("drive", "v3", http=httplib2.Http())
+        request = service.files().create(body={"name": "f"}, fields="id")
+        assert request.methodId == "drive.files.create"
+
+    def test_falls_back_to_build_without_bundled_document(self):
+        http = MagicMock()
+        with patch("slack_chat_migrator.utils.discovery_docs.build") as mock_build:
+            build_service("no-such-api", "v0", http=http)
+        mock_build.assert_called_once_with(
+            "no-such-api", "v0", http=http, cache_discovery=False
+        )
+
+    def test_concurrent_builds(self):
+        errors: list[BaseException] = []
+
+        def worker() -> None:
+            try:
+                for _ in range(20):
+                    service = build_service("chat", "v1", http=httplib2.Http())
+                    service.spaces().members().list(parent="spaces/S")
+            except BaseException as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
@@ -1,6 +1,7 @@
 """Unit tests for the DriveFileUploader class."""
 
 import hashlib
+import threading
 from unittest.mock import MagicMock, patch
 
 from googleapiclient.errors import HttpError
@@ -105,6 +106,18 @@ class TestGetCurrentChannel:
 
         assert uploader._get_current_channel() is None
 
+    def test_channel_is_per_thread(self):
+        uploader = _make_uploader()
+        uploader.current_channel = "general"
+        seen: list[str | None] = []
+
+        worker = threading.Thread(target=lambda: seen.append(uploader.current_channel))
+        worker.start()
+        worker.join()
+
+        assert seen == [None]
+        assert uploader.current_channel == "general"
+
 
 # -------------------------------------------------------------------
 # TestPreCacheFolderFileHashes
@@ -332,6 +345,29 @@ class TestUploadFileToDrive:
 
         assert file_id == "new_file_id"
         assert url == "https://new_link"
+        assert uploader.last_upload_reused is False
+
+    @patch("slack_chat_migrator.services.drive.drive_uploader.MediaFileUpload")
+    def test_known_hash_skips_rehashing(self, mock_media_cls, tmp_path):
+        """A caller-supplied MD5 is used instead of re-reading the file."""
+        uploader = _make_uploader()
+        uploader.folders_pre_cached.add("folder1")
+        uploader.file_hash_cache["known"] = ("existing_id", "https://existing")
+        uploader.drive_service.get_file.return_value = {
+            "id": "existing_id",
+            "webViewLink": "https://existing",
+        }
+
+        test_file = tmp_path / "upload.txt"
+        test_file.write_bytes(b"content")
+
+        with patch.object(uploader, "_calculate_file_hash") as mock_hash:
+            file_id, _url = uploader.upload_file_to_drive(
+                str(test_file), "upload.txt", "folder1", file_hash="known"
+            )
+
+        mock_hash.assert_not_called()
+        assert file_id == "existing_id"
 
     @patch("slack_chat_migrator.services.drive.drive_uploader.MediaFileUpload")
     def test_http_error_during_upload(self, mock_media_cls, tmp_path):
@@ -384,6 +420,7 @@ class TestUploadFileToDrive:
 
         assert file_id == "existing_id"
         assert url == "https://existing_link"
+        assert uploader.last_upload_reused is True
         # create should NOT have been called
         uploader.drive_service.create_file.assert_not_called()
 
@@ -201,6 +201,13 @@ class TestDryRunMessages:
         r2 = msgs.create(parent="spaces/abc", body={"text": "b"}).execute()
         assert r1["name"] != r2["name"]
 
+    def test_get_returns_message_with_thread(self):
+        result = (
+            self._make_messages().get(name="spaces/abc/messages/client-1").execute()
+        )
+        assert result["name"] == "spaces/abc/messages/client-1"
+        assert result["thread"]["name"] == "spaces/abc/threads/dry-run-client-1"
+
     def test_list_returns_empty_messages(self):
         result = self._make_messages().list(parent="spaces/abc").execute()
         assert result["messages"] == []
@@ -208,6 +215,21 @@ class TestDryRunMessages:
     def test_reactions_returns_dry_run_reactions(self):
         assert isinstance(self._make_messages().reactions(), DryRunReactions)
 
+    def test_captured_calls_keep_most_recent(self):
+        msgs = DryRunMessages(MigrationState(), capture_limit=3)
+        for i in range(5):
+            msgs.create(parent="spaces/S", body={"text": str(i)}).execute()
+        assert [c["body"]["text"] for c in msgs.captured_calls] == ["2", "3", "4"]
+
+    def test_captured_calls_sampled(self):
+        msgs = DryRunMessages(MigrationState(), sample_size=3)
+        for i in range(100):
+            msgs.create(parent="spaces/S", body={"text": str(i)}).execute()
+        assert len(msgs.captured_calls) == 3
+        assert {c["body"]["text"] for c in msgs.captured_calls} <= {
+            str(i) for i in range(100)
+        }
+
 
 # ===================================================================
 # Reactions
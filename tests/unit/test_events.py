@@ -0,0 +1,152 @@
+"""Unit tests for the JSONL event stream."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from slack_chat_migrator.utils.api import RetryWrapper
+from slack_chat_migrator.utils.events import (
+    EVENTS_FILENAME,
+    events_enabled,
+    note_retry,
+    record_event,
+    start_event_stream,
+    stop_event_stream,
+    timed_event,
+)
+
+
+@pytest.fixture(autouse=True)
+def _stop_stream():
+    yield
+    stop_event_stream()
+
+
+def _read_events(output_dir) -> list[dict]:
+    stop_event_stream()
+    path = output_dir / EVENTS_FILENAME
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class _FakeRequest:
+    """Minimal stand-in for googleapiclient's HttpRequest."""
+
+    methodId = "chat.spaces.messages.create"
+
+    def __init__(self, outcomes: list) -> None:
+        self.body = '{"text": "hello"}'
+        self._outcomes = outcomes
+
+    def execute(self):
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class _FakeResource:
+    def __init__(self, request: _FakeRequest) -> None:
+        self._request = request
+
+    def create(self):
+        return self._request
+
+
+def _http_error(status: int) -> HttpError:
+    resp = httplib2.Response({"status": status})
+    resp.reason = "error"
+    return HttpError(resp, b"error body")
+
+
+class TestEventStream:
+    """Tests for starting, writing and stopping the stream."""
+
+    def test_disabled_by_default(self, tmp_path):
+        assert not events_enabled()
+        record_event("message", status="sent")
+        with timed_event("message") as event:
+            event.update(status="sent")
+        assert not event.enabled
+        assert not (tmp_path / EVENTS_FILENAME).exists()
+
+    def test_records_are_compact_json_lines(self, tmp_path):
+        path = start_event_stream(tmp_path)
+        assert path == tmp_path / EVENTS_FILENAME
+        assert events_enabled()
+        record_event("file", status="drive", bytes=10)
+        record_event("file", status="failed", bytes=0)
+
+        events = _read_events(tmp_path)
+        assert [e["status"] for e in events] == ["drive", "failed"]
+        assert events[0]["event"] == "file"
+        assert events[0]["bytes"] == 10
+        assert " " not in path.read_text().splitlines()[0]
+
+    def test_stop_flushes_and_disables(self, tmp_path):
+        start_event_stream(tmp_path)
+        record_event("message", status="sent")
+        stop_event_stream()
+        assert not events_enabled()
+        assert len((tmp_path / EVENTS_FILENAME).read_text().splitlines()) == 1
+
+
+class TestTimedEvent:
+    """Tests for timed_event()."""
+
+    def test_records_latency_status_and_retries(self, tmp_path):
+        start_event_stream(tmp_path)
+        with timed_event("message", ts="1.0") as event:
+            note_retry()
+            note_retry()
+            event.update(status="sent")
+
+        (recorded,) = _read_events(tmp_path)
+        assert recorded["event"] == "message"
+        assert recorded["ts"] == "1.0"
+        assert recorded["status"] == "sent"
+        assert recorded["retries"] == 2
+        assert recorded["latency_ms"] >= 0
+
+    def test_exception_marks_error(self, tmp_path):
+        start_event_stream(tmp_path)
+        with pytest.raises(ValueError), timed_event("file"):
+            raise ValueError("boom")
+        assert _read_events(tmp_path)[0]["status"] == "error"
+
+
+class TestApiCallEvents:
+    """RetryWrapper emits one api_call event per execute()."""
+
+    def test_success(self, tmp_path):
+        start_event_stream(tmp_path)
+        request = _FakeRequest([{"name": "spaces/S/messages/M"}])
+        RetryWrapper(_FakeResource(request)).create().execute()
+
+        (recorded,) = _read_events(tmp_path)
+        assert recorded["event"] == "api_call"
+        assert recorded["endpoint"] == "chat.spaces.messages.create"
+        assert recorded["bytes"] == len(request.body)
+        assert recorded["retries"] == 0
+        assert recorded["status"] == 200
+
+    @patch("slack_chat_migrator.utils.api.time.sleep")
+    def test_retries_counted(self, _sleep, tmp_path):
+        start_event_stream(tmp_path)
+        request = _FakeRequest([_http_error(503), _http_error(429), {"ok": True}])
+        RetryWrapper(_FakeResource(request)).create().execute()
+
+        (recorded,) = _read_events(tmp_path)
+        assert recorded["retries"] == 2
+        assert recorded["status"] == 200
+
+    def test_client_error_status_recorded(self, tmp_path):
+        start_event_stream(tmp_path)
+        request = _FakeRequest([_http_error(404)])
+        with pytest.raises(HttpError):
+            RetryWrapper(_FakeResource(request)).create().execute()
+        assert _read_events(tmp_path)[0]["status"] == 404
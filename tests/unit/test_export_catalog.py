@@ -0,0 +1,205 @@
+"""Unit tests for the pre-indexed export catalog."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from slack_chat_migrator.cli.commands import cli
+from slack_chat_migrator.services.export_catalog import (
+    CATALOG_FILENAME,
+    ExportCatalog,
+    scan_channel,
+)
+from slack_chat_migrator.services.messages.message_stream import ChannelMessageStream
+
+
+def _write_day(ch_dir: Path, day: str, msgs: list[dict]) -> Path:
+    ch_dir.mkdir(parents=True, exist_ok=True)
+    path = ch_dir / f"{day}.json"
+    path.write_text(json.dumps(msgs), encoding="utf-8")
+    return path
+
+
+def _make_channel(export_root: Path) -> Path:
+    ch_dir = export_root / "general"
+    _write_day(
+        ch_dir,
+        "2024-01-01",
+        [
+            {
+                "type": "message",
+                "subtype": "channel_join",
+                "user": "U1",
+                "ts": "1704067200.000100",
+            },
+            {
+                "type": "message",
+                "user": "U1",
+                "ts": "1704067300.000100",
+                "thread_ts": "1704067300.000100",
+                "files": [{"id": "F1"}, {"id": "F2"}],
+            },
+            {
+                "type": "message",
+                "user": "U2",
+                "ts": "1704067400.000100",
+                "reactions": [
+                    {"name": "tada", "users": ["U1", "U4"]},
+                    {"name": "eyes", "users": ["U4"]},
+                ],
+            },
+        ],
+    )
+    _write_day(
+        ch_dir,
+        "2024-01-02",
+        [
+            # Thread reply repeated in the next day's file
+            {"type": "message", "user": "U2", "ts": "1704067400.000100"},
+            {
+                "type": "message",
+                "subtype": "channel_leave",
+                "user": "U2",
+                "ts": "1704153600.000100",
+            },
+            {"type": "message", "user": "U3", "files": [{"id": "F1"}]},
+        ],
+    )
+    return ch_dir
+
+
+class TestScanChannel:
+    """Tests for scan_channel()."""
+
+    def test_counts_and_references(self, tmp_path):
+        summary = scan_channel(_make_channel(tmp_path), "general")
+        assert summary.message_count == 6
+        assert summary.unique_message_count == 4
+        assert summary.first_ts == "1704067200.000100"
+        assert summary.last_ts == "1704153600.000100"
+        assert summary.users == ["U1", "U2", "U3"]
+        assert summary.reactors == ["U1", "U4"]
+        assert summary.file_count == 3
+        assert summary.file_ids == ["F1", "F2"]
+        assert summary.thread_roots == ["1704067300.000100"]
+
+    def test_unique_count_matches_send_stream(self, tmp_path):
+        ch_dir = _make_channel(tmp_path)
+        stream = ChannelMessageStream(ch_dir, "general")
+        assert scan_channel(ch_dir, "general").unique_message_count == (
+            stream.count_messages()
+        )
+
+    def test_membership_history(self, tmp_path):
+        membership = scan_channel(_make_channel(tmp_path), "general").membership
+        assert membership["U1"]["join_time"] is not None
+        assert membership["U1"]["active"] is True
+        assert membership["U2"]["leave_time"] is not None
+        assert membership["U2"]["active"] is False
+        # Messages without a ts carry no timing information
+        assert "U3" not in membership
+
+    def test_unreadable_file_skipped(self, tmp_path):
+        ch_dir = _make_channel(tmp_path)
+        (ch_dir / "2024-01-03.json").write_text("NOT JSON")
+        assert scan_channel(ch_dir, "general").unique_message_count == 4
+
+    def test_missing_channel_is_empty(self, tmp_path):
+        summary = scan_channel(tmp_path / "absent", "absent")
+        assert summary.message_count == 0
+        assert summary.first_ts is None
+
+
+class TestExportCatalog:
+    """Tests for ExportCatalog."""
+
+    def test_round_trip(self, tmp_path):
+        _make_channel(tmp_path)
+        path = ExportCatalog(tmp_path).build(["general"]).save()
+        assert path == tmp_path / CATALOG_FILENAME
+
+        loaded = ExportCatalog.load(tmp_path)
+        assert "general" in loaded
+        assert loaded.channel("general") == scan_channel(
+            tmp_path / "general", "general"
+        )
+
+    def test_fresh_entry_not_rescanned(self, tmp_path, monkeypatch):
+        _make_channel(tmp_path)
+        ExportCatalog(tmp_path).build(["general"]).save()
+
+        def fail(*args):
+            raise AssertionError("channel was re-parsed")
+
+        monkeypatch.setattr(
+            "slack_chat_migrator.services.export_catalog.scan_channel", fail
+        )
+        assert ExportCatalog.load(tmp_path).channel("general").message_count == 6
+
+    def test_changed_files_rescanned(self, tmp_path):
+        ch_dir = _make_channel(tmp_path)
+        ExportCatalog(tmp_path).build(["general"]).save()
+
+        day = _write_day(
+            ch_dir, "2024-01-03", [{"type": "message", "ts": "1704240000.000100"}]
+        )
+        os.utime(day, ns=(1, 1))
+        summary = ExportCatalog.load(tmp_path).channel("general")
+        assert summary.unique_message_count == 5
+        assert summary.last_ts == "1704240000.000100"
+
+    def test_unsupported_catalog_ignored(self, tmp_path):
+        _make_channel(tmp_path)
+        (tmp_path / CATALOG_FILENAME).write_text(
+            json.dumps({"schema_version": 999, "channels": {}})
+        )
+        catalog = ExportCatalog.load(tmp_path)
+        assert "general" not in catalog
+        assert catalog.channel("general").message_count == 6
+
+    def test_membership_snapshot_is_independent(self, tmp_path):
+        _make_channel(tmp_path)
+        summary = ExportCatalog(tmp_path).channel("general")
+        snapshot = summary.membership_snapshot()
+        snapshot["U1"]["join_time"] = "changed"
+        assert summary.membership["U1"]["join_time"] != "changed"
+
+
+class TestExportIndexCommand:
+    """Tests for ``export index``."""
+
+    def test_writes_catalog(self, tmp_path):
+        _make_channel(tmp_path)
+        result = CliRunner().invoke(
+            cli, ["export", "index", "--export_path", str(tmp_path)]
+        )
+        assert result.exit_code == 0, result.output
+        assert "Export indexed" in result.output
+        data = json.loads((tmp_path / CATALOG_FILENAME).read_text())
+        assert data["channels"]["general"]["message_count"] == 6
+
+    def test_output_option_removed(self, tmp_path):
+        _make_channel(tmp_path)
+        result = CliRunner().invoke(
+            cli,
+            [
+                "export",
+                "index",
+                "--export_path",
+                str(tmp_path),
+                "--output",
+                str(tmp_path / "catalog.json"),
+            ],
+        )
+        assert result.exit_code == 2
+        assert not (tmp_path / "catalog.json").exists()
+
+    def test_invalid_export_path(self, tmp_path):
+        result = CliRunner().invoke(
+            cli, ["export", "index", "--export_path", str(tmp_path / "missing")]
+        )
+        assert result.exit_code == 1
@@ -0,0 +1,188 @@
+"""Unit tests for the synthetic Slack export generator."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from slack_chat_migrator.cli.commands import cli
+from slack_chat_migrator.services.export_catalog import scan_channel
+from slack_chat_migrator.services.export_generator import (
+    ExportSpec,
+    _split_evenly,
+    generate_export,
+)
+from slack_chat_migrator.services.export_inspector import ExportInspector
+
+_SPEC = ExportSpec(users=30, channels=6, messages=600, days=10, file_ratio=0.1)
+
+
+def _tree(root: Path) -> dict[str, bytes]:
+    return {
+        str(p.relative_to(root)): p.read_bytes() for p in sorted(root.rglob("*.json"))
+    }
+
+
+def _messages(root: Path) -> list[dict]:
+    return [
+        m
+        for p in sorted(root.glob("*/*.json"))
+        for m in json.loads(p.read_text(encoding="utf-8"))
+    ]
+
+
+@pytest.fixture(scope="module")
+def generated(tmp_path_factory):
+    root = tmp_path_factory.mktemp("export")
+    return generate_export(_SPEC, root)
+
+
+class TestSplitEvenly:
+    """Tests for _split_evenly()."""
+
+    def test_parts_sum_to_total(self):
+        parts = _split_evenly(1000, [1.0, 0.5, 0.333, 0.25])
+        assert sum(parts) == 1000
+        assert parts == sorted(parts, reverse=True)
+
+    def test_minimum_per_part(self):
+        assert min(_split_evenly(100, [1.0] + [1e-9] * 9, minimum=1)) == 1
+
+    def test_minimum_capped_by_total(self):
+        assert _split_evenly(2, [1.0, 1.0, 1.0], minimum=1) == [1, 1, 0]
+
+
+class TestExportSpec:
+    """Tests for ExportSpec validation."""
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"users": 1}, {"channels": 0}, {"file_ratio": 1.5}, {"reaction_density": -1}],
+    )
+    def test_rejects_invalid(self, kwargs):
+        with pytest.raises(ValueError):
+            ExportSpec(**kwargs)
+
+
+class TestGenerateExport:
+    """Tests for generate_export()."""
+
+    def test_layout_passes_inspection(self, generated):
+        inspector = ExportInspector(generated.root)
+        assert inspector.get_structure_issues() == []
+        assert inspector.get_channel_count() == 6
+        assert inspector.get_user_count() == 30
+        assert inspector.get_total_file_count() == generated.files
+
+    def test_message_counts(self, generated):
+        assert generated.messages == 600
+        assert sum(generated.channel_messages.values()) == 600
+        assert min(generated.channel_messages.values()) >= 1
+        regular = [m for m in _messages(generated.root) if m.get("subtype") is None]
+        bot = [m for m in _messages(generated.root) if m.get("bot_id")]
+        assert len(regular) + len(bot) == 600
+
+    def test_deterministic(self, generated, tmp_path):
+        again = generate_export(_SPEC, tmp_path / "again")
+        assert _tree(again.root) == _tree(generated.root)
+
+    def test_seed_changes_output(self, generated, tmp_path):
+        spec = ExportSpec(**{**_SPEC.__dict__, "seed": 1})
+        other = generate_export(spec, tmp_path / "other")
+        assert _tree(other.root) != _tree(generated.root)
+
+    def test_threads_follow_their_parent(self, generated):
+        messages = _messages(generated.root)
+        by_ts = {m["ts"]: m for m in messages}
+        replies = [m for m in messages if m.get("thread_ts") not in (None, m["ts"])]
+        assert replies
+        for reply in replies:
+            parent = by_ts[reply["thread_ts"]]
+            assert float(parent["ts"]) < float(reply["ts"])
+            assert reply["ts"] in {r["ts"] for r in parent["replies"]}
+        assert generated.threads == sum(
+            1 for m in messages if m.get("thread_ts") == m["ts"]
+        )
+
+    def test_reactions_files_and_edits(self, generated):
+        messages = _messages(generated.root)
+        reactions = sum(
+            len(r["users"]) for m in messages for r in m.get("reactions", [])
+        )
+        files = [f for m in messages for f in m.get("files", [])]
+        assert reactions == generated.reactions > 0
+        assert len(files) == generated.files > 0
+        assert len({f["id"] for f in files}) == len(files)
+        assert all(f["url_private_download"] and f["size"] > 0 for f in files)
+        assert sum(1 for m in messages if "edited" in m) == generated.edits > 0
+
+    def test_catalog_sees_authors_and_reactors(self, generated):
+        users = json.loads((generated.root / "users.json").read_text())
+        channels = json.loads((generated.root / "channels.json").read_text())
+        user_ids = {u["id"] for u in users}
+        for channel in channels:
+            summary = scan_channel(generated.root / channel["name"], channel["name"])
+            assert set(summary.users) <= set(channel["members"])
+            assert set(summary.reactors) <= user_ids
+
+    def test_general_has_everyone(self, generated):
+        channels = json.loads((generated.root / "channels.json").read_text())
+        general = next(c for c in channels if c["is_general"])
+        assert general["name"] == "general"
+        assert len(general["members"]) == 30
+
+    def test_users_have_domain_emails(self, generated):
+        users = json.loads((generated.root / "users.json").read_text())
+        humans = [u for u in users if not u["is_bot"]]
+        assert all(u["profile"]["email"].endswith("@example.com") for u in humans)
+        assert len({u["profile"]["email"] for u in humans}) == len(humans)
+
+
+class TestExportGenerateCommand:
+    """Tests for ``export generate``."""
+
+    def test_writes_export(self, tmp_path):
+        output = tmp_path / "synthetic"
+        result = CliRunner().invoke(
+            cli,
+            [
+                "export",
+                "generate",
+                "--output",
+                str(output),
+                "--channels",
+                "3",
+                "--messages",
+                "50",
+                "--seed",
+                "7",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "Export generated" in result.output
+        assert ExportInspector(output).get_channel_count() == 3
+
+    def test_refuses_non_empty_output(self, tmp_path):
+        (tmp_path / "existing.txt").write_text("keep me")
+        result = CliRunner().invoke(
+            cli, ["export", "generate", "--output", str(tmp_path)]
+        )
+        assert result.exit_code == 1
+        assert (tmp_path / "existing.txt").read_text() == "keep me"
+
+    def test_rejects_bad_ratio(self, tmp_path):
+        result = CliRunner().invoke(
+            cli,
+            [
+                "export",
+                "generate",
+                "--output",
+                str(tmp_path / "x"),
+                "--file_ratio",
+                "2",
+            ],
+        )
+        assert result.exit_code == 2
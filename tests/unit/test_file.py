@@ -1,5 +1,8 @@
 """Unit tests for the file handling module."""
 
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,11 +11,19 @@ from googleapiclient.errors import HttpError
 from httplib2 import Response
 
 from slack_chat_migrator.core.config import MigrationConfig, SharedDriveConfig
+from slack_chat_migrator.core.progress import EventType, ProgressEvent, ProgressTracker
 from slack_chat_migrator.core.state import MigrationState
-from slack_chat_migrator.services.files.file import FileHandler, _safe_temp_suffix
+from slack_chat_migrator.services.files.attachment_store import (
+    AttachmentStore,
+    StoredAttachment,
+)
+from slack_chat_migrator.services.files.file import FileHandler
 from slack_chat_migrator.services.files.file_download import (
+    DownloadedFile,
     DownloadOutcome,
     _is_internal_host,
+    _safe_temp_suffix,
+    _spool_response,
     download_file,
 )
 from slack_chat_migrator.types import UploadResult
@@ -22,6 +33,15 @@ from slack_chat_migrator.types import UploadResult
 # ---------------------------------------------------------------------------
 
 
+def _downloaded(content: bytes) -> DownloadedFile:
+    """Describe *content* as a spooled download without touching disk."""
+    return DownloadedFile(
+        path="/nonexistent/spool",
+        md5=hashlib.md5(content).hexdigest(),  # noqa: S324
+        size=len(content),
+    )
+
+
 def _make_deps(**overrides):
     """Create explicit dependency values for FileHandler construction."""
     state = MigrationState()
@@ -204,6 +224,24 @@ class TestGetFileStatistics:
         stats = handler.get_file_statistics()
         assert stats["success_rate"] == 100.0
 
+    def test_counts_exact_across_worker_threads(self):
+        handler = _make_handler()
+        handler.user_resolver.is_external_user.return_value = False
+
+        def record(channel: str) -> None:
+            for i in range(200):
+                handler._update_file_stats({"id": f"F{i}"}, channel)
+                handler._increment_stat("drive_uploads")
+
+        channels = [f"ch{i}" for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(record, channels))
+
+        stats = handler.get_file_statistics()
+        assert stats["total_files_processed"] == 1600
+        assert stats["drive_uploads"] == 1600
+        assert stats["files_by_channel"] == dict.fromkeys(channels, 200)
+
 
 # ===========================================================================
 # _get_current_channel tests
@@ -346,7 +384,7 @@ class TestUploadStrategy:
     def test_small_image_tries_direct_upload(self):
         handler = self._make_ready_handler()
         content = b"\x89PNG" + b"\x00" * 1000
-        handler._download_file = MagicMock(return_value=content)
+        handler._download_file = MagicMock(return_value=_downloaded(content))
         handler.chat_uploader.is_suitable_for_direct_upload = MagicMock(
             return_value=True
         )
@@ -375,7 +413,7 @@ class TestUploadStrategy:
     def test_direct_upload_fallback_to_drive(self):
         handler = self._make_ready_handler()
         content = b"\x89PNG" + b"\x00" * 1000
-        handler._download_file = MagicMock(return_value=content)
+        handler._download_file = MagicMock(return_value=_downloaded(content))
         handler.chat_uploader.is_suitable_for_direct_upload = MagicMock(
             return_value=True
         )
@@ -403,7 +441,7 @@ class TestUploadStrategy:
     def test_non_image_goes_to_drive(self):
         handler = self._make_ready_handler()
         content = b"file data"
-        handler._download_file = MagicMock(return_value=content)
+        handler._download_file = MagicMock(return_value=_downloaded(content))
         handler._upload_to_drive = MagicMock(
             return_value=UploadResult(
                 upload_type="drive",
@@ -424,11 +462,27 @@ class TestUploadStrategy:
         assert result.upload_type == "drive"
         handler._upload_to_drive.assert_called_once()
 
+    def test_spool_file_removed_after_upload(self, tmp_path):
+        handler = self._make_ready_handler()
+        spool = tmp_path / "spool"
+        spool.write_bytes(b"file data")
+        handler._download_file = MagicMock(
+            return_value=DownloadedFile(path=str(spool), md5="abc", size=9)
+        )
+        handler._upload_to_drive = MagicMock(return_value=None)
+
+        handler.upload_attachment(
+            {"id": "F1", "name": "report.pdf", "mimetype": "application/pdf"},
+            channel="general",
+        )
+
+        assert not spool.exists()
+
     def test_large_image_goes_to_drive(self):
         """Images larger than 25MB should bypass direct upload."""
         handler = self._make_ready_handler()
         content = b"\x89PNG" + b"\x00" * (26 * 1024 * 1024)
-        handler._download_file = MagicMock(return_value=content)
+        handler._download_file = MagicMock(return_value=_downloaded(content))
         handler._upload_to_drive = MagicMock(
             return_value=UploadResult(
                 upload_type="drive",
@@ -453,7 +507,7 @@ class TestUploadStrategy:
     def test_drive_upload_failure_returns_error_result(self):
         handler = self._make_ready_handler()
         content = b"some data"
-        handler._download_file = MagicMock(return_value=content)
+        handler._download_file = MagicMock(return_value=_downloaded(content))
         handler._upload_to_drive = MagicMock(return_value=None)
 
         file_obj = {
@@ -499,7 +553,7 @@ class TestUploadStrategy:
     def test_null_mimetype_gets_guessed(self):
         handler = self._make_ready_handler()
         content = b"data"
-        handler._download_file = MagicMock(return_value=content)
+        handler._download_file = MagicMock(return_value=_downloaded(content))
         handler._upload_to_drive = MagicMock(
             return_value=UploadResult(
                 upload_type="drive",
@@ -578,6 +632,167 @@ class TestUploadFile:
         assert result is None
 
 
+# ===========================================================================
+# Upload progress events
+# ===========================================================================
+
+
+class TestUploadProgressEvents:
+    """FILE_UPLOADED is emitted only for bytes actually uploaded."""
+
+    def _make_tracked_handler(self):
+        handler = _make_handler(folder_id="root_folder")
+        handler._drive_initialized = True
+        tracker = ProgressTracker()
+        received: list[ProgressEvent] = []
+        tracker.subscribe(received.append)
+        handler.progress_tracker = tracker
+        return handler, received
+
+    @staticmethod
+    def _uploaded_sizes(received):
+        return [
+            e.size_bytes for e in received if e.event_type == EventType.FILE_UPLOADED
+        ]
+
+    def test_drive_upload_reports_downloaded_size(self):
+        handler, received = self._make_tracked_handler()
+        handler._download_file = MagicMock(return_value=_downloaded(b"x" * 300))
+        handler._upload_to_drive = MagicMock(
+            return_value=UploadResult(upload_type="drive", drive_id="d1")
+        )
+
+        handler.upload_attachment(
+            {"id": "F1", "name": "a.pdf", "mimetype": "application/pdf", "size": 1},
+            channel="general",
+        )
+
+        assert self._uploaded_sizes(received) == [300]
+        assert received[0].channel == "general"
+
+    def test_direct_upload_reports_downloaded_size(self):
+        handler, received = self._make_tracked_handler()
+        handler._download_file = MagicMock(return_value=_downloaded(b"\x89PNG"))
+        handler.chat_uploader.is_suitable_for_direct_upload = MagicMock(
+            return_value=True
+        )
+        handler._upload_direct_to_chat = MagicMock(
+            return_value=UploadResult(upload_type="direct")
+        )
+
+        handler.upload_attachment(
+            {"id": "F1", "name": "i.png", "mimetype": "image/png"},
+            channel="general",
+            space="spaces/ABC",
+        )
+
+        assert self._uploaded_sizes(received) == [4]
+
+    def test_drive_file_reused_by_hash_not_reported(self):
+        handler, received = self._make_tracked_handler()
+        handler._download_file = MagicMock(return_value=_downloaded(b"data"))
+        handler._upload_to_drive = MagicMock(
+            return_value=UploadResult(
+                upload_type="drive", drive_id="d1", metadata={"reused": True}
+            )
+        )
+
+        handler.upload_attachment({"id": "F1", "name": "a.txt"}, channel="general")
+
+        assert self._uploaded_sizes(received) == []
+
+    def test_failed_cached_and_referenced_files_not_reported(self):
+        handler, received = self._make_tracked_handler()
+        handler.processed_files["F1"] = UploadResult(upload_type="drive")
+        handler._download_file = MagicMock(
+            side_effect=[None, DownloadOutcome.GOOGLE_DRIVE_FILE]
+        )
+        handler._create_drive_reference = MagicMock(
+            return_value=UploadResult(upload_type="drive", drive_id="d3")
+        )
+
+        handler.upload_attachment({"id": "F1", "name": "a"}, channel="general")
+        handler.upload_attachment({"id": "F2", "name": "b"}, channel="general")
+        handler.upload_attachment({"id": "F3", "name": "c"}, channel="general")
+
+        assert self._uploaded_sizes(received) == []
+
+
+# ===========================================================================
+# Attachment store tests
+# ===========================================================================
+
+
+class TestAttachmentStoreReuse:
+    """FileHandler reuses and records Drive uploads via the attachment store."""
+
+    def _make_ready_handler(self, store):
+        handler = _make_handler(folder_id="root_folder")
+        handler._drive_initialized = True
+        handler.drive_uploader.file_hash_cache = {}
+        handler.attach_attachment_store(store)
+        return handler
+
+    def test_attach_seeds_drive_hash_cache(self):
+        store = AttachmentStore()
+        store.add(StoredAttachment("F1", "abc", "d1", "https://d1"))
+        handler = self._make_ready_handler(store)
+        assert handler.drive_uploader.file_hash_cache["abc"] == ("d1", "https://d1")
+        assert handler.is_known_attachment("F1")
+        assert not handler.is_known_attachment("F2")
+
+    def test_stored_upload_skips_download(self):
+        store = AttachmentStore()
+        store.add(StoredAttachment("F1", "abc", "d1", "https://d1"))
+        handler = self._make_ready_handler(store)
+        handler.drive_service.get_file.return_value = {"id": "d1", "trashed": False}
+        handler._download_file = MagicMock()
+
+        result = handler.upload_attachment(
+            {"id": "F1", "name": "a.pdf", "mimetype": "application/pdf"},
+            channel="general",
+        )
+
+        assert result.upload_type == "drive"
+        assert result.drive_id == "d1"
+        assert result.url == "https://d1"
+        handler._download_file.assert_not_called()
+        assert handler.processed_files["F1"] is result
+
+    def test_failed_spot_check_verifies_each_hit(self):
+        store = AttachmentStore()
+        store.add(StoredAttachment("F1", "abc", "d1", "https://d1"))
+        handler = self._make_ready_handler(store)
+        handler.drive_service.get_file.side_effect = HttpError(
+            Response({"status": "404"}), b"not found"
+        )
+        handler._download_file = MagicMock(return_value=None)
+
+        result = handler.upload_attachment(
+            {"id": "F1", "name": "a.pdf"}, channel="general"
+        )
+
+        assert result.error == "Download failed"
+        handler._download_file.assert_called_once()
+        assert store.get("F1") is None
+
+    def test_drive_upload_recorded(self):
+        store = AttachmentStore()
+        handler = self._make_ready_handler(store)
+        handler.drive_uploader.upload_file_to_drive.return_value = ("d9", None)
+
+        handler._upload_to_drive(
+            {"id": "F9", "name": "a.txt", "mimetype": "text/plain"},
+            _downloaded(b"data"),
+        )
+
+        entry = store.get("F9")
+        assert entry is not None
+        assert entry.drive_file_id == "d9"
+        assert entry.md5 == _downloaded(b"data").md5
+        assert entry.url == "https://drive.google.com/file/d/d9/view"
+
+
 # ===========================================================================
 # _download_file tests
 # ===========================================================================
@@ -623,14 +838,22 @@ class TestDownloadFile:
         handler = _make_handler()
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = b"file bytes"
+        mock_response.iter_content.return_value = [b"file ", b"", b"bytes"]
         mock_response.headers = {"Content-Length": "10"}
         mock_get.return_value = mock_response
 
         result = handler._download_file(
             {"id": "F1", "name": "test.txt", "url_private": "https://files.slack.com/a"}
         )
-        assert result == b"file bytes"
+        assert isinstance(result, DownloadedFile)
+        try:
+            with open(result.path, "rb") as f:
+                assert f.read() == b"file bytes"
+            assert result.size == 10
+            assert result.md5 == hashlib.md5(b"file bytes").hexdigest()  # noqa: S324
+        finally:
+            result.discard()
+        mock_response.close.assert_called_once()
         mock_get.assert_called_once_with(
             "https://files.slack.com/a",
             headers={},
@@ -638,6 +861,31 @@ class TestDownloadFile:
             timeout=60,
         )
 
+    @patch("slack_chat_migrator.services.files.file.requests.get")
+    def test_interrupted_stream_removes_spool_file(self, mock_get, tmp_path):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.headers = {}
+
+        def chunks(chunk_size):
+            yield b"partial"
+            raise requests.exceptions.ChunkedEncodingError("reset")
+
+        mock_response.iter_content.side_effect = chunks
+        mock_get.return_value = mock_response
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            download_file(
+                {
+                    "id": "F1",
+                    "name": "a.txt",
+                    "url_private": "https://files.slack.com/a",
+                },
+                "general",
+                spool_dir=str(tmp_path),
+            )
+        assert list(tmp_path.iterdir()) == []
+
     @patch("slack_chat_migrator.services.files.file.requests.get")
     def test_http_error_raises_for_retry(self, mock_get):
         handler = _make_handler()
@@ -1098,7 +1346,7 @@ class TestUploadDirectToChat:
 
         file_obj = {"id": "F1", "name": "pic.png", "mimetype": "image/png"}
         result = handler._upload_direct_to_chat(
-            file_obj, b"png data", channel="general", space="spaces/ABC"
+            file_obj, _downloaded(b"png data"), channel="general", space="spaces/ABC"
         )
 
         assert result is not None
@@ -1128,7 +1376,7 @@ class TestUploadDirectToChat:
             file_obj = {"id": "F1", "name": "pic.png", "mimetype": "image/png"}
             result = handler._upload_direct_to_chat(
                 file_obj,
-                b"png data",
+                _downloaded(b"png data"),
                 channel="general",
                 space="spaces/ABC",
                 user_service=mock_user_service,
@@ -1146,7 +1394,7 @@ class TestUploadDirectToChat:
 
         file_obj = {"id": "F1", "name": "pic.png", "mimetype": "image/png"}
         result = handler._upload_direct_to_chat(
-            file_obj, b"png data", channel="general", space="spaces/ABC"
+            file_obj, _downloaded(b"png data"), channel="general", space="spaces/ABC"
         )
 
         assert result is None
@@ -1160,7 +1408,7 @@ class TestUploadDirectToChat:
 
         file_obj = {"id": "F1", "name": "pic.png", "mimetype": "image/png"}
         result = handler._upload_direct_to_chat(
-            file_obj, b"png data", channel="general"
+            file_obj, _downloaded(b"png data"), channel="general"
         )
 
         assert result is None
@@ -1172,7 +1420,7 @@ class TestUploadDirectToChat:
 
         file_obj = {"id": "F1", "name": "pic.png", "mimetype": "image/png"}
         result = handler._upload_direct_to_chat(
-            file_obj, b"png data", channel="general"
+            file_obj, _downloaded(b"png data"), channel="general"
         )
 
         assert result is None
@@ -1189,7 +1437,9 @@ class TestUploadDirectToChat:
         }
 
         # file_obj with no id, name, or mimetype
-        result = handler._upload_direct_to_chat({}, b"data", channel="general")
+        result = handler._upload_direct_to_chat(
+            {}, _downloaded(b"data"), channel="general"
+        )
 
         assert result is not None
         assert isinstance(result, UploadResult)
@@ -1232,7 +1482,7 @@ class TestUploadToDrive:
         }
         result = handler._upload_to_drive(
             file_obj,
-            b"pdf content",
+            _downloaded(b"pdf content"),
             channel="general",
             sender_email="alice@example.com",
         )
@@ -1254,7 +1504,9 @@ class TestUploadToDrive:
         handler.drive_uploader.upload_file_to_drive.return_value = (None, None)
 
         file_obj = {"id": "F1", "name": "file.txt", "mimetype": "text/plain"}
-        result = handler._upload_to_drive(file_obj, b"data", channel="general")
+        result = handler._upload_to_drive(
+            file_obj, _downloaded(b"data"), channel="general"
+        )
 
         assert result is None
 
@@ -1268,7 +1520,7 @@ class TestUploadToDrive:
         )
 
         file_obj = {"id": "F1", "name": "file.txt", "mimetype": "text/plain"}
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert isinstance(result, UploadResult)
@@ -1284,7 +1536,7 @@ class TestUploadToDrive:
         handler._shared_drive_id = None
 
         file_obj = {"id": "F1", "name": "file.txt", "mimetype": "text/plain"}
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is None
 
@@ -1311,7 +1563,9 @@ class TestUploadToDrive:
             "mimetype": "text/plain",
             "user": "U123",
         }
-        result = handler._upload_to_drive(file_obj, b"data", channel="general")
+        result = handler._upload_to_drive(
+            file_obj, _downloaded(b"data"), channel="general"
+        )
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1344,7 +1598,9 @@ class TestUploadToDrive:
             "mimetype": "text/plain",
             "user": "U123",
         }
-        result = handler._upload_to_drive(file_obj, b"data", channel="general")
+        result = handler._upload_to_drive(
+            file_obj, _downloaded(b"data"), channel="general"
+        )
 
         assert result is not None  # upload succeeded, just ownership transfer failed
         assert result.upload_type == "drive"
@@ -1373,7 +1629,9 @@ class TestUploadToDrive:
             "mimetype": "text/plain",
             "user": "UEXT",
         }
-        result = handler._upload_to_drive(file_obj, b"data", channel="general")
+        result = handler._upload_to_drive(
+            file_obj, _downloaded(b"data"), channel="general"
+        )
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1402,7 +1660,9 @@ class TestUploadToDrive:
             "mimetype": "text/plain",
             "user": "U123",
         }
-        result = handler._upload_to_drive(file_obj, b"data", channel="general")
+        result = handler._upload_to_drive(
+            file_obj, _downloaded(b"data"), channel="general"
+        )
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1424,7 +1684,7 @@ class TestUploadToDrive:
             "mimetype": "application/octet-stream",
             "url_private": "https://docs.google.com/document/d/abc/edit",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1446,7 +1706,7 @@ class TestUploadToDrive:
             "mimetype": "application/octet-stream",
             "url_private": "https://docs.google.com/spreadsheets/d/abc/edit",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1468,7 +1728,7 @@ class TestUploadToDrive:
             "mimetype": "application/octet-stream",
             "url_private": "https://docs.google.com/presentation/d/abc/edit",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1490,7 +1750,7 @@ class TestUploadToDrive:
             "mimetype": "application/octet-stream",
             "url_private": "https://sheets.google.com/d/abc/edit",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1512,7 +1772,7 @@ class TestUploadToDrive:
             "mimetype": "application/octet-stream",
             "url_private": "https://drive.google.com/file/d/abc/view",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1534,7 +1794,7 @@ class TestUploadToDrive:
             "mimetype": "application/octet-stream",
             "url_private": "https://drive.google.com/file/d/abc/view",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1555,7 +1815,7 @@ class TestUploadToDrive:
             "name": "data.json",
             "mimetype": "null",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1576,7 +1836,7 @@ class TestUploadToDrive:
             "name": "file.txt",
             "mimetype": "",
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1592,7 +1852,9 @@ class TestUploadToDrive:
         )
 
         file_obj = {"id": "F1", "name": "file.txt", "mimetype": "text/plain"}
-        result = handler._upload_to_drive(file_obj, b"data", channel="general")
+        result = handler._upload_to_drive(
+            file_obj, _downloaded(b"data"), channel="general"
+        )
 
         assert result is None
 
@@ -1612,8 +1874,8 @@ class TestUploadToDrive:
         file_obj1 = {"id": "F1", "name": "a.txt", "mimetype": "text/plain"}
         file_obj2 = {"id": "F2", "name": "b.txt", "mimetype": "text/plain"}
 
-        handler._upload_to_drive(file_obj1, b"data", channel="general")
-        handler._upload_to_drive(file_obj2, b"data", channel="general")
+        handler._upload_to_drive(file_obj1, _downloaded(b"data"), channel="general")
+        handler._upload_to_drive(file_obj2, _downloaded(b"data"), channel="general")
 
         # Folder key should be in the shared_channel_folders set
         assert "general_channel_folder" in handler.shared_channel_folders
@@ -1625,7 +1887,7 @@ class TestUploadToDrive:
         handler.drive_uploader.upload_file_to_drive.return_value = ("file_id", None)
 
         file_obj = {"id": "F1", "name": "file.txt", "mimetype": "text/plain"}
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -1654,7 +1916,10 @@ class TestUploadToDrive:
             "user": "U123",
         }
         handler._upload_to_drive(
-            file_obj, b"data", channel="general", sender_email="bob@example.com"
+            file_obj,
+            _downloaded(b"data"),
+            channel="general",
+            sender_email="bob@example.com",
         )
 
         # Verify upload_file_to_drive was called with sender_email
@@ -1681,7 +1946,7 @@ class TestUploadToDrive:
             "mimetype": "text/plain",
             "user": "U999",  # not in user_map
         }
-        result = handler._upload_to_drive(file_obj, b"data")
+        result = handler._upload_to_drive(file_obj, _downloaded(b"data"))
 
         assert result is not None
         assert result.upload_type == "drive"
@@ -2033,11 +2298,11 @@ class TestDownloadFileSSRF:
         assert result is None
 
     @patch("slack_chat_migrator.services.files.file_download.requests.get")
-    def test_allows_https_public_url(self, mock_get):
+    def test_allows_https_public_url(self, mock_get, tmp_path):
         """Valid HTTPS URLs to public hosts should proceed to download."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = b"file content"
+        mock_response.iter_content.return_value = [b"file content"]
         mock_response.headers = {}
         mock_get.return_value = mock_response
 
@@ -2046,6 +2311,61 @@ class TestDownloadFileSSRF:
             "name": "test.txt",
             "url_private": "https://files.slack.com/file.txt",
         }
-        result = download_file(file_obj, "general")
-        assert result == b"file content"
+        result = download_file(file_obj, "general", spool_dir=str(tmp_path))
+        assert isinstance(result, DownloadedFile)
+        assert os.path.dirname(result.path) == str(tmp_path)
         mock_get.assert_called_once()
+
+
+class TestSpoolSizeLimit:
+    """Tests for the size cap enforced while spooling downloads."""
+
+    def _response(self, chunks):
+        response = MagicMock()
+        response.iter_content.return_value = chunks
+        return response
+
+    def test_within_limit_is_spooled(self, tmp_path):
+        response = self._response([b"abc", b"de"])
+
+        result = _spool_response(response, "f.txt", str(tmp_path), max_bytes=5)
+
+        assert isinstance(result, DownloadedFile)
+        assert result.size == 5
+        response.close.assert_called_once()
+
+    def test_over_limit_aborts_and_removes_spool_file(self, tmp_path):
+        consumed = []
+
+        def chunks():
+            for chunk in (b"abc", b"def", b"ghi"):
+                consumed.append(chunk)
+                yield chunk
+
+        response = self._response(chunks())
+
+        result = _spool_response(response, "f.txt", str(tmp_path), max_bytes=5)
+
+        assert result is None
+        assert consumed == [b"abc", b"def"]
+        assert list(tmp_path.iterdir()) == []
+        response.close.assert_called_once()
+
+    @patch("slack_chat_migrator.services.files.file_download.MAX_FILE_SIZE_BYTES", 4)
+    @patch("slack_chat_migrator.services.files.file_download.requests.get")
+    def test_download_file_fails_when_too_large(self, mock_get, tmp_path):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"too large"]
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        file_obj = {
+            "id": "F005",
+            "name": "big.bin",
+            "url_private": "https://files.slack.com/big.bin",
+        }
+        result = download_file(file_obj, "general", spool_dir=str(tmp_path))
+
+        assert result is None
+        assert list(tmp_path.iterdir()) == []
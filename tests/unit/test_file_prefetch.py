@@ -0,0 +1,245 @@
+"""Unit tests for the background attachment prefetcher."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+import threading
+from typing import Any
+from unittest.mock import MagicMock
+
+import requests
+
+from slack_chat_migrator.constants import MAX_FILE_SIZE_BYTES
+from slack_chat_migrator.services.files.file_download import (
+    DownloadedFile,
+    DownloadOutcome,
+)
+from slack_chat_migrator.services.files.file_prefetch import AttachmentPrefetcher
+from slack_chat_migrator.services.messages.message_attachments import message_files
+
+
+def _file(file_id: str, size: int = 0) -> dict[str, Any]:
+    return {
+        "id": file_id,
+        "name": f"{file_id}.bin",
+        "size": size,
+        "url_private": f"https://files.slack.com/{file_id}",
+    }
+
+
+class _Downloader:
+    """Download stub that records calls and spools canned content."""
+
+    def __init__(self, results: dict[str, Any] | None = None) -> None:
+        self.results = results or {}
+        self.calls: list[str] = []
+        self.gate: threading.Event | None = None
+
+    def __call__(
+        self, file_obj: dict[str, Any], channel: str | None, spool_dir: str | None
+    ) -> Any:
+        self.calls.append(file_obj["id"])
+        if self.gate is not None:
+            self.gate.wait(5)
+        result = self.results.get(file_obj["id"], file_obj["id"].encode() * 4)
+        if isinstance(result, Exception):
+            raise result
+        if not isinstance(result, bytes):
+            return result
+        fd, path = tempfile.mkstemp(dir=spool_dir)
+        with os.fdopen(fd, "wb") as f:
+            f.write(result)
+        return DownloadedFile(
+            path=path,
+            md5=hashlib.md5(result).hexdigest(),  # noqa: S324
+            size=len(result),
+        )
+
+
+def _read(download: Any) -> bytes:
+    with open(download.path, "rb") as f:
+        return f.read()
+
+
+class TestAttachmentPrefetcher:
+    """Tests for AttachmentPrefetcher."""
+
+    def test_take_returns_prefetched_content(self):
+        download = _Downloader({"F1": b"hello"})
+        prefetcher = AttachmentPrefetcher(download=download)
+        try:
+            assert prefetcher.prefetch(_file("F1", 5), "general")
+            found, staged = prefetcher.take("F1")
+            assert found
+            assert _read(staged) == b"hello"
+            assert staged.md5 == hashlib.md5(b"hello").hexdigest()  # noqa: S324
+            assert prefetcher.reserved_bytes == 0
+            assert "F1" not in prefetcher
+        finally:
+            prefetcher.close()
+
+    def test_take_unknown_file_is_miss(self):
+        prefetcher = AttachmentPrefetcher(download=_Downloader())
+        try:
+            assert prefetcher.take("F404") == (False, None)
+        finally:
+            prefetcher.close()
+
+    def test_same_file_downloaded_once(self):
+        download = _Downloader()
+        prefetcher = AttachmentPrefetcher(download=download)
+        try:
+            prefetcher.prefetch(_file("F1"), "general")
+            prefetcher.prefetch(_file("F1"), "general")
+            prefetcher.take("F1")
+            assert download.calls == ["F1"]
+        finally:
+            prefetcher.close()
+
+    def test_non_bytes_outcome_passed_through(self):
+        download = _Downloader({"F1": DownloadOutcome.GOOGLE_DRIVE_FILE})
+        prefetcher = AttachmentPrefetcher(download=download)
+        try:
+            prefetcher.prefetch(_file("F1"), "general")
+            assert prefetcher.take("F1") == (True, DownloadOutcome.GOOGLE_DRIVE_FILE)
+        finally:
+            prefetcher.close()
+
+    def test_failed_download_is_miss(self):
+        download = _Downloader({"F1": requests.ConnectionError("boom")})
+        prefetcher = AttachmentPrefetcher(download=download)
+        try:
+            prefetcher.prefetch(_file("F1", 10), "general")
+            assert prefetcher.take("F1") == (False, None)
+            assert prefetcher.reserved_bytes == 0
+        finally:
+            prefetcher.close()
+
+    def test_refuses_beyond_cache_budget(self):
+        download = _Downloader()
+        download.gate = threading.Event()
+        prefetcher = AttachmentPrefetcher(download=download, max_cache_bytes=100)
+        try:
+            assert prefetcher.prefetch(_file("F1", 60), "general")
+            assert not prefetcher.prefetch(_file("F2", 60), "general")
+            assert prefetcher.reserved_bytes == 60
+            download.gate.set()
+        finally:
+            prefetcher.close()
+
+    def test_unknown_size_reserves_max_file_size(self):
+        download = _Downloader()
+        download.gate = threading.Event()
+        prefetcher = AttachmentPrefetcher(
+            download=download, max_cache_bytes=MAX_FILE_SIZE_BYTES + 100
+        )
+        try:
+            assert prefetcher.prefetch(_file("F1"), "general")
+            assert prefetcher.reserved_bytes == MAX_FILE_SIZE_BYTES
+            missing = _file("F2")
+            del missing["size"]
+            assert not prefetcher.prefetch(missing, "general")
+            assert prefetcher.prefetch(_file("F3", 100), "general")
+            download.gate.set()
+            prefetcher._entries["F1"].future.result()
+            prefetcher._entries["F3"].future.result()
+            # Both reservations now match the spooled sizes
+            assert prefetcher.reserved_bytes == len(b"F1" * 4) + len(b"F3" * 4)
+        finally:
+            prefetcher.close()
+
+    def test_reservation_tracks_actual_size(self):
+        download = _Downloader({"F1": b"x" * 7})
+        prefetcher = AttachmentPrefetcher(download=download)
+        try:
+            prefetcher.prefetch(_file("F1", 1000), "general")
+            prefetcher._entries["F1"].future.result()
+            assert prefetcher.reserved_bytes == 7
+        finally:
+            prefetcher.close()
+
+    def test_queued_download_cancelled_on_take(self):
+        download = _Downloader()
+        download.gate = threading.Event()
+        prefetcher = AttachmentPrefetcher(max_workers=1, download=download)
+        try:
+            prefetcher.prefetch(_file("F1"), "general")
+            prefetcher.prefetch(_file("F2"), "general")
+            # F2 is queued behind F1, so the caller downloads it directly
+            assert prefetcher.take("F2") == (False, None)
+            download.gate.set()
+            assert prefetcher.take("F1")[0] is True
+            assert download.calls == ["F1"]
+        finally:
+            prefetcher.close()
+
+    def test_discard_removes_only_channel_files(self):
+        prefetcher = AttachmentPrefetcher(download=_Downloader())
+        try:
+            prefetcher.prefetch(_file("F1", 4), "general")
+            prefetcher.prefetch(_file("F2", 4), "random")
+            staged = prefetcher._entries["F1"].future.result()
+            prefetcher.discard("general")
+            assert "F1" not in prefetcher
+            assert "F2" in prefetcher
+            assert not os.path.exists(staged.path)
+        finally:
+            prefetcher.close()
+
+    def test_close_removes_cache_dir(self):
+        prefetcher = AttachmentPrefetcher(download=_Downloader())
+        prefetcher.prefetch(_file("F1"), "general")
+        prefetcher._entries["F1"].future.result()
+        cache_dir = prefetcher._cache_dir
+        assert cache_dir is not None and os.path.isdir(cache_dir)
+        prefetcher.close()
+        assert not os.path.exists(cache_dir)
+        assert not prefetcher.prefetch(_file("F2"), "general")
+
+
+class TestFileHandlerUsesPrefetcher:
+    """FileHandler._download_file consults the prefetcher first."""
+
+    def _handler(self, prefetcher: Any) -> Any:
+        from slack_chat_migrator.services.files.file import FileHandler
+
+        handler = FileHandler.__new__(FileHandler)
+        handler.prefetcher = prefetcher
+        handler.state = MagicMock()
+        return handler
+
+    def test_hit_skips_download(self, monkeypatch):
+        prefetcher = MagicMock()
+        prefetcher.take.return_value = (True, b"cached")
+        direct = MagicMock()
+        monkeypatch.setattr(
+            "slack_chat_migrator.services.files.file.download_file", direct
+        )
+        assert self._handler(prefetcher)._download_file(_file("F1")) == b"cached"
+        direct.assert_not_called()
+
+    def test_miss_downloads_directly(self, monkeypatch):
+        prefetcher = MagicMock()
+        prefetcher.take.return_value = (False, None)
+        direct = MagicMock(return_value=b"direct")
+        monkeypatch.setattr(
+            "slack_chat_migrator.services.files.file.download_file", direct
+        )
+        assert self._handler(prefetcher)._download_file(_file("F1")) == b"direct"
+
+
+class TestMessageFiles:
+    """Tests for message_files()."""
+
+    def test_includes_forwarded_files_without_mutating(self):
+        msg = {
+            "files": [_file("F1")],
+            "attachments": [
+                {"is_share": True, "files": [_file("F2")]},
+                {"files": [_file("F3")]},
+            ],
+        }
+        assert [f["id"] for f in message_files(msg)] == ["F1", "F2"]
+        assert len(msg["files"]) == 1
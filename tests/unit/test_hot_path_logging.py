@@ -0,0 +1,88 @@
+"""Lint: DEBUG logging on per-message hot paths must not format eagerly.
+
+``log_with_context(logging.DEBUG, f"...")`` builds its message even when
+DEBUG is disabled.  Modules that log once or more per message or
+attachment pass a ``%``-template and arguments instead, so the work is
+skipped or moved to the log writer thread.
+"""
+
+from __future__ import annotations
+
+import ast
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[2] / "src" / "slack_chat_migrator"
+
+HOT_PATH_MODULES = [
+    "core/channel_processor.py",
+    "services/chat/chat_uploader.py",
+    "services/drive/drive_uploader.py",
+    "services/files/file.py",
+    "services/files/file_download.py",
+    "services/files/file_prefetch.py",
+    "services/messages/message_attachments.py",
+    "services/messages/message_builder.py",
+    "services/messages/message_sender.py",
+    "services/messages/message_stream.py",
+    "services/messages/reaction_processor.py",
+]
+
+
+def _is_debug_level(node: ast.expr) -> bool:
+    return (
+        isinstance(node, ast.Attribute)
+        and node.attr == "DEBUG"
+        and isinstance(node.value, ast.Name)
+        and node.value.id == "logging"
+    )
+
+
+def _is_eager(node: ast.expr) -> bool:
+    """True for f-strings, ``%``/``+`` expressions and ``.format()`` calls."""
+    if isinstance(node, (ast.JoinedStr, ast.BinOp)):
+        return True
+    return (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "format"
+    )
+
+
+def eager_debug_calls(path: Path) -> list[int]:
+    """Return line numbers of eagerly formatted DEBUG log_with_context calls."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    lines = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "log_with_context"
+            and len(node.args) >= 2
+            and _is_debug_level(node.args[0])
+            and _is_eager(node.args[1])
+        ):
+            lines.append(node.lineno)
+    return lines
+
+
+@pytest.mark.parametrize("module", HOT_PATH_MODULES)
+def test_no_eager_debug_formatting(module):
+    path = SRC / module
+    assert path.exists(), f"{module} moved; update HOT_PATH_MODULES"
+    assert eager_debug_calls(path) == [], (
+        f"{module}: pass a %-template and args to log_with_context(logging.DEBUG, ...)"
+    )
+
+
+def test_detects_eager_forms(tmp_path):
+    sample = tmp_path / "sample.py"
+    sample.write_text(
+        'log_with_context(logging.DEBUG, f"a {x}")\n'
+        'log_with_context(logging.DEBUG, "a %s" % x)\n'
+        'log_with_context(logging.DEBUG, "a {}".format(x))\n'
+        'log_with_context(logging.DEBUG, "a %s", x)\n'
+        'log_with_context(logging.INFO, f"a {x}")\n'
+    )
+    assert eager_debug_calls(sample) == [1, 2, 3]
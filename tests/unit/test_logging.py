@@ -4,27 +4,35 @@ import http.client
 import json
 import logging
 import os
+import time
 from unittest.mock import patch
 
 import pytest
 
 import slack_chat_migrator.utils.logging as log_module
 from slack_chat_migrator.utils.logging import (
+    AsyncLogSink,
+    BufferedFileHandler,
+    ChannelLogHandle,
+    ChannelLogRouter,
     EnhancedFormatter,
-    ImmediateFlushHandler,
     JsonFormatter,
     _extract_api_operation,
     ensure_channel_log_created,
+    flush_logs,
+    get_log_sink,
     get_logger,
     is_debug_api_enabled,
     log_api_request,
     log_api_response,
     log_failed_message,
     log_with_context,
+    remove_log_handler,
     sanitize_for_log,
     setup_channel_logger,
     setup_logger,
     setup_main_log_file,
+    shutdown_log_sink,
 )
 
 # Capture the stdlib putheader before any test has a chance to patch it.
@@ -38,6 +46,7 @@ def _clean_logger():
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     yield
+    shutdown_log_sink()
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
     # Reset the module-level debug flag
@@ -231,8 +240,16 @@ class TestSetupLogger:
         assert isinstance(result, logging.Logger)
         assert result.name == "slack_chat_migrator"
 
-    def test_logger_level_is_debug(self):
+    def test_logger_level_info_without_log_files(self):
         result = setup_logger()
+        assert result.level == logging.INFO
+
+    def test_logger_level_debug_when_verbose(self):
+        result = setup_logger(verbose=True)
+        assert result.level == logging.DEBUG
+
+    def test_logger_level_debug_with_log_file(self, tmp_path):
+        result = setup_logger(output_dir=str(tmp_path))
         assert result.level == logging.DEBUG
 
     def test_console_handler_info_level_by_default(self):
@@ -272,8 +289,9 @@ class TestSetupLogger:
 
     def test_output_dir_creates_file_handler(self, tmp_path):
         result = setup_logger(output_dir=str(tmp_path))
+        assert get_log_sink().queue_handler in result.handlers
         file_handlers = [
-            h for h in result.handlers if isinstance(h, ImmediateFlushHandler)
+            h for h in get_log_sink().handlers if isinstance(h, BufferedFileHandler)
         ]
         assert len(file_handlers) == 1
         assert os.path.exists(os.path.join(str(tmp_path), "migration.log"))
@@ -319,7 +337,7 @@ class TestLogWithContext:
             assert "lineno" not in extras
 
     def test_api_data_gets_defaults(self):
-        logger = setup_logger()
+        logger = setup_logger(verbose=True)
         with patch.object(logger, "log") as mock_log:
             log_with_context(logging.DEBUG, "api log", api_data='{"test": 1}')
             extras = mock_log.call_args[1]["extra"]
@@ -337,6 +355,18 @@ class TestLogWithContext:
             assert "api_data" not in extras
             assert "response" not in extras
 
+    def test_args_passed_through_unformatted(self):
+        logger = setup_logger()
+        with patch.object(logger, "log") as mock_log:
+            log_with_context(logging.INFO, "sent %s of %d", "a", 2, channel="c")
+            assert mock_log.call_args[0] == (logging.INFO, "sent %s of %d", "a", 2)
+
+    def test_disabled_level_short_circuits(self):
+        logger = setup_logger()
+        with patch.object(logger, "log") as mock_log:
+            log_with_context(logging.DEBUG, "skipped %s", "x", channel="c")
+            mock_log.assert_not_called()
+
 
 # --- _extract_api_operation tests ---
 
@@ -635,9 +665,10 @@ class TestSetupMainLogFile:
         log_file = tmp_path / "migration.log"
         assert log_file.exists()
 
-    def test_returns_immediate_flush_handler(self, tmp_path):
+    def test_returns_buffered_file_handler(self, tmp_path):
         result = setup_main_log_file(str(tmp_path))
-        assert isinstance(result, ImmediateFlushHandler)
+        assert isinstance(result, BufferedFileHandler)
+        assert result in get_log_sink().handlers
 
     def test_handler_level_is_debug(self, tmp_path):
         result = setup_main_log_file(str(tmp_path))
@@ -736,9 +767,11 @@ class TestSetupChannelLogger:
         log_file = tmp_path / "channel_logs" / "general_migration.log"
         assert log_file.exists()
 
-    def test_returns_immediate_flush_handler(self, tmp_path):
+    def test_returns_channel_handle(self, tmp_path):
         result = setup_channel_logger(str(tmp_path), "general")
-        assert isinstance(result, ImmediateFlushHandler)
+        assert isinstance(result, ChannelLogHandle)
+        assert result.router in get_log_sink().handlers
+        assert result not in logging.getLogger("slack_chat_migrator").handlers
 
     def test_handler_level_is_debug(self, tmp_path):
         result = setup_channel_logger(str(tmp_path), "general")
@@ -829,6 +862,199 @@ class TestSetupChannelLogger:
         assert all(f.filter(record) for f in handler.filters)
 
 
+# --- AsyncLogSink tests ---
+
+
+def _sink_logger(tmp_path, sink):
+    handler = BufferedFileHandler(str(tmp_path / "sink.log"), mode="w")
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    sink.add_handler(handler)
+    logger = logging.getLogger("slack_chat_migrator")
+    logger.setLevel(logging.DEBUG)
+    return logger, handler
+
+
+class TestAsyncLogSink:
+    """Tests for AsyncLogSink and the module-level sink helpers."""
+
+    def test_queue_level_follows_file_handlers(self, tmp_path):
+        sink = AsyncLogSink(flush_interval=60)
+        try:
+            _, handler = _sink_logger(tmp_path, sink)
+            assert sink.queue_handler.level == logging.DEBUG
+            handler.setLevel(logging.INFO)
+            sink.add_handler(handler)
+            assert sink.queue_handler.level == logging.INFO
+        finally:
+            sink.shutdown()
+
+    def test_args_merged_on_writer_thread(self, tmp_path):
+        sink = AsyncLogSink(flush_interval=60)
+        try:
+            logger, _ = _sink_logger(tmp_path, sink)
+            record = logger.makeRecord(
+                logger.name, logging.DEBUG, "f", 1, "n=%d", (1,), None
+            )
+            assert sink.queue_handler.prepare(record).args == (1,)
+            logger.debug("n=%d %s", 7, "ok")
+            sink.drain()
+            assert (tmp_path / "sink.log").read_text() == "DEBUG n=7 ok\n"
+        finally:
+            sink.shutdown()
+
+    def test_mutable_args_formatted_at_enqueue(self, tmp_path):
+        sink = AsyncLogSink(flush_interval=60)
+        try:
+            logger, _ = _sink_logger(tmp_path, sink)
+            items = ["a"]
+            logger.debug("items=%s", items)
+            items.append("b")
+            sink.drain()
+            assert "items=['a']" in (tmp_path / "sink.log").read_text()
+        finally:
+            sink.shutdown()
+
+    def test_drain_writes_queued_records(self, tmp_path):
+        sink = AsyncLogSink(flush_interval=60)
+        try:
+            logger, _ = _sink_logger(tmp_path, sink)
+            for i in range(100):
+                logger.debug("line %d", i)
+            assert sink.drain()
+            lines = (tmp_path / "sink.log").read_text().splitlines()
+            assert lines[0] == "DEBUG line 0"
+            assert len(lines) == 100
+        finally:
+            sink.shutdown()
+
+    def test_warning_flushed_without_drain(self, tmp_path):
+        sink = AsyncLogSink(flush_interval=60)
+        try:
+            logger, _ = _sink_logger(tmp_path, sink)
+            logger.debug("before")
+            logger.warning("careful")
+            log_file = tmp_path / "sink.log"
+            deadline = time.monotonic() + 5
+            while "careful" not in log_file.read_text():
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+            assert "DEBUG before" in log_file.read_text()
+        finally:
+            sink.shutdown()
+
+    def test_exception_text_preserved(self, tmp_path):
+        sink = AsyncLogSink()
+        try:
+            logger, _ = _sink_logger(tmp_path, sink)
+            try:
+                raise ValueError("boom")
+            except ValueError:
+                logger.error("failed", exc_info=True)
+            sink.drain()
+            content = (tmp_path / "sink.log").read_text()
+            assert "ERROR failed" in content
+            assert "ValueError: boom" in content
+        finally:
+            sink.shutdown()
+
+    def test_filters_applied_on_writer(self, tmp_path):
+        sink = AsyncLogSink()
+        try:
+            logger, handler = _sink_logger(tmp_path, sink)
+            handler.addFilter(lambda r: getattr(r, "channel", None) == "general")
+            logger.info("kept", extra={"channel": "general"})
+            logger.info("dropped", extra={"channel": "random"})
+            sink.drain()
+            assert (tmp_path / "sink.log").read_text() == "INFO kept\n"
+        finally:
+            sink.shutdown()
+
+    def test_shutdown_flushes_closes_and_detaches(self, tmp_path):
+        sink = AsyncLogSink(flush_interval=60)
+        logger, handler = _sink_logger(tmp_path, sink)
+        logger.info("last words")
+        sink.shutdown()
+        assert (tmp_path / "sink.log").read_text() == "INFO last words\n"
+        assert handler.stream is None
+        assert sink.queue_handler not in logger.handlers
+
+    def test_remove_log_handler_drains_first(self, tmp_path):
+        sink = get_log_sink()
+        logger, handler = _sink_logger(tmp_path, sink)
+        logger.debug("queued")
+        remove_log_handler(handler)
+        handler.close()
+        assert handler not in sink.handlers
+        assert (tmp_path / "sink.log").read_text() == "DEBUG queued\n"
+
+    def test_flush_logs_without_sink(self):
+        shutdown_log_sink()
+        assert flush_logs() is True
+
+
+# --- ChannelLogRouter tests ---
+
+
+def _channel_record(channel, msg="event", level=logging.INFO):
+    record = logging.LogRecord("slack_chat_migrator", level, "t.py", 1, msg, (), None)
+    if channel is not None:
+        record.channel = channel
+    return record
+
+
+class TestChannelLogRouter:
+    """Tests for ChannelLogRouter and ChannelLogHandle."""
+
+    def _open(self, router, tmp_path, channel):
+        handle = router.open_channel(channel, str(tmp_path / f"{channel}.log"))
+        handle.setFormatter(logging.Formatter("%(message)s"))
+        return handle
+
+    def test_routes_by_channel(self, tmp_path):
+        router = ChannelLogRouter()
+        self._open(router, tmp_path, "general")
+        self._open(router, tmp_path, "random")
+        router.handle(_channel_record("general", "to general"))
+        router.handle(_channel_record("random", "to random"))
+        router.handle(_channel_record("other", "unrouted"))
+        router.handle(_channel_record(None, "no channel"))
+        router.close()
+        assert (tmp_path / "general.log").read_text() == "to general\n"
+        assert (tmp_path / "random.log").read_text() == "to random\n"
+
+    def test_idle_files_closed_and_reopened_for_append(self, tmp_path):
+        router = ChannelLogRouter(max_open=2)
+        for channel in ("a", "b", "c"):
+            self._open(router, tmp_path, channel)
+            router.handle(_channel_record(channel, f"{channel}1"))
+        assert router.open_files == 2
+        router.handle(_channel_record("a", "a2"))
+        assert router.open_files == 2
+        router.close()
+        assert (tmp_path / "a.log").read_text() == "a1\na2\n"
+        assert (tmp_path / "b.log").read_text() == "b1\n"
+
+    def test_closed_handle_stops_routing(self, tmp_path):
+        router = ChannelLogRouter()
+        handle = self._open(router, tmp_path, "general")
+        router.handle(_channel_record("general", "kept"))
+        handle.flush()
+        handle.close()
+        router.handle(_channel_record("general", "dropped"))
+        assert router.open_files == 0
+        assert (tmp_path / "general.log").read_text() == "kept\n"
+
+    def test_channel_logs_written_through_sink(self, tmp_path):
+        handle = setup_channel_logger(str(tmp_path), "general")
+        log_with_context(logging.DEBUG, "queued", channel="general")
+        log_with_context(logging.DEBUG, "elsewhere", channel="random")
+        assert flush_logs()
+        handle.close()
+        content = (tmp_path / "channel_logs" / "general_migration.log").read_text()
+        assert "queued" in content
+        assert "elsewhere" not in content
+
+
 # --- ensure_channel_log_created tests ---
 
 
@@ -1,5 +1,6 @@
 """Unit tests for the message processing module."""
 
+import logging
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,6 +10,10 @@ from httplib2 import Response
 from slack_chat_migrator.core.config import MigrationConfig
 from slack_chat_migrator.core.context import MigrationContext
 from slack_chat_migrator.core.state import MigrationState, _default_migration_summary
+from slack_chat_migrator.services.messages.message_builder import (
+    MESSAGE_ID_MAX_LENGTH,
+    generate_message_id,
+)
 from slack_chat_migrator.services.messages.message_sender import (
     _resolve_chat_service,
     send_intro,
@@ -16,6 +21,7 @@ from slack_chat_migrator.services.messages.message_sender import (
     track_message_stats,
 )
 from slack_chat_migrator.services.messages.reaction_processor import (
+    ReactionAccumulator,
     process_reactions_batch,
 )
 from slack_chat_migrator.services.spaces.discovery import log_space_mapping_conflicts
@@ -104,6 +110,51 @@ def _make_http_error(status=400, reason="Bad Request", content=b"error details")
     return HttpError(resp=resp, content=content)
 
 
+# ---------------------------------------------------------------------------
+# generate_message_id
+# ---------------------------------------------------------------------------
+
+
+class TestGenerateMessageId:
+    """Tests for generate_message_id()."""
+
+    def test_deterministic(self):
+        a = generate_message_id("1700000000.000001", False, "", "C012AB3CD")
+        b = generate_message_id("1700000000.000001", False, "", "C012AB3CD")
+        assert a == b
+
+    def test_readable_form(self):
+        message_id = generate_message_id("1700000000.000001", False, "", "C012AB3CD")
+        assert message_id == "client-slack-c012ab3cd-1700000000-000001"
+
+    def test_distinct_per_channel(self):
+        a = generate_message_id("1700000000.000001", False, "", "C001")
+        b = generate_message_id("1700000000.000001", False, "", "C002")
+        assert a != b
+
+    def test_edit_changes_id(self):
+        original = generate_message_id("1700000000.000001", False, "", "C001")
+        edited = generate_message_id(
+            "1700000000.000001", True, "1700000100.000002", "C001"
+        )
+        assert original != edited
+        assert edited.startswith("client-slack-edit-")
+
+    def test_long_id_hashed_within_limit(self):
+        message_id = generate_message_id(
+            "1700000000.000001", True, "1700000100.000002", "C0123456789AB"
+        )
+        assert len(message_id) <= MESSAGE_ID_MAX_LENGTH
+        assert message_id.startswith("client-slack-edit-")
+        assert message_id == generate_message_id(
+            "1700000000.000001", True, "1700000100.000002", "C0123456789AB"
+        )
+
+    def test_only_valid_characters(self):
+        message_id = generate_message_id("1.2", False, "", "general_chat!")
+        assert all(c.isdigit() or c.islower() or c == "-" for c in message_id)
+
+
 # ---------------------------------------------------------------------------
 # TestTrackMessageStats (existing)
 # ---------------------------------------------------------------------------
@@ -380,7 +431,7 @@ class TestSendMessage:
         """Thread replies use the stored thread name from thread_map."""
         ctx, state, chat, ur, ap = _make_send_deps()
         state.messages.thread_map = {
-            "1700000000.000001": "spaces/SPACE1/threads/THREAD001"
+            ("general", "1700000000.000001"): "spaces/SPACE1/threads/THREAD001"
         }
         msg = {
             "ts": "1700000000.000050",
@@ -403,6 +454,24 @@ class TestSendMessage:
             == "REPLY_MESSAGE_FALLBACK_TO_NEW_THREAD"
         )
 
+    def test_thread_reply_ignores_other_channels_threads(self):
+        """A thread with the same ts in another channel is not replied to."""
+        ctx, state, chat, ur, ap = _make_send_deps()
+        state.messages.thread_map = {
+            ("random", "1700000000.000001"): "spaces/OTHER/threads/THREAD001"
+        }
+        msg = {
+            "ts": "1700000000.000050",
+            "user": "U001",
+            "text": "Reply text",
+            "thread_ts": "1700000000.000001",
+        }
+
+        send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", msg)
+
+        call_kwargs = chat.create_message.call_args
+        assert call_kwargs[1]["body"]["thread"] == {"thread_key": "1700000000.000001"}
+
     def test_thread_reply_falls_back_to_thread_key(self):
         """Thread replies without stored thread name fall back to thread_key."""
         ctx, state, chat, ur, ap = _make_send_deps()
@@ -438,7 +507,7 @@ class TestSendMessage:
         send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", msg)
 
         assert (
-            state.messages.thread_map["1700000000.000001"]
+            state.messages.thread_map[("general", "1700000000.000001")]
             == "spaces/SPACE1/threads/THREAD001"
         )
 
@@ -505,7 +574,7 @@ class TestSendMessage:
 
         send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", msg)
 
-        edit_key = "1700000000.000001:edited:1700000001.000000"
+        edit_key = ("general", "1700000000.000001:edited:1700000001.000000")
         assert edit_key in state.messages.message_id_map
         assert (
             state.messages.message_id_map[edit_key] == "spaces/SPACE1/messages/MSG001"
@@ -553,6 +622,87 @@ class TestSendMessage:
         assert state.messages.failed_messages[0]["channel"] == "general"
         assert state.messages.failed_messages[0]["ts"] == "1700000000.000001"
 
+    def test_409_already_exists_counts_as_success(self):
+        """A conflict on the deterministic message ID means it was already sent."""
+        ctx, state, chat, ur, ap = _make_send_deps()
+        chat.create_message.side_effect = _make_http_error(
+            status=409, reason="Conflict", content=b"ALREADY_EXISTS"
+        )
+        chat.get_message.side_effect = lambda name: {"name": name}
+        msg = {"ts": "1700000000.000001", "user": "U001", "text": "Hello"}
+
+        result = send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", msg)
+
+        assert result.success is True
+        message_id = chat.create_message.call_args.kwargs["message_id"]
+        assert result.message_name == f"spaces/SPACE1/messages/{message_id}"
+        chat.get_message.assert_called_once_with(result.message_name)
+        assert state.messages.failed_messages == []
+
+    def test_409_parent_still_threads_replies(self):
+        """After a conflict the existing parent's thread is used for replies."""
+        ctx, state, chat, ur, ap = _make_send_deps()
+        thread_name = "spaces/SPACE1/threads/EXISTING"
+        chat.create_message.side_effect = [
+            _make_http_error(status=409, reason="Conflict", content=b"ALREADY_EXISTS"),
+            {"name": "spaces/SPACE1/messages/R1", "thread": {"name": thread_name}},
+        ]
+        chat.get_message.side_effect = lambda name: {
+            "name": name,
+            "thread": {"name": thread_name},
+        }
+        parent = {"ts": "1700000000.000001", "user": "U001", "text": "Parent"}
+        reply = {
+            "ts": "1700000000.000002",
+            "user": "U001",
+            "text": "Reply",
+            "thread_ts": "1700000000.000001",
+        }
+
+        with patch(
+            "slack_chat_migrator.services.messages.message_sender.log_with_context"
+        ) as mock_log:
+            send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", parent)
+        with patch(
+            "slack_chat_migrator.services.messages.message_builder.log_with_context"
+        ) as mock_builder_log:
+            send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", reply)
+
+        assert state.messages.thread_map[("general", parent["ts"])] == thread_name
+        reply_body = chat.create_message.call_args.kwargs["body"]
+        assert reply_body["thread"] == {"name": thread_name}
+        warnings = [
+            c
+            for log in (mock_log, mock_builder_log)
+            for c in log.call_args_list
+            if c.args[0] == logging.WARNING
+        ]
+        assert warnings == []
+
+    def test_409_unreadable_existing_message_falls_back_to_name(self):
+        ctx, state, chat, ur, ap = _make_send_deps()
+        chat.create_message.side_effect = _make_http_error(
+            status=409, reason="Conflict", content=b"ALREADY_EXISTS"
+        )
+        chat.get_message.side_effect = _make_http_error(status=404)
+        msg = {"ts": "1700000000.000001", "user": "U001", "text": "Hello"}
+
+        result = send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", msg)
+
+        message_id = chat.create_message.call_args.kwargs["message_id"]
+        assert result.message_name == f"spaces/SPACE1/messages/{message_id}"
+
+    def test_message_id_is_stable_across_sends(self):
+        """Re-sending the same Slack message reuses the same message ID."""
+        ctx, state, chat, ur, ap = _make_send_deps()
+        msg = {"ts": "1700000000.000001", "user": "U001", "text": "Hello"}
+
+        send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", msg)
+        send_message(ctx, state, chat, ur, ap, "spaces/SPACE1", dict(msg))
+
+        ids = [c.kwargs["message_id"] for c in chat.create_message.call_args_list]
+        assert ids[0] == ids[1]
+
     def test_update_mode_skips_already_sent_message(self):
         """Update mode skips messages already in sent_messages set."""
         ctx, state, chat, ur, ap = _make_send_deps(update_mode=True)
@@ -788,8 +938,8 @@ class TestProcessReactionsBatch:
         # Reaction is counted in the summary (happens before external check)
         assert state.progress.migration_summary["reactions_created"] == 1
 
-    def test_admin_service_fallback_sends_reactions_synchronously(self):
-        """When impersonation fails (delegate == admin), reactions are sent one by one."""
+    def test_admin_service_fallback_batches_reactions(self):
+        """When impersonation fails (delegate == admin), the admin batch is used."""
         ctx, state, chat, ur = self._setup()
         # Make get_delegate return the admin service (same as chat)
         ur.get_delegate.return_value = chat
@@ -799,8 +949,29 @@ class TestProcessReactionsBatch:
             ctx, state, chat, ur, "spaces/S1/messages/M1", reactions, "M1"
         )
 
-        # Verify synchronous create_reaction was called via admin service
-        chat.create_reaction.assert_called()
+        chat.new_batch_http_request.return_value.execute.assert_called_once()
+        chat.create_reaction.assert_not_called()
+
+    def test_accumulator_defers_sending(self):
+        """With an accumulator, reactions are queued instead of executed."""
+        ctx, state, chat, ur = self._setup()
+        delegate = ur.get_delegate.return_value
+        accumulator = ReactionAccumulator(state)
+        reactions = [{"name": "thumbsup", "users": ["U001", "U002"]}]
+
+        process_reactions_batch(
+            ctx,
+            state,
+            chat,
+            ur,
+            "spaces/S1/messages/M1",
+            reactions,
+            "M1",
+            accumulator=accumulator,
+        )
+
+        delegate.new_batch_http_request.assert_not_called()
+        assert accumulator.pending_count == 2
 
     def test_batch_execution_error_is_caught(self):
         """HttpError during batch.execute() is logged and does not raise."""
@@ -859,6 +1030,179 @@ class TestProcessReactionsBatch:
         assert state.progress.migration_summary["reactions_created"] == 0
 
 
+# ---------------------------------------------------------------------------
+# TestReactionAccumulator
+# ---------------------------------------------------------------------------
+
+
+class _FakeBatch:
+    """Minimal BatchHttpRequest stand-in that records added requests."""
+
+    def __init__(self, callback, failing_ids=(), status=500):
+        self.callback = callback
+        self.requests = []
+        self._failing_ids = set(failing_ids)
+        self._status = status
+
+    def add(self, request, request_id=None):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, _ in self.requests:
+            if request_id in self._failing_ids:
+                self.callback(request_id, None, _make_http_error(self._status))
+            else:
+                self.callback(request_id, {}, None)
+
+
+class TestReactionAccumulator:
+    """Tests for ReactionAccumulator."""
+
+    def _svc(self, failing_ids=(), status=500):
+        svc = MagicMock()
+        svc.batches = []
+
+        def new_batch(callback=None):
+            batch = _FakeBatch(callback, failing_ids, status)
+            svc.batches.append(batch)
+            return batch
+
+        svc.new_batch_http_request.side_effect = new_batch
+        return svc
+
+    def test_batches_across_messages(self):
+        state = _make_state()
+        svc = self._svc()
+        acc = ReactionAccumulator(state, max_batch_size=100, flush_interval=60)
+
+        for i in range(5):
+            acc.add("a@example.com", svc, f"spaces/S/messages/M{i}", f"M{i}", ["👍"])
+        assert svc.batches == []
+
+        acc.flush()
+
+        assert len(svc.batches) == 1
+        assert len(svc.batches[0].requests) == 5
+        assert acc.pending_count == 0
+
+    def test_flushes_at_max_batch_size(self):
+        state = _make_state()
+        svc = self._svc()
+        acc = ReactionAccumulator(state, max_batch_size=3, flush_interval=60)
+
+        acc.add("a@example.com", svc, "spaces/S/messages/M1", "M1", ["1", "2"])
+        acc.add("a@example.com", svc, "spaces/S/messages/M2", "M2", ["3", "4"])
+
+        assert len(svc.batches) == 1
+        assert len(svc.batches[0].requests) == 3
+        assert acc.pending_count == 1
+
+    def test_flushes_after_interval(self):
+        state = _make_state()
+        svc = self._svc()
+        now = [0.0]
+        acc = ReactionAccumulator(
+            state, max_batch_size=100, flush_interval=5, clock=lambda: now[0]
+        )
+
+        acc.add("a@example.com", svc, "spaces/S/messages/M1", "M1", ["👍"])
+        assert svc.batches == []
+        now[0] = 6.0
+        acc.add("b@example.com", svc, "spaces/S/messages/M2", "M2", ["👍"])
+
+        # a's queue is stale; b's was just created.
+        assert len(svc.batches) == 1
+        assert acc.pending_count == 1
+
+    def test_separate_batches_per_user(self):
+        state = _make_state()
+        svc_a, svc_b = self._svc(), self._svc()
+        acc = ReactionAccumulator(state, flush_interval=60)
+
+        acc.add("a@example.com", svc_a, "spaces/S/messages/M1", "M1", ["👍"])
+        acc.add("b@example.com", svc_b, "spaces/S/messages/M1", "M1", ["👍"])
+        acc.flush()
+
+        assert len(svc_a.batches) == 1
+        assert len(svc_b.batches) == 1
+
+    def test_failures_reported_per_message(self):
+        state = _make_state()
+        state.progress.migration_summary["reactions_created"] = 3
+        svc = self._svc(failing_ids={"1"})
+        acc = ReactionAccumulator(state, flush_interval=60)
+
+        acc.add("a@example.com", svc, "spaces/S/messages/M1", "M1", ["👍"])
+        acc.add("a@example.com", svc, "spaces/S/messages/M2", "M2", ["❤️"])
+        acc.add("a@example.com", svc, "spaces/S/messages/M3", "M3", ["🎉"])
+        acc.flush()
+
+        assert state.messages.failed_reactions_by_channel == {
+            "general": {"M2": [":❤️: (500)"]}
+        }
+        assert state.progress.migration_summary["reactions_created"] == 2
+
+    def test_on_added_called_per_created_reaction(self):
+        state = _make_state()
+        svc = self._svc(failing_ids={"1"})
+        added = []
+        acc = ReactionAccumulator(
+            state, flush_interval=60, on_added=lambda: added.append(1)
+        )
+
+        acc.add("a@example.com", svc, "spaces/S/messages/M1", "M1", ["👍", "❤️", "🎉"])
+        acc.flush()
+
+        assert len(added) == 2
+
+    def test_conflict_is_not_a_failure(self):
+        state = _make_state()
+        svc = self._svc(failing_ids={"0"}, status=409)
+        acc = ReactionAccumulator(state, flush_interval=60)
+
+        acc.add("a@example.com", svc, "spaces/S/messages/M1", "M1", ["👍"])
+        acc.flush()
+
+        assert state.messages.failed_reactions_by_channel == {}
+
+    def test_batch_execute_error_fails_every_reaction(self):
+        state = _make_state()
+        svc = MagicMock()
+        svc.new_batch_http_request.return_value.execute.side_effect = _make_http_error(
+            500
+        )
+        acc = ReactionAccumulator(state, flush_interval=60)
+
+        acc.add("a@example.com", svc, "spaces/S/messages/M1", "M1", ["👍", "🎉"])
+        acc.flush()
+
+        assert len(state.messages.failed_reactions_by_channel["general"]["M1"]) == 2
+
+    def test_failures_from_interval_flush_reach_state(self):
+        state = _make_state()
+        svc = self._svc(failing_ids={"0"})
+        now = [0.0]
+        acc = ReactionAccumulator(
+            state, max_batch_size=100, flush_interval=5, clock=lambda: now[0]
+        )
+
+        acc.add("a@example.com", svc, "spaces/S/messages/M1", "M1", ["👍"])
+        now[0] = 6.0
+        acc.flush_due()
+        assert len(svc.batches) == 1
+
+        acc.flush()
+
+        assert state.messages.failed_reactions_by_channel == {
+            "general": {"M1": [":👍: (500)"]}
+        }
+
+    def test_flush_with_nothing_queued(self):
+        acc = ReactionAccumulator(_make_state())
+        acc.flush()
+        assert acc.pending_count == 0
+
+
 # ---------------------------------------------------------------------------
 # TestSendIntro
 # ---------------------------------------------------------------------------
@@ -0,0 +1,148 @@
+"""Unit tests for the streaming channel message reader."""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from slack_chat_migrator.services.messages import message_stream
+from slack_chat_migrator.services.messages.message_stream import (
+    ChannelMessageStream,
+    dedupe_messages,
+    merge_day_files,
+)
+
+# 2024-01-01T00:00:00Z
+_DAY = 1704067200.0
+
+
+def _msg(ts: float, text: str = "", **extra: Any) -> dict[str, Any]:
+    return {"type": "message", "ts": f"{ts:.6f}", "text": text, **extra}
+
+
+def _write_day(ch_dir: Path, name: str, msgs: list[dict[str, Any]]) -> Path:
+    ch_dir.mkdir(exist_ok=True)
+    path = ch_dir / f"{name}.json"
+    path.write_text(json.dumps(msgs))
+    return path
+
+
+class TestMergeDayFiles:
+    """Tests for merge_day_files()."""
+
+    def test_merges_in_ts_order(self, tmp_path):
+        d1 = _write_day(tmp_path, "2024-01-01", [_msg(_DAY + 50), _msg(_DAY + 10)])
+        d2 = _write_day(
+            tmp_path, "2024-01-02", [_msg(_DAY + 86400 + 5), _msg(_DAY + 30)]
+        )
+
+        out = [float(m["ts"]) for m in merge_day_files([d1, d2], "general")]
+
+        assert out == sorted(out)
+        assert len(out) == 4
+
+    def test_equal_ts_keeps_file_order(self, tmp_path):
+        d1 = _write_day(tmp_path, "2024-01-01", [_msg(_DAY, "first")])
+        d2 = _write_day(tmp_path, "2024-01-02", [_msg(_DAY, "second")])
+
+        out = [m["text"] for m in merge_day_files([d1, d2], "general")]
+
+        assert out == ["first", "second"]
+
+    def test_later_files_opened_lazily(self, tmp_path):
+        days = [
+            _write_day(tmp_path, f"2024-01-{i:02d}", [_msg(_DAY + (i - 1) * 86400)])
+            for i in range(1, 6)
+        ]
+        opened: list[str] = []
+        real_load = message_stream._load_day_file
+
+        def tracking_load(path, channel, quiet):
+            opened.append(path.stem)
+            return real_load(path, channel, quiet)
+
+        with patch.object(message_stream, "_load_day_file", tracking_load):
+            it = merge_day_files(days, "general")
+            next(it)
+
+        # Only the first day and its neighbour (within the one-day
+        # timezone margin) have been read.
+        assert opened == ["2024-01-01", "2024-01-02"]
+
+    def test_unreadable_file_logged_and_skipped(self, tmp_path, caplog):
+        good = _write_day(tmp_path, "2024-01-01", [_msg(_DAY)])
+        bad = tmp_path / "2024-01-02.json"
+        bad.write_text("{not json")
+
+        with caplog.at_level(logging.WARNING, logger="slack_chat_migrator"):
+            out = list(merge_day_files([good, bad], "general"))
+
+        assert len(out) == 1
+        assert "Failed to load messages" in caplog.text
+
+    def test_non_date_filename_opened_first(self, tmp_path):
+        extra = _write_day(tmp_path, "extra", [_msg(_DAY - 500)])
+        day = _write_day(tmp_path, "2024-01-01", [_msg(_DAY)])
+
+        out = [float(m["ts"]) for m in merge_day_files([day, extra], "general")]
+
+        assert out == [_DAY - 500, _DAY]
+
+
+class TestDedupeMessages:
+    """Tests for dedupe_messages()."""
+
+    def test_drops_repeated_ts(self):
+        msgs = [_msg(1.0, "a"), _msg(1.0, "b"), _msg(2.0, "c")]
+        out = [m["text"] for m in dedupe_messages(iter(msgs), "general")]
+        assert out == ["a", "c"]
+
+    def test_drops_messages_without_ts(self):
+        msgs = [{"type": "message", "text": "no ts"}, _msg(1.0, "a")]
+        out = [m["text"] for m in dedupe_messages(iter(msgs), "general")]
+        assert out == ["a"]
+
+    def test_distinct_ts_strings_with_same_value_kept(self):
+        msgs = [
+            {"type": "message", "ts": "1.0", "text": "a"},
+            {"type": "message", "ts": "1.000000", "text": "b"},
+        ]
+        out = [m["text"] for m in dedupe_messages(iter(msgs), "general")]
+        assert out == ["a", "b"]
+
+    def test_logs_duplicate_summary(self, caplog):
+        msgs = [_msg(1.0), _msg(1.0)]
+        with caplog.at_level(logging.INFO, logger="slack_chat_migrator"):
+            list(dedupe_messages(iter(msgs), "general"))
+        assert "Deduplicated 1 messages" in caplog.text
+
+
+class TestChannelMessageStream:
+    """Tests for ChannelMessageStream."""
+
+    def test_reiterable_and_counts_messages(self, tmp_path):
+        _write_day(
+            tmp_path,
+            "2024-01-01",
+            [
+                _msg(_DAY + 2),
+                _msg(_DAY + 1),
+                _msg(_DAY + 1),
+                {"type": "file_comment", "ts": f"{_DAY + 3:.6f}"},
+            ],
+        )
+        stream = ChannelMessageStream(tmp_path, "general")
+
+        assert stream.count_messages() == 2
+        first = [m["ts"] for m in stream]
+        second = [m["ts"] for m in stream]
+        assert first == second
+        assert len(first) == 3
+
+    def test_empty_channel_dir(self, tmp_path):
+        stream = ChannelMessageStream(tmp_path, "general")
+        assert stream.count_messages() == 0
+        assert list(stream) == []
@@ -0,0 +1,170 @@
+"""Unit tests for the per-endpoint API metrics registry."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from slack_chat_migrator.constants import API_METRICS_FILENAME
+from slack_chat_migrator.utils.api import RetryWrapper
+from slack_chat_migrator.utils.metrics import (
+    ApiCall,
+    EndpointMetrics,
+    MetricsRegistry,
+    dump_api_metrics,
+    get_api_metrics,
+)
+
+
+def _http_error(status: int) -> HttpError:
+    resp = httplib2.Response({"status": status})
+    resp.reason = "error"
+    return HttpError(resp, b"error body")
+
+
+class _Request:
+    """Stand-in for googleapiclient's HttpRequest."""
+
+    def __init__(self, method_id: str, outcomes: list) -> None:
+        self.methodId = method_id
+        self._outcomes = outcomes
+
+    def execute(self):
+        outcome = self._outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+class _Resource:
+    def __init__(self, request: _Request) -> None:
+        self._request = request
+
+    def create(self):
+        return self._request
+
+
+class TestEndpointMetrics:
+    """Tests for EndpointMetrics."""
+
+    def test_counts_and_histogram(self):
+        metrics = EndpointMetrics(bucket_bounds=(10, 100))
+        metrics.observe(ApiCall("e"), 5)
+        metrics.observe(ApiCall("e", retries=2, rate_limited=1), 50)
+        metrics.observe(ApiCall("e", error="500"), 500)
+        assert metrics.calls == 3
+        assert metrics.retries == 2
+        assert metrics.rate_limited == 1
+        assert metrics.errors == {"500": 1}
+        assert metrics.bucket_counts == [1, 1, 1]
+        assert metrics.latency_ms_max == 500
+
+    def test_percentile_interpolates_within_bucket(self):
+        metrics = EndpointMetrics(bucket_bounds=(100, 200))
+        for _ in range(10):
+            metrics.observe(ApiCall("e"), 150)
+        assert metrics.percentile(0.5) == pytest.approx(125)
+        assert metrics.percentile(1.0) == pytest.approx(150)
+
+    def test_percentile_uses_max_for_overflow(self):
+        metrics = EndpointMetrics(bucket_bounds=(10,))
+        metrics.observe(ApiCall("e"), 1000)
+        assert metrics.percentile(0.99) == pytest.approx(10 + 990 * 0.99)
+
+    def test_empty(self):
+        metrics = EndpointMetrics()
+        assert metrics.percentile(0.5) is None
+        assert metrics.mean_ms is None
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_per_endpoint_and_totals(self):
+        registry = MetricsRegistry()
+        registry.observe(ApiCall("chat.spaces.messages.create"), 0.1)
+        registry.observe(ApiCall("chat.spaces.messages.create"), 0.2)
+        registry.observe(ApiCall("drive.files.create", error="403"), 1.0)
+
+        snapshot = registry.snapshot()
+        assert snapshot["chat.spaces.messages.create"].calls == 2
+        assert snapshot["drive.files.create"].error_count == 1
+        assert registry.totals().calls == 3
+
+    def test_snapshot_is_independent(self):
+        registry = MetricsRegistry()
+        registry.observe(ApiCall("e"), 0.1)
+        snapshot = registry.snapshot()
+        registry.observe(ApiCall("e"), 0.1)
+        assert snapshot["e"].calls == 1
+
+    def test_as_dict_orders_by_total_time(self):
+        registry = MetricsRegistry()
+        registry.observe(ApiCall("fast"), 0.01)
+        registry.observe(ApiCall("slow"), 5.0)
+        data = registry.as_dict()
+        assert list(data["endpoints"]) == ["slow", "fast"]
+        assert data["totals"]["calls"] == 2
+        assert data["endpoints"]["slow"]["latency_ms"]["max"] == 5000.0
+
+
+class TestDumpApiMetrics:
+    """Tests for dump_api_metrics()."""
+
+    def test_writes_json(self, tmp_path):
+        get_api_metrics().observe(ApiCall("chat.spaces.create"), 0.3)
+        path = dump_api_metrics(tmp_path)
+        assert path == tmp_path / API_METRICS_FILENAME
+        data = json.loads(path.read_text())
+        assert data["endpoints"]["chat.spaces.create"]["calls"] == 1
+
+    def test_nothing_written_without_calls(self, tmp_path):
+        assert dump_api_metrics(tmp_path) is None
+        assert not (tmp_path / API_METRICS_FILENAME).exists()
+
+
+class TestRetryWrapperMetrics:
+    """RetryWrapper records every execute() in the registry."""
+
+    def test_success_recorded(self):
+        request = _Request("chat.spaces.messages.create", [{"name": "m"}])
+        RetryWrapper(_Resource(request)).create().execute()
+
+        metrics = get_api_metrics().snapshot()["chat.spaces.messages.create"]
+        assert metrics.calls == 1
+        assert metrics.errors == {}
+        assert metrics.retries == 0
+
+    @patch("slack_chat_migrator.utils.api.time.sleep")
+    def test_retries_and_429s_recorded(self, _sleep):
+        request = _Request(
+            "drive.files.create", [_http_error(429), _http_error(503), {"id": "F"}]
+        )
+        RetryWrapper(_Resource(request), retry_delay=1.0).create().execute()
+
+        metrics = get_api_metrics().snapshot()["drive.files.create"]
+        assert metrics.retries == 2
+        assert metrics.rate_limited == 1
+        assert metrics.backoff_seconds == pytest.approx(1.0 + 2.0)
+        assert metrics.errors == {}
+
+    def test_final_error_class_recorded(self):
+        request = _Request("chat.spaces.members.create", [_http_error(403)])
+        with pytest.raises(HttpError):
+            RetryWrapper(_Resource(request)).create().execute()
+
+        metrics = get_api_metrics().snapshot()["chat.spaces.members.create"]
+        assert metrics.errors == {"403": 1}
+
+    def test_throttle_time_recorded(self):
+        rate_limit = MagicMock()
+        rate_limit.acquire.return_value = 0.25
+        request = _Request("chat.spaces.messages.create", [{"name": "m"}])
+        RetryWrapper(_Resource(request), rate_limit=rate_limit).create().execute()
+
+        metrics = get_api_metrics().snapshot()["chat.spaces.messages.create"]
+        assert metrics.throttle_seconds == pytest.approx(0.25)
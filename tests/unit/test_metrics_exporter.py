@@ -0,0 +1,203 @@
+"""Unit tests for the OpenMetrics exporter."""
+
+from __future__ import annotations
+
+import urllib.error
+import urllib.request
+
+import pytest
+
+from slack_chat_migrator.cli.metrics_exporter import (
+    CONTENT_TYPE,
+    MetricsExporter,
+    ProgressStats,
+    RateWindow,
+    render_openmetrics,
+)
+from slack_chat_migrator.core.progress import ProgressTracker
+from slack_chat_migrator.utils.metrics import ApiCall, MetricsRegistry
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _samples(text: str) -> dict[str, float]:
+    """Parse exposition text into {"name{labels}": value}."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+class TestRateWindow:
+    """Tests for RateWindow."""
+
+    def test_rate_over_window(self):
+        window = RateWindow(window_seconds=10)
+        for second in range(10):
+            window.add(100.0 + second, amount=2)
+        assert window.rate(109.5, elapsed=1000) == pytest.approx(2.0)
+
+    def test_old_buckets_expire(self):
+        window = RateWindow(window_seconds=10)
+        window.add(100.0, amount=50)
+        window.add(115.0)
+        assert window.rate(115.0, elapsed=1000) == pytest.approx(0.1)
+
+    def test_young_run_averages_over_its_age(self):
+        window = RateWindow(window_seconds=60)
+        window.add(100.0, amount=10)
+        assert window.rate(100.0, elapsed=5) == pytest.approx(2.0)
+
+
+class TestProgressStats:
+    """Tests for ProgressStats."""
+
+    def test_counts_events(self):
+        clock = _Clock()
+        tracker = ProgressTracker()
+        stats = ProgressStats(total_channels=2, clock=clock)
+        tracker.subscribe(stats.handle_event)
+
+        tracker.channel_start("general")
+        tracker.message_sent("general", count=1, total=4)
+        tracker.message_failed("general", detail="boom")
+        tracker.reaction_added("general")
+        tracker.file_uploaded("general", size_bytes=2048)
+        tracker.file_uploaded("general")
+
+        counters = stats.snapshot()["counters"]
+        assert counters["messages"] == 1
+        assert counters["messages_failed"] == 1
+        assert counters["reactions"] == 1
+        assert counters["files"] == 2
+        assert counters["uploaded_bytes"] == 2048
+        assert stats.snapshot()["active_channels"] == ["general"]
+
+    def test_eta_from_channel_progress(self):
+        clock = _Clock()
+        tracker = ProgressTracker()
+        stats = ProgressStats(total_channels=2, clock=clock)
+        tracker.subscribe(stats.handle_event)
+        assert stats.eta_seconds() is None
+
+        tracker.channel_start("a")
+        tracker.channel_complete("a")
+        tracker.channel_start("b")
+        tracker.message_phase_start("b", total=10)
+        tracker.message_sent("b", count=5, total=10)
+        clock.now += 300
+
+        # 1.5 of 2 channels done in 300s
+        assert stats.eta_seconds() == pytest.approx(100.0)
+        assert stats.snapshot()["active_channels"] == ["b"]
+
+    def test_eta_unknown_without_channel_total(self):
+        stats = ProgressStats()
+        assert stats.eta_seconds() is None
+
+
+class TestRenderOpenMetrics:
+    """Tests for render_openmetrics()."""
+
+    def test_progress_and_api_metrics(self):
+        clock = _Clock()
+        tracker = ProgressTracker()
+        stats = ProgressStats(total_channels=3, clock=clock)
+        tracker.subscribe(stats.handle_event)
+        tracker.phase_change("migration")
+        tracker.channel_start('we"ird')
+        tracker.message_sent('we"ird', count=1, total=2)
+
+        registry = MetricsRegistry(bucket_bounds=(100, 1000))
+        registry.observe(ApiCall("chat.spaces.messages.create"), 0.05)
+        registry.observe(
+            ApiCall("chat.spaces.messages.create", rate_limited=1, retries=1), 0.5
+        )
+        registry.observe(ApiCall("drive.files.create", error="403"), 2.0)
+
+        text = render_openmetrics(stats, registry)
+        samples = _samples(text)
+
+        assert text.endswith("# EOF\n")
+        assert "# TYPE slack_migrator_messages counter" in text
+        assert samples["slack_migrator_messages_total"] == 1
+        assert samples["slack_migrator_channels"] == 3
+        assert samples['slack_migrator_current_channel_info{channel="we\\"ird"}'] == 1
+        assert samples['slack_migrator_phase_info{phase="migration"}'] == 1
+        assert "slack_migrator_messages_per_second" in samples
+        assert samples["slack_migrator_rate_limited_ratio"] == pytest.approx(1 / 3)
+
+        endpoint = '{endpoint="chat.spaces.messages.create"'
+        assert samples[f"slack_migrator_api_calls_total{endpoint}}}"] == 2
+        assert samples[f"slack_migrator_api_rate_limited_total{endpoint}}}"] == 1
+        assert (
+            samples[f'slack_migrator_api_latency_seconds_bucket{endpoint},le="0.1"}}']
+            == 1
+        )
+        assert (
+            samples[f'slack_migrator_api_latency_seconds_bucket{endpoint},le="1.0"}}']
+            == 2
+        )
+        assert (
+            samples[f'slack_migrator_api_latency_seconds_bucket{endpoint},le="+Inf"}}']
+            == 2
+        )
+        assert samples[
+            f"slack_migrator_api_latency_seconds_sum{endpoint}}}"
+        ] == pytest.approx(0.55)
+        assert (
+            samples[
+                'slack_migrator_api_errors_total{endpoint="drive.files.create",error="403"}'
+            ]
+            == 1
+        )
+
+    def test_eta_omitted_until_known(self):
+        text = render_openmetrics(ProgressStats(), MetricsRegistry())
+        assert "# TYPE slack_migrator_eta_seconds gauge" in text
+        assert "slack_migrator_eta_seconds" not in _samples(text)
+
+
+class TestMetricsExporter:
+    """Tests for the HTTP endpoint."""
+
+    @pytest.fixture
+    def exporter(self):
+        tracker = ProgressTracker()
+        exporter = MetricsExporter(
+            tracker, port=0, total_channels=1, metrics=MetricsRegistry()
+        )
+        exporter.start()
+        yield tracker, exporter
+        exporter.stop()
+
+    def test_serves_metrics(self, exporter):
+        tracker, exp = exporter
+        tracker.message_sent("general")
+
+        with urllib.request.urlopen(exp.url, timeout=5) as response:  # noqa: S310
+            body = response.read().decode("utf-8")
+            assert response.headers["Content-Type"] == CONTENT_TYPE
+
+        assert _samples(body)["slack_migrator_messages_total"] == 1
+
+    def test_unknown_path_is_404(self, exporter):
+        _, exp = exporter
+        with pytest.raises(urllib.error.HTTPError) as excinfo:
+            urllib.request.urlopen(  # noqa: S310
+                exp.url.replace("/metrics", "/other"), timeout=5
+            )
+        assert excinfo.value.code == 404
+
+    def test_stop_is_idempotent(self, exporter):
+        _, exp = exporter
+        exp.stop()
+        exp.stop()
@@ -68,6 +68,7 @@ def _make_migrator(tmp_path, domain="example.com", users=None, channels=None, **
         verbose=kwargs.get("verbose", False),
         update_mode=kwargs.get("update_mode", False),
         debug_api=kwargs.get("debug_api", False),
+        channel_workers=kwargs.get("channel_workers", 1),
     )
     # Create UserResolver eagerly (mirrors _initialize_api_services but
     # with chat=None — tests here don't exercise impersonation/API calls).
@@ -202,6 +203,29 @@ class TestInitParams:
         assert isinstance(m.export_root, Path)
         assert m.export_root == tmp_path
 
+    def test_channel_workers_default(self, tmp_path):
+        m = _make_migrator(tmp_path)
+        assert m.channel_workers == 1
+
+    def test_channel_workers_stored(self, tmp_path):
+        m = _make_migrator(tmp_path, channel_workers=4)
+        assert m.channel_workers == 4
+
+    def test_channel_workers_below_one_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="channel_workers"):
+            _make_migrator(tmp_path, channel_workers=0)
+
+    def test_low_memory_requires_dry_run(self, tmp_path):
+        _setup_export(tmp_path)
+        with pytest.raises(ValueError, match="low_memory"):
+            SlackToChatMigrator(
+                creds_path="fake_creds.json",
+                export_path=str(tmp_path),
+                workspace_admin="admin@example.com",
+                config_path=str(tmp_path / "config.yaml"),
+                low_memory=True,
+            )
+
 
 class TestInitCaches:
     """Tests that caches and state tracking dicts are initialized."""
@@ -461,6 +485,69 @@ class TestExportPathValidation:
             for r in caplog.records
         )
 
+    def test_channel_dir_warnings_in_directory_order(self, tmp_path, caplog):
+        """Empty channel directories are reported in a stable order."""
+        channels = [
+            {"id": f"C{i:03d}", "name": f"ch{i:02d}", "members": []} for i in range(40)
+        ]
+        _setup_export(tmp_path, channels=channels)
+        for ch in channels[::2]:
+            (tmp_path / ch["name"] / "2024-01-01.json").write_text("[]")
+
+        with caplog.at_level(logging.WARNING, logger="slack_chat_migrator"):
+            _make_migrator(tmp_path, channels=channels)
+
+        warned = [
+            r.message.rsplit(" ", 1)[-1]
+            for r in caplog.records
+            if "No JSON files found in channel directory" in r.message
+        ]
+        expected = [
+            d.name
+            for d in os.scandir(tmp_path)
+            if d.is_dir() and d.name in {ch["name"] for ch in channels[1::2]}
+        ]
+        assert warned == expected
+
+
+class TestStartupPipeline:
+    """Tests for the startup phases run by __init__."""
+
+    def test_metadata_files_read_once(self, tmp_path):
+        # ignore_bots makes the unmapped-user scan look at users.json too
+        (tmp_path / "config.yaml").write_text("ignore_bots: true\n")
+        opened: list[str] = []
+        real_open = open
+
+        def counting_open(file, mode="r", *args, **kwargs):
+            if "r" in mode:
+                opened.append(Path(file).name)
+            return real_open(file, mode, *args, **kwargs)
+
+        with patch("builtins.open", counting_open), patch("io.open", counting_open):
+            m = _make_migrator(tmp_path)
+
+        assert m.config.ignore_bots is True
+        assert opened.count("users.json") == 1
+        assert opened.count("channels.json") == 1
+
+    def test_phase_timings_recorded_and_logged(self, tmp_path, caplog):
+        with caplog.at_level(logging.INFO, logger="slack_chat_migrator"):
+            m = _make_migrator(tmp_path)
+
+        assert list(m.startup_timings) == [
+            "validate_export",
+            "load_config",
+            "read_metadata",
+            "user_map",
+            "unmapped_user_scan",
+            "export_catalog",
+        ]
+        assert all(seconds >= 0 for seconds in m.startup_timings.values())
+        summary = next(r.message for r in caplog.records if "Startup took" in r.message)
+        assert "read_metadata" in summary
+        assert "unmapped_user_scan" in summary
+
 
 # ---------------------------------------------------------------------------
 # _load_channels_meta tests
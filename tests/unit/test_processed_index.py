@@ -0,0 +1,107 @@
+"""Unit tests for the per-channel processed-message index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from slack_chat_migrator.core.processed_index import (
+    ProcessedIndex,
+    processed_index_path,
+)
+
+
+def _path(tmp_path: Path) -> Path:
+    return processed_index_path(tmp_path / "run_1", "general")
+
+
+class TestProcessedIndexPath:
+    """Tests for processed_index_path()."""
+
+    def test_under_hidden_dir(self, tmp_path):
+        assert _path(tmp_path) == tmp_path / ".processed" / "general.ts"
+
+    def test_shared_across_runs(self, tmp_path):
+        assert processed_index_path(tmp_path / "run_1", "general") == (
+            processed_index_path(tmp_path / "run_2", "general")
+        )
+
+
+class TestProcessedIndex:
+    """Tests for ProcessedIndex."""
+
+    def test_in_memory_index(self):
+        index = ProcessedIndex("spaces/S1")
+        index.add("100.000001")
+        assert "100.000001" in index
+        assert "200.0" not in index
+        assert len(index) == 1
+
+    def test_add_is_idempotent(self, tmp_path):
+        with ProcessedIndex.load(_path(tmp_path), "spaces/S1") as index:
+            index.add("1.0")
+            index.add("1.0")
+        lines = _path(tmp_path).read_text().splitlines()
+        assert lines == ["# space: spaces/S1", "1.0"]
+
+    def test_round_trip(self, tmp_path):
+        with ProcessedIndex.load(_path(tmp_path), "spaces/S1") as index:
+            index.add("1.000001")
+            index.add("2.000002")
+
+        reloaded = ProcessedIndex.load(_path(tmp_path), "spaces/S1")
+        assert "1.000001" in reloaded
+        assert "2.000002" in reloaded
+        assert len(reloaded) == 2
+
+    def test_appends_on_resume(self, tmp_path):
+        with ProcessedIndex.load(_path(tmp_path), "spaces/S1") as index:
+            index.add("1.0")
+        with ProcessedIndex.load(_path(tmp_path), "spaces/S1") as index:
+            index.add("2.0")
+
+        reloaded = ProcessedIndex.load(_path(tmp_path), "spaces/S1")
+        assert len(reloaded) == 2
+
+    def test_compact_lookup_uses_sorted_array(self, tmp_path):
+        with ProcessedIndex.load(_path(tmp_path), "spaces/S1") as index:
+            for ts in ("3.000003", "1.000001", "2.000002"):
+                index.add(ts)
+
+        compact = ProcessedIndex.load(_path(tmp_path), "spaces/S1", compact=True)
+        assert list(compact._previous) == [1.000001, 2.000002, 3.000003]
+        assert "2.000002" in compact
+        assert "2.5" not in compact
+        assert "9.0" not in compact
+
+    def test_compact_mixes_previous_and_current(self, tmp_path):
+        with ProcessedIndex.load(_path(tmp_path), "spaces/S1") as index:
+            index.add("1.0")
+        with ProcessedIndex.load(_path(tmp_path), "spaces/S1", compact=True) as index:
+            index.add("2.0")
+            assert "1.0" in index
+            assert "2.0" in index
+            assert len(index) == 2
+
+    def test_other_space_discarded(self, tmp_path):
+        with ProcessedIndex.load(_path(tmp_path), "spaces/OLD") as index:
+            index.add("1.0")
+
+        with ProcessedIndex.load(_path(tmp_path), "spaces/NEW") as index:
+            assert "1.0" not in index
+            index.add("2.0")
+
+        assert _path(tmp_path).read_text().splitlines() == [
+            "# space: spaces/NEW",
+            "2.0",
+        ]
+
+    def test_sorted_timestamps(self):
+        index = ProcessedIndex("spaces/S1")
+        for ts in ("3.0", "1.0", "2.0"):
+            index.add(ts)
+        assert list(index.sorted_timestamps()) == [1.0, 2.0, 3.0]
+
+    def test_non_string_not_contained(self):
+        index = ProcessedIndex("spaces/S1")
+        index.add("1.0")
+        assert 1.0 not in index
@@ -0,0 +1,154 @@
+"""Unit tests for the adaptive token-bucket rate limiter."""
+
+from __future__ import annotations
+
+import pytest
+
+from slack_chat_migrator.utils.rate_limit import (
+    RateLimit,
+    RateLimiterRegistry,
+    TokenBucket,
+    get_rate_limiter,
+    reset_rate_limiters,
+)
+
+
+class _FakeClock:
+    """Manually advanced monotonic clock; ``sleep`` advances it too."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _bucket(clock: _FakeClock, rate: float = 10.0, capacity: float = 2) -> TokenBucket:
+    return TokenBucket(
+        rate,
+        capacity,
+        min_rate=1.0,
+        backoff_factor=0.5,
+        recovery_step=1.0,
+        clock=clock,
+        sleep=clock.sleep,
+    )
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_burst_is_immediate(self):
+        clock = _FakeClock()
+        bucket = _bucket(clock, capacity=3)
+        for _ in range(3):
+            assert bucket.acquire() == 0.0
+        assert clock.sleeps == []
+
+    def test_waits_once_burst_exhausted(self):
+        clock = _FakeClock()
+        bucket = _bucket(clock, rate=10.0, capacity=1)
+        bucket.acquire()
+        waited = bucket.acquire()
+        assert waited == pytest.approx(0.1)
+
+    def test_refills_over_time(self):
+        clock = _FakeClock()
+        bucket = _bucket(clock, rate=10.0, capacity=1)
+        bucket.acquire()
+        clock.now += 1.0
+        assert bucket.acquire() == 0.0
+
+    def test_concurrent_reservations_queue(self):
+        """Each reservation past the burst waits one token-interval longer."""
+        clock = _FakeClock()
+        bucket = _bucket(clock, rate=10.0, capacity=1)
+        waits = [bucket.reserve() for _ in range(4)]
+        assert waits == pytest.approx([0.0, 0.1, 0.2, 0.3])
+
+    def test_rate_limited_halves_rate(self):
+        clock = _FakeClock()
+        bucket = _bucket(clock, rate=10.0)
+        bucket.on_rate_limited()
+        assert bucket.rate == 5.0
+
+    def test_rate_limited_respects_floor(self):
+        clock = _FakeClock()
+        bucket = _bucket(clock, rate=10.0)
+        for _ in range(10):
+            bucket.on_rate_limited()
+        assert bucket.rate == 1.0
+
+    def test_rate_limited_drops_banked_burst(self):
+        clock = _FakeClock()
+        bucket = _bucket(clock, rate=10.0, capacity=5)
+        bucket.on_rate_limited()
+        assert bucket.acquire() > 0
+
+    def test_success_recovers_up_to_max(self):
+        clock = _FakeClock()
+        bucket = _bucket(clock, rate=10.0)
+        bucket.on_rate_limited()
+        bucket.on_success()
+        assert bucket.rate == 6.0
+        for _ in range(20):
+            bucket.on_success()
+        assert bucket.rate == 10.0
+
+    def test_non_positive_rate_rejected(self):
+        with pytest.raises(ValueError, match="rate"):
+            TokenBucket(0)
+
+
+class TestRateLimiterRegistry:
+    """Tests for RateLimiterRegistry and the module-level helpers."""
+
+    def test_same_user_shares_buckets(self):
+        registry = RateLimiterRegistry()
+        a = registry.for_user("chat", "alice@example.com")
+        b = registry.for_user("chat", "alice@example.com")
+        a.on_rate_limited()
+        assert a._buckets[1] is b._buckets[1]
+
+    def test_api_bucket_shared_across_users(self):
+        registry = RateLimiterRegistry()
+        alice = registry.for_user("chat", "alice@example.com")
+        bob = registry.for_user("chat", "bob@example.com")
+        assert alice._buckets[0] is bob._buckets[0]
+        assert alice._buckets[1] is not bob._buckets[1]
+
+    def test_apis_are_independent(self):
+        registry = RateLimiterRegistry()
+        chat = registry.for_user("chat", "alice@example.com")
+        drive = registry.for_user("drive", "alice@example.com")
+        assert chat._buckets[0] is not drive._buckets[0]
+        assert chat._buckets[1] is not drive._buckets[1]
+
+    def test_rate_limit_applies_to_both_buckets(self):
+        clock = _FakeClock()
+        api_bucket = _bucket(clock, rate=10.0)
+        user_bucket = _bucket(clock, rate=4.0)
+        limit = RateLimit(api_bucket, user_bucket)
+        limit.on_rate_limited()
+        assert api_bucket.rate == 5.0
+        assert user_bucket.rate == 2.0
+
+    def test_user_scoped_rate_limit_spares_api_bucket(self):
+        clock = _FakeClock()
+        api_bucket = _bucket(clock, rate=10.0)
+        user_bucket = _bucket(clock, rate=4.0)
+        limit = RateLimit(api_bucket, user_bucket)
+        limit.on_rate_limited(user_scoped=True)
+        assert api_bucket.rate == 10.0
+        assert user_bucket.rate == 2.0
+
+    def test_reset_rate_limiters(self):
+        before = get_rate_limiter("chat", "alice@example.com")
+        reset_rate_limiters()
+        after = get_rate_limiter("chat", "alice@example.com")
+        assert before._buckets[1] is not after._buckets[1]
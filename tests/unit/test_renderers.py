@@ -9,6 +9,7 @@ from slack_chat_migrator.cli.renderers import create_renderer
 from slack_chat_migrator.cli.renderers.plain_renderer import PlainProgressRenderer
 from slack_chat_migrator.cli.renderers.rich_renderer import RichProgressRenderer
 from slack_chat_migrator.core.progress import EventType, ProgressEvent, ProgressTracker
+from slack_chat_migrator.utils.metrics import ApiCall, MetricsRegistry
 
 
 class TestPlainProgressRenderer:
@@ -370,6 +371,53 @@ class TestRichThroughputAndErrors:
         assert "Throughput" not in output
 
 
+class TestApiMetricsDisplay:
+    """Renderers show live API metrics from the registry."""
+
+    @staticmethod
+    def _metrics() -> MetricsRegistry:
+        metrics = MetricsRegistry()
+        metrics.observe(ApiCall("chat.spaces.messages.create"), 0.08)
+        metrics.observe(
+            ApiCall("drive.files.create", rate_limited=2, backoff_seconds=3.0), 2.0
+        )
+        return metrics
+
+    def test_rich_stats_include_api_rows(self):
+        from io import StringIO
+
+        from rich.console import Console
+
+        renderer = RichProgressRenderer(ProgressTracker(), metrics=self._metrics())
+        buf = StringIO()
+        Console(file=buf, width=100).print(renderer._build_stats_table())
+        output = buf.getvalue()
+        assert "API calls" in output
+        assert "Rate limited (429)" in output
+        assert "drive.files.create" in output
+
+    def test_rich_stats_omit_api_rows_without_calls(self):
+        from io import StringIO
+
+        from rich.console import Console
+
+        renderer = RichProgressRenderer(ProgressTracker(), metrics=MetricsRegistry())
+        buf = StringIO()
+        Console(file=buf, width=100).print(renderer._build_stats_table())
+        assert "API calls" not in buf.getvalue()
+
+    def test_plain_status_includes_api_summary(self):
+        tracker = ProgressTracker()
+        output = io.StringIO()
+        renderer = PlainProgressRenderer(
+            tracker, output=output, interval=0, metrics=self._metrics()
+        )
+        renderer.start()
+        tracker.message_sent("general")
+        assert "API: 2 calls" in output.getvalue()
+        assert "2 x 429" in output.getvalue()
+
+
 class TestPlainRendererDryRun:
     """Tests for dry-run mode in the plain renderer."""
 
@@ -679,6 +679,28 @@ class TestGenerateReport:
         rec_types = [r["type"] for r in report["recommendations"]]
         assert "skipped_reactions" in rec_types
 
+    @patch("slack_chat_migrator.cli.report.log_with_context")
+    def test_failed_reactions_in_report(self, mock_log, tmp_path):
+        ctx = _make_ctx()
+        state = _make_state(output_dir=str(tmp_path))
+        state.messages.failed_reactions_by_channel = {
+            "general": {"M1": [":👍: (500)", ":🎉: (500)"], "M2": [":❤️: (403)"]}
+        }
+        user_resolver = MagicMock()
+        user_resolver.is_external_user.return_value = False
+
+        result = generate_report(ctx, state, user_resolver)
+
+        with open(result) as f:
+            report = yaml.safe_load(f)
+
+        assert report["migration_summary"]["failed_reactions_count"] == 3
+        assert report["spaces"]["general"]["failed_reactions"] == 3
+        assert report["spaces"]["random"]["failed_reactions"] == 0
+        assert report["failed_reactions"]["general"]["M2"] == [":❤️: (403)"]
+        rec_types = [r["type"] for r in report["recommendations"]]
+        assert "failed_reactions" in rec_types
+
     @patch("slack_chat_migrator.cli.report.log_with_context")
     def test_file_statistics_in_report(self, mock_log, tmp_path):
         ctx = _make_ctx()
@@ -0,0 +1,74 @@
+"""Unit tests for reservoir sampling."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+
+import pytest
+
+from slack_chat_migrator.utils.sampling import Reservoir
+
+
+class TestReservoir:
+    """Tests for Reservoir."""
+
+    def test_keeps_everything_below_size(self):
+        sample = Reservoir[int](5)
+        for i in range(3):
+            sample.add(i)
+        assert sample.items == [0, 1, 2]
+        assert sample.seen == 3
+
+    def test_bounded_and_counts_all(self):
+        sample = Reservoir[int](10)
+        for i in range(10_000):
+            sample.add(i)
+        assert len(sample.items) == 10
+        assert len(set(sample.items)) == 10
+        assert sample.seen == 10_000
+
+    def test_uniform(self):
+        hits: Counter[int] = Counter()
+        for seed in range(2000):
+            sample = Reservoir[int](2, seed=seed)
+            for i in range(10):
+                sample.add(i)
+            hits.update(sample.items)
+        # Each of the 10 items lands in a 2-item sample ~20% of the time
+        assert all(300 < hits[i] < 500 for i in range(10))
+
+    def test_seeded(self):
+        def run() -> list[int]:
+            sample = Reservoir[int](3, seed=7)
+            for i in range(100):
+                sample.add(i)
+            return sample.items
+
+        assert run() == run()
+
+    def test_updates_given_list_in_place(self):
+        items: list[int] = [1, 2]
+        sample = Reservoir(3, items)
+        sample.add(3)
+        assert items == [1, 2, 3]
+        assert sample.seen == 3
+
+    def test_concurrent_adds(self):
+        sample = Reservoir[int](50)
+
+        def worker() -> None:
+            for i in range(1000):
+                sample.add(i)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sample.seen == 8000
+        assert len(sample.items) == 50
+
+    def test_rejects_empty_size(self):
+        with pytest.raises(ValueError):
+            Reservoir(0)
@@ -0,0 +1,368 @@
+"""Unit tests for the simulated Chat/Drive backend."""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import patch
+
+import pytest
+from googleapiclient.errors import HttpError
+from googleapiclient.http import MediaInMemoryUpload
+
+from slack_chat_migrator.services.simulated_backend import (
+    LatencyModel,
+    SimulatedBackend,
+    SimulatedBackendServer,
+    SimulationProfile,
+    route,
+)
+from slack_chat_migrator.utils.api import (
+    RetryWrapper,
+    clear_service_cache,
+    get_gcp_service,
+    get_service_factory,
+    set_service_factory,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _backend(**profile) -> tuple[SimulatedBackend, list[float], _Clock]:
+    sleeps: list[float] = []
+    clock = _Clock()
+    backend = SimulatedBackend(
+        SimulationProfile(**profile), sleep=sleeps.append, clock=clock
+    )
+    return backend, sleeps, clock
+
+
+def _send(chat, text: str = "hi") -> dict:
+    return (
+        chat.spaces()
+        .messages()
+        .create(parent="spaces/S", body={"text": text})
+        .execute()
+    )
+
+
+class TestLatencyModel:
+    """Tests for LatencyModel.sample()."""
+
+    def test_median_and_tail(self):
+        rng = random.Random(1)  # noqa: S311
+        samples = sorted(LatencyModel(0.2, 1.0).sample(rng) for _ in range(5000))
+        assert samples[2500] == pytest.approx(0.2, rel=0.1)
+        assert samples[4950] == pytest.approx(1.0, rel=0.25)
+
+    def test_constant_without_tail(self):
+        rng = random.Random(0)  # noqa: S311
+        assert LatencyModel(0.3, 0.3).sample(rng) == 0.3
+
+
+class TestRoute:
+    """Tests for route()."""
+
+    @pytest.mark.parametrize(
+        ("method", "path", "endpoint"),
+        [
+            ("POST", "/v1/spaces", "chat.spaces.create"),
+            ("POST", "/v1/spaces/S:completeImport", "chat.spaces.completeImport"),
+            ("POST", "/v1/spaces/S/messages", "chat.spaces.messages.create"),
+            (
+                "POST",
+                "/v1/spaces/S/messages/M/reactions",
+                "chat.spaces.messages.reactions.create",
+            ),
+            ("POST", "/upload/v1/spaces/S/attachments:upload", "chat.media.upload"),
+            ("POST", "/upload/drive/v3/files", "drive.files.create"),
+            ("POST", "/drive/v3/files/F/permissions", "drive.permissions.create"),
+            ("POST", "/batch/drive/v3", "batch"),
+        ],
+    )
+    def test_known_endpoints(self, method, path, endpoint):
+        routed = route(method, path)
+        assert routed is not None
+        assert routed[0] == endpoint
+
+    def test_unknown_endpoint(self):
+        assert route("POST", "/v2/unknown") is None
+
+
+class TestSimulatedBackend:
+    """Tests for SimulatedBackend through real googleapiclient services."""
+
+    def test_chat_round_trip(self):
+        backend, sleeps, _ = _backend()
+        chat = backend.build_service("chat", "v1", "a@example.com")
+
+        space = chat.spaces().create(body={"displayName": "general"}).execute()
+        message = (
+            chat.spaces()
+            .messages()
+            .create(
+                parent=space["name"], body={"text": "hi", "thread": {"thread_key": "k"}}
+            )
+            .execute()
+        )
+
+        assert space["displayName"] == "general"
+        assert message["name"].startswith(f"{space['name']}/messages/")
+        assert message["thread"]["name"] == f"{space['name']}/threads/k"
+        assert len(sleeps) == 2
+        assert backend.stats() == {
+            "chat.spaces.create": {200: 1},
+            "chat.spaces.messages.create": {200: 1},
+        }
+
+    def test_drive_uploads(self):
+        backend, _, _ = _backend(time_scale=0)
+        drive = backend.build_service("drive", "v3", "a@example.com")
+
+        simple = (
+            drive.files()
+            .create(
+                body={"name": "notes.txt"},
+                media_body=MediaInMemoryUpload(b"abc", mimetype="text/plain"),
+                fields="id,name",
+            )
+            .execute()
+        )
+        resumable = (
+            drive.files()
+            .create(
+                body={"name": "big.bin"},
+                media_body=MediaInMemoryUpload(b"x" * 1024, resumable=True),
+                fields="id",
+            )
+            .execute()
+        )
+
+        assert simple["name"] == "notes.txt"
+        assert resumable["id"].startswith("sim-file-")
+        assert backend.stats()["drive.files.create"] == {200: 3}
+
+    def test_latency_scaled(self):
+        backend, sleeps, _ = _backend(
+            latencies={"chat.spaces.messages.create": LatencyModel(0.5, 0.5)},
+            time_scale=0.1,
+        )
+        _send(backend.build_service("chat", "v1", "a@example.com"))
+        assert sleeps == [pytest.approx(0.05)]
+
+    def test_no_sleep_at_zero_time_scale(self):
+        backend, sleeps, _ = _backend(time_scale=0)
+        _send(backend.build_service("chat", "v1", "a@example.com"))
+        assert sleeps == []
+
+    def test_unknown_path_is_404(self):
+        backend, _, _ = _backend()
+        response = backend.handle("GET", "https://chat.googleapis.com/v9/x", {}, b"")
+        assert response.status == 404
+        assert backend.stats() == {"unknown": {404: 1}}
+
+    def test_user_quota(self):
+        backend, _, clock = _backend(user_write_quota=2, time_scale=0)
+        alice = backend.build_service("chat", "v1", "alice@example.com")
+        bob = backend.build_service("chat", "v1", "bob@example.com")
+
+        _send(alice)
+        _send(alice)
+        with pytest.raises(HttpError) as exc_info:
+            _send(alice)
+        assert exc_info.value.resp.status == 429
+        assert "RESOURCE_EXHAUSTED" in exc_info.value.content.decode()
+
+        _send(bob)  # other users have their own quota
+        alice.spaces().messages().list(parent="spaces/S").execute()  # reads are free
+
+        clock.now = 61.0
+        _send(alice)  # next window
+
+    def test_project_quota(self):
+        backend, _, clock = _backend(
+            user_write_quota=10, project_write_quota=3, quota_window_seconds=10
+        )
+        services = [
+            backend.build_service("chat", "v1", f"u{i}@example.com") for i in range(4)
+        ]
+        for chat in services[:3]:
+            _send(chat)
+        with pytest.raises(HttpError) as exc_info:
+            _send(services[3])
+        assert exc_info.value.resp.status == 429
+
+        clock.now = 10.0
+        _send(services[3])
+
+    def test_server_errors(self):
+        backend, _, _ = _backend(server_error_rate=1.0, server_error_status=500)
+        with pytest.raises(HttpError) as exc_info:
+            _send(backend.build_service("chat", "v1", "a@example.com"))
+        assert exc_info.value.resp.status == 500
+
+    def test_server_error_rate_is_seeded(self):
+        def failures(seed: int) -> list[int]:
+            backend, _, _ = _backend(server_error_rate=0.3, seed=seed, time_scale=0)
+            return [
+                backend.handle(
+                    "POST", "/v1/spaces/S/messages", {}, b"", user="a"
+                ).status
+                for _ in range(50)
+            ]
+
+        assert failures(1) == failures(1)
+        assert 503 in failures(1)
+
+
+class TestBatches:
+    """Tests for batch requests."""
+
+    def _batch(self, backend: SimulatedBackend, parts: int) -> list:
+        chat = backend.build_service("chat", "v1", "a@example.com")
+        results: list = []
+        batch = chat.new_batch_http_request(
+            callback=lambda rid, resp, exc: results.append((rid, resp, exc))
+        )
+        for i in range(parts):
+            batch.add(
+                chat.spaces()
+                .messages()
+                .reactions()
+                .create(
+                    parent=f"spaces/S/messages/M{i}", body={"emoji": {"unicode": "x"}}
+                )
+            )
+        batch.execute()
+        return results
+
+    def test_parts_answered_in_order(self):
+        backend, _, _ = _backend()
+        results = self._batch(backend, 3)
+        assert [rid for rid, _, _ in results] == ["1", "2", "3"]
+        assert results[2][1]["name"].startswith("spaces/S/messages/M2/reactions/")
+        assert backend.stats() == {
+            "batch": {200: 1},
+            "chat.spaces.messages.reactions.create": {200: 3},
+        }
+
+    def test_latency_is_overhead_plus_slowest_part(self):
+        backend, sleeps, _ = _backend(
+            latencies={
+                "batch": LatencyModel(0.1, 0.1),
+                "chat.spaces.messages.reactions.create": LatencyModel(0.3, 0.3),
+            }
+        )
+        self._batch(backend, 5)
+        assert sleeps == [pytest.approx(0.4)]
+
+    def test_parts_count_against_quota(self):
+        backend, _, _ = _backend(user_write_quota=2)
+        results = self._batch(backend, 3)
+        assert [exc is None for _, _, exc in results] == [True, True, False]
+        assert results[2][2].resp.status == 429
+
+    def test_too_many_parts(self):
+        backend, _, _ = _backend(batch_max_parts=2)
+        with pytest.raises(HttpError) as exc_info:
+            self._batch(backend, 3)
+        assert exc_info.value.resp.status == 400
+
+
+class TestSimulatedBackendServer:
+    """Tests for serving the backend over HTTP."""
+
+    def test_requests_batches_and_uploads(self):
+        backend, _, _ = _backend(time_scale=0)
+        server = SimulatedBackendServer(backend)
+        server.start()
+        try:
+            chat = server.build_service("chat", "v1", "a@example.com")
+            drive = server.build_service("drive", "v3", "a@example.com")
+
+            assert _send(chat)["name"].startswith("spaces/S/messages/")
+            results: list = []
+            batch = chat.new_batch_http_request(
+                callback=lambda rid, resp, exc: results.append(exc)
+            )
+            batch.add(chat.spaces().members().create(parent="spaces/S", body={}))
+            batch.execute()
+            upload = (
+                drive.files()
+                .create(
+                    body={"name": "big.bin"},
+                    media_body=MediaInMemoryUpload(b"x" * 1024, resumable=True),
+                    fields="id",
+                )
+                .execute()
+            )
+        finally:
+            server.stop()
+
+        assert results == [None]
+        assert upload["id"].startswith("sim-file-")
+        assert server.url.startswith("http://127.0.0.1:")
+
+    def test_quota_attributed_by_bearer_token(self):
+        backend, _, _ = _backend(user_write_quota=1, time_scale=0)
+        server = SimulatedBackendServer(backend)
+        server.start()
+        try:
+            _send(server.build_service("chat", "v1", "a@example.com"))
+            _send(server.build_service("chat", "v1", "b@example.com"))
+            with pytest.raises(HttpError):
+                _send(server.build_service("chat", "v1", "a@example.com"))
+        finally:
+            server.stop()
+
+
+class TestSetServiceFactory:
+    """Tests for routing get_gcp_service() to the simulator."""
+
+    @pytest.fixture(autouse=True)
+    def _clean(self):
+        clear_service_cache()
+        yield
+        set_service_factory(None)
+        clear_service_cache()
+
+    def test_get_gcp_service_uses_simulator(self):
+        backend, _, _ = _backend(time_scale=0)
+        set_service_factory(backend)
+        assert get_service_factory() is backend
+
+        with patch(
+            "slack_chat_migrator.utils.api.service_account.Credentials"
+        ) as credentials:
+            chat = get_gcp_service("missing.json", "a@example.com", "chat", "v1")
+            credentials.from_service_account_file.assert_not_called()
+
+        assert isinstance(chat, RetryWrapper)
+        assert _send(chat)["name"].startswith("spaces/S/messages/")
+        assert backend.stats() == {"chat.spaces.messages.create": {200: 1}}
+
+    def test_retries_through_injected_errors(self):
+        backend, _, _ = _backend(time_scale=0, server_error_rate=0.5, seed=2)
+        set_service_factory(backend)
+        chat = get_gcp_service(
+            "missing.json", "a@example.com", "chat", "v1", max_retries=10, retry_delay=0
+        )
+        for _ in range(5):
+            _send(chat)
+        stats = backend.stats()["chat.spaces.messages.create"]
+        assert stats[200] == 5
+        assert stats[503] > 0
+
+    def test_cache_keyed_by_backend(self):
+        first, _, _ = _backend()
+        set_service_factory(first)
+        chat = get_gcp_service("c.json", "a@example.com", "chat", "v1")
+        assert get_gcp_service("c.json", "a@example.com", "chat", "v1") is chat
+
+        set_service_factory(_backend()[0])
+        assert get_gcp_service("c.json", "a@example.com", "chat", "v1") is not chat
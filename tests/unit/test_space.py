@@ -2,7 +2,7 @@
 
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 from googleapiclient.errors import HttpError
@@ -435,8 +435,7 @@ class TestAddUsersToSpace:
         (ch_dir / "2024-01-01.json").write_text(json.dumps(messages))
         return ch_dir
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_dry_run_processes_via_noop_service(self, mock_sleep, tmp_path):
+    def test_dry_run_processes_via_noop_service(self, tmp_path):
         """In dry run mode, API calls flow through the no-op service layer."""
         msgs = [{"type": "message", "user": "U001", "ts": "1700000000.000000"}]
         self._setup_channel_dir(tmp_path, "dev", msgs)
@@ -455,8 +454,7 @@ class TestAddUsersToSpace:
         # With DI, dry-run calls flow through mock (DryRunChatService in prod)
         chat.create_membership.assert_called()
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_adds_user_with_membership_body(self, mock_sleep, tmp_path):
+    def test_adds_user_with_membership_body(self, tmp_path):
         """Users are added to the space with createTime and deleteTime."""
         msgs = [{"type": "message", "user": "U001", "ts": "1700000000.000000"}]
         self._setup_channel_dir(tmp_path, "dev", msgs)
@@ -483,8 +481,7 @@ class TestAddUsersToSpace:
         assert "createTime" in body
         assert "deleteTime" in body
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_user_without_email_skipped(self, mock_sleep, tmp_path):
+    def test_user_without_email_skipped(self, tmp_path):
         """Users with no email mapping are skipped."""
         msgs = [{"type": "message", "user": "U999", "ts": "1700000000.000000"}]
         self._setup_channel_dir(tmp_path, "dev", msgs)
@@ -500,8 +497,7 @@ class TestAddUsersToSpace:
         # create_membership should not be called since user has no email
         chat.create_membership.assert_not_called()
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_409_conflict_counted_as_success(self, mock_sleep, tmp_path):
+    def test_409_conflict_counted_as_success(self, tmp_path):
         """409 Conflict (user already in space) is treated as success."""
         msgs = [{"type": "message", "user": "U001", "ts": "1700000000.000000"}]
         self._setup_channel_dir(tmp_path, "dev", msgs)
@@ -520,8 +516,7 @@ class TestAddUsersToSpace:
         # Should not raise
         add_users_to_space(ctx, state, chat, ur, "spaces/dev", "dev")
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_other_http_error_counted_as_failure(self, mock_sleep, tmp_path):
+    def test_other_http_error_counted_as_failure(self, tmp_path):
         """Non-409 HttpErrors count as failures but don't raise."""
         msgs = [{"type": "message", "user": "U001", "ts": "1700000000.000000"}]
         self._setup_channel_dir(tmp_path, "dev", msgs)
@@ -540,8 +535,7 @@ class TestAddUsersToSpace:
         # Should not raise
         add_users_to_space(ctx, state, chat, ur, "spaces/dev", "dev")
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_unexpected_error_counted_as_failure(self, mock_sleep, tmp_path):
+    def test_unexpected_error_counted_as_failure(self, tmp_path):
         """Generic exceptions count as failures but don't raise."""
         msgs = [{"type": "message", "user": "U001", "ts": "1700000000.000000"}]
         self._setup_channel_dir(tmp_path, "dev", msgs)
@@ -559,8 +553,7 @@ class TestAddUsersToSpace:
         # Should not raise
         add_users_to_space(ctx, state, chat, ur, "spaces/dev", "dev")
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_join_time_from_channel_join_event(self, mock_sleep, tmp_path):
+    def test_join_time_from_channel_join_event(self, tmp_path):
         """Explicit channel_join events are used as join times."""
         msgs = [
             {
@@ -587,8 +580,7 @@ class TestAddUsersToSpace:
         # The join time should use the channel_join timestamp (1699000000 -> 2023-11-03)
         assert "2023-11-03" in body["createTime"]
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_leave_time_from_channel_leave_event(self, mock_sleep, tmp_path):
+    def test_leave_time_from_channel_leave_event(self, tmp_path):
         """channel_leave events set the leave time."""
         msgs = [
             {
@@ -621,8 +613,7 @@ class TestAddUsersToSpace:
         # Leave time should use the channel_leave timestamp (1701000000 -> 2023-11-26)
         assert "2023-11-26" in body["deleteTime"]
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_external_user_tracked(self, mock_sleep, tmp_path):
+    def test_external_user_tracked(self, tmp_path):
         """External users are added to state.users.external_users."""
         msgs = [{"type": "message", "user": "U001", "ts": "1700000000.000000"}]
         self._setup_channel_dir(tmp_path, "dev", msgs)
@@ -655,8 +646,7 @@ class TestAddUsersToSpace:
 
         assert "U001" in state.progress.active_users_by_channel["dev"]
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_metadata_members_added_with_default_join_time(self, mock_sleep, tmp_path):
+    def test_metadata_members_added_with_default_join_time(self, tmp_path):
         """Members in metadata but not in messages get default join time."""
         # No messages at all in the channel
         ch_dir = tmp_path / "dev"
@@ -691,8 +681,7 @@ class TestAddUsersToSpace:
         # Should not raise
         add_users_to_space(ctx, state, chat, ur, "spaces/broken", "broken")
 
-    @patch("slack_chat_migrator.services.spaces.historical_membership.time.sleep")
-    def test_bot_user_ids_filtered_from_membership(self, mock_sleep, tmp_path):
+    def test_bot_user_ids_filtered_from_membership(self, tmp_path):
         """Bot user IDs in ctx.bot_user_ids are excluded from membership."""
         msgs = [
             {"type": "message", "user": "U001", "ts": "1700000000.000000"},
@@ -727,8 +716,7 @@ class TestAddUsersToSpace:
 class TestAddRegularMembers:
     """Tests for add_regular_members()."""
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_dry_run_processes_via_noop_service(self, mock_sleep):
+    def test_dry_run_processes_via_noop_service(self):
         """In dry run mode, API calls flow through the no-op service layer."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -745,8 +733,7 @@ class TestAddRegularMembers:
         # With DI, dry-run calls flow through mock (DryRunChatService in prod)
         chat.create_membership.assert_called()
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_adds_active_users_as_regular_members(self, mock_sleep):
+    def test_adds_active_users_as_regular_members(self):
         """Active users are added via the memberships API."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -767,8 +754,7 @@ class TestAddRegularMembers:
         assert "createTime" not in body
         assert "deleteTime" not in body
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_unmapped_user_skipped(self, mock_sleep):
+    def test_unmapped_user_skipped(self):
         """Users with no email mapping are skipped."""
         ctx, state, chat, ur = _make_membership_deps()
         state.progress.active_users_by_channel = {"dev": {"U999"}}
@@ -778,8 +764,7 @@ class TestAddRegularMembers:
 
         chat.create_membership.assert_not_called()
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_409_conflict_counted_as_success(self, mock_sleep):
+    def test_409_conflict_counted_as_success(self):
         """409 Conflict is treated as a successful addition."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -795,8 +780,7 @@ class TestAddRegularMembers:
         # Should not raise
         add_regular_members(ctx, state, chat, ur, None, "spaces/dev", "dev")
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_400_error_counted_as_failure(self, mock_sleep):
+    def test_400_error_counted_as_failure(self):
         """400 Bad Request is counted as failure."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -812,8 +796,7 @@ class TestAddRegularMembers:
         # Should not raise
         add_regular_members(ctx, state, chat, ur, None, "spaces/dev", "dev")
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_403_error_logged_with_extra_detail(self, mock_sleep):
+    def test_403_error_logged_with_extra_detail(self):
         """403/404 errors get additional error logging."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -829,8 +812,7 @@ class TestAddRegularMembers:
         # Should not raise
         add_regular_members(ctx, state, chat, ur, None, "spaces/dev", "dev")
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_unexpected_exception_counted_as_failure(self, mock_sleep):
+    def test_unexpected_exception_counted_as_failure(self):
         """Generic exceptions are caught and counted as failures."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -875,8 +857,7 @@ class TestAddRegularMembers:
         # Verify the fallback loaded the members
         assert state.progress.active_users_by_channel["dev"] == ["U001", "U002"]
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_admin_removed_if_not_in_channel(self, mock_sleep):
+    def test_admin_removed_if_not_in_channel(self):
         """Workspace admin is removed from space if not in the original channel."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={
@@ -904,8 +885,7 @@ class TestAddRegularMembers:
         # Admin should be removed (delete called with admin membership name)
         chat.delete_membership.assert_called()
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_admin_kept_if_in_channel(self, mock_sleep):
+    def test_admin_kept_if_in_channel(self):
         """Workspace admin is NOT removed if they were in the original channel."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={
@@ -933,8 +913,7 @@ class TestAddRegularMembers:
         # Admin should NOT be removed
         chat.delete_membership.assert_not_called()
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_external_user_enables_external_access(self, mock_sleep):
+    def test_external_user_enables_external_access(self):
         """When active users include external users, external access is enabled."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "ext@other.com"},
@@ -952,8 +931,7 @@ class TestAddRegularMembers:
         # Space should be patched to enable external user access
         chat.patch_space.assert_called()
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_external_user_tracked_in_external_users_set(self, mock_sleep):
+    def test_external_user_tracked_in_external_users_set(self):
         """External users are added to state.users.external_users."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "ext@other.com"},
@@ -969,8 +947,7 @@ class TestAddRegularMembers:
 
         assert "ext@other.com" in state.users.external_users
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_drive_folder_permissions_updated(self, mock_sleep):
+    def test_drive_folder_permissions_updated(self):
         """Drive folder permissions are updated for active members."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -988,8 +965,7 @@ class TestAddRegularMembers:
 
         file_handler.folder_manager.set_channel_folder_permissions.assert_called_once()
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_verification_failure_does_not_raise(self, mock_sleep):
+    def test_verification_failure_does_not_raise(self):
         """Failure during member verification doesn't propagate."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={"U001": "alice@example.com"},
@@ -1006,8 +982,7 @@ class TestAddRegularMembers:
         # Should not raise
         add_regular_members(ctx, state, chat, ur, None, "spaces/dev", "dev")
 
-    @patch("slack_chat_migrator.services.spaces.regular_membership.time.sleep")
-    def test_admin_found_by_email_field(self, mock_sleep):
+    def test_admin_found_by_email_field(self):
         """Admin membership can be found via 'email' field instead of 'name'."""
         ctx, state, chat, ur = _make_membership_deps(
             user_map={
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 
 from slack_chat_migrator.core.state import (
@@ -117,8 +119,8 @@ class TestMigrationStateConstruction:
         state.spaces.channel_handlers = {"ch1": "handler"}
         assert state.spaces.channel_handlers == {"ch1": "handler"}
 
-        state.messages.thread_map = {"ts1": "thread1"}
-        assert state.messages.thread_map == {"ts1": "thread1"}
+        state.messages.thread_map = {("general", "ts1"): "thread1"}
+        assert state.messages.thread_map == {("general", "ts1"): "thread1"}
 
         state.context.current_channel = "general"
         assert state.context.current_channel == "general"
@@ -165,7 +167,9 @@ class TestResetForRun:
         assert state.spaces.channel_handlers == {}
 
     def test_resets_thread_map(self):
-        state = MigrationState(messages=MessageState(thread_map={"ts1": "thread1"}))
+        state = MigrationState(
+            messages=MessageState(thread_map={("general", "ts1"): "thread1"})
+        )
         state.reset_for_run()
         assert state.messages.thread_map == {}
 
@@ -265,7 +269,7 @@ class TestResetForRun:
         """Verify all expected fields are reset when starting from dirty state."""
         state = MigrationState(
             spaces=SpaceState(channel_handlers={"h": "v"}),
-            messages=MessageState(thread_map={"t": "v"}),
+            messages=MessageState(thread_map={("c", "t"): "v"}),
             progress=ProgressState(
                 migration_summary=_make_summary(
                     channels_processed=["x"], spaces_created=1
@@ -433,3 +437,113 @@ class TestTotalMessagesAttempted:
         """Default MigrationSummary has messages_created=0."""
         state = MigrationState()
         assert state.total_messages_attempted == 0
+
+
+class TestThreadSafety:
+    """Shared-state helpers used by concurrent channel workers."""
+
+    def test_current_channel_is_thread_local(self):
+        ctx = ContextState()
+        ctx.current_channel = "main"
+        seen: dict[str, str | None] = {}
+
+        def worker() -> None:
+            seen["before"] = ctx.current_channel
+            ctx.current_channel = "worker"
+            seen["after"] = ctx.current_channel
+
+        t = threading.Thread(target=worker)
+        t.start()
+        t.join()
+
+        assert seen == {"before": None, "after": "worker"}
+        assert ctx.current_channel == "main"
+
+    def test_increment_summary_concurrent(self):
+        state = MigrationState()
+
+        def worker() -> None:
+            for _ in range(1000):
+                state.increment_summary("messages_created")
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert state.progress.migration_summary["messages_created"] == 8000
+
+    def test_increment_summary_amount(self):
+        state = MigrationState()
+        state.increment_summary("spaces_created", 3)
+        state.increment_summary("spaces_created", -1)
+        assert state.progress.migration_summary["spaces_created"] == 2
+
+    def test_record_channel_processed(self):
+        state = MigrationState()
+        threads = [
+            threading.Thread(target=state.record_channel_processed, args=(f"c{i}",))
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        processed = state.progress.migration_summary["channels_processed"]
+        assert sorted(processed) == sorted(f"c{i}" for i in range(20))
+
+
+class TestFailureSampling:
+    """Tests for MessageState.record_failure() and sample_failures()."""
+
+    def test_records_all_by_default(self):
+        messages = MessageState()
+        for i in range(5):
+            messages.record_failure(_make_failed(str(i)))
+        assert len(messages.failed_messages) == 5
+        assert messages.failed_message_count == 5
+
+    def test_sampled_failures_keep_exact_count(self):
+        state = MigrationState(
+            progress=ProgressState(migration_summary=_make_summary(messages_created=10))
+        )
+        state.messages.sample_failures(3)
+        for i in range(50):
+            state.messages.record_failure(_make_failed(str(i)))
+
+        assert len(state.messages.failed_messages) == 3
+        assert state.messages.failed_message_count == 50
+        assert state.total_messages_attempted == 60
+
+
+class TestReleaseChannel:
+    """Tests for MigrationState.release_channel()."""
+
+    def test_drops_only_that_channel(self):
+        state = MigrationState()
+        m = state.messages
+        m.sent_messages.update({"a:1", "a:2", "a:2:edited:3", "b:9"})
+        m.message_id_map.update(
+            {
+                ("a", "1"): "spaces/A/messages/1",
+                ("a", "2:edited:3"): "x",
+                ("b", "1"): "spaces/B/messages/1",
+            }
+        )
+        m.thread_map.update(
+            {("a", "1"): "spaces/A/threads/1", ("b", "1"): "spaces/B/threads/1"}
+        )
+
+        state.release_channel("a")
+
+        assert m.sent_messages == {"b:9"}
+        assert m.message_id_map == {("b", "1"): "spaces/B/messages/1"}
+        assert m.thread_map == {("b", "1"): "spaces/B/threads/1"}
+
+    def test_channel_prefix_is_exact(self):
+        state = MigrationState()
+        state.messages.sent_messages.update({"dev:1", "dev-ops:1"})
+        state.release_channel("dev")
+        assert state.messages.sent_messages == {"dev-ops:1"}
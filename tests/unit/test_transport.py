@@ -0,0 +1,193 @@
+"""Unit tests for the pooled Google API HTTP transport."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+import requests
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest, HttpRequest
+from googleapiclient.model import JsonModel
+from requests.adapters import BaseAdapter
+
+from slack_chat_migrator.utils.transport import (
+    SharedTransport,
+    authorized_http,
+    get_shared_transport,
+    reset_shared_transport,
+)
+
+
+class _TokenCredentials(AnonymousCredentials):
+    """Credentials that sign requests with a fixed bearer token."""
+
+    def __init__(self, token: str) -> None:
+        super().__init__()
+        self.token = token
+
+    @property
+    def valid(self) -> bool:
+        return True
+
+    def apply(self, headers, token=None):
+        headers["authorization"] = f"Bearer {self.token}"
+
+    def before_request(self, request, method, url, headers):
+        self.apply(headers)
+
+
+class _FakeAdapter(BaseAdapter):
+    """Records requests and answers each with a canned response."""
+
+    def __init__(self, status: int = 200, body: bytes = b'{"name": "x"}') -> None:
+        super().__init__()
+        self.status = status
+        self.body = body
+        self.requests: list[requests.PreparedRequest] = []
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self.requests.append(request)
+        response = requests.Response()
+        response.status_code = self.status
+        response.reason = "OK" if self.status < 400 else "Forbidden"
+        response.headers["Content-Type"] = "application/json"
+        response._content = self.body
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def transport():
+    shared = SharedTransport()
+    shared.adapter = _FakeAdapter()
+    return shared
+
+
+@pytest.fixture(autouse=True)
+def _reset_transport():
+    yield
+    reset_shared_transport()
+
+
+class TestSessionHttp:
+    """Tests for the httplib2-compatible facade."""
+
+    def test_returns_httplib2_style_response(self, transport):
+        http = transport.http_for(_TokenCredentials("t"))
+        resp, content = http.request("https://chat.googleapis.com/v1/spaces")
+        assert resp.status == 200
+        assert resp.reason == "OK"
+        assert resp["content-type"] == "application/json"
+        assert content == b'{"name": "x"}'
+
+    def test_signs_with_session_credentials(self, transport):
+        transport.http_for(_TokenCredentials("alice")).request("https://x/a")
+        transport.http_for(_TokenCredentials("bob")).request("https://x/b")
+        auth = [r.headers["authorization"] for r in transport.adapter.requests]
+        assert auth == ["Bearer alice", "Bearer bob"]
+
+    def test_text_body_sent_as_utf8(self, transport):
+        http = transport.http_for(_TokenCredentials("t"))
+        http.request("https://x/m", method="POST", body='{"text": "héllo 👋"}')
+        assert transport.adapter.requests[0].body == '{"text": "héllo 👋"}'.encode()
+
+    def test_credentials_exposed_for_batches(self, transport):
+        creds = _TokenCredentials("t")
+        assert transport.http_for(creds).credentials is creds
+
+
+class TestGoogleApiClientIntegration:
+    """SessionHttp works as the http of googleapiclient requests."""
+
+    def _request(self, http, method="POST"):
+        return HttpRequest(
+            http,
+            JsonModel().response,
+            "https://chat.googleapis.com/v1/spaces/S/messages",
+            method=method,
+            body=json.dumps({"text": "hi"}),
+            headers={"content-type": "application/json"},
+            methodId="chat.spaces.messages.create",
+        )
+
+    def test_execute_parses_json(self, transport):
+        http = transport.http_for(_TokenCredentials("t"))
+        assert self._request(http).execute() == {"name": "x"}
+
+    def test_error_status_raises_http_error(self, transport):
+        transport.adapter.status = 403
+        transport.adapter.body = b'{"error": {"message": "denied"}}'
+        http = transport.http_for(_TokenCredentials("t"))
+        with pytest.raises(HttpError) as excinfo:
+            self._request(http).execute()
+        assert excinfo.value.resp.status == 403
+
+    def test_batch_signs_parts_with_http_credentials(self, transport):
+        boundary = "batch_abc"
+        part = (
+            "Content-Type: application/http\r\n"
+            "Content-ID: <response-abc + 0>\r\n\r\n"
+            "HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n\r\n"
+            '{"name": "r"}\r\n'
+        )
+        transport.adapter.body = f"--{boundary}\r\n{part}--{boundary}--".encode()
+        http = transport.http_for(_TokenCredentials("batch-token"))
+
+        results = []
+        batch = BatchHttpRequest(
+            callback=lambda rid, resp, exc: results.append((rid, resp, exc)),
+            batch_uri="https://chat.googleapis.com/batch",
+        )
+        batch.add(self._request(http), request_id="0")
+        # Answer the multipart request with a matching multipart response
+        original_send = transport.adapter.send
+
+        def send(request, **kwargs):
+            response = original_send(request, **kwargs)
+            response.headers["Content-Type"] = f"multipart/mixed; boundary={boundary}"
+            return response
+
+        transport.adapter.send = send
+        batch.execute(http=http)
+
+        assert results == [("0", {"name": "r"}, None)]
+        sent = transport.adapter.requests[0]
+        assert b"Bearer batch-token" in sent.body
+
+
+class TestSharedPool:
+    """All sessions share one adapter."""
+
+    def test_sessions_share_adapter(self):
+        first = authorized_http(_TokenCredentials("a"))
+        second = authorized_http(_TokenCredentials("b"))
+        adapter = get_shared_transport().adapter
+        assert first._session.get_adapter("https://chat.googleapis.com") is adapter
+        assert second._session.get_adapter("https://www.googleapis.com") is adapter
+
+    def test_reset_creates_new_pool(self):
+        before = get_shared_transport()
+        reset_shared_transport()
+        assert get_shared_transport() is not before
+
+    def test_concurrent_requests(self, transport):
+        def worker(n: int) -> None:
+            http = transport.http_for(_TokenCredentials(f"user{n}"))
+            for _ in range(20):
+                http.request("https://chat.googleapis.com/v1/spaces")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert len(transport.adapter.requests) == 160
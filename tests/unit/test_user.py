@@ -172,6 +172,14 @@ class TestGenerateUserMap:
         with pytest.raises(ExportError, match=r"Failed to parse users\.json"):
             generate_user_map(tmp_path, MigrationConfig())
 
+    def test_preloaded_users_skip_file(self, tmp_path):
+        users = [{"id": "U001", "name": "alice", "profile": {"email": "a@x.com"}}]
+
+        # No users.json on disk: the preloaded list is used as is
+        user_map, _, _ = generate_user_map(tmp_path, MigrationConfig(), users)
+
+        assert user_map == {"U001": "a@x.com"}
+
     def test_no_valid_users_raises(self, tmp_path):
         _write_users_json(tmp_path, [{"id": "U001", "name": "noemail", "profile": {}}])
         with pytest.raises(UserMappingError, match="No valid users found"):
@@ -1,6 +1,8 @@
 """Unit tests for the user resolver module."""
 
+import contextvars
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 from google.auth.exceptions import RefreshError
@@ -11,6 +13,7 @@ from slack_chat_migrator.core.config import MigrationConfig
 from slack_chat_migrator.core.state import MigrationState
 from slack_chat_migrator.services.chat_adapter import ChatAdapter
 from slack_chat_migrator.services.user_resolver import UserResolver
+from slack_chat_migrator.utils.logging import _DEBUG_API_ENABLED, is_debug_api_enabled
 from slack_chat_migrator.utils.user_validation import UnmappedUserTracker
 
 _UNSET = object()  # sentinel to distinguish "not passed" from explicit None
@@ -155,6 +158,125 @@ class TestGetDelegate:
         assert result is resolver.chat
 
 
+# ===========================================================================
+# warm_up_delegates
+# ===========================================================================
+
+
+class TestWarmUpDelegates:
+    """Tests for UserResolver.warm_up_delegates."""
+
+    @patch("slack_chat_migrator.services.user_resolver.get_gcp_service")
+    def test_validates_new_users_concurrently(self, mock_get_service):
+        resolver = _make_resolver()
+        barrier = threading.Barrier(3, timeout=5)
+
+        def make_service(creds, email, *args, **kwargs):
+            service = MagicMock(name=email)
+            # Each validation waits for the others: only passes if concurrent
+            service.spaces.return_value.list.return_value.execute.side_effect = lambda: (
+                barrier.wait()
+            )
+            return service
+
+        mock_get_service.side_effect = make_service
+
+        validated = resolver.warm_up_delegates(
+            ["a@example.com", "b@example.com", "c@example.com", "a@example.com"],
+            max_workers=3,
+        )
+
+        assert validated == 3
+        assert mock_get_service.call_count == 3
+        assert set(resolver.state.users.chat_delegates) == {
+            "a@example.com",
+            "b@example.com",
+            "c@example.com",
+        }
+        # The send loop now finds the delegates without another API call
+        resolver.get_delegate("a@example.com")
+        assert mock_get_service.call_count == 3
+
+    @patch("slack_chat_migrator.services.user_resolver.get_gcp_service")
+    def test_logs_channel_of_caller(self, mock_get_service):
+        resolver = _make_resolver(channel="random")
+
+        resolver.warm_up_delegates(["a@example.com"])
+
+        assert mock_get_service.call_args.args[4] == "random"
+
+    @patch("slack_chat_migrator.services.user_resolver.get_gcp_service")
+    def test_skips_external_empty_and_known_users(self, mock_get_service):
+        resolver = _make_resolver()
+        resolver.state.users.valid_users["bad@example.com"] = False
+
+        validated = resolver.warm_up_delegates(
+            ["", "guest@other.com", "bad@example.com"]
+        )
+
+        assert validated == 0
+        mock_get_service.assert_not_called()
+
+    @patch("slack_chat_migrator.services.user_resolver.get_gcp_service")
+    def test_failed_validation_falls_back_to_admin(self, mock_get_service):
+        resolver = _make_resolver()
+        mock_get_service.side_effect = RefreshError("unauthorized_client")
+
+        validated = resolver.warm_up_delegates(["bad@example.com"])
+
+        assert validated == 0
+        assert resolver.state.users.valid_users["bad@example.com"] is False
+        assert resolver.get_delegate("bad@example.com") is resolver.chat
+
+    @patch("slack_chat_migrator.services.user_resolver.refresh_if_expiring")
+    @patch("slack_chat_migrator.services.user_resolver.get_gcp_service")
+    def test_refreshes_tokens_of_known_delegates(self, mock_get_service, mock_refresh):
+        resolver = _make_resolver()
+        resolver.warm_up_delegates(["a@example.com"])
+        mock_refresh.assert_not_called()
+
+        resolver.warm_up_delegates(["a@example.com"])
+
+        mock_refresh.assert_called_once_with(mock_get_service.return_value)
+        assert mock_get_service.call_count == 1
+
+    @patch("slack_chat_migrator.services.user_resolver.refresh_if_expiring")
+    @patch("slack_chat_migrator.services.user_resolver.get_gcp_service")
+    def test_refresh_failure_keeps_delegate(self, mock_get_service, mock_refresh):
+        resolver = _make_resolver()
+        resolver.warm_up_delegates(["a@example.com"])
+        mock_refresh.side_effect = RefreshError("boom")
+
+        resolver.warm_up_delegates(["a@example.com"])
+
+        assert resolver.state.users.valid_users["a@example.com"] is True
+
+    @patch("slack_chat_migrator.services.user_resolver.get_gcp_service")
+    def test_workers_see_caller_context(self, mock_get_service):
+        resolver = _make_resolver()
+        seen = []
+
+        def make_service(*args, **kwargs):
+            seen.append(is_debug_api_enabled())
+            return MagicMock()
+
+        mock_get_service.side_effect = make_service
+
+        def warm_up_with_debug_api():
+            _DEBUG_API_ENABLED.set(True)
+            resolver.warm_up_delegates(["a@example.com", "b@example.com"])
+
+        contextvars.copy_context().run(warm_up_with_debug_api)
+
+        assert seen == [True, True]
+
+    def test_no_credentials_is_noop(self):
+        resolver = _make_resolver(creds_path=None)
+
+        assert resolver.warm_up_delegates(["a@example.com"]) == 0
+        assert resolver.state.users.valid_users == {}
+
+
 # ===========================================================================
 # get_internal_email
 # ===========================================================================
@@ -686,6 +686,24 @@ class TestScanChannelMembersForUnmappedUsers:
         # Both should be tracked because we can't determine bot status
         assert tracker.get_unmapped_count() == 2
 
+    def test_preloaded_data_skips_files(self, tmp_path):
+        channels = [{"name": "general", "members": ["U001", "B001"]}]
+        users = [{"id": "B001", "name": "testbot", "is_bot": True}]
+        tracker = UnmappedUserTracker()
+
+        # Neither file exists on disk: the preloaded lists are used instead
+        with patch("slack_chat_migrator.utils.user_validation.log_with_context"):
+            scan_channel_members_for_unmapped_users(
+                tracker,
+                tmp_path,
+                MigrationConfig(ignore_bots=True),
+                {},
+                channels_data=channels,
+                users_data=users,
+            )
+
+        assert tracker.get_unmapped_users_list() == ["U001"]
+
     def test_multiple_channels_with_overlapping_members(self, tmp_path):
         channels = [
             {"name": "general", "members": ["U001", "U002"]},